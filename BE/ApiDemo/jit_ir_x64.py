@@ -0,0 +1,28 @@
+#!/bin/env python3
+
+"""Python version of jit_ir_x64.cc
+
+Builds the fibonacci IR programmatically and runs it via CodeGenX64.jit
+"""
+
+import platform
+
+from BE.ApiDemo import builder_example
+from BE.CodeGenX64 import jit
+
+
+def main():
+    isa = platform.machine()
+    if isa != "x86_64":
+        print(f"\nIncompatible machine architecture {isa}: no execution")
+        return
+
+    code = jit.JitUnit(builder_example.BuildExample())
+    fib = code.GetFun("fib")
+    for i in range(10):
+        print(f"{i} {fib(i)}")
+    code.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 #include "BE/Base/cfg.h"
 
+#include <algorithm>
 #include <set>
 
 #include "BE/Base/opcode_gen.h"
@@ -475,4 +476,117 @@ void UnitRemoveUnreachableCode(Unit unit, const std::vector<Fun>& seeds) {
   }
 }
 
+namespace {
+std::vector<Fun> FunBsrCallees(Fun fun) {
+  std::vector<Fun> callees;
+  for (Bbl bbl : FunBblIter(fun)) {
+    for (Ins ins : BblInsIter(bbl)) {
+      if (InsOPC(ins) != OPC::BSR) continue;
+      const Fun callee = Fun(InsOperand(ins, 0));
+      if (std::find(callees.begin(), callees.end(), callee) == callees.end()) {
+        callees.push_back(callee);
+      }
+    }
+  }
+  // reverse so that popping from the end visits callees in order of appearance
+  std::reverse(callees.begin(), callees.end());
+  return callees;
+}
+}  // namespace
+
+std::vector<Fun> UnitFunsInCallGraphPostOrder(Unit unit) {
+  std::vector<Fun> out;
+  std::set<Fun> seen;
+  // explicit stack of (fun, remaining callees) to avoid deep recursion
+  std::vector<std::pair<Fun, std::vector<Fun>>> stack;
+  for (Fun root : UnitFunIter(unit)) {
+    if (seen.find(root) != seen.end()) continue;
+    seen.insert(root);
+    stack.emplace_back(root, FunBsrCallees(root));
+    while (!stack.empty()) {
+      std::vector<Fun>& callees = stack.back().second;
+      if (!callees.empty()) {
+        const Fun callee = callees.back();
+        callees.pop_back();
+        if (seen.find(callee) == seen.end()) {
+          seen.insert(callee);
+          stack.emplace_back(callee, FunBsrCallees(callee));
+        }
+      } else {
+        out.push_back(stack.back().first);
+        stack.pop_back();
+      }
+    }
+  }
+  return out;
+}
+
+bool BblNeedsFrame(Bbl bbl,
+                   const std::function<bool(CpuReg)>& is_saved_cpu_reg) {
+  for (Ins ins : BblInsIter(bbl)) {
+    const OPC opc = InsOPC(ins);
+    if (InsOpcode(ins).IsCall() || opc == OPC::INLINE || opc == OPC::GETFP ||
+        opc == OPC::GETSP) {
+      return true;
+    }
+    for (unsigned i = 0; i < InsOpcode(ins).num_operands; ++i) {
+      const Handle op = InsOperand(ins, i);
+      if (Kind(op) == RefKind::STK) return true;
+      if (Kind(op) == RefKind::REG) {
+        const Handle cpu_reg = RegCpuReg(Reg(op));
+        if (Kind(cpu_reg) != RefKind::CPU_REG ||
+            is_saved_cpu_reg(CpuReg(cpu_reg))) {
+          return true;
+        }
+      }
+    }
+  }
+  return false;
+}
+
+Bbl FunShrinkWrap(Fun fun,
+                  const std::function<bool(CpuReg)>& is_saved_cpu_reg,
+                  std::set<Bbl>* frameless) {
+  frameless->clear();
+  std::set<Bbl> framed;
+  std::vector<Bbl> stack;
+  for (Bbl bbl : FunBblIter(fun)) {
+    if (BblNeedsFrame(bbl, is_saved_cpu_reg)) stack.push_back(bbl);
+  }
+  while (!stack.empty()) {
+    const Bbl bbl = stack.back();
+    stack.pop_back();
+    if (framed.find(bbl) != framed.end()) continue;
+    framed.insert(bbl);
+    for (Edg edg : BblSuccEdgIter(bbl)) {
+      stack.push_back(EdgSuccBbl(edg));
+    }
+  }
+  if (framed.empty() ||
+      framed.find(FunBblList::Head(fun)) != framed.end()) {
+    return Bbl(0);
+  }
+  Bbl entry = Bbl(0);
+  for (Bbl bbl : FunBblIter(fun)) {
+    if (framed.find(bbl) == framed.end()) continue;
+    bool has_outside_pred = false;
+    bool has_inside_pred = false;
+    for (Edg edg : BblPredEdgIter(bbl)) {
+      if (framed.find(EdgPredBbl(edg)) == framed.end()) {
+        has_outside_pred = true;
+      } else {
+        has_inside_pred = true;
+      }
+    }
+    if (!has_outside_pred) continue;
+    if (!entry.isnull() || has_inside_pred) return Bbl(0);
+    entry = bbl;
+  }
+  if (entry.isnull()) return Bbl(0);
+  for (Bbl bbl : FunBblIter(fun)) {
+    if (framed.find(bbl) == framed.end()) frameless->insert(bbl);
+  }
+  return entry;
+}
+
 }  // namespace cwerg::base
@@ -1,6 +1,9 @@
 #pragma once
 // (c) Robert Muth - see LICENSE for more info
 
+#include <functional>
+#include <set>
+
 #include "BE/Base/ir.h"
 
 namespace cwerg::base {
@@ -31,4 +34,22 @@ extern Str NewDerivedBblName(Str orig_name, const char* suffix, Fun fun);
 
 extern void UnitRemoveUnreachableCode(Unit unit, const std::vector<Fun>& seeds);
 
+// Returns all funs of the unit ordered so that callees (bsr targets) come
+// before their callers. Funs which are part of a call cycle are returned in
+// some order compatible with the acyclic part of the call graph.
+extern std::vector<Fun> UnitFunsInCallGraphPostOrder(Unit unit);
+
+// Can bbl only be executed after the prolog has set up the stack frame?
+// Must be run after register allocation.
+extern bool BblNeedsFrame(Bbl bbl,
+                          const std::function<bool(CpuReg)>& is_saved_cpu_reg);
+
+// Determines where the prolog and the epilogs of fun must go (shrink-wrapping).
+// Returns the bbl at whose start the prolog must be emitted and fills in the
+// bbls whose RETs do not need an epilog. A null bbl means: emit the prolog at
+// the fun entry. See cfg.py for details.
+extern Bbl FunShrinkWrap(Fun fun,
+                         const std::function<bool(CpuReg)>& is_saved_cpu_reg,
+                         std::set<Bbl>* frameless);
+
 }  // namespace cwerg
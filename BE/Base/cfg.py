@@ -1,7 +1,7 @@
 """This file contains helpers related to the CFG (Control Flow Graph)"""
 # (c) Robert Muth - see LICENSE for more info
 
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional, Callable
 
 from BE.Base import ir
 from BE.Base import opcode_tab as o
@@ -322,3 +322,105 @@ def UnitRemoveUnreachableCode(unit: ir.Unit, seeds: List[ir.Fun]):
                                 ir.FUN_FLAG.REACHACHABLE not in op.flags):
                             reachable.add(op)
     unit.funs = [f for f in unit.funs if ir.FUN_FLAG.REACHACHABLE in f.flags]
+
+
+def UnitFunsInCallGraphPostOrder(unit: ir.Unit) -> List[ir.Fun]:
+    """Returns all funs of the unit ordered so that callees (bsr targets)
+    come before their callers.
+
+    Funs which are part of a call cycle are returned in some order
+    compatible with the acyclic part of the call graph.
+    """
+    out: List[ir.Fun] = []
+    seen: Set[ir.Fun] = set()
+    for root in unit.funs:
+        if root in seen:
+            continue
+        seen.add(root)
+        # explicit stack of (fun, remaining callees) to avoid deep recursion
+        stack = [(root, _FunBsrCallees(root))]
+        while stack:
+            fun, callees = stack[-1]
+            if callees:
+                callee = callees.pop()
+                if callee not in seen:
+                    seen.add(callee)
+                    stack.append((callee, _FunBsrCallees(callee)))
+            else:
+                stack.pop()
+                out.append(fun)
+    return out
+
+
+def _FunBsrCallees(fun: ir.Fun) -> List[ir.Fun]:
+    callees: List[ir.Fun] = []
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            if ins.opcode is o.BSR and ins.operands[0] not in callees:
+                callees.append(ins.operands[0])
+    # reverse so that popping from the end visits callees in order of appearance
+    callees.reverse()
+    return callees
+
+
+def BblNeedsFrame(bbl: ir.Bbl, is_saved_cpu_reg: Callable[[ir.CpuReg], bool]) -> bool:
+    """Can bbl only be executed after the prolog has set up the stack frame?
+
+    This is the case if it calls other funs, accesses the stack (including
+    reading the frame or stack pointer) or uses a callee-saved cpu reg that
+    the prolog saves.
+    Must be run after register allocation.
+    """
+    for ins in bbl.inss:
+        if ins.opcode.is_call() or ins.opcode in {o.INLINE, o.GETFP, o.GETSP}:
+            return True
+        for op in ins.operands:
+            if isinstance(op, ir.Stk):
+                return True
+            if isinstance(op, ir.Reg):
+                if not op.HasCpuReg() or is_saved_cpu_reg(op.cpu_reg):
+                    return True
+    return False
+
+
+def FunShrinkWrap(fun: ir.Fun,
+                  is_saved_cpu_reg: Callable[[ir.CpuReg], bool]) -> Tuple[Optional[ir.Bbl], Set[str]]:
+    """Determines where the prolog and the epilogs of fun must go.
+
+    Returns the bbl at whose start the prolog must be emitted and the names of
+    the bbls whose RETs do not need an epilog. A bbl of None means: emit the
+    prolog at the fun entry (i.e. no shrink-wrapping).
+
+    The region needing the frame consists of all bbls reachable from bbls needing
+    it (see BblNeedsFrame). Shrink-wrapping is only done if that region has a
+    single entry bbl other than the fun entry that is not part of a loop
+    within the region. This covers the common case of early exits, e.g.
+    bounds checks, ahead of the "real work".
+    """
+    framed: Set[str] = set()
+    stack = [bbl for bbl in fun.bbls if BblNeedsFrame(bbl, is_saved_cpu_reg)]
+    while stack:
+        bbl = stack.pop()
+        if bbl.name in framed:
+            continue
+        framed.add(bbl.name)
+        stack += bbl.edge_out
+    if not framed or fun.bbls[0].name in framed:
+        return None, set()
+    entries = [bbl for bbl in fun.bbls if bbl.name in framed and
+               any(pred.name not in framed for pred in bbl.edge_in)]
+    if len(entries) != 1 or any(pred.name in framed for pred in entries[0].edge_in):
+        return None, set()
+    return entries[0], {bbl.name for bbl in fun.bbls if bbl.name not in framed}
+
+
+def FunLoopHeadersByLayout(fun: ir.Fun) -> List[ir.Bbl]:
+    """Returns the bbls that are the target of a backward edge in the current bbl order
+
+    For the usual layouts these are the loop headers: every iteration
+    re-enters the loop there via a branch from a bbl further down (or itself).
+    Must be run after the final bbl order has been established.
+    """
+    pos = {bbl.name: n for n, bbl in enumerate(fun.bbls)}
+    return [bbl for n, bbl in enumerate(fun.bbls)
+            if any(pos[pred.name] >= n for pred in bbl.edge_in)]
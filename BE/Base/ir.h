@@ -752,7 +752,8 @@ enum class FUN_FLAG : uint8_t {
   CFG_NOT_LINEAR = 1 << 1,
   LIVENESs_VALID = 1 << 2,
   STACK_FINALIZED = 1 << 3,
-  REACHABLE = 1 << 4
+  REACHABLE = 1 << 4,
+  CLOBBER_SUMMARY = 1 << 5  // cpu_live_clobber is exact (after reg alloc)
 };
 
 struct FunCore {
@@ -351,6 +351,7 @@ class FUN_FLAG(enum.Flag):
     LIVENESS_VALID = 1 << 2  # liveness info is valid
     STACK_FINALIZED = 1 << 3  # stack size must not change anymore (no more scratch regs!)
     REACHACHABLE = 1 << 4
+    CLOBBER_SUMMARY = 1 << 5  # cpu_live_clobber is exact (computed after reg alloc)
 
 
 class Fun:
@@ -383,7 +384,8 @@ class Fun:
         # (def) "defined by function = results"
         self.cpu_live_out: List[CpuReg] = []
         # (def2) "potentially changed but no visible to caller = scratch"
-        #        we usually use an approximation, i.e. caller-save regs
+        #        we usually use an approximation, i.e. caller-save regs,
+        #        unless FUN_FLAG.CLOBBER_SUMMARY is set
         self.cpu_live_clobber: List[CpuReg] = []
 
         if kind != o.FUN_KIND.INVALID:  # not  forward_declared
@@ -567,6 +569,11 @@ class DataAddrMem:
     offset: int
 
 
+# names of the mems created by Unit.FindOrAddConstMem(). The name is derived from the
+# content so equally named const mems in different units are interchangeable.
+CONST_MEM_PREFIX = "$const_"
+
+
 class Unit:
     """Represents and entire program or a module"""
 
@@ -618,7 +625,7 @@ class Unit:
     def FindOrAddConstMem(self, num: Const):
         def MakeName(data: bytes, kind: o.DK) -> str:
             data_str = "_".join(f"{b:02x}" for b in data)
-            return f"$const_{kind.name}_{data_str}"
+            return f"{CONST_MEM_PREFIX}{kind.name}_{data_str}"
 
         data = num.ToBytes()
         name = MakeName(data, num.kind)
@@ -275,6 +275,10 @@ std::vector<LiveRange> BblGetLiveRanges(Bbl bbl,
   }
 
   int16_t last_call_pos = -1;
+  // the nearest call without a clobber summary
+  int16_t last_lac_call_pos = -1;
+  // calls to funs with a clobber summary in order of decreasing pos
+  std::vector<std::pair<int16_t, Fun>> summarized_calls;
   const CpuReg* last_call_cpu_live_in = nullptr;
   unsigned last_call_num_cpu_live_in = 0;
 
@@ -294,9 +298,22 @@ std::vector<LiveRange> BblGetLiveRanges(Bbl bbl,
     // BblRenderToAsm(bbl, fun, &std::cout);
     ASSERT(lr.def_pos == -1, "in " << Name(fun) << "unexpected def_pos " << lr);
     lr.def_pos = def_pos;
-    if (last_call_pos != -1 && last_call_pos != AFTER_BBL &&
-        last_call_pos < lr.last_use_pos) {
+    if (last_lac_call_pos != -1 && last_lac_call_pos < lr.last_use_pos) {
       lr.SetFlag(LR_FLAG::LAC);
+    } else {
+      for (auto it = summarized_calls.rbegin(); it != summarized_calls.rend();
+           ++it) {
+        if (it->first >= lr.last_use_pos) break;
+        lr.SetFlag(LR_FLAG::LAC);
+        const Fun callee = it->second;
+        for (unsigned i = 0; i < FunNumCpuLiveClobber(callee); ++i) {
+          const CpuReg cpu_reg = FunCpuLiveClobber(callee)[i];
+          if (std::find(lr.cpu_clobber.begin(), lr.cpu_clobber.end(),
+                        cpu_reg) == lr.cpu_clobber.end()) {
+            lr.cpu_clobber.push_back(cpu_reg);
+          }
+        }
+      }
     }
     RegLastUse(lr.reg) = 0;  // invalid
   };
@@ -334,6 +351,12 @@ std::vector<LiveRange> BblGetLiveRanges(Bbl bbl,
       last_call_pos = pos;
       last_call_cpu_live_in = FunCpuLiveIn(callee);
       last_call_num_cpu_live_in = FunNumCpuLiveIn(callee);
+      if (InsOPC(ins) == OPC::BSR &&
+          FunHasFlag(callee, FUN_FLAG::CLOBBER_SUMMARY)) {
+        summarized_calls.emplace_back(pos, callee);
+      } else {
+        last_lac_call_pos = pos;
+      }
     }
     const unsigned num_defs = InsOpcode(ins).num_defs;
     const unsigned num_ops = InsOpcode(ins).num_operands;
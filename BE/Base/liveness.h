@@ -49,6 +49,10 @@ struct LiveRange {
   // CPU_REG_INVALID ???
   // CPU_REG_SPILL reg must be spilled
   // a CpuReg  cpu_reg the liverange is allocated to.
+  // for LAC LRs spanning only calls to funs with a FUN_FLAG::CLOBBER_SUMMARY:
+  // the cpu regs clobbered by those calls (all other caller-saved regs are
+  // fine, too)
+  std::vector<CpuReg> cpu_clobber;
 
   bool HasFlag(LR_FLAG flag) const { return (flags & uint8_t(flag)) != 0; }
 
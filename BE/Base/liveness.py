@@ -3,7 +3,7 @@
 the LiveRange computation using it"""
 
 import dataclasses
-from typing import List, Tuple, Set, Dict
+from typing import List, Tuple, Set, Dict, FrozenSet
 import enum
 
 from BE.Base import ir
@@ -238,6 +238,9 @@ class LiveRange:
     uses: List["LiveRange"] = dataclasses.field(default_factory=list)
     flags: LiveRangeFlag = LiveRangeFlag(0)
     cpu_reg: ir.CpuReg = ir.CPU_REG_INVALID  # CPU register after allocation
+    # for LAC LRs spanning only calls to funs with a FUN_FLAG.CLOBBER_SUMMARY:
+    # the cpu regs clobbered by those calls (all other caller-saved regs are fine, too)
+    cpu_clobber: FrozenSet[ir.CpuReg] = frozenset()
 
     def is_cross_bbl(self):
         return self.last_use_pos is AFTER_BBL or self.def_pos is BEFORE_BBL
@@ -298,6 +301,10 @@ def BblGetLiveRanges(bbl: ir.Bbl, fun: ir.Fun, live_out: Set[ir.Reg]) -> List[Li
 
     last_use: Dict[ir.Reg, LiveRange] = {}
     last_call_pos = -1
+    # the nearest call without a clobber summary
+    last_lac_call_pos = -1
+    # calls to funs with a clobber summary in order of decreasing pos
+    summarized_calls: List[Tuple[int, FrozenSet[ir.CpuReg]]] = []
     # these cpu registers are also live because they are inputs to function call
     # or being returned
     last_call_cpu_live_in = []
@@ -311,9 +318,14 @@ def BblGetLiveRanges(bbl: ir.Bbl, fun: ir.Fun, live_out: Set[ir.Reg]) -> List[Li
 
     def finalize_lr(lr: LiveRange, def_pos: int):
         lr.def_pos = def_pos
-        if (last_call_pos != -1 and last_call_pos != AFTER_BBL and
-                last_call_pos < lr.last_use_pos):
+        if last_lac_call_pos != -1 and last_lac_call_pos < lr.last_use_pos:
             lr.flags |= LiveRangeFlag.LAC
+        else:
+            for call_pos, clobber in reversed(summarized_calls):
+                if call_pos >= lr.last_use_pos:
+                    break
+                lr.flags |= LiveRangeFlag.LAC
+                lr.cpu_clobber = lr.cpu_clobber | clobber
         del last_use[lr.reg]
 
     # handle live ranges that extend passed the bbl
@@ -345,6 +357,10 @@ def BblGetLiveRanges(bbl: ir.Bbl, fun: ir.Fun, live_out: Set[ir.Reg]) -> List[Li
                         finalize_lr(lr, pos)
             last_call_cpu_live_in = callee.cpu_live_in
             last_call_pos = pos  # setting this after dealing with cpu_live_out seems right
+            if ins.opcode is o.BSR and ir.FUN_FLAG.CLOBBER_SUMMARY in callee.flags:
+                summarized_calls.append((pos, frozenset(callee.cpu_live_clobber)))
+            else:
+                last_lac_call_pos = pos
 
         num_defs = ins.opcode.def_ops_count()
         uses = []
@@ -288,6 +288,53 @@ class TestRanges(unittest.TestCase):
         for lr in ranges:
             print(lr)
 
+    def testClobberSummary(self):
+        code = io.StringIO(r"""
+.fun leaf NORMAL [] = []
+.bbl start
+    ret
+
+.fun other NORMAL [] = []
+.bbl start
+    ret
+
+.fun test NORMAL [] = []
+.reg U32 [a b]
+.bbl start
+    mov a 1                                # 0
+    mov b 2                                # 1
+    bsr leaf                               # 2
+    add a a a                              # 3
+    bsr other                              # 4
+    add b b b                              # 5
+    ret                                    # 6
+""")
+        unit = serialize.UnitParseFromAsm(code)
+        r0, r1 = ir.CpuReg("r0", 0), ir.CpuReg("r1", 1)
+        leaf = unit.fun_syms["leaf"]
+        leaf.cpu_live_clobber = [r0]
+        leaf.flags |= ir.FUN_FLAG.CLOBBER_SUMMARY
+        unit.fun_syms["other"].cpu_live_clobber = [r1]
+
+        self.assertEqual([f.name for f in cfg.UnitFunsInCallGraphPostOrder(unit)],
+                         ["leaf", "other", "test"])
+
+        fun = unit.fun_syms["test"]
+        cfg.FunSplitBblsAtTerminators(fun)
+        cfg.FunInitCFG(fun)
+        cfg.FunRemoveUnconditionalBranches(fun)
+        cfg.FunRemoveEmptyBbls(fun)
+        liveness.FunComputeLivenessInfo(fun)
+        ranges = liveness.BblGetLiveRanges(fun.bbls[0], fun, fun.bbls[0].live_out)
+        lr_a = liveness.FindDefRange("a", 0, ranges)
+        lr_b = liveness.FindDefRange("b", 1, ranges)
+        # a only spans the call to leaf which has a clobber summary
+        self.assertIn(liveness.LiveRangeFlag.LAC, lr_a.flags)
+        self.assertEqual(lr_a.cpu_clobber, {r0})
+        # b also spans the call to other without summary (its cpu_live_clobber is ignored)
+        self.assertIn(liveness.LiveRangeFlag.LAC, lr_b.flags)
+        self.assertEqual(lr_b.cpu_clobber, frozenset())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -897,7 +897,7 @@ NOP1 = Opcode(0x71, "nop1", OPC_KIND.NOP1, [OP_KIND.REG],
 
 LINE = Opcode(0x77, "line", OPC_KIND.LINE, [OP_KIND.BYTES, OP_KIND.CONST],
               [TC.INVALID, TC.UINT], OPC_GENUS.BASE,
-              "NYI: debug line number",
+              "Debug line number - attributes the subsequent instructions to a source line",
               OA.SPECIAL)
 
 ############################################################
@@ -1,4 +1,5 @@
 """This file contains code for Register Allocation/Assignment """
+import bisect
 from typing import List, Dict, Optional
 
 from BE.Base import ir
@@ -12,37 +13,62 @@ class PreAllocation:
 
     We want to query this set for overlap with a given lr.
     Also the queries are against monotonically increasing lrs.
+
+    Queries are answered with a binary search over the running maximum of the
+    last_use_pos of the ranges, starting at a cached cursor, so each query is
+    O(log n) even for very large Bbls.
     """
 
     def __init__(self):
         self.ranges: List[LiveRange] = []  # must be sorted ow. has_conflict wont work
+        # max_last_use[i] == max(r.last_use_pos for r in ranges[:i+1])
+        # Note: this is non-decreasing even when a range without use (NO_USE)
+        # is followed by ranges with smaller last_use_pos.
+        self.max_last_use: List[int] = []
         self.current = 0
 
     def add(self, lr: LiveRange):
         if self.ranges:
             assert self.ranges[-1] < lr
+            self.max_last_use.append(max(self.max_last_use[-1], lr.last_use_pos))
+        else:
+            self.max_last_use.append(lr.last_use_pos)
         self.ranges.append(lr)
 
     def has_conflict(self, lr: LiveRange) -> bool:
-        while self.current < len(self.ranges):
-            top = self.ranges[self.current]
-            # consider two ranges:
-            # lr:  [def:11 - last_use:12]
-            # top: [def:10 - last_use:11]
-            # there is no overlap and since subsequent lrs will have bigger last_use
-            # components we can drop
-
-            if top.last_use_pos <= lr.def_pos:
-                self.current += 1
-                continue
+        # consider two ranges:
+        # lr:  [def:11 - last_use:12]
+        # top: [def:10 - last_use:11]
+        # there is no overlap and since subsequent lrs will have bigger last_use
+        # components we can drop top.
+        # We want the first range with last_use_pos > lr.def_pos. All ranges before
+        # the cursor have already been dropped by an earlier (smaller) query, so
+        # this is also the first range whose running max exceeds lr.def_pos.
+        self.current = bisect.bisect_right(self.max_last_use, lr.def_pos, self.current)
+        if self.current < len(self.ranges):
             # we know top.last_use_pos > lr.def_pos
-            return top.def_pos < lr.last_use_pos
+            return self.ranges[self.current].def_pos < lr.last_use_pos
         return False
 
     def __str__(self):
         return f"PRE-ALLOCATED: {self.ranges}"
 
 
+def FindUnreservedReg(available: int, reserved: List[PreAllocation], lr: LiveRange) -> int:
+    """Returns the lowest n such that bit n is set in `available` and reserved[n]
+    does not conflict with lr. Returns -1 if there is no such n.
+
+    Only the set bits of the `available` mask are visited.
+    """
+    while available:
+        lowest = available & -available
+        n = lowest.bit_length() - 1
+        if not reserved[n].has_conflict(lr):
+            return n
+        available ^= lowest
+    return -1
+
+
 class RegPool:
     """RegPool interface manages register available for allocation
      while running a linear scan allocator.
@@ -83,6 +83,47 @@ def MakeGenericCpuRegs(num_gpr_not_lac, num_gpr_lac=0, num_flt_not_lac=0, num_fl
             [ir.CpuReg(f"sl{i}", i, FLT_LAC) for i in range(num_flt_lac)])
 
 
+class TestPreAllocation(unittest.TestCase):
+
+    def testConflicts(self):
+        reg = ir.Reg("r", o.DK.U32)
+        pa = reg_alloc.PreAllocation()
+        for def_pos, last_use_pos in [(2, 4), (6, liveness.NO_USE), (8, 9), (12, 14)]:
+            pa.add(liveness.LiveRange(def_pos, last_use_pos, reg, 1))
+
+        def lr(def_pos, last_use_pos):
+            return liveness.LiveRange(def_pos, last_use_pos, reg, 1)
+
+        self.assertFalse(pa.has_conflict(lr(0, 1)))
+        self.assertFalse(pa.has_conflict(lr(0, 2)))
+        self.assertTrue(pa.has_conflict(lr(1, 3)))
+        self.assertFalse(pa.has_conflict(lr(4, 6)))
+        # the range without use blocks the register for the rest of the bbl
+        self.assertTrue(pa.has_conflict(lr(10, 11)))
+        self.assertTrue(pa.has_conflict(lr(15, 16)))
+
+        pa = reg_alloc.PreAllocation()
+        for n in range(1000):
+            pa.add(liveness.LiveRange(n * 4, n * 4 + 2, reg, 1))
+        self.assertTrue(pa.has_conflict(lr(1, 2)))
+        self.assertFalse(pa.has_conflict(lr(2002, 2004)))
+        self.assertTrue(pa.has_conflict(lr(3000, 3005)))
+        self.assertFalse(pa.has_conflict(lr(4000, 4001)))
+
+    def testFindUnreservedReg(self):
+        reg = ir.Reg("r", o.DK.U32)
+        reserved = [reg_alloc.PreAllocation() for _ in range(4)]
+        reserved[1].add(liveness.LiveRange(0, 10, reg, 1))
+        reserved[2].add(liveness.LiveRange(0, 3, reg, 1))
+        lr = liveness.LiveRange(2, 5, reg, 1)
+        self.assertEqual(-1, reg_alloc.FindUnreservedReg(0, reserved, lr))
+        self.assertEqual(0, reg_alloc.FindUnreservedReg(0xf, reserved, lr))
+        self.assertEqual(3, reg_alloc.FindUnreservedReg(0xe, reserved, lr))
+        self.assertEqual(-1, reg_alloc.FindUnreservedReg(0x6, reserved, lr))
+        lr = liveness.LiveRange(3, 5, reg, 1)
+        self.assertEqual(2, reg_alloc.FindUnreservedReg(0x6, reserved, lr))
+
+
 class TestRanges(unittest.TestCase):
 
     def testSimple(self):
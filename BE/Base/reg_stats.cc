@@ -5,6 +5,7 @@
 #include <algorithm>
 #include <iomanip>
 #include <map>
+#include <set>
 
 #include "BE/Base/liveness.h"
 #include "BE/Base/opcode_gen.h"
@@ -190,11 +191,14 @@ void FunComputeRegStatsExceptLAC(Fun fun) {
   }
 }
 
-void FunComputeRegStatsLAC(Fun fun) {
+void FunComputeRegStatsLAC(Fun fun,
+                           std::map<Reg, std::vector<CpuReg>>* clobbered) {
   for (Reg reg : FunRegIter(fun)) {
     // we will (re)compute these
     RegFlags(reg) &= ~(+REG_FLAG::GLOBAL | +REG_FLAG::LAC);
   }
+  if (clobbered != nullptr) clobbered->clear();
+  std::set<Reg> unsummarized;
   const unsigned num_regs = FunNumRegs(fun);
   BitVec live = BitVec::New(num_regs);
   const Reg* const reg_map = (Reg*)FunRegMap(fun).BackingStorage();
@@ -202,9 +206,26 @@ void FunComputeRegStatsLAC(Fun fun) {
     live.CopyFrom(BblLiveOut(bbl));
     for (Ins ins : BblInsIterReverse(bbl)) {
       if (InsOpcode(ins).IsCall()) {
+        const bool summarized =
+            InsOPC(ins) == OPC::BSR &&
+            FunHasFlag(Fun(InsOperand(ins, 0)), FUN_FLAG::CLOBBER_SUMMARY);
         for (unsigned i = 1; i < num_regs; ++i) {
           if (live.BitGet(i)) {
             RegFlags(reg_map[i]) |= +REG_FLAG::LAC;
+            if (clobbered == nullptr) continue;
+            if (!summarized) {
+              unsummarized.insert(reg_map[i]);
+              continue;
+            }
+            const Fun callee = Fun(InsOperand(ins, 0));
+            std::vector<CpuReg>& cpu_regs = (*clobbered)[reg_map[i]];
+            for (unsigned j = 0; j < FunNumCpuLiveClobber(callee); ++j) {
+              const CpuReg cpu_reg = FunCpuLiveClobber(callee)[j];
+              if (std::find(cpu_regs.begin(), cpu_regs.end(), cpu_reg) ==
+                  cpu_regs.end()) {
+                cpu_regs.push_back(cpu_reg);
+              }
+            }
           }
         }
       }
@@ -228,6 +249,52 @@ void FunComputeRegStatsLAC(Fun fun) {
     }
   }
   BitVec::Del(live);
+  if (clobbered != nullptr) {
+    for (Reg reg : unsummarized) clobbered->erase(reg);
+  }
+}
+
+bool FunComputeCpuLiveClobber(Fun fun,
+                              const std::vector<CpuReg>& implicit_clobbers,
+                              const std::set<CpuReg>& callee_saved) {
+  if (FunKind(fun) != FUN_KIND::NORMAL) return false;
+  std::set<CpuReg> clobber(implicit_clobbers.begin(), implicit_clobbers.end());
+  for (unsigned i = 0; i < FunNumCpuLiveIn(fun); ++i) {
+    clobber.insert(FunCpuLiveIn(fun)[i]);
+  }
+  for (unsigned i = 0; i < FunNumCpuLiveOut(fun); ++i) {
+    clobber.insert(FunCpuLiveOut(fun)[i]);
+  }
+  for (Bbl bbl : FunBblIter(fun)) {
+    for (Ins ins : BblInsIter(bbl)) {
+      const OPC opc = InsOPC(ins);
+      if (opc == OPC::BSR) {
+        const Fun callee = Fun(InsOperand(ins, 0));
+        if (!FunHasFlag(callee, FUN_FLAG::CLOBBER_SUMMARY)) return false;
+        for (unsigned i = 0; i < FunNumCpuLiveClobber(callee); ++i) {
+          clobber.insert(FunCpuLiveClobber(callee)[i]);
+        }
+      } else if (opc == OPC::JSR || opc == OPC::INLINE) {
+        return false;
+      }
+    }
+  }
+  for (Reg reg : FunRegIter(fun)) {
+    const CpuReg cpu_reg(RegCpuReg(reg));
+    if (Kind(cpu_reg) == RefKind::CPU_REG) clobber.insert(cpu_reg);
+  }
+  std::vector<CpuReg> out;
+  for (CpuReg cpu_reg : clobber) {
+    if (callee_saved.find(cpu_reg) == callee_saved.end()) out.push_back(cpu_reg);
+  }
+  ASSERT(out.size() <= MAX_PARAMETERS, "too many clobbered regs");
+  std::sort(out.begin(), out.end(), [](CpuReg a, CpuReg b) {
+    return StrCmpLt(Name(a), Name(b));
+  });
+  FunNumCpuLiveClobber(fun) = out.size();
+  std::copy(out.begin(), out.end(), FunCpuLiveClobber(fun));
+  FunFlags(fun) |= uint8_t(FUN_FLAG::CLOBBER_SUMMARY);
+  return true;
 }
 
 int FunDropUnreferencedRegs(Fun fun) {
@@ -2,6 +2,9 @@
 // (c) Robert Muth - see LICENSE for more info
 
 #include <functional>
+#include <map>
+#include <set>
+#include <vector>
 
 #include "BE/Base/ir.h"
 
@@ -25,7 +28,22 @@ extern std::ostream& operator<<(std::ostream& os, const DK_LAC_COUNTS& usage);
 
 extern void FunComputeRegStatsExceptLAC(Fun fun);
 
-extern void FunComputeRegStatsLAC(Fun fun);
+// Updates Reg info: Sets flags: GLOBAL, LAC
+// If clobbered is not null it receives the LAC regs which are only live across
+// calls to funs with a FUN_FLAG::CLOBBER_SUMMARY together with the cpu regs
+// clobbered by those calls. Such regs may also be assigned the remaining
+// caller-saved cpu regs.
+extern void FunComputeRegStatsLAC(
+    Fun fun, std::map<Reg, std::vector<CpuReg>>* clobbered = nullptr);
+
+// Summarizes the cpu regs a fun may change (after register allocation).
+// On success FunCpuLiveClobber(fun) is updated and FUN_FLAG::CLOBBER_SUMMARY is
+// set. implicit_clobbers are regs used by the code generator that do not show
+// up in the IR. Summaries are only computed if all callees already have one,
+// so funs must be processed callees first.
+extern bool FunComputeCpuLiveClobber(
+    Fun fun, const std::vector<CpuReg>& implicit_clobbers,
+    const std::set<CpuReg>& callee_saved);
 
 extern int FunDropUnreferencedRegs(Fun fun);
 
@@ -136,19 +136,31 @@ def FunComputeRegStatsExceptLAC(fun: ir.Fun):
                         reg.flags |= ir.REG_FLAG.GLOBAL
 
 
-def FunComputeRegStatsLAC(fun: ir.Fun):
+def FunComputeRegStatsLAC(fun: ir.Fun) -> Dict[ir.Reg, Set[ir.CpuReg]]:
     """Updates Reg info: Sets flags: GLOBAL, LAC
 
     Note the GLOBAL flags computation is more accurate than FunComputeRegStatsExceptLAC.
+
+    Returns the LAC regs which are only live across calls to funs with a
+    FUN_FLAG.CLOBBER_SUMMARY together with the cpu regs clobbered by those calls.
+    Such regs may also be assigned the remaining caller-saved cpu regs.
     """
+    clobbered: Dict[ir.Reg, Set[ir.CpuReg]] = collections.defaultdict(set)
+    unsummarized: Set[ir.Reg] = set()
     for reg in fun.regs:
         reg.flags &= ~(ir.REG_FLAG.GLOBAL | ir.REG_FLAG.LAC)
     for bbl in fun.bbls:
         live_out = bbl.live_out.copy()
         for ins in reversed(bbl.inss):
             if ins.opcode.is_call():
+                summarized = (ins.opcode is o.BSR and
+                              ir.FUN_FLAG.CLOBBER_SUMMARY in ins.operands[0].flags)
                 for reg in live_out:
                     reg.flags |= ir.REG_FLAG.LAC
+                    if summarized:
+                        clobbered[reg].update(ins.operands[0].cpu_live_clobber)
+                    else:
+                        unsummarized.add(reg)
             num_defs = ins.opcode.def_ops_count()
             for n, reg in enumerate(ins.operands):
                 if not isinstance(reg, ir.Reg): continue
@@ -158,6 +170,44 @@ def FunComputeRegStatsLAC(fun: ir.Fun):
                     live_out.add(reg)
         for reg in live_out:
             reg.flags |= ir.REG_FLAG.GLOBAL
+    return {reg: cpu_regs for reg, cpu_regs in clobbered.items() if reg not in unsummarized}
+
+
+def FunComputeCpuLiveClobber(fun: ir.Fun, implicit_clobbers: List[ir.CpuReg],
+                             callee_saved: Set[ir.CpuReg]) -> bool:
+    """Summarizes the cpu regs a fun may change (after register allocation)
+
+    On success fun.cpu_live_clobber is updated and FUN_FLAG.CLOBBER_SUMMARY is set,
+    so that callers processed later can keep values in the remaining caller-saved
+    regs across calls to fun.
+
+    implicit_clobbers are regs used by the code generator that do not show up in the IR.
+
+    Summaries are only computed if all callees already have one, so funs must be
+    processed callees first. Recursive funs never get a summary.
+    """
+    if fun.kind is not o.FUN_KIND.NORMAL:
+        return False
+    clobber: Set[ir.CpuReg] = set(implicit_clobbers)
+    clobber.update(fun.cpu_live_in)
+    clobber.update(fun.cpu_live_out)
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            opc = ins.opcode
+            if opc is o.BSR:
+                callee: ir.Fun = ins.operands[0]
+                if ir.FUN_FLAG.CLOBBER_SUMMARY not in callee.flags:
+                    return False
+                clobber.update(callee.cpu_live_clobber)
+            elif opc is o.JSR or opc is o.INLINE:
+                return False
+    for reg in fun.regs:
+        if reg.HasCpuReg():
+            clobber.add(reg.cpu_reg)
+    fun.cpu_live_clobber = sorted((r for r in clobber if r not in callee_saved),
+                                  key=lambda r: r.name)
+    fun.flags |= ir.FUN_FLAG.CLOBBER_SUMMARY
+    return True
 
 
 KIND_AND_LAC = Tuple[o.DK, bool]
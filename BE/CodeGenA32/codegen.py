@@ -26,12 +26,15 @@ from BE.CodeGenA32 import legalize
 
 from BE.Elf import enum_tab
 from BE.Elf import elf_unit
+from BE.Elf import linker
 
 
-def LegalizeAll(unit: ir.Unit, opt_stats, fout, verbose=False):
+def LegalizeAll(unit: ir.Unit, opt_stats, fout, verbose=False, remove_unreachable=True):
+    """`remove_unreachable` must be False for units compiled into object files
+    where every global fun may be referenced by another object"""
     seeds = [f for f in [unit.fun_syms.get("_start"),
                          unit.fun_syms.get("main")] if f]
-    if seeds:
+    if seeds and remove_unreachable:
         cfg.UnitRemoveUnreachableCode(unit, seeds)
     for fun in unit.funs:
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
@@ -100,6 +103,11 @@ def _RenderIns(ins: a32.Ins):
     return f"    {name} {' '.join(ops)}"
 
 
+def _RenderLine(ins: ir.Ins) -> str:
+    filename, line = ins.operands
+    return f"    .line {serialize.RenderOperand(filename, o.TC.INVALID)} {line.value}"
+
+
 def _FunCodeGenArm32(fun: ir.Fun, _mod: ir.Unit) -> List[str]:
     assert fun.kind is not o.FUN_KIND.EXTERN
     assert ir.FUN_FLAG.STACK_FINALIZED in fun.flags
@@ -115,17 +123,24 @@ def _FunCodeGenArm32(fun: ir.Fun, _mod: ir.Unit) -> List[str]:
 
     ctx = regs.FunComputeEmitContext(fun)
 
-    out += [_RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
-            for tmpl in isel_tab.EmitFunProlog(ctx)]
+    if ctx.prolog_bbl is None:
+        out += [_RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
+                for tmpl in isel_tab.EmitFunProlog(ctx)]
     for bbl in fun.bbls:
         live_out = sorted([r.name for r in bbl.live_out])
         out.append(f".bbl {bbl.name} 4")
+        if bbl is ctx.prolog_bbl:
+            out += [_RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
+                    for tmpl in isel_tab.EmitFunProlog(ctx)]
         for ins in bbl.inss:
             if ins.opcode is o.NOP1:
                 isel_tab.HandlePseudoNop1(ins, ctx)
+            elif ins.opcode is o.LINE:
+                out.append(_RenderLine(ins))
             elif ins.opcode is o.RET:
-                out += [_RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
-                        for tmpl in isel_tab.EmitFunEpilog(ctx)]
+                epilog_ctx = regs.FRAMELESS_EMIT_CONTEXT if bbl.name in ctx.frameless_bbls else ctx
+                out += [_RenderIns(tmpl.MakeInsFromTmpl(None, epilog_ctx))
+                        for tmpl in isel_tab.EmitFunEpilog(epilog_ctx)]
             else:
                 pattern = isel_tab.FindMatchingPattern(ins)
                 assert pattern, (f"could not find pattern for\n{ins} {ins.operands} "
@@ -188,11 +203,14 @@ def codegen(unit: ir.Unit) -> Unit:
 def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
     elfunit = elf_unit.Unit()
     for mem in unit.mems:
-        assert mem.kind is not o.MEM_KIND.EXTERN
-        if mem.kind == o.MEM_KIND.BUILTIN:
+        # EXTERN mems (and funs) are left to the linker
+        if mem.kind in {o.MEM_KIND.BUILTIN, o.MEM_KIND.EXTERN}:
             continue
-        elfunit.MemStart(mem.name, mem.alignment,
-                         _MEMKIND_TO_SECTION[mem.kind], False)
+        sym = elfunit.MemStart(mem.name, mem.alignment,
+                               _MEMKIND_TO_SECTION[mem.kind], False)
+        if mem.name.startswith(ir.CONST_MEM_PREFIX):
+            # other objects may contain the same const
+            sym.st_bind = enum_tab.ST_INFO_BIND.WEAK
         for d in mem.datas:
             if isinstance(d, ir.DataBytes):
                 elfunit.AddData(d.count, d.data)
@@ -208,6 +226,8 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
 
     sec_text = elfunit.sec_text
     for fun in unit.funs:
+        if fun.kind in {o.FUN_KIND.SIGNATURE, o.FUN_KIND.EXTERN}:
+            continue
         elfunit.FunStart(fun.name, 16, assembler.NOP_BYTES)
         for jtb in fun.jtbs:
             elfunit.MemStart(jtb.name, 4, "rodata", True)
@@ -218,21 +238,26 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
 
         ctx = regs.FunComputeEmitContext(fun)
 
-        for tmpl in isel_tab.EmitFunProlog(ctx):
-            assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
+        if ctx.prolog_bbl is None:
+            for tmpl in isel_tab.EmitFunProlog(ctx):
+                assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
 
         for bbl in fun.bbls:
             elfunit.AddLabel(bbl.name, 4, assembler.NOP_BYTES)
+            if bbl is ctx.prolog_bbl:
+                for tmpl in isel_tab.EmitFunProlog(ctx):
+                    assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
             for ins in bbl.inss:
                 if ins.opcode is o.NOP1:
                     isel_tab.HandlePseudoNop1(ins, ctx)
                 elif ins.opcode is o.LINE:
-                    pass
-                    # TODO: add line number support
+                    filename, line = ins.operands
+                    elfunit.AddLine(str(filename, "utf-8"), line.value)
                 elif ins.opcode is o.RET:
-                    for tmpl in isel_tab.EmitFunEpilog(ctx):
+                    epilog_ctx = regs.FRAMELESS_EMIT_CONTEXT if bbl.name in ctx.frameless_bbls else ctx
+                    for tmpl in isel_tab.EmitFunEpilog(epilog_ctx):
                         assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(None, ctx))
+                                         tmpl.MakeInsFromTmpl(None, epilog_ctx))
 
                 else:
                     pattern = isel_tab.FindMatchingPattern(ins)
@@ -249,12 +274,14 @@ if __name__ == "__main__":
     import sys
     import argparse
 
-    _ALLOWED_MODES = {"normal", "binary", "legalize", "reg_alloc_global",
+    _ALLOWED_MODES = {"normal", "binary", "object", "legalize", "reg_alloc_global",
                       "reg_alloc_local"}
 
     def main():
         parser = argparse.ArgumentParser(description='CodeGenA32')
         parser.add_argument('-mode', type=str, help='mode')
+        parser.add_argument('-runtime', type=str, default="",
+                            help='precompiled runtime object to link with (binary mode only)')
         parser.add_argument('input', type=str, help='input file')
         parser.add_argument('output', type=str, help='output file')
         args = parser.parse_args()
@@ -265,15 +292,23 @@ if __name__ == "__main__":
         unit = serialize.UnitParseFromAsm(fin)
         opt_stats: Dict[str, int] = collections.defaultdict(int)
 
-        if args.mode == "binary":
+        if args.mode in {"binary", "object"}:
             # we need to legalize all functions first as this may change the signature
             # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-            LegalizeAll(unit, opt_stats, None)
+            LegalizeAll(unit, opt_stats, None,
+                        remove_unreachable=args.mode != "object")
             RegAllocGlobal(unit, opt_stats, None)
             RegAllocLocal(unit, opt_stats, None)
             armunit = EmitUnitAsBinary(unit)
+            if args.mode == "object":
+                elf_unit.UnitSaveAsObject(armunit, enum_tab.E_MACHINE.ARM,
+                                          open(args.output, "wb"))
+                return
+            if args.runtime:
+                armunit = linker.LinkWithRuntime(armunit, args.runtime,
+                                                 enum_tab.E_MACHINE.ARM)
             exe = assembler.Assemble(armunit, True)
-            exe.save(open(args.output, "wb"))
+            exe.save_to_path(args.output)
             os.chmod(args.output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
             return
 
@@ -3472,54 +3472,74 @@ const InsTmpl kInsTemplates[] = {
     a32::OPC::rbit, 0x6 },  // cnttz [1669]
   { {+PRED::al, +PARAM::reg0, +PARAM::reg0},
     a32::OPC::clz, 0x6 },  // cnttz [1670]
+  { {+PRED::al, +PARAM::scratch_flt_lo, +PARAM::reg1},
+    a32::OPC::vmov_atos, 0x6 },  // cntpop [1671]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vcnt_8, 0x3 },  // cntpop [1672]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vpaddl_u8, 0x3 },  // cntpop [1673]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vpaddl_u16, 0x3 },  // cntpop [1674]
+  { {+PRED::al, +PARAM::reg0, +PARAM::scratch_flt_lo},
+    a32::OPC::vmov_stoa, 0x6 },  // cntpop [1675]
+  { {+PRED::al, +PARAM::scratch_flt_lo, +PARAM::reg1},
+    a32::OPC::vmov_atos, 0x6 },  // cntpop [1676]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vcnt_8, 0x3 },  // cntpop [1677]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vpaddl_u8, 0x3 },  // cntpop [1678]
+  { {+PARAM::scratch_flt, +PARAM::scratch_flt},
+    a32::OPC::vpaddl_u16, 0x3 },  // cntpop [1679]
+  { {+PRED::al, +PARAM::reg0, +PARAM::scratch_flt_lo},
+    a32::OPC::vmov_stoa, 0x6 },  // cntpop [1680]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1671]
+    a32::OPC::movw, 0x6 },  // getfp [1681]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1672]
+    a32::OPC::add_regimm, 0xa },  // getfp [1682]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1673]
+    a32::OPC::movw, 0x6 },  // getfp [1683]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1674]
+    a32::OPC::add_regimm, 0xa },  // getfp [1684]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1675]
+    a32::OPC::movw, 0x6 },  // getfp [1685]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1676]
+    a32::OPC::add_regimm, 0xa },  // getfp [1686]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1677]
+    a32::OPC::movw, 0x6 },  // getfp [1687]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1678]
+    a32::OPC::add_regimm, 0xa },  // getfp [1688]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1679]
+    a32::OPC::movw, 0x6 },  // getfp [1689]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1680]
+    a32::OPC::add_regimm, 0xa },  // getfp [1690]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1681]
+    a32::OPC::movw, 0x6 },  // getfp [1691]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1682]
+    a32::OPC::add_regimm, 0xa },  // getfp [1692]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1683]
+    a32::OPC::movw, 0x6 },  // getfp [1693]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1684]
+    a32::OPC::add_regimm, 0xa },  // getfp [1694]
   { {+PRED::al, +PARAM::reg0, +PARAM::frame_size},
-    a32::OPC::movw, 0x6 },  // getfp [1685]
+    a32::OPC::movw, 0x6 },  // getfp [1695]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +PARAM::reg0, +SHIFT::lsl, 0},
-    a32::OPC::add_regimm, 0xa },  // getfp [1686]
+    a32::OPC::add_regimm, 0xa },  // getfp [1696]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1687]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1697]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1688]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1698]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1689]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1699]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1690]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1700]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1691]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1701]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1692]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1702]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1693]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1703]
   { {+PRED::al, +PARAM::reg0, +REG::sp, +SHIFT::lsl, 0},
-    a32::OPC::mov_regimm, 0x2 },  // getsp [1694]
+    a32::OPC::mov_regimm, 0x2 },  // getsp [1704]
 };
 
 const uint16_t kPatternJumper[256] = {
@@ -3547,46 +3567,46 @@ const uint16_t kPatternJumper[256] = {
  743 /* copysign */,  743 /* sqrt */,  743 /* --- */,  743 /* --- */, 
  743 /* sin */,  743 /* cos */,  743 /* tan */,  743 /* asin */, 
  743 /* acos */,  743 /* atan */,  743 /* exp */,  743 /* log */, 
- 743 /* cntlz */,  745 /* cnttz */,  747 /* cntpop */,  747 /* --- */, 
- 747 /* --- */,  747 /* --- */,  747 /* --- */,  747 /* --- */, 
- 747 /* --- */,  747 /* --- */,  747 /* --- */,  747 /* --- */, 
- 747 /* --- */,  747 /* --- */,  747 /* --- */,  747 /* --- */, 
- 747 /* nop */,  747 /* nop1 */,  747 /* --- */,  747 /* --- */, 
- 747 /* --- */,  747 /* --- */,  747 /* --- */,  747 /* line */, 
- 747 /* inline */,  747 /* getfp */,  755 /* getsp */,  763 /* gettp */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* bcopy */,  763 /* --- */,  763 /* bzero */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
- 763 /* --- */,  763 /* --- */,  763 /* --- */,  763 /* --- */, 
+ 743 /* cntlz */,  745 /* cnttz */,  747 /* cntpop */,  749 /* --- */, 
+ 749 /* --- */,  749 /* --- */,  749 /* --- */,  749 /* --- */, 
+ 749 /* --- */,  749 /* --- */,  749 /* --- */,  749 /* --- */, 
+ 749 /* --- */,  749 /* --- */,  749 /* --- */,  749 /* --- */, 
+ 749 /* nop */,  749 /* nop1 */,  749 /* --- */,  749 /* --- */, 
+ 749 /* --- */,  749 /* --- */,  749 /* --- */,  749 /* line */, 
+ 749 /* inline */,  749 /* getfp */,  757 /* getsp */,  765 /* gettp */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* bcopy */,  765 /* --- */,  765 /* bzero */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
+ 765 /* --- */,  765 /* --- */,  765 /* --- */,  765 /* --- */, 
 };
 
 const Pattern kPatterns[] = {
@@ -5831,54 +5851,60 @@ const Pattern kPatterns[] = {
   { {DK::S32, DK::S32},
     {IC::invalid, IC::invalid},
     &kInsTemplates[1668], 2 },  // cnttz [746]
+  { {DK::U32, DK::U32},
+    {IC::invalid, IC::invalid},
+    &kInsTemplates[1670], 5 },  // cntpop [747]
+  { {DK::S32, DK::S32},
+    {IC::invalid, IC::invalid},
+    &kInsTemplates[1675], 5 },  // cntpop [748]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1670], 2 },  // getfp [747]
+    &kInsTemplates[1680], 2 },  // getfp [749]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1672], 2 },  // getfp [748]
+    &kInsTemplates[1682], 2 },  // getfp [750]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1674], 2 },  // getfp [749]
+    &kInsTemplates[1684], 2 },  // getfp [751]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1676], 2 },  // getfp [750]
+    &kInsTemplates[1686], 2 },  // getfp [752]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1678], 2 },  // getfp [751]
+    &kInsTemplates[1688], 2 },  // getfp [753]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1680], 2 },  // getfp [752]
+    &kInsTemplates[1690], 2 },  // getfp [754]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1682], 2 },  // getfp [753]
+    &kInsTemplates[1692], 2 },  // getfp [755]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1684], 2 },  // getfp [754]
+    &kInsTemplates[1694], 2 },  // getfp [756]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1686], 1 },  // getsp [755]
+    &kInsTemplates[1696], 1 },  // getsp [757]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1687], 1 },  // getsp [756]
+    &kInsTemplates[1697], 1 },  // getsp [758]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1688], 1 },  // getsp [757]
+    &kInsTemplates[1698], 1 },  // getsp [759]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1689], 1 },  // getsp [758]
+    &kInsTemplates[1699], 1 },  // getsp [760]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1690], 1 },  // getsp [759]
+    &kInsTemplates[1700], 1 },  // getsp [761]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1691], 1 },  // getsp [760]
+    &kInsTemplates[1701], 1 },  // getsp [762]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1692], 1 },  // getsp [761]
+    &kInsTemplates[1702], 1 },  // getsp [763]
   { {DK::A32},
     {IC::invalid},
-    &kInsTemplates[1693], 1 },  // getsp [762]
+    &kInsTemplates[1703], 1 },  // getsp [764]
 };
 }  // namespace
 
@@ -5952,6 +5978,7 @@ const char* const PARAM_ToStringMap[] = {
     "stk1_offset2_lo", // 42
     "stk1_offset2_hi", // 43
     "frame_size", // 44
+    "scratch_flt_lo", // 45
 };
 const char* EnumToString(PARAM x) { return PARAM_ToStringMap[unsigned(x)]; }
 
@@ -6096,6 +6123,11 @@ int32_t ExtractParamOp(Ins ins, PARAM param, const EmitContext& ctx) {
                  CpuRegKind(ctx.scratch_cpu_reg) == +CPU_REG_KIND::FLT,
              "expected not gpr reg");
       return CpuRegNo(ctx.scratch_cpu_reg);
+    case PARAM::scratch_flt_lo:
+      // the single precision reg overlapping the low half of the double scratch
+      ASSERT(CpuRegKind(ctx.scratch_cpu_reg) == +CPU_REG_KIND::DBL,
+             "expected dbl reg");
+      return CpuRegNo(ctx.scratch_cpu_reg) * 2;
     case PARAM::frame_size:
       return ctx.FrameSize();
     case PARAM::ldm_regmask:
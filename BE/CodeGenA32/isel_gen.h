@@ -80,6 +80,7 @@ enum class PARAM : uint8_t {
     stk1_offset2_lo = 42,
     stk1_offset2_hi = 43,
     frame_size = 44,
+    scratch_flt_lo = 45,
 };
 /* @AUTOGEN-END@ */
 
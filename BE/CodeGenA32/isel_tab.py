@@ -6,7 +6,7 @@ See `ARM32.md` for more details.
 """
 
 import collections
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Tuple
 import enum
 
 from BE.Base import ir
@@ -105,6 +105,10 @@ def _InsAddNop1ForCodeSel(ins: ir.Ins, fun: ir.Fun) -> Optional[List[ir.Ins]]:
         # we know the result cannot be wider than 32bit for this CPU
         scratch = fun.GetScratchReg(o.DK.R32, "itof", False)
         return [ir.Ins(o.NOP1, [scratch]), ins]
+    elif opc is o.CNTPOP:
+        # vcnt operates on a whole double reg
+        scratch = fun.GetScratchReg(o.DK.R64, "popcnt", False)
+        return [ir.Ins(o.NOP1, [scratch]), ins]
     return [ins]
 
 
@@ -164,6 +168,7 @@ class PARAM(enum.Enum):
     stk1_offset2_lo = 42
     stk1_offset2_hi = 43
     frame_size = 44
+    scratch_flt_lo = 45
 
 
 def GetStackOffset(stk: ir.Stk, num: ir.Const) -> int:
@@ -214,6 +219,10 @@ def _ExtractTmplArgOp(ins: ir.Ins, arg: PARAM, ctx: regs.EmitContext) -> int:
     elif arg is PARAM.scratch_gpr:
         assert ctx.scratch_cpu_reg.kind is regs.CpuRegKind.GPR, f"{ctx.scratch_cpu_reg} not gpr"
         return ctx.scratch_cpu_reg.no
+    elif arg is PARAM.scratch_flt_lo:
+        # the single precision reg overlapping the low half of the double scratch
+        assert ctx.scratch_cpu_reg.kind is regs.CpuRegKind.DBL
+        return ctx.scratch_cpu_reg.no * 2
     elif arg is PARAM.stm_regmask:
         return ctx.stm_regs
     elif arg is PARAM.ldm_regmask:
@@ -292,7 +301,6 @@ def _HandleReloc(armins: arm.Ins, pos: int, ins: ir.Ins, op: PARAM):
     if op in {PARAM.mem1_num2_lo16, PARAM.mem1_num2_hi16}:
         mem = ins.operands[1]
         assert isinstance(mem, ir.Mem), f"{ins} {mem}"
-        assert mem.kind is not o.MEM_KIND.EXTERN, f"undefined fun: {mem.name}"
         num = ins.operands[2]
         assert isinstance(num, ir.Const), f"{ins} {num}"
         assert armins.operands[pos] == 0
@@ -318,12 +326,20 @@ def _HandleReloc(armins: arm.Ins, pos: int, ins: ir.Ins, op: PARAM):
         armins.reloc_kind = enum_tab.RELOC_TYPE_ARM.CALL
         fun = ins.operands[0]
         assert isinstance(fun, ir.Fun), f"{ins} {fun}"
-        assert fun.kind is not o.FUN_KIND.EXTERN, f"undefined fun: {fun.name}"
         armins.set_reloc(_OP_TO_RELOC_KIND[op], False, pos, fun.name)
     else:
         assert False
 
 
+# How InsTmpl fills in an operand that depends on the IR instruction, see InsTmpl._fillers
+_FILL_REG = 0  # cpu reg number of the IR operand at the given index
+_FILL_NUM = 1  # value of the IR const operand at the given index
+_FILL_PARAM = 2  # anything else is handled by _ExtractTmplArgOp
+
+_REG_PARAMS = {PARAM.reg0, PARAM.reg1, PARAM.reg2, PARAM.reg3, PARAM.reg4}
+_NUM_PARAMS = {PARAM.num0, PARAM.num1, PARAM.num2, PARAM.num3, PARAM.num4}
+
+
 class InsTmpl:
     """Represents a template for an A32 instructions
 
@@ -346,20 +362,50 @@ class InsTmpl:
                 f"unknown op {op} for {opcode.name} {args}")
         self.opcode = opcode
         self.args: List[Any] = args
+        # The compiled form of args used by MakeInsFromTmpl:
+        # operands not depending on the IR instruction are encoded once here,
+        # the others are described by (pos, _FILL_XXX, IR operand index or PARAM, encoder)
+        # and relocations by (pos, PARAM)
+        self._operands: List[int] = []
+        self._fillers: List[Tuple[int, int, Any, Any]] = []
+        self._relocs: List[Tuple[int, PARAM]] = []
+        for n, arg in enumerate(args):
+            enc = _RAW_ENOCDER.get(opcode.fields[n])
+            if not isinstance(arg, PARAM):
+                val = _TranslateTmplOpInt(None, arg, None)
+                self._operands.append(enc(val) if enc else val)
+                continue
+            if arg in _OP_TO_RELOC_KIND:
+                # the value is filled in by _HandleReloc if needed
+                self._operands.append(enc(0) if enc else 0)
+                self._relocs.append((n, arg))
+                continue
+            # placeholder, not necessarily encodable
+            self._operands.append(0)
+            if arg in _REG_PARAMS:
+                self._fillers.append((n, _FILL_REG, arg.value - PARAM.reg0.value, enc))
+            elif arg in _NUM_PARAMS:
+                self._fillers.append((n, _FILL_NUM, arg.value - PARAM.num0.value, enc))
+            else:
+                self._fillers.append((n, _FILL_PARAM, arg, enc))
 
     def MakeInsFromTmpl(self, ins: Optional[ir.Ins], ctx: regs.EmitContext) -> arm.Ins:
-        out = arm.Ins(self.opcode)
+        operands = self._operands.copy()
         # if ins: print (f"{ins} {ins.operands}")
-        for n, arg in enumerate(self.args):
-            val = _TranslateTmplOpInt(ins, arg, ctx)
-            enc = _RAW_ENOCDER.get(self.opcode.fields[n])
+        for pos, fill, arg, enc in self._fillers:
+            if fill == _FILL_REG:
+                val = ins.operands[arg].cpu_reg.no
+            elif fill == _FILL_NUM:
+                val = ins.operands[arg].value
+            else:
+                val = _ExtractTmplArgOp(ins, arg, ctx)
             if enc:
                 val = enc(val)
             assert val is not None
-            out.operands.append(val)
-            # note: this may alter the value we just appended
-            if arg in _OP_TO_RELOC_KIND:
-                _HandleReloc(out, n, ins, arg)
+            operands[pos] = val
+        out = arm.Ins(self.opcode, operands)
+        for pos, arg in self._relocs:
+            _HandleReloc(out, pos, ins, arg)
         return out
 
 
@@ -435,6 +481,9 @@ class Pattern:
     """
     # groups all the patterns for a given opcode number together
     Table: Dict[int, List["Pattern"]] = collections.defaultdict(list)
+    # maps an opcode number plus operand shapes (see _OperandShape) to the
+    # patterns which can possibly match. Filled lazily by _CandidatePatterns.
+    Candidates: Dict[Tuple[int, Tuple], List["Pattern"]] = {}
 
     def __init__(self, opcode: o.Opcode, type_curbs: List[o.DK],
                  emit: List[InsTmpl],
@@ -468,6 +517,24 @@ class Pattern:
 
         # we put all the patterns for given IR opcode into the same bucket
         Pattern.Table[opcode.no].append(self)
+        Pattern.Candidates.clear()
+
+    def MatchesShape(self, shapes: Tuple) -> bool:
+        """Like MatchesTypeConstraints but also rejects regs where an immediate is needed
+
+        shapes are the _OperandShape()s of the instruction operands
+        """
+        for type_constr, imm_constr, shape in zip(self.type_curbs, self.imm_curbs, shapes):
+            if type_constr is o.DK.INVALID:
+                continue
+            assert shape is not None
+            kind, is_const = shape
+            if kind != type_constr:
+                return False
+            if not is_const and imm_constr is not IMM_CURB.invalid:
+                # have a reg but need a const
+                return False
+        return True
 
     def MatchesTypeConstraints(self, ins: ir.Ins) -> bool:
         for type_constr, op in zip(self.type_curbs, ins.operands):
@@ -708,6 +775,13 @@ def InitAlu():
         Pattern(o.CNTTZ, [kind1] * 2,
                 [InsTmpl("rbit", [PARAM.reg0, PARAM.reg1]),
                  InsTmpl("clz", [PARAM.reg0, PARAM.reg0])])
+        # count the bits of each byte and then sum up the bytes of the low word
+        Pattern(o.CNTPOP, [kind1] * 2,
+                [InsTmpl("vmov_atos", [PARAM.scratch_flt_lo, PARAM.reg1]),
+                 InsTmpl("vcnt_8", [PARAM.scratch_flt, PARAM.scratch_flt], pred=None),
+                 InsTmpl("vpaddl_u8", [PARAM.scratch_flt, PARAM.scratch_flt], pred=None),
+                 InsTmpl("vpaddl_u16", [PARAM.scratch_flt, PARAM.scratch_flt], pred=None),
+                 InsTmpl("vmov_stoa", [PARAM.reg0, PARAM.scratch_flt_lo])])
 
     for opc, kind1, shift_dir in [(o.SHL, o.DK.U32, arm.SHIFT.lsl),
                                   (o.SHL, o.DK.S32, arm.SHIFT.lsl),
@@ -1147,16 +1221,38 @@ InitConv()
 InitVFP()
 
 
+def _OperandShape(op) -> Optional[Tuple[o.DK, bool]]:
+    """Returns the properties of an operand that pattern matching depends on,
+    except for immediate values
+
+    The second component indicates whether the operand is a const
+    """
+    if isinstance(op, ir.Reg):
+        return op.kind, False
+    elif isinstance(op, ir.Const):
+        return op.kind, True
+    return None
+
+
+def _CandidatePatterns(ins: ir.Ins) -> List[Pattern]:
+    key = (ins.opcode.no, tuple([_OperandShape(op) for op in ins.operands]))
+    patterns = Pattern.Candidates.get(key)
+    if patterns is None:
+        patterns = [p for p in Pattern.Table[ins.opcode.no] if p.MatchesShape(key[1])]
+        Pattern.Candidates[key] = patterns
+    return patterns
+
+
 def FindMatchingPattern(ins: ir.Ins) -> Optional[Pattern]:
     """Returns the best pattern matching `ins` or None
 
     This can only be called AFTER the stack has been finalized
     """
-    patterns = Pattern.Table[ins.opcode.no]
+    patterns = _CandidatePatterns(ins)
     # print(f"@ {ins} {ins.operands}")
     for p in patterns:
         # print(f"@trying pattern {p}")
-        if p.MatchesTypeConstraints(ins) and 0 == p.MatchesImmConstraints(ins, False):
+        if 0 == p.MatchesImmConstraints(ins, False):
             return p
     else:
         # assert False, f"Could not find a matching patterns for {ins}. tried:\n{patterns}"
@@ -1171,10 +1267,7 @@ def FindtImmediateMismatchesInBestMatchPattern(ins: ir.Ins,
     """
     best = MATCH_IMPOSSIBLE
     best_num_bits = bin(best).count('1')
-    patterns = Pattern.Table[ins.opcode.no]
-    for p in patterns:
-        if not p.MatchesTypeConstraints(ins):
-            continue
+    for p in _CandidatePatterns(ins):
         mismatches = p.MatchesImmConstraints(ins, assume_stk_op_matches)
         if mismatches == 0:
             return 0
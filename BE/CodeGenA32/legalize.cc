@@ -57,6 +57,13 @@ void FunAddNop1ForCodeSel(Fun fun, std::vector<Ins>* inss) {
           inss->push_back(ins);
           dirty = true;
           break;
+        case OPC::CNTPOP:
+          // vcnt operates on a whole double reg
+          tmp = FunGetScratchReg(fun, DK::R64, "popcnt", false);
+          inss->push_back(InsNew(OPC::NOP1, tmp));
+          inss->push_back(ins);
+          dirty = true;
+          break;
         case OPC::CONV:
           if (Kind(InsOperand(ins, 1)) == RefKind::REG) {
             DK src_kind = RegKind(Reg(InsOperand(ins, 1)));
@@ -231,8 +238,9 @@ void PhaseLegalization(Fun fun, Unit unit, std::ostream* fout) {
   FunPushargConversion(fun, *PushPopInterfaceA32);
   FunPopargConversion(fun, *PushPopInterfaceA32);
 
+  // ARM is missing instructions for: mod
+  // (cntpop is handled by NEON in the isel)
   FunEliminateRem(fun, &inss);
-  FunEliminateCntPop(fun, &inss);
 
   FunEliminateStkLoadStoreWithRegOffset(fun, DK::A32, DK::S32, &inss);
 
@@ -250,9 +250,9 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
     lowering.FunPushargConversion(fun, regs.PushPopInterface)
     lowering.FunPopargConversion(fun, regs.PushPopInterface)
 
-    # ARM is missing instructions for: mod, cntpop
+    # ARM is missing instructions for: mod
+    # (cntpop is handled by NEON in the isel)
     lowering.FunEliminateRem(fun)
-    lowering.FunEliminateCntPop(fun)
 
     # A32 has not support for base + reg + offset but a stack access implicitly
     # requires base (=sp) + offset, so we have to rewrite
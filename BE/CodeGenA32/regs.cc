@@ -2,6 +2,7 @@
 
 #include <algorithm>
 
+#include "BE/Base/cfg.h"
 #include "BE/Base/reg_alloc.h"
 #include "BE/Base/serialize.h"
 #include "BE/CodeGenA32/isel_gen.h"
@@ -444,6 +445,8 @@ void AssignCpuRegOrMarkForSpilling(const std::vector<Reg>& regs,
   }
 }
 
+const EmitContext FRAMELESS_EMIT_CONTEXT{0, 0, 0, 0};
+
 EmitContext FunComputeEmitContext(Fun fun) {
   CpuRegMasks masks = FunCpuRegStats(fun);
   const bool must_save_link_reg =
@@ -462,6 +465,13 @@ EmitContext FunComputeEmitContext(Fun fun) {
   stk_size = (stk_size + 15) / 16 * 16;
   stk_size -= 4 * num_saved_regs;
   out.stk_size = stk_size;
+  auto is_saved_cpu_reg = [&out](CpuReg cpu_reg) {
+    const uint32_t mask = CpuRegKind(cpu_reg) == +CPU_REG_KIND::GPR
+                              ? out.stm_regs
+                              : out.vstm_regs;
+    return (mask & A32RegToAllocMask(cpu_reg)) != 0;
+  };
+  out.prolog_bbl = FunShrinkWrap(fun, is_saved_cpu_reg, &out.frameless_bbls);
   return out;
 }
 
@@ -3,9 +3,10 @@
 import operator
 import dataclasses
 import functools
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 import enum
 
+from BE.Base import cfg
 from BE.Base import ir
 from BE.Base import liveness
 from BE.Base import lowering
@@ -82,6 +83,7 @@ _PC_REG_MASK = A32RegToAllocMask(PC_REG)
 
 FLT_REGS_MASK = 0xffffffff
 FLT_LAC_REGS_MASK = 0xffff0000
+_EVEN_BITS_MASK = 0x55555555  # bit 2n of this marks the dbl reg n in a flt mask
 
 GPR_PARAMETER_REGS = GPR_REGS[0:6]
 FLT_PARAMETER_REGS = FLT_REGS[0:16]
@@ -224,27 +226,26 @@ class CpuRegPool(reg_alloc.RegPool):
         available = self.get_available(lac, is_gpr)
         # print(f"GET {lr} {self}  avail:{available:x}")
         if lr.reg.kind == o.DK.R64:
-            for n in range(len(DBL_REGS)):
-                mask = 3 << (n * 2)  # two adjacent bit at an even bit pos
-                if available & mask == mask:
-                    if (not self._flt_reserved[n * 2 + 0].has_conflict(lr) and
-                            not self._flt_reserved[n * 2 + 1].has_conflict(lr)):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return DBL_REGS[n]
+            # two adjacent bits at an even bit pos
+            pairs = available & (available >> 1) & _EVEN_BITS_MASK
+            while pairs:
+                lowest = pairs & -pairs
+                pairs ^= lowest
+                n = (lowest.bit_length() - 1) // 2
+                if (not self._flt_reserved[n * 2 + 0].has_conflict(lr) and
+                        not self._flt_reserved[n * 2 + 1].has_conflict(lr)):
+                    self.set_available(lac, is_gpr, available & ~(3 << (n * 2)))
+                    return DBL_REGS[n]
         elif lr.reg.kind == o.DK.R32:
-            for n in range(len(FLT_REGS)):
-                mask = 1 << n
-                if available & mask == mask:
-                    if not self._flt_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return FLT_REGS[n]
+            n = reg_alloc.FindUnreservedReg(available, self._flt_reserved, lr)
+            if n >= 0:
+                self.set_available(lac, is_gpr, available & ~(1 << n))
+                return FLT_REGS[n]
         else:
-            for n in range(len(GPR_REGS)):
-                mask = 1 << n
-                if mask & available == mask:
-                    if not self._gpr_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return GPR_REGS[n]
+            n = reg_alloc.FindUnreservedReg(available, self._gpr_reserved, lr)
+            if n >= 0:
+                self.set_available(lac, is_gpr, available & ~(1 << n))
+                return GPR_REGS[n]
         if self._allow_spilling:
             return ir.CPU_REG_SPILL
         print("@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@")
@@ -477,6 +478,10 @@ class EmitContext:
     vstm_regs: int = 0
     stk_size: int = 0
     scratch_cpu_reg: ir.CpuReg = ir.CPU_REG_INVALID
+    # shrink-wrapping: emit the prolog at the start of this bbl instead of the fun entry
+    prolog_bbl: Optional[ir.Bbl] = None
+    # names of the bbls executed without a frame, their RETs do not need an epilog
+    frameless_bbls: Set[str] = dataclasses.field(default_factory=set)
 
     def FrameSize(self):
         # TODO: make sure stack is 8 byte aligned.
@@ -524,4 +529,14 @@ def FunComputeEmitContext(fun: ir.Fun) -> EmitContext:
     stk_size = (stk_size + 15) // 16 * 16
     stk_size -= 4 * num_saved_regs
     ctx.stk_size = stk_size
+
+    def is_saved_cpu_reg(cpu_reg: ir.CpuReg) -> bool:
+        mask = ctx.stm_regs if cpu_reg.kind == CpuRegKind.GPR else ctx.vstm_regs
+        return (mask & A32RegToAllocMask(cpu_reg)) != 0
+
+    ctx.prolog_bbl, ctx.frameless_bbls = cfg.FunShrinkWrap(fun, is_saved_cpu_reg)
     return ctx
+
+
+# the context for bbls without a frame, i.e. plain returns
+FRAMELESS_EMIT_CONTEXT = EmitContext()
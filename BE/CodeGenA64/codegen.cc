@@ -64,15 +64,20 @@ void FunCodeGen(Fun fun, std::ostream* output) {
   };
 
   EmitContext ctx = FunComputeEmitContext(fun);
-  EmitFunProlog(ctx, &inss);
-  drain();
+  if (ctx.prolog_bbl.isnull()) {
+    EmitFunProlog(ctx, &inss);
+    drain();
+  }
   for (Bbl bbl : FunBblIter(fun)) {
     *output << ".bbl " << Name(bbl) << " 4\n";
+    if (bbl == ctx.prolog_bbl) EmitFunProlog(ctx, &inss);
     for (Ins ins : BblInsIter(bbl)) {
       if (InsOPC(ins) == OPC::NOP1) {
         ctx.scratch_cpu_reg = CpuReg(RegCpuReg(Reg(InsOperand(ins, 0))));
       } else if (InsOPC(ins) == OPC::RET) {
-        EmitFunEpilog(ctx, &inss);
+        const EmitContext& epilog_ctx =
+            ctx.frameless_bbls.count(bbl) > 0 ? FRAMELESS_EMIT_CONTEXT : ctx;
+        EmitFunEpilog(epilog_ctx, &inss);
       } else {
         const Pattern* pat = FindMatchingPattern(ins);
         ASSERT(pat != nullptr, "");
@@ -188,17 +193,22 @@ a64::A64Unit EmitUnitAsBinary(base::Unit unit) {
       out.MemEnd();
     }
     EmitContext ctx = FunComputeEmitContext(fun);
-    EmitFunProlog(ctx, &inss);
-    drain();
+    if (ctx.prolog_bbl.isnull()) {
+      EmitFunProlog(ctx, &inss);
+      drain();
+    }
     for (Bbl bbl : FunBblIter(fun)) {
       out.AddLabel(StrData(Name(bbl)), 4, padding_nop);
+      if (bbl == ctx.prolog_bbl) EmitFunProlog(ctx, &inss);
       for (Ins ins : BblInsIter(bbl)) {
         if (InsOPC(ins) == OPC::NOP1) {
           ctx.scratch_cpu_reg = CpuReg(RegCpuReg(Reg(InsOperand(ins, 0))));
         } else if (InsOPC(ins) == OPC::LINE) {
           // TODO
         } else if (InsOPC(ins) == OPC::RET) {
-          EmitFunEpilog(ctx, &inss);
+          const EmitContext& epilog_ctx =
+              ctx.frameless_bbls.count(bbl) > 0 ? FRAMELESS_EMIT_CONTEXT : ctx;
+          EmitFunEpilog(epilog_ctx, &inss);
         } else {
           const Pattern* pat = FindMatchingPattern(ins);
           ASSERT(pat != nullptr, "could not find matching pattern for "
@@ -7,7 +7,7 @@ See `README.md` for more details.
 import os
 import stat
 import collections
-from typing import List, Dict
+from typing import List, Dict, Any
 
 from BE.Base import cfg
 from BE.Base import ir
@@ -25,12 +25,15 @@ from BE.CodeGenA64 import legalize
 
 from BE.Elf import enum_tab
 from BE.Elf import elf_unit
+from BE.Elf import linker
 
 
-def LegalizeAll(unit, opt_stats, fout, verbose=False):
+def LegalizeAll(unit, opt_stats, fout, verbose=False, remove_unreachable=True):
+    """`remove_unreachable` must be False for units compiled into object files
+    where every global fun may be referenced by another object"""
     seeds = [f for f in [unit.fun_syms.get("_start"),
                          unit.fun_syms.get("main")] if f]
-    if seeds:
+    if seeds and remove_unreachable:
         cfg.UnitRemoveUnreachableCode(unit, seeds)
     for fun in unit.funs:
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
@@ -111,6 +114,11 @@ def _SimplifyCpuIns(cpu_ins: a64.Ins) -> bool:
     return True
 
 
+def _RenderLine(ins: ir.Ins) -> str:
+    filename, line = ins.operands
+    return f"    .line {serialize.RenderOperand(filename, o.TC.INVALID)} {line.value}"
+
+
 def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
     assert ir.FUN_FLAG.STACK_FINALIZED in fun.flags
     assert fun.stk_size >= 0, f"did you call FinalizeStk?"
@@ -123,18 +131,25 @@ def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
         yield from _JtbCodeGen(jtb)
 
     ctx = regs.FunComputeEmitContext(fun)
-    for tmpl in isel_tab.EmitFunProlog(ctx):
-        yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
+    if ctx.prolog_bbl is None:
+        for tmpl in isel_tab.EmitFunProlog(ctx):
+            yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
 
     for bbl in fun.bbls:
         live_out = sorted([r.name for r in bbl.live_out])
         yield f".bbl {bbl.name} 4"
+        if bbl is ctx.prolog_bbl:
+            for tmpl in isel_tab.EmitFunProlog(ctx):
+                yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
         for ins in bbl.inss:
             if ins.opcode is o.NOP1:
                 isel_tab.HandlePseudoNop1(ins, ctx)
+            elif ins.opcode is o.LINE:
+                yield _RenderLine(ins)
             elif ins.opcode is o.RET:
-                for tmpl in isel_tab.EmitFunEpilog(ctx):
-                    yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
+                epilog_ctx = regs.FRAMELESS_EMIT_CONTEXT if bbl.name in ctx.frameless_bbls else ctx
+                for tmpl in isel_tab.EmitFunEpilog(epilog_ctx):
+                    yield _RenderIns(tmpl.MakeInsFromTmpl(None, epilog_ctx))
 
             else:
                 pattern = isel_tab.FindMatchingPattern(ins)
@@ -195,14 +210,25 @@ def codegen(unit: ir.Unit) -> Unit:
 # binary emitter
 ############################################################
 
-def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
+def EmitUnitAsBinary(unit: ir.Unit, loop_alignment: int = 0,
+                     loop_alignment_budget: int = 10) -> elf_unit.Unit:
+    """Encodes the unit
+
+    If `loop_alignment` is non-zero, loop headers are padded with nops to start at a
+    multiple of it, spending at most `loop_alignment_budget` percent of a fun's size
+    on this padding.
+    """
+    assert loop_alignment % 4 == 0, f"bad loop alignment {loop_alignment}"
     elfunit = elf_unit.Unit()
     for mem in unit.mems:
-        assert mem.kind != o.MEM_KIND.EXTERN, f"undefined symbol: {mem}"
-        if mem.kind == o.MEM_KIND.BUILTIN:
+        # EXTERN mems (and funs) are left to the linker
+        if mem.kind in {o.MEM_KIND.BUILTIN, o.MEM_KIND.EXTERN}:
             continue
-        elfunit.MemStart(mem.name, mem.alignment,
-                         _MEMKIND_TO_SECTION[mem.kind], False)
+        sym = elfunit.MemStart(mem.name, mem.alignment,
+                               _MEMKIND_TO_SECTION[mem.kind], False)
+        if mem.name.startswith(ir.CONST_MEM_PREFIX):
+            # other objects may contain the same const
+            sym.st_bind = enum_tab.ST_INFO_BIND.WEAK
         for d in mem.datas:
             if isinstance(d, ir.DataBytes):
                 elfunit.AddData(d.count, d.data)
@@ -218,6 +244,8 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
 
     sec_text = elfunit.sec_text
     for fun in unit.funs:
+        if fun.kind in {o.FUN_KIND.SIGNATURE, o.FUN_KIND.EXTERN}:
+            continue
         elfunit.FunStart(fun.name, 16, assembler.NOP_BYTES)
         for jtb in fun.jtbs:
             elfunit.MemStart(jtb.name, 8, "rodata", True)
@@ -227,22 +255,30 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
                     enum_tab.RELOC_TYPE_AARCH64.ABS64, 8, bbl.name)
             elfunit.MemEnd()
         ctx = regs.FunComputeEmitContext(fun)
+        # labels (str) interleaved with cpu instructions so that
+        # the label alignment can be decided before anything is encoded
+        code: List[Any] = []
+        # position in code -> LINE ins
+        lines: Dict[int, ir.Ins] = {}
 
-        for tmpl in isel_tab.EmitFunProlog(ctx):
-            assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
+        if ctx.prolog_bbl is None:
+            for tmpl in isel_tab.EmitFunProlog(ctx):
+                code.append(tmpl.MakeInsFromTmpl(None, ctx))
 
         for bbl in fun.bbls:
-            elfunit.AddLabel(bbl.name, 4, assembler.NOP_BYTES)
+            code.append(bbl.name)
+            if bbl is ctx.prolog_bbl:
+                for tmpl in isel_tab.EmitFunProlog(ctx):
+                    code.append(tmpl.MakeInsFromTmpl(None, ctx))
             for ins in bbl.inss:
                 if ins.opcode is o.NOP1:
                     isel_tab.HandlePseudoNop1(ins, ctx)
                 elif ins.opcode is o.LINE:
-                    # TODO
-                    pass
+                    lines[len(code)] = ins
                 elif ins.opcode is o.RET:
-                    for tmpl in isel_tab.EmitFunEpilog(ctx):
-                        assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(None, ctx))
+                    epilog_ctx = regs.FRAMELESS_EMIT_CONTEXT if bbl.name in ctx.frameless_bbls else ctx
+                    for tmpl in isel_tab.EmitFunEpilog(epilog_ctx):
+                        code.append(tmpl.MakeInsFromTmpl(None, epilog_ctx))
 
                 else:
                     pattern = isel_tab.FindMatchingPattern(ins)
@@ -260,7 +296,23 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
                     for tmpl in pattern.emit:
                         cpu_ins = tmpl.MakeInsFromTmpl(ins, ctx)
                         if _SimplifyCpuIns(cpu_ins):
-                            assembler.AddIns(elfunit, cpu_ins)
+                            code.append(cpu_ins)
+
+        alignments: Dict[str, int] = {}
+        if loop_alignment:
+            alignments = {bbl.name: loop_alignment
+                          for bbl in cfg.FunLoopHeadersByLayout(fun)}
+            budget = 4 * sum(1 for ins in code if not isinstance(ins, str)) * \
+                loop_alignment_budget // 100
+            assembler.AlignLabels(code, len(sec_text.data), alignments, budget)
+        for n, item in enumerate(code):
+            if n in lines:
+                filename, line = lines[n].operands
+                elfunit.AddLine(str(filename, "utf-8"), line.value)
+            if isinstance(item, str):
+                elfunit.AddLabel(item, alignments.get(item, 4), assembler.NOP_BYTES)
+            else:
+                assembler.AddIns(elfunit, item)
         elfunit.FunEnd()
     elfunit.AddLinkerDefs()
     return elfunit
@@ -270,12 +322,18 @@ if __name__ == "__main__":
     import sys
     import argparse
 
-    _ALLOWED_MODES = {"normal", "binary", "legalize", "reg_alloc_global",
+    _ALLOWED_MODES = {"normal", "binary", "object", "legalize", "reg_alloc_global",
                       "reg_alloc_local"}
 
     def main():
         parser = argparse.ArgumentParser(description='CodeGenA64')
         parser.add_argument('-mode', type=str, help='mode')
+        parser.add_argument('-loop_alignment', type=int, default=0,
+                            help='align loop headers to this many bytes (binary mode only)')
+        parser.add_argument('-loop_alignment_budget', type=int, default=10,
+                            help='max padding for loop alignment in percent of fun size')
+        parser.add_argument('-runtime', type=str, default="",
+                            help='precompiled runtime object to link with (binary mode only)')
         parser.add_argument('input', type=str, help='input file')
         parser.add_argument('output', type=str, help='output file')
         args = parser.parse_args()
@@ -286,15 +344,24 @@ if __name__ == "__main__":
         unit = serialize.UnitParseFromAsm(fin)
         opt_stats: Dict[str, int] = collections.defaultdict(int)
 
-        if args.mode == "binary":
+        if args.mode in {"binary", "object"}:
             # we need to legalize all functions first as this may change the signature
             # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-            LegalizeAll(unit, opt_stats, None)
+            LegalizeAll(unit, opt_stats, None,
+                        remove_unreachable=args.mode != "object")
             RegAllocGlobal(unit, opt_stats, None)
             RegAllocLocal(unit, opt_stats, None)
-            armunit = EmitUnitAsBinary(unit)
+            armunit = EmitUnitAsBinary(unit, args.loop_alignment,
+                                       args.loop_alignment_budget)
+            if args.mode == "object":
+                elf_unit.UnitSaveAsObject(armunit, enum_tab.E_MACHINE.AARCH64,
+                                          open(args.output, "wb"))
+                return
+            if args.runtime:
+                armunit = linker.LinkWithRuntime(armunit, args.runtime,
+                                                 enum_tab.E_MACHINE.AARCH64)
             exe = assembler.Assemble(armunit, True)
-            exe.save(open(args.output, "wb"))
+            exe.save_to_path(args.output)
             os.chmod(args.output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
             return
 
@@ -7,7 +7,7 @@ See `ARM32.md` for more details.
 
 import collections
 import enum
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Tuple
 
 from BE.Base import ir
 from BE.Base import opcode_tab as o
@@ -247,12 +247,10 @@ def _HandleReloc(cpuins: a64.Ins, pos: int, ins: ir.Ins, op: PARAM):
     elif op is PARAM.fun0:
         fun = ins.operands[0]
         assert isinstance(fun, ir.Fun), f"{ins} {fun}"
-        assert fun.kind is not o.FUN_KIND.EXTERN, f"undefined fun: {fun.name}"
         cpuins.set_reloc(_OP_TO_RELOC_KIND[op], False, pos, fun.name)
     elif op in {PARAM.mem1_num2_prel_hi21, PARAM.mem1_num2_lo12}:
         mem = ins.operands[1]
         assert isinstance(mem, ir.Mem), f"{ins} {mem}"
-        assert mem.kind is not o.MEM_KIND.EXTERN, f"undefined fun: {mem.name}"
         num = ins.operands[2]
         assert isinstance(num, ir.Const), f"{ins} {num}"
         assert cpuins.operands[pos] == 0
@@ -261,7 +259,6 @@ def _HandleReloc(cpuins: a64.Ins, pos: int, ins: ir.Ins, op: PARAM):
     elif op in {PARAM.fun1_prel_hi21, PARAM.fun1_lo12}:
         fun = ins.operands[1]
         assert isinstance(fun, ir.Fun), f"{ins} {fun}"
-        assert fun.kind is not o.FUN_KIND.EXTERN, f"undefined fun: {fun.name}"
         cpuins.set_reloc(_OP_TO_RELOC_KIND[op], False, pos, fun.name)
     elif op in {PARAM.jtb1_prel_hi21, PARAM.jtb1_lo12}:
         jtb = ins.operands[1]
@@ -271,6 +268,15 @@ def _HandleReloc(cpuins: a64.Ins, pos: int, ins: ir.Ins, op: PARAM):
         assert False
 
 
+# How InsTmpl fills in an operand that depends on the IR instruction, see InsTmpl._fillers
+_FILL_REG = 0  # cpu reg number of the IR operand at the given index
+_FILL_NUM = 1  # value of the IR const operand at the given index
+_FILL_PARAM = 2  # anything else is handled by _ExtractTmplArgOp
+
+_REG_PARAMS = {PARAM.reg0, PARAM.reg1, PARAM.reg2, PARAM.reg3, PARAM.reg4}
+_NUM_PARAMS = {PARAM.num0, PARAM.num1, PARAM.num2, PARAM.num3, PARAM.num4}
+
+
 class InsTmpl:
     """Represents a template for an A32 instruction
 
@@ -291,26 +297,49 @@ class InsTmpl:
                 f"unknown op {op} for {opcode.name} {args}")
         self.opcode = opcode
         self.args: List[Any] = args
-
-    def MakeInsFromTmpl(self, ins: Optional[ir.Ins], ctx: regs.EmitContext) -> a64.Ins:
-        out = a64.Ins(self.opcode)
-        for n, arg in enumerate(self.args):
+        # The compiled form of args used by MakeInsFromTmpl:
+        # operands not depending on the IR instruction are encoded once here,
+        # the others are described by (pos, _FILL_XXX, IR operand index or PARAM)
+        # and relocations by (pos, PARAM)
+        self._operands: List[int] = []
+        self._fillers: List[Tuple[int, int, Any]] = []
+        self._relocs: List[Tuple[int, PARAM]] = []
+        for n, arg in enumerate(args):
             if type(arg) == int:
                 val = arg
-            elif isinstance(arg, PARAM):
-                val = _ExtractTmplArgOp(ins, arg, ctx)
-            elif isinstance(arg, FIXARG):
-                val = arg.value
-            elif isinstance(arg, a64.SHIFT):
+            elif isinstance(arg, (FIXARG, a64.SHIFT)):
                 val = arg.value
+            elif arg in _OP_TO_RELOC_KIND:
+                # the value is filled in by _HandleReloc if needed
+                val = 0
+                self._relocs.append((n, arg))
             else:
-                assert False, f"unknown param {repr(arg)}"
+                # placeholder, not necessarily encodable
+                self._operands.append(0)
+                if arg in _REG_PARAMS:
+                    self._fillers.append((n, _FILL_REG, arg.value - PARAM.reg0.value))
+                elif arg in _NUM_PARAMS:
+                    self._fillers.append((n, _FILL_NUM, arg.value - PARAM.num0.value))
+                else:
+                    self._fillers.append((n, _FILL_PARAM, arg))
+                continue
+            self._operands.append(a64.EncodeOperand(opcode.fields[n], val))
 
-            assert val is not None
-            out.operands.append(a64.EncodeOperand(self.opcode.fields[n], val))
-            # note: this may alter the value we just appended
-            if arg in _OP_TO_RELOC_KIND:
-                _HandleReloc(out, n, ins, arg)
+    def MakeInsFromTmpl(self, ins: Optional[ir.Ins], ctx: regs.EmitContext) -> a64.Ins:
+        operands = self._operands.copy()
+        for pos, fill, arg in self._fillers:
+            if fill == _FILL_REG:
+                # reg fields need no encoding
+                operands[pos] = ins.operands[arg].cpu_reg.no
+                continue
+            elif fill == _FILL_NUM:
+                val = ins.operands[arg].value
+            else:
+                val = _ExtractTmplArgOp(ins, arg, ctx)
+            operands[pos] = a64.EncodeOperand(self.opcode.fields[pos], val)
+        out = a64.Ins(self.opcode, operands)
+        for pos, arg in self._relocs:
+            _HandleReloc(out, pos, ins, arg)
         return out
 
 
@@ -342,6 +371,9 @@ class Pattern:
     """
     # groups all the patterns for a given opcode number together
     Table: Dict[int, List["Pattern"]] = collections.defaultdict(list)
+    # maps an opcode number plus operand shapes (see _OperandShape) to the
+    # patterns which can possibly match. Filled lazily by _CandidatePatterns.
+    Candidates: Dict[Tuple[int, Tuple], List["Pattern"]] = {}
 
     def __init__(self, opcode: o.Opcode, type_constraints: List[o.DK],
                  emit: List[InsTmpl],
@@ -376,6 +408,24 @@ class Pattern:
 
         # we put all the patterns for given IR opcode into the same bucket
         Pattern.Table[opcode.no].append(self)
+        Pattern.Candidates.clear()
+
+    def MatchesShape(self, shapes: Tuple) -> bool:
+        """Like MatchesTypeCurbs but also rejects regs where an immediate is needed
+
+        shapes are the _OperandShape()s of the instruction operands
+        """
+        for type_constr, imm_constr, shape in zip(self.type_constraints, self.imm_curbs, shapes):
+            if type_constr is o.DK.INVALID:
+                continue
+            assert shape is not None
+            kind, is_const = shape
+            if kind != type_constr:
+                return False
+            if not is_const and imm_constr is not IMM_CURB.INVALID:
+                # have a reg but need a const
+                return False
+        return True
 
     def MatchesTypeCurbs(self, ins: ir.Ins) -> bool:
         for type_constr, op in zip(self.type_constraints, ins.operands):
@@ -1306,13 +1356,40 @@ InitConv()
 InitVFP()
 
 
+def _OperandShape(op) -> Optional[Tuple[o.DK, bool]]:
+    """Returns the properties of an operand that pattern matching depends on,
+    except for immediate values
+
+    The second component indicates whether the operand is a const
+    """
+    if isinstance(op, ir.Reg):
+        return op.kind, False
+    elif isinstance(op, ir.Const):
+        return op.kind, True
+    return None
+
+
+def _CandidatePatterns(ins: ir.Ins) -> List[Pattern]:
+    key = (ins.opcode.no, tuple([_OperandShape(op) for op in ins.operands]))
+    patterns = Pattern.Candidates.get(key)
+    if patterns is None:
+        patterns = [p for p in Pattern.Table[ins.opcode.no] if p.MatchesShape(key[1])]
+        Pattern.Candidates[key] = patterns
+    return patterns
+
+
 def FindMatchingPattern(ins: ir.Ins, diagnostic: bool = False) -> Optional[Pattern]:
     """Returns the best pattern matching `ins` or None
 
     This can only be called AFTER the stack has been finalized
     """
-    patterns = Pattern.Table[ins.opcode.no]
+    if not diagnostic:
+        for p in _CandidatePatterns(ins):
+            if 0 == p.MatchesImmCurbs(ins, False):
+                return p
+        return None
 
+    patterns = Pattern.Table[ins.opcode.no]
     for p in patterns:
         if diagnostic:
             print(f"@@ trying pattern {p}", end=" ")
@@ -1336,10 +1413,7 @@ def FindtImmediateMismatchesInBestMatchPattern(ins: ir.Ins, assume_stk_op_matche
     """
     best = MATCH_IMPOSSIBLE
     best_num_bits = bin(best).count('1')
-    patterns = Pattern.Table[ins.opcode.no]
-    for p in patterns:
-        if not p.MatchesTypeCurbs(ins):
-            continue
+    for p in _CandidatePatterns(ins):
         mismatches = p.MatchesImmCurbs(ins, assume_stk_op_matches)
         if mismatches == 0:
             return 0
@@ -415,6 +415,8 @@ void AssignCpuRegOrMarkForSpilling(const std::vector<Reg>& assign_to,
   }
 }
 
+const EmitContext FRAMELESS_EMIT_CONTEXT{};
+
 EmitContext FunComputeEmitContext(Fun fun) {
   CpuRegMasks masks = FunCpuRegStats(fun);
   masks.gpr_mask &= GPR_LAC_REGS_MASK_WITH_LR;
@@ -425,7 +427,15 @@ EmitContext FunComputeEmitContext(Fun fun) {
   }
 
   const uint32_t stk_size = (FunStackSize(fun) + 15) / 16 * 16;
-  return EmitContext{masks.gpr_mask, masks.flt_mask, stk_size};
+  EmitContext out{masks.gpr_mask, masks.flt_mask, stk_size};
+  auto is_saved_cpu_reg = [&masks](CpuReg cpu_reg) {
+    const uint32_t mask = CpuRegKind(cpu_reg) == +CPU_REG_KIND::GPR
+                              ? masks.gpr_mask
+                              : masks.flt_mask;
+    return (mask & (1U << CpuRegNo(cpu_reg))) != 0;
+  };
+  out.prolog_bbl = FunShrinkWrap(fun, is_saved_cpu_reg, &out.frameless_bbls);
+  return out;
 }
 
 std::vector<CpuReg> GetAllRegs() {
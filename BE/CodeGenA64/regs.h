@@ -2,6 +2,7 @@
 // (c) Robert Muth - see LICENSE for more info
 
 #include <array>
+#include <set>
 
 #include "BE/Base/ir.h"
 #include "BE/Base/lowering.h"
@@ -74,6 +75,11 @@ struct EmitContext {
   uint32_t flt_reg_mask = 0;
   uint32_t stk_size = 0;
   base::CpuReg scratch_cpu_reg = base::CpuReg(0);
+  // shrink-wrapping: emit the prolog at the start of this bbl instead of the
+  // fun entry (null means fun entry)
+  base::Bbl prolog_bbl = base::Bbl(0);
+  // bbls executed without a frame, their RETs do not need an epilog
+  std::set<base::Bbl> frameless_bbls;
 
   uint32_t FrameSize() const {
     uint32_t num_gpr = __builtin_popcount(gpr_reg_mask);
@@ -86,4 +92,7 @@ struct EmitContext {
 
 extern EmitContext FunComputeEmitContext(base::Fun fun);
 
+// the context for bbls without a frame, i.e. plain returns
+extern const EmitContext FRAMELESS_EMIT_CONTEXT;
+
 }  // namespace cwerg::code_gen_a64
@@ -6,7 +6,7 @@ from BE.Base import reg_alloc
 from BE.Base import serialize
 
 import dataclasses
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 import enum
 
 
@@ -215,19 +215,12 @@ class CpuRegPool(reg_alloc.RegPool):
         available = self.get_available(lac, is_gpr)
         # print(f"GET {lr} {self}  avail:{available:x}")
         if not is_gpr:
-            for n in range(len(_FLT_REGS)):
-                mask = 1 << n
-                if available & mask == mask:
-                    if not self._flt_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
+            n = reg_alloc.FindUnreservedReg(available, self._flt_reserved, lr)
         else:
-            for n in range(len(_GPR_REGS)):
-                mask = 1 << n
-                if mask & available == mask:
-                    if not self._gpr_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
+            n = reg_alloc.FindUnreservedReg(available, self._gpr_reserved, lr)
+        if n >= 0:
+            self.set_available(lac, is_gpr, available & ~(1 << n))
+            return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
         if self._allow_spilling:
             return ir.CPU_REG_SPILL
         print("@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@")
@@ -439,6 +432,10 @@ class EmitContext:
     stk_size: int = 0
 
     scratch_cpu_reg: ir.CpuReg = ir.CPU_REG_INVALID
+    # shrink-wrapping: emit the prolog at the start of this bbl instead of the fun entry
+    prolog_bbl: Optional[ir.Bbl] = None
+    # names of the bbls executed without a frame, their RETs do not need an epilog
+    frameless_bbls: Set[str] = dataclasses.field(default_factory=set)
 
     def FrameSize(self):
         num_gpr_regs = popcount(self.gpr_reg_mask)
@@ -457,4 +454,15 @@ def FunComputeEmitContext(fun: ir.Fun) -> EmitContext:
     if not ir.FunIsLeaf(fun):
         gpr_mask |= _LINK_REG_MASK
     stk_size = (fun.stk_size + 15) // 16 * 16
-    return EmitContext(gpr_mask, flt_mask, stk_size)
+    ctx = EmitContext(gpr_mask, flt_mask, stk_size)
+
+    def is_saved_cpu_reg(cpu_reg: ir.CpuReg) -> bool:
+        mask = gpr_mask if cpu_reg.kind == CpuRegKind.GPR else flt_mask
+        return (mask & (1 << cpu_reg.no)) != 0
+
+    ctx.prolog_bbl, ctx.frameless_bbls = cfg.FunShrinkWrap(fun, is_saved_cpu_reg)
+    return ctx
+
+
+# the context for bbls without a frame, i.e. plain returns
+FRAMELESS_EMIT_CONTEXT = EmitContext()
@@ -2,10 +2,13 @@
 
 #include "BE/CodeGenX64/codegen.h"
 
+#include <map>
+#include <set>
 #include <string_view>
 
 #include "BE/Base/serialize.h"
 #include "BE/CodeGenX64/isel_gen.h"
+#include "BE/CodeGenX64/peephole.h"
 #include "BE/CodeGenX64/regs.h"
 #include "BE/CpuX64/assembler.h"
 #include "BE/CpuX64/opcode_gen.h"
@@ -41,13 +44,6 @@ void JtbCodeGen(Jtb jtb, std::ostream* output) {
   *output << ".endmem\n";
 }
 
-bool SimpifyCpuIns(x64::Ins cpu_ins) {
-  if (cpu_ins.operands[0] != cpu_ins.operands[1]) return true;
-  x64::OPC opc = x64::OpcodeOPC(cpu_ins.opcode);
-  return opc != x64::OPC::mov_8_r_mr && opc != x64::OPC::mov_16_r_mr &&
-         opc != x64::OPC::mov_64_r_mr;
-}
-
 x64::Ins HandleInline(const char* cpu_asm_str) {
   std::vector<std::string_view> token;
   ParseLineWithStrings(cpu_asm_str, false, &token);
@@ -84,17 +80,37 @@ void FunCodeGen(Fun fun, std::ostream* output) {
   };
 
   EmitContext ctx = FunComputeEmitContext(fun);
-  EmitFunProlog(ctx, &inss);
-  drain();
+  if (ctx.prolog_bbl.isnull()) {
+    EmitFunProlog(ctx, &inss);
+    drain();
+  }
   for (Bbl bbl : FunBblIter(fun)) {
     *output << ".bbl " << Name(bbl) << " 4\n";
+    if (bbl == ctx.prolog_bbl) EmitFunProlog(ctx, &inss);
+    const std::map<unsigned, AddrMode> addr_modes = BblFindAddrModes(fun, bbl);
+    std::set<unsigned> absorbed;
+    for (const auto& [pos, mode] : addr_modes) {
+      absorbed.insert(mode.absorbed.begin(), mode.absorbed.end());
+    }
+    unsigned pos = 0;
     for (Ins ins : BblInsIter(bbl)) {
-      if (InsOPC(ins) == OPC::NOP1) {
+      auto it = addr_modes.find(pos);
+      if (absorbed.count(pos++) > 0) {
+        continue;
+      } else if (it != addr_modes.end()) {
+        inss.push_back(EmitWithAddrMode(ins, it->second));
+      } else if (InsOPC(ins) == OPC::NOP1) {
         ctx.scratch_cpu_reg = CpuReg(RegCpuReg(Reg(InsOperand(ins, 0))));
       } else if (InsOPC(ins) == OPC::RET) {
-        EmitFunEpilog(ctx, &inss);
+        const EmitContext& epilog_ctx =
+            ctx.frameless_bbls.count(bbl) > 0 ? FRAMELESS_EMIT_CONTEXT : ctx;
+        EmitFunEpilog(epilog_ctx, &inss);
       } else if (InsOPC(ins) == OPC::INLINE) {
+        // the inline code may use the flags so they must be live
+        PeepholeOptimize(&inss, true);
+        drain();
         inss.push_back(HandleInline(StrData(Str(InsOperand(ins, 0)))));
+        drain();
       } else {
         const Pattern* pat = FindMatchingPattern(ins);
         if (pat == nullptr) {
@@ -103,13 +119,11 @@ void FunCodeGen(Fun fun, std::ostream* output) {
         }
 
         for (unsigned i = 0; i < pat->length; ++i) {
-          x64::Ins cpu_ins = MakeInsFromTmpl(pat->start[i], ins, ctx);
-          if (SimpifyCpuIns(cpu_ins)) {
-            inss.push_back(cpu_ins);
-          }
+          inss.push_back(MakeInsFromTmpl(pat->start[i], ins, ctx));
         }
       }
     }
+    PeepholeOptimize(&inss, false);
     drain();
   }
   *output << ".endfun\n";
@@ -217,31 +231,49 @@ x64::X64Unit EmitUnitAsBinary(base::Unit unit) {
       out.MemEnd();
     }
     EmitContext ctx = FunComputeEmitContext(fun);
-    EmitFunProlog(ctx, &inss);
-    drain();
+    if (ctx.prolog_bbl.isnull()) {
+      EmitFunProlog(ctx, &inss);
+      drain();
+    }
     for (Bbl bbl : FunBblIter(fun)) {
       out.AddLabel(StrData(Name(bbl)), 1, x64::TextPadder);
+      if (bbl == ctx.prolog_bbl) EmitFunProlog(ctx, &inss);
+      const std::map<unsigned, AddrMode> addr_modes = BblFindAddrModes(fun, bbl);
+      std::set<unsigned> absorbed;
+      for (const auto& [pos, mode] : addr_modes) {
+        absorbed.insert(mode.absorbed.begin(), mode.absorbed.end());
+      }
+      unsigned pos = 0;
       for (Ins ins : BblInsIter(bbl)) {
-        if (InsOPC(ins) == OPC::NOP1) {
+        auto it = addr_modes.find(pos);
+        if (absorbed.count(pos++) > 0) {
+          continue;
+        } else if (it != addr_modes.end()) {
+          inss.push_back(EmitWithAddrMode(ins, it->second));
+        } else if (InsOPC(ins) == OPC::NOP1) {
           ctx.scratch_cpu_reg = CpuReg(RegCpuReg(Reg(InsOperand(ins, 0))));
         } else if (InsOPC(ins) == OPC::RET) {
-          EmitFunEpilog(ctx, &inss);
+          const EmitContext& epilog_ctx =
+              ctx.frameless_bbls.count(bbl) > 0 ? FRAMELESS_EMIT_CONTEXT : ctx;
+          EmitFunEpilog(epilog_ctx, &inss);
         } else if (InsOPC(ins) == OPC::LINE) {
           // TODO
         } else if (InsOPC(ins) == OPC::INLINE) {
+          // the inline code may use the flags so they must be live
+          PeepholeOptimize(&inss, true);
+          drain();
           inss.push_back(HandleInline(StrData(Str(InsOperand(ins, 0)))));
+          drain();
         } else {
           const Pattern* pat = FindMatchingPattern(ins);
           ASSERT(pat != nullptr, "could not find matching pattern for "
                                      << ins << " in " << Name(fun));
           for (unsigned i = 0; i < pat->length; ++i) {
-            x64::Ins cpu_ins = MakeInsFromTmpl(pat->start[i], ins, ctx);
-            if (SimpifyCpuIns(cpu_ins)) {
-              inss.push_back(cpu_ins);
-            }
+            inss.push_back(MakeInsFromTmpl(pat->start[i], ins, ctx));
           }
         }
       }
+      PeepholeOptimize(&inss, false);
       drain();
     }
     out.FunEnd();
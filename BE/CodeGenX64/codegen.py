@@ -8,7 +8,7 @@ See `README.md` for more details.
 import os
 import stat
 import collections
-from typing import List, Dict
+from typing import List, Dict, Any
 
 from BE.Base import cfg
 from BE.Base import ir
@@ -23,15 +23,19 @@ from BE.CpuX64 import assembler
 from BE.CodeGenX64 import isel_tab
 from BE.CodeGenX64 import regs
 from BE.CodeGenX64 import legalize
+from BE.CodeGenX64 import peephole
 
 from BE.Elf import enum_tab
 from BE.Elf import elf_unit
+from BE.Elf import linker
 
 
-def LegalizeAll(unit, opt_stats, fout, verbose=False):
+def LegalizeAll(unit, opt_stats, fout, verbose=False, remove_unreachable=True):
+    """`remove_unreachable` must be False for units compiled into object files
+    where every global fun may be referenced by another object"""
     seeds = [f for f in [unit.fun_syms.get("_start"),
                          unit.fun_syms.get("main")] if f]
-    if seeds:
+    if seeds and remove_unreachable:
         cfg.UnitRemoveUnreachableCode(unit, seeds)
     for fun in unit.funs:
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
@@ -58,6 +62,21 @@ def RegAllocLocal(unit, opt_stats, fout, verbose=False):
             legalize.DumpFun("after stack finalization", fun)
 
 
+def RegAllocAll(unit, opt_stats, fout, verbose=False):
+    """Global and local reg alloc one fun at a time, callees first
+
+    This way the clobber summaries of the callees are available when
+    allocating the callers.
+    """
+    for fun in cfg.UnitFunsInCallGraphPostOrder(unit):
+        sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
+        legalize.PhaseGlobalRegAlloc(fun, opt_stats, fout)
+        legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, fout)
+        legalize.PhaseComputeClobberSummary(fun, opt_stats, fout)
+        if verbose:
+            legalize.DumpFun("after stack finalization", fun)
+
+
 ############################################################
 # textual emitter
 ############################################################
@@ -98,16 +117,65 @@ def _RenderIns(ins: x64.Ins) -> str:
     return f"    {name}{ops_str}"
 
 
-# Note: mv_32_r_mr is NOT a nop. It clears the upper bits.
-_REG_MOV_OPCODES = {
-    x64.Opcode.name_to_opcode[f"mov_{bw}_r_mr"] for bw in [8, 16, 64]}
+def _Optimize(cpu_inss: List[x64.Ins], lines: Dict[int, ir.Ins], flags_live_out=False):
+    """Runs the peephole optimizer and interleaves the LINE instructions in `lines`"""
+    out = peephole.Optimize(cpu_inss, flags_live_out, lines)
+    for n, cpu_ins in enumerate(out):
+        if n in lines:
+            yield lines[n]
+        yield cpu_ins
+    if len(out) in lines:
+        yield lines[len(out)]
+
 
+def _RenderLine(ins: ir.Ins) -> str:
+    filename, line = ins.operands
+    return f"    .line {serialize.RenderOperand(filename, o.TC.INVALID)} {line.value}"
 
-def _SimplifyCpuIns(cpu_ins: x64.Ins) -> bool:
-    # TODO: rewrite instruction to a simpler variant
-    if cpu_ins.opcode in _REG_MOV_OPCODES and cpu_ins.operands[0] == cpu_ins.operands[1]:
-        return False
-    return True
+
+def _BblCpuIns(fun: ir.Fun, bbl: ir.Bbl, ctx: regs.EmitContext):
+    """Yields the cpu instructions for bbl after peephole optimization
+
+    INLINE instructions are yielded as is (i.e. as ir.Ins) and act as
+    a barrier for the peephole optimizer.
+    LINE instructions are also yielded as is in front of the first cpu instruction
+    derived from the code following them. They do not affect the optimizations.
+    """
+    cpu_inss: List[x64.Ins] = []
+    # position in cpu_inss -> LINE ins
+    lines: Dict[int, ir.Ins] = {}
+    if bbl is ctx.prolog_bbl:
+        for tmpl in isel_tab.EmitFunProlog(ctx):
+            cpu_inss.append(tmpl.MakeInsFromTmpl(None, ctx))
+    addr_modes = isel_tab.BblFindAddrModes(bbl)
+    absorbed = {i for mode in addr_modes.values() for i in mode.absorbed}
+    for pos, ins in enumerate(bbl.inss):
+        if pos in absorbed:
+            continue
+        mode = addr_modes.get(pos)
+        if mode:
+            cpu_inss += isel_tab.EmitWithAddrMode(ins, mode)
+        elif ins.opcode is o.NOP1:
+            isel_tab.HandlePseudoNop1(ins, ctx)
+        elif ins.opcode is o.LINE:
+            lines[len(cpu_inss)] = ins
+        elif ins.opcode is o.RET:
+            epilog_ctx = regs.FRAMELESS_EMIT_CONTEXT if bbl.name in ctx.frameless_bbls else ctx
+            for tmpl in isel_tab.EmitFunEpilog(epilog_ctx):
+                cpu_inss.append(tmpl.MakeInsFromTmpl(None, epilog_ctx))
+        elif ins.opcode is o.INLINE:
+            # we do not know what the inline code does with the flags
+            yield from _Optimize(cpu_inss, lines, flags_live_out=True)
+            cpu_inss = []
+            lines = {}
+            yield ins
+        else:
+            pattern = isel_tab.FindMatchingPattern(ins)
+            assert pattern, (f"could not find pattern for\n{ins} {ins.operands} "
+                             f"in {fun.name}:{bbl.name}")
+            for tmpl in pattern.emit:
+                cpu_inss.append(tmpl.MakeInsFromTmpl(ins, ctx))
+    yield from _Optimize(cpu_inss, lines)
 
 
 def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
@@ -122,27 +190,19 @@ def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
         yield from _JtbCodeGen(jtb)
 
     ctx = regs.FunComputeEmitContext(fun)
-    for tmpl in isel_tab.EmitFunProlog(ctx):
-        yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
+    if ctx.prolog_bbl is None:
+        for tmpl in isel_tab.EmitFunProlog(ctx):
+            yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
     for bbl in fun.bbls:
         live_out = sorted([r.name for r in bbl.live_out])
         yield f".bbl {bbl.name} 4"
-        for ins in bbl.inss:
-            if ins.opcode is o.NOP1:
-                isel_tab.HandlePseudoNop1(ins, ctx)
-            elif ins.opcode is o.RET:
-                for tmpl in isel_tab.EmitFunEpilog(ctx):
-                    yield _RenderIns(tmpl.MakeInsFromTmpl(None, ctx))
-            elif ins.opcode is o.INLINE:
-                yield "    " + str(ins.operands[0], "ascii")
+        for cpu_ins in _BblCpuIns(fun, bbl, ctx):
+            if isinstance(cpu_ins, ir.Ins) and cpu_ins.opcode is o.LINE:
+                yield _RenderLine(cpu_ins)
+            elif isinstance(cpu_ins, ir.Ins):
+                yield "    " + str(cpu_ins.operands[0], "ascii")
             else:
-                pattern = isel_tab.FindMatchingPattern(ins)
-                assert pattern, (f"could not find pattern for\n{ins} {ins.operands} "
-                                 f"in {fun.name}:{bbl.name}")
-                for tmpl in pattern.emit:
-                    cpu_ins = tmpl.MakeInsFromTmpl(ins, ctx)
-                    if _SimplifyCpuIns(cpu_ins):
-                        yield _RenderIns(cpu_ins)
+                yield _RenderIns(cpu_ins)
     yield ".endfun"
 
 
@@ -194,14 +254,24 @@ def codegen(unit: ir.Unit) -> Unit:
 # binary emitter
 ############################################################
 
-def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
+def EmitUnitAsBinary(unit: ir.Unit, loop_alignment: int = 0,
+                     loop_alignment_budget: int = 10) -> elf_unit.Unit:
+    """Encodes the unit
+
+    If `loop_alignment` is non-zero, loop headers are padded with nops to start at a
+    multiple of it, spending at most `loop_alignment_budget` percent of a fun's size
+    on this padding.
+    """
     elfunit = elf_unit.Unit()
     for mem in unit.mems:
-        assert mem.kind != o.MEM_KIND.EXTERN, f"undefined symbol: {mem}"
-        if mem.kind == o.MEM_KIND.BUILTIN:
+        # EXTERN mems (and funs) are left to the linker
+        if mem.kind in {o.MEM_KIND.BUILTIN, o.MEM_KIND.EXTERN}:
             continue
-        elfunit.MemStart(mem.name, mem.alignment,
-                         _MEMKIND_TO_SECTION[mem.kind], False)
+        sym = elfunit.MemStart(mem.name, mem.alignment,
+                               _MEMKIND_TO_SECTION[mem.kind], False)
+        if mem.name.startswith(ir.CONST_MEM_PREFIX):
+            # other objects may contain the same const
+            sym.st_bind = enum_tab.ST_INFO_BIND.WEAK
         for d in mem.datas:
             if isinstance(d, ir.DataBytes):
                 elfunit.AddData(d.count, d.data)
@@ -217,6 +287,8 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
 
     sec_text = elfunit.sec_text
     for fun in unit.funs:
+        if fun.kind in {o.FUN_KIND.SIGNATURE, o.FUN_KIND.EXTERN}:
+            continue
         # print (f"Processing {fun.name}")
         elfunit.FunStart(fun.name, 16, assembler.TextPadder)
         for jtb in fun.jtbs:
@@ -227,34 +299,44 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
                     enum_tab.RELOC_TYPE_X86_64.X_64, 8, bbl.name)
             elfunit.MemEnd()
         ctx = regs.FunComputeEmitContext(fun)
+        # labels (str) interleaved with cpu instructions so that
+        # branches can be relaxed before anything is encoded
+        code: List[Any] = []
+        # position in code -> LINE ins
+        lines: Dict[int, ir.Ins] = {}
 
-        for tmpl in isel_tab.EmitFunProlog(ctx):
-            assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
+        if ctx.prolog_bbl is None:
+            for tmpl in isel_tab.EmitFunProlog(ctx):
+                code.append(tmpl.MakeInsFromTmpl(None, ctx))
 
         for bbl in fun.bbls:
-            elfunit.AddLabel(bbl.name, 1, assembler.TextPadder)
-            for ins in bbl.inss:
-                if ins.opcode is o.NOP1:
-                    isel_tab.HandlePseudoNop1(ins, ctx)
-                elif ins.opcode is o.LINE:
-                    # TODO
-                    pass
-                elif ins.opcode is o.RET:
-                    for tmpl in isel_tab.EmitFunEpilog(ctx):
-                        assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(None, ctx))
-                elif ins.opcode is o.INLINE:
-                    tokens = str(ins.operands[0], "ascii").split()
-                    cpu_ins = symbolic.InsFromSymbolized(tokens[0], tokens[1:])
+            code.append(bbl.name)
+            for cpu_ins in _BblCpuIns(fun, bbl, ctx):
+                if isinstance(cpu_ins, ir.Ins) and cpu_ins.opcode is o.LINE:
+                    lines[len(code)] = cpu_ins
+                    continue
+                if isinstance(cpu_ins, ir.Ins):
+                    tokens = str(cpu_ins.operands[0], "ascii").split()
                     # intentionally no simplification for now
-                    assembler.AddIns(elfunit, cpu_ins)
-                else:
-                    pattern = isel_tab.FindMatchingPattern(ins)
-                    assert pattern, f"could not find pattern in fun {fun.name}\n{ins} {ins.operands}"
-                    for tmpl in pattern.emit:
-                        cpu_ins = tmpl.MakeInsFromTmpl(ins, ctx)
-                        if _SimplifyCpuIns(cpu_ins):
-                            assembler.AddIns(elfunit, cpu_ins)
+                    cpu_ins = symbolic.InsFromSymbolized(tokens[0], tokens[1:])
+                code.append(cpu_ins)
+
+        alignments: Dict[str, int] = {}
+        budget = 0
+        if loop_alignment:
+            alignments = {bbl.name: loop_alignment
+                          for bbl in cfg.FunLoopHeadersByLayout(fun)}
+            budget = sum(x64.InsLength(ins) for ins in code
+                         if not isinstance(ins, str)) * loop_alignment_budget // 100
+        assembler.RelaxBranches(code, len(sec_text.data), alignments, budget)
+        for n, item in enumerate(code):
+            if n in lines:
+                filename, line = lines[n].operands
+                elfunit.AddLine(str(filename, "utf-8"), line.value)
+            if isinstance(item, str):
+                elfunit.AddLabel(item, alignments.get(item, 1), assembler.TextPadder)
+            else:
+                assembler.AddIns(elfunit, item)
         elfunit.FunEnd()
     elfunit.AddLinkerDefs()
     return elfunit
@@ -264,16 +346,38 @@ if __name__ == "__main__":
     import sys
     import argparse
 
-    _ALLOWED_MODES = {"normal", "binary", "legalize", "reg_alloc_global",
+    _ALLOWED_MODES = {"normal", "binary", "object", "legalize", "reg_alloc_global",
                       "reg_alloc_local"}
 
+    def _HotFuns(x64unit: elf_unit.Unit, path: str) -> List[str]:
+        if path:
+            with open(path) as fin:
+                return [line.strip() for line in fin
+                        if line.strip() and not line.startswith("#")]
+        # without a profile assume that small funs (helpers, leaves) are called often
+        sizes = linker.FunSizes(x64unit)
+        return sorted(sizes, key=lambda name: sizes[name])
+
     def main():
         parser = argparse.ArgumentParser(description='CodeGenA64')
         parser.add_argument('-mode', type=str, help='mode')
-
+        parser.add_argument('-loop_alignment', type=int, default=0,
+                            help='align loop headers to this many bytes (binary mode only)')
+        parser.add_argument('-loop_alignment_budget', type=int, default=10,
+                            help='max padding for loop alignment in percent of fun size')
+
+        parser.add_argument('-runtime', type=str, default="",
+                            help='precompiled runtime object to link with (binary mode only)')
+        parser.add_argument('-large_pages', action='store_true',
+                            help='lay out the text for 2MiB pages with hot funs first (binary mode only)')
+        parser.add_argument('-hot_funs', type=str, default="",
+                            help='file listing the hot funs, one per line and hottest first '
+                                 '(requires -large_pages, default: smallest funs first)')
         parser.add_argument('input', type=str, help='input file')
         parser.add_argument('output', type=str, help='output file')
         args = parser.parse_args()
+        if args.hot_funs and not args.large_pages:
+            parser.error("-hot_funs only has an effect with -large_pages")
 
         log = None
         assert args.mode in _ALLOWED_MODES
@@ -282,15 +386,25 @@ if __name__ == "__main__":
         unit = serialize.UnitParseFromAsm(fin)
         opt_stats: Dict[str, int] = collections.defaultdict(int)
 
-        if args.mode == "binary":
+        if args.mode in {"binary", "object"}:
             # we need to legalize all functions first as this may change the signature
             # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-            LegalizeAll(unit, opt_stats, None)
-            RegAllocGlobal(unit, opt_stats, None)
-            RegAllocLocal(unit, opt_stats, None)
-            x64unit = EmitUnitAsBinary(unit)
-            exe = assembler.Assemble(x64unit, True)
-            exe.save(open(args.output, "wb"))
+            LegalizeAll(unit, opt_stats, None,
+                        remove_unreachable=args.mode != "object")
+            RegAllocAll(unit, opt_stats, None)
+            x64unit = EmitUnitAsBinary(unit, args.loop_alignment,
+                                       args.loop_alignment_budget)
+            if args.mode == "object":
+                elf_unit.UnitSaveAsObject(x64unit, enum_tab.E_MACHINE.X86_64,
+                                          open(args.output, "wb"))
+                return
+            if args.runtime:
+                x64unit = linker.LinkWithRuntime(x64unit, args.runtime,
+                                                 enum_tab.E_MACHINE.X86_64)
+            if args.large_pages:
+                x64unit = linker.UnitReorderFuns(x64unit, _HotFuns(x64unit, args.hot_funs))
+            exe = assembler.Assemble(x64unit, True, args.large_pages)
+            exe.save_to_path(args.output)
             os.chmod(args.output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
             return
 
@@ -303,12 +417,12 @@ if __name__ == "__main__":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocGlobal(unit, opt_stats, log)
         if args.mode == "reg_alloc_global":
+            RegAllocGlobal(unit, opt_stats, log)
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocLocal(unit, opt_stats, log)
+        RegAllocAll(unit, opt_stats, log)
         if args.mode == "reg_alloc_local":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
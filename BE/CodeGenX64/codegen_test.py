@@ -0,0 +1,159 @@
+#!/bin/env python3
+
+import collections
+import io
+import unittest
+from typing import Dict, List
+
+from BE.Base import serialize
+from BE.CodeGenX64 import codegen
+
+
+def Compile(asm: str) -> Dict[str, Dict[str, List[str]]]:
+    """Returns the cpu instructions of each bbl (keyed by fun name and bbl name)
+
+    The instructions emitted ahead of the first bbl are listed under "".
+    """
+    unit = serialize.UnitParseFromAsm(io.StringIO(asm))
+    opt_stats: Dict[str, int] = collections.defaultdict(int)
+    codegen.LegalizeAll(unit, opt_stats, None)
+    codegen.RegAllocAll(unit, opt_stats, None)
+    fout = io.StringIO()
+    codegen.EmitUnitAsText(unit, fout)
+    out: Dict[str, Dict[str, List[str]]] = {}
+    bbl: List[str] = []
+    for line in fout.getvalue().splitlines():
+        token = line.split()
+        if not token or token[0].startswith("#"):
+            continue
+        if token[0] == ".fun":
+            bbl = []
+            fun = out[token[1]] = {"": bbl}
+        elif token[0] == ".bbl":
+            bbl = fun[token[1]] = []
+        elif not token[0].startswith("."):
+            bbl.append(line.strip())
+    return out
+
+
+def FrameIns(inss: List[str]) -> List[str]:
+    """Returns the instructions setting up or tearing down the frame"""
+    return [ins for ins in inss if ins.split()[0] in {"push_64_r", "pop_64_r"} or
+            ins.startswith(("sub_64_mr_imm32 rsp", "add_64_mr_imm32 rsp"))]
+
+
+class TestShrinkWrap(unittest.TestCase):
+
+    def testEarlyExit(self):
+        funs = Compile("""
+.fun callee NORMAL [] = []
+.bbl start
+    ret
+
+.fun early NORMAL [U64] = [U64]
+.bbl start
+    poparg x:U64
+    bne x 0 work
+.bbl done
+    pusharg x
+    ret
+.bbl work
+    bsr callee
+    pusharg 1:U64
+    ret
+""")
+        fun = funs["early"]
+        # the early exit needs no frame
+        for name in ["", "start", "done"]:
+            self.assertEqual([], FrameIns(fun[name]), name)
+        self.assertEqual("ret", fun["done"][-1])
+        # the prolog moved to the bbl calling
+        self.assertEqual("sub_64_mr_imm32 rsp 0x8", fun["work"][0])
+        self.assertEqual(["add_64_mr_imm32 rsp 0x8", "ret"], fun["work"][-2:])
+
+    def testNoEarlyExit(self):
+        funs = Compile("""
+.fun callee NORMAL [] = []
+.bbl start
+    ret
+
+.fun loop NORMAL [] = [U64]
+.bbl start
+    poparg x:U64
+.bbl work
+    bsr callee
+    sub x x 1
+    bne x 0 work
+.bbl done
+    ret
+""")
+        fun = funs["loop"]
+        # the region needing the frame is entered via a loop: prolog at the fun entry
+        self.assertEqual(["sub_64_mr_imm32 rsp 0x8"], FrameIns(fun[""]))
+        self.assertEqual([], FrameIns(fun["work"]))
+        self.assertEqual(["add_64_mr_imm32 rsp 0x8"], FrameIns(fun["done"]))
+
+
+def RspOffsets(inss: List[str]) -> List[int]:
+    """Returns the displacements of the rsp based memory operands"""
+    out = []
+    for ins in inss:
+        token = ins.split()
+        for i in range(1, len(token) - 3):
+            # base index scale displacement
+            if token[i] == "rsp" and token[i + 1] == "noindex":
+                out.append(int(token[i + 3], 0))
+    return out
+
+
+class TestRedZone(unittest.TestCase):
+    LEAF = """
+.fun leaf NORMAL [U64] = [U64]
+.stk buf 8 %d
+.bbl start
+    poparg x:U64
+    st.stk buf 0 x
+    st.stk buf 24 x
+    ld.stk y:U64 buf 8
+    pusharg y
+    ret
+"""
+
+    def testLeaf(self):
+        fun = Compile(self.LEAF % 32)["leaf"]
+        self.assertEqual([], FrameIns(fun[""]) + FrameIns(fun["start"]))
+        offsets = RspOffsets(fun["start"])
+        self.assertEqual(3, len(offsets))
+        # the locals live below rsp
+        for x in offsets:
+            self.assertTrue(-128 <= x < 0, x)
+
+    def testLeafTooLarge(self):
+        fun = Compile(self.LEAF % 256)["leaf"]
+        self.assertEqual(["sub_64_mr_imm32 rsp 0x108"], FrameIns(fun[""]))
+        self.assertEqual(3, len(RspOffsets(fun["start"])))
+        for x in RspOffsets(fun["start"]):
+            self.assertTrue(x >= 0, x)
+
+    def testNonLeaf(self):
+        fun = Compile("""
+.fun callee NORMAL [] = []
+.bbl start
+    ret
+
+.fun caller NORMAL [] = [U64]
+.stk buf 8 32
+.bbl start
+    poparg x:U64
+    st.stk buf 0 x
+    bsr callee
+    ret
+""")["caller"]
+        self.assertEqual(["sub_64_mr_imm32 rsp 0x28"], FrameIns(fun[""]))
+        self.assertEqual(1, len(RspOffsets(fun["start"])))
+        for x in RspOffsets(fun["start"]):
+            self.assertTrue(x >= 0, x)
+
+
+if __name__ == '__main__':
+    unittest.main()
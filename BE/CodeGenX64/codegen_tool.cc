@@ -151,8 +151,7 @@ int main(int argc, const char* argv[]) {
 
   if (sw_mode.Value() == "binary") {
     LegalizeAll(unit, false, nullptr);
-    RegAllocGlobal(unit, false, nullptr);
-    RegAllocLocal(unit, false, nullptr);
+    RegAllocAll(unit, false, nullptr);
     x64::X64Unit cpuunit = EmitUnitAsBinary(unit);
     auto exe = x64::MakeExe(&cpuunit, true);
     std::vector<std::string_view> chunks = exe.Save();
@@ -168,13 +167,13 @@ int main(int argc, const char* argv[]) {
     return 0;
   }
 
-  RegAllocGlobal(unit, false, log);
   if (sw_mode.Value() == "reg_alloc_global") {
+    RegAllocGlobal(unit, false, log);
     UnitRenderToAsm(unit, fout);
     return 0;
   }
 
-  RegAllocLocal(unit, false, log);
+  RegAllocAll(unit, false, log);
   if (sw_mode.Value() == "reg_alloc_local") {
     UnitRenderToAsm(unit, fout);
     return 0;
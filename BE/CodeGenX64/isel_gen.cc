@@ -9,6 +9,7 @@
 #include "BE/Base/opcode_gen.h"
 #include "BE/Base/serialize.h"
 #include "BE/CpuX64//opcode_gen.h"
+#include "Util/parse.h"
 
 namespace cwerg::code_gen_x64 {
 namespace {
@@ -315,16 +316,19 @@ int64_t ExtractTmplArgOP(Ins ins, P arg, const EmitContext& ctx) {
       ASSERT(Kind(reg) == RefKind::REG, "");
       const StackSlot slot(RegCpuReg(reg));
       ASSERT(Kind(slot) == RefKind::STACK_SLOT, "");
-      return StackSlotOffset(slot);
+      return int64_t(StackSlotOffset(slot)) - ctx.red_zone_size;
     }
     case P::stk1_offset2:
-      return GetStackOffset(InsOperand(ins, 1), InsOperand(ins, 2));
+      return int64_t(GetStackOffset(InsOperand(ins, 1), InsOperand(ins, 2))) -
+             ctx.red_zone_size;
     case P::stk0_offset1:
-      return GetStackOffset(InsOperand(ins, 0), InsOperand(ins, 1));
+      return int64_t(GetStackOffset(InsOperand(ins, 0), InsOperand(ins, 1))) -
+             ctx.red_zone_size;
     case P::stk1:
-      return GetStackOffset(InsOperand(ins, 1), ConstNewOffset(0));
+      return int64_t(GetStackOffset(InsOperand(ins, 1), ConstNewOffset(0))) -
+             ctx.red_zone_size;
     case P::frame_size:
-      return ctx.FrameSize();
+      return ctx.FrameSize() - ctx.red_zone_size;
     case P::bbl0:
     case P::bbl1:
     case P::bbl2:
@@ -448,12 +452,13 @@ void EmitFunProlog(const EmitContext& ctx, std::vector<x64::Ins>* output) {
       output->push_back(MakeIns(x64::OPC::push_64_r, i));
     }
   }
-  const uint32_t stk_adjust = ctx.StackAdjustment();
+  const uint32_t stk_adjust = ctx.StackAdjustment() - ctx.red_zone_size;
   if (stk_adjust > 0) {
     output->push_back(MakeIns(x64::OPC::sub_64_mr_imm32, +F::RSP, stk_adjust));
   }
 
-  uint32_t offset = ctx.stk_size;
+  // negative if the xmm saves live in the red zone
+  int64_t offset = int64_t(ctx.stk_size) - ctx.red_zone_size;
   for (int i = FLT_REGS.size() - 1; i >= 0; --i) {
     if (ctx.flt_reg_mask & (1U << i)) {
       output->push_back(MakeIns(x64::OPC::movsd_mbis32_x, +F::RSP, +F::NO_INDEX,
@@ -472,12 +477,13 @@ void EmitFunEpilog(const EmitContext& ctx, std::vector<x64::Ins>* output) {
       output->push_back(MakeIns(x64::OPC::pop_64_r, i));
     }
   }
-  const uint32_t stk_adjust = ctx.StackAdjustment();
+  const uint32_t stk_adjust = ctx.StackAdjustment() - ctx.red_zone_size;
   if (stk_adjust > 0) {
     output->push_back(MakeIns(x64::OPC::add_64_mr_imm32, +F::RSP, stk_adjust));
   }
 
-  uint32_t offset = ctx.stk_size;
+  // negative if the xmm saves live in the red zone
+  int64_t offset = int64_t(ctx.stk_size) - ctx.red_zone_size;
   for (int i = FLT_REGS.size() - 1; i >= 0; --i) {
     if (ctx.flt_reg_mask & (1U << i)) {
       output->push_back(MakeIns(x64::OPC::movsd_x_mbis32, i, +F::RSP,
@@ -489,4 +495,282 @@ void EmitFunEpilog(const EmitContext& ctx, std::vector<x64::Ins>* output) {
   std::reverse(output->begin() + start, output->end());
 }
 
+
+namespace {
+
+bool InCpuReg(Handle op) {
+  return Kind(op) == RefKind::REG &&
+         Kind(RegCpuReg(Reg(op))) == RefKind::CPU_REG;
+}
+
+bool SameCpuReg(Handle op, CpuReg cpu_reg) {
+  return InCpuReg(op) && CpuReg(RegCpuReg(Reg(op))) == cpu_reg;
+}
+
+// instructions without implicit register effects beyond their operands
+// (line markers emit no code and must not change the code of their neighbors)
+bool IsSimpleKind(OPC_KIND kind) {
+  switch (kind) {
+    case OPC_KIND::ALU:
+    case OPC_KIND::ALU1:
+    case OPC_KIND::MOV:
+    case OPC_KIND::LEA:
+    case OPC_KIND::LEA1:
+    case OPC_KIND::LD:
+    case OPC_KIND::ST:
+    case OPC_KIND::CONV:
+    case OPC_KIND::NOP1:
+    case OPC_KIND::LINE:
+      return true;
+    default:
+      return false;
+  }
+}
+
+// these only read their operands
+bool IsBranchKind(OPC_KIND kind) {
+  return kind == OPC_KIND::COND_BRA || kind == OPC_KIND::BRA ||
+         kind == OPC_KIND::SWITCH;
+}
+
+bool InsWritesCpuReg(Ins ins, CpuReg cpu_reg) {
+  const Opcode& opcode = InsOpcode(ins);
+  if (opcode.kind == OPC_KIND::NOP1) {
+    // the reg becomes the scratch of the next ins
+    return SameCpuReg(InsOperand(ins, 0), cpu_reg);
+  }
+  for (unsigned i = 0; i < opcode.num_defs; ++i) {
+    if (SameCpuReg(InsOperand(ins, i), cpu_reg)) return true;
+  }
+  return false;
+}
+
+bool InsReadsCpuReg(Ins ins, CpuReg cpu_reg) {
+  const Opcode& opcode = InsOpcode(ins);
+  if (opcode.kind == OPC_KIND::NOP1) return false;
+  for (unsigned i = opcode.num_defs; i < opcode.num_operands; ++i) {
+    if (SameCpuReg(InsOperand(ins, i), cpu_reg)) return true;
+  }
+  return false;
+}
+
+bool IsDeadAfter(CpuReg cpu_reg, const std::vector<Ins>& inss, unsigned pos,
+                 const std::vector<Reg>& live_out) {
+  for (unsigned i = pos + 1; i < inss.size(); ++i) {
+    const OPC_KIND kind = InsOpcode(inss[i]).kind;
+    if (!IsSimpleKind(kind) && !IsBranchKind(kind)) return false;
+    if (InsReadsCpuReg(inss[i], cpu_reg)) return false;
+    if (InsWritesCpuReg(inss[i], cpu_reg)) return true;
+  }
+  for (Reg reg : live_out) {
+    if (SameCpuReg(reg, cpu_reg)) return false;
+  }
+  return true;
+}
+
+// Returns the position of the closest ins before `n` touching cpu_reg or -1
+int FindPrev(const std::vector<Ins>& inss, int n, CpuReg cpu_reg) {
+  for (int i = n - 1; i >= 0; --i) {
+    if (!IsSimpleKind(InsOpcode(inss[i]).kind)) return -1;
+    if (InsReadsCpuReg(inss[i], cpu_reg) || InsWritesCpuReg(inss[i], cpu_reg)) {
+      return i;
+    }
+  }
+  return -1;
+}
+
+// Is inss[i] `opc cpu_reg = cpu_reg const:kind`
+bool IsAab(const std::vector<Ins>& inss, int i, OPC opc, CpuReg cpu_reg,
+           DK kind) {
+  if (i < 0) return false;
+  const Ins prev = inss[i];
+  return InsOPC(prev) == opc && SameCpuReg(InsOperand(prev, 0), cpu_reg) &&
+         SameCpuReg(InsOperand(prev, 1), cpu_reg) &&
+         Kind(InsOperand(prev, 2)) == RefKind::CONST &&
+         ConstKind(Const(InsOperand(prev, 2))) == kind;
+}
+
+bool FindAddrMode(const std::vector<Ins>& inss, unsigned pos,
+                  const std::vector<Reg>& live_out, AddrMode* mode) {
+  const Ins ins = inss[pos];
+  Handle base;
+  Handle off;
+  std::vector<Handle> others;
+  switch (InsOPC(ins)) {
+    case OPC::LD:
+      // a spilled dst would need a memory to memory move
+      if (!InCpuReg(InsOperand(ins, 0))) return false;
+      base = InsOperand(ins, 1);
+      off = InsOperand(ins, 2);
+      break;
+    case OPC::ST:
+      base = InsOperand(ins, 0);
+      off = InsOperand(ins, 1);
+      others.push_back(InsOperand(ins, 2));
+      break;
+    case OPC::LEA:
+      if (InsOperand(ins, 0) != InsOperand(ins, 1)) return false;
+      base = InsOperand(ins, 1);
+      off = InsOperand(ins, 2);
+      break;
+    default:
+      return false;
+  }
+  if (!InCpuReg(off) || !InCpuReg(base)) return false;
+  for (Handle x : others) {
+    if (!InCpuReg(x)) return false;
+  }
+  const DK off_kind = RegKind(Reg(off));
+  if (off_kind != DK::U64 && off_kind != DK::S64) return false;
+  const CpuReg cpu_reg(RegCpuReg(Reg(off)));
+  // regs pinned to a cpu reg may be read implicitly, e.g. by calls
+  char buf[kMaxIdLength];
+  if (StrData(Name(Reg(off))) ==
+      StrCat(buf, sizeof(buf), "$", StrData(Name(cpu_reg)), "_",
+             EnumToString(off_kind))) {
+    return false;
+  }
+  if (SameCpuReg(base, cpu_reg)) return false;
+  for (Handle x : others) {
+    if (SameCpuReg(x, cpu_reg)) return false;
+  }
+
+  mode->absorbed.clear();
+  mode->scale = 0;
+  mode->disp = 0;
+  int i = FindPrev(inss, pos, cpu_reg);
+  if (IsAab(inss, i, OPC::ADD, cpu_reg, off_kind)) {
+    const Const num(InsOperand(inss[i], 2));
+    if (off_kind == DK::U64) {
+      if (ConstValueU(num) >= (uint64_t(1) << 31)) return false;
+      mode->disp = ConstValueU(num);
+    } else {
+      mode->disp = ConstValueInt64(num);
+      if (mode->disp >= (int64_t(1) << 31) || mode->disp < -(int64_t(1) << 31))
+        return false;
+    }
+    mode->absorbed.push_back(i);
+    i = FindPrev(inss, i, cpu_reg);
+  }
+  if (IsAab(inss, i, OPC::SHL, cpu_reg, off_kind)) {
+    const int64_t scale = ConstValueInt64(Const(InsOperand(inss[i], 2)));
+    if (1 <= scale && scale <= 3) {
+      mode->scale = scale;
+      mode->absorbed.push_back(i);
+      i = FindPrev(inss, i, cpu_reg);
+    }
+  }
+  if (mode->absorbed.empty()) return false;
+  CpuReg index = cpu_reg;
+  if (i >= 0 && InsOPC(inss[i]) == OPC::MOV &&
+      SameCpuReg(InsOperand(inss[i], 0), cpu_reg)) {
+    const Handle src = InsOperand(inss[i], 1);
+    // src must still hold its value at the memory op
+    if (InCpuReg(src) && RegKind(Reg(src)) == off_kind) {
+      const CpuReg src_cpu_reg(RegCpuReg(Reg(src)));
+      bool clobbered = false;
+      for (unsigned j = i + 1; j < pos; ++j) {
+        clobbered |= InsWritesCpuReg(inss[j], src_cpu_reg);
+      }
+      if (!clobbered) {
+        index = src_cpu_reg;
+        mode->absorbed.push_back(i);
+      }
+    }
+  }
+  if (CpuRegNo(index) == +F::RSP) return false;
+  const bool overwritten =
+      InsOPC(ins) == OPC::LD && SameCpuReg(InsOperand(ins, 0), cpu_reg);
+  if (!overwritten && !IsDeadAfter(cpu_reg, inss, pos, live_out)) return false;
+  mode->index = CpuRegNo(index);
+  return true;
+}
+
+// indexed by [log2(bitwidth / 8)][disp needs 32 bits]
+const x64::OPC kLdOpcs[4][2] = {
+    {x64::OPC::mov_8_r_mbis8, x64::OPC::mov_8_r_mbis32},
+    {x64::OPC::mov_16_r_mbis8, x64::OPC::mov_16_r_mbis32},
+    {x64::OPC::mov_32_r_mbis8, x64::OPC::mov_32_r_mbis32},
+    {x64::OPC::mov_64_r_mbis8, x64::OPC::mov_64_r_mbis32},
+};
+
+const x64::OPC kStOpcs[4][2] = {
+    {x64::OPC::mov_8_mbis8_r, x64::OPC::mov_8_mbis32_r},
+    {x64::OPC::mov_16_mbis8_r, x64::OPC::mov_16_mbis32_r},
+    {x64::OPC::mov_32_mbis8_r, x64::OPC::mov_32_mbis32_r},
+    {x64::OPC::mov_64_mbis8_r, x64::OPC::mov_64_mbis32_r},
+};
+
+unsigned BitWidthIndex(DK kind) {
+  switch (DKBitWidth(kind)) {
+    case 8:
+      return 0;
+    case 16:
+      return 1;
+    case 32:
+      return 2;
+    default:
+      return 3;
+  }
+}
+
+}  // namespace
+
+std::map<unsigned, AddrMode> BblFindAddrModes(Fun fun, Bbl bbl) {
+  std::vector<Reg> live_out;
+  const Reg* const reg_map = (Reg*)FunRegMap(fun).BackingStorage();
+  for (unsigned i = 1; i < FunNumRegs(fun); ++i) {
+    if (BblLiveOut(bbl).BitGet(i)) live_out.push_back(reg_map[i]);
+  }
+  std::vector<Ins> inss;
+  for (Ins ins : BblInsIter(bbl)) inss.push_back(ins);
+
+  std::map<unsigned, AddrMode> out;
+  AddrMode mode;
+  for (unsigned pos = 0; pos < inss.size(); ++pos) {
+    const OPC opc = InsOPC(inss[pos]);
+    if (opc != OPC::LD && opc != OPC::ST && opc != OPC::LEA) continue;
+    if (FindAddrMode(inss, pos, live_out, &mode)) out[pos] = mode;
+  }
+  return out;
+}
+
+x64::Ins EmitWithAddrMode(Ins ins, const AddrMode& mode) {
+  const bool wide = mode.disp < -(1 << 7) || (1 << 7) <= mode.disp;
+  switch (InsOPC(ins)) {
+    case OPC::LD: {
+      const Reg dst(InsOperand(ins, 0));
+      x64::OPC opc;
+      if (RegKind(dst) == DK::R32) {
+        opc = wide ? x64::OPC::movss_x_mbis32 : x64::OPC::movss_x_mbis8;
+      } else if (RegKind(dst) == DK::R64) {
+        opc = wide ? x64::OPC::movsd_x_mbis32 : x64::OPC::movsd_x_mbis8;
+      } else {
+        opc = kLdOpcs[BitWidthIndex(RegKind(dst))][wide];
+      }
+      return MakeIns(opc, ExtractReg(dst), ExtractReg(Reg(InsOperand(ins, 1))),
+                     mode.index, mode.scale, mode.disp);
+    }
+    case OPC::ST: {
+      const Reg src(InsOperand(ins, 2));
+      x64::OPC opc;
+      if (RegKind(src) == DK::R32) {
+        opc = wide ? x64::OPC::movss_mbis32_x : x64::OPC::movss_mbis8_x;
+      } else if (RegKind(src) == DK::R64) {
+        opc = wide ? x64::OPC::movsd_mbis32_x : x64::OPC::movsd_mbis8_x;
+      } else {
+        opc = kStOpcs[BitWidthIndex(RegKind(src))][wide];
+      }
+      return MakeIns(opc, ExtractReg(Reg(InsOperand(ins, 0))), mode.index,
+                     mode.scale, mode.disp, ExtractReg(src));
+    }
+    default:
+      ASSERT(InsOPC(ins) == OPC::LEA, "unexpected " << ins);
+      return MakeIns(wide ? x64::OPC::lea_64_r_mbis32 : x64::OPC::lea_64_r_mbis8,
+                     ExtractReg(Reg(InsOperand(ins, 0))),
+                     ExtractReg(Reg(InsOperand(ins, 1))), mode.index, mode.scale,
+                     mode.disp);
+  }
+}
+
 }  // namespace cwerg::code_gen_x64
@@ -3,6 +3,8 @@
 // (c) Robert Muth - see LICENSE for more info
 
 #include <cstdint>
+#include <map>
+#include <vector>
 
 #include "BE/Base/ir.h"
 #include "BE/Base/opcode_gen.h"
@@ -113,6 +115,22 @@ extern void EmitFunEpilog(const EmitContext& ctx,
 
 extern void FunAddNop1ForCodeSel(base::Fun fun, std::vector<base::Ins>* inss);
 
+// [base + index * (1 << scale) + disp] replacing the ins at `absorbed`
+// (positions within the bbl) - see isel_tab.py for details
+struct AddrMode {
+  std::vector<unsigned> absorbed;
+  int64_t index;  // cpu reg no
+  int64_t scale;
+  int64_t disp;
+};
+
+// Returns the AddrModes found for the ld/st/lea at the given positions in bbl
+// The instructions at AddrMode.absorbed must not be emitted.
+extern std::map<unsigned, AddrMode> BblFindAddrModes(base::Fun fun,
+                                                     base::Bbl bbl);
+
+extern x64::Ins EmitWithAddrMode(base::Ins ins, const AddrMode& mode);
+
 extern const char* EnumToString(C f);
 extern const char* EnumToString(P f);
 
@@ -5,7 +5,7 @@
 
 import collections
 import enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from BE.Base import ir
 from BE.Base import opcode_tab as o
@@ -201,13 +201,11 @@ def _HandleReloc(cpuins: x64.Ins, pos: int, ins: ir.Ins, op: P):
     elif op is P.fun1_prel:
         fun = ins.operands[1]
         assert isinstance(fun, ir.Fun), f"{ins} {fun}"
-        assert fun.kind is not o.FUN_KIND.EXTERN, f"undefined fun: {fun.name}"
         cpuins.set_reloc(_OP_TO_RELOC_KIND[op], False, pos, fun.name)
     elif op in {P.mem1_num2_prel, P.mem0_num1_prel}:
         slot = op.value - P.mem0_num1_prel.value
         mem = ins.operands[slot]
         assert isinstance(mem, ir.Mem), f"{ins} {mem}"
-        assert mem.kind is not o.MEM_KIND.EXTERN, f"undefined fun: {mem.name}"
         num = ins.operands[slot + 1]
         assert isinstance(num, ir.Const), f"{ins} {num}"
         assert cpuins.operands[pos] == 0
@@ -249,11 +247,11 @@ def _ExtractTmplArgOp(ins: ir.Ins, arg: P, ctx: regs.EmitContext) -> int:
         assert isinstance(ops[pos], ir.Const)
         return ops[pos].value
     elif arg is P.stk1_offset2:
-        return GetStackOffset(ops[1], ops[2])
+        return GetStackOffset(ops[1], ops[2]) - ctx.red_zone_size
     elif arg is P.stk0_offset1:
-        return GetStackOffset(ops[0], ops[1])
+        return GetStackOffset(ops[0], ops[1]) - ctx.red_zone_size
     elif arg is P.stk1:
-        return GetStackOffset(ops[1], ir.Const(o.DK.U32, 0))
+        return GetStackOffset(ops[1], ir.Const(o.DK.U32, 0)) - ctx.red_zone_size
     elif arg is P.tmp_gpr:
         return _F_TO_INT[F.RAX]
     elif arg is P.tmp_flt:
@@ -266,21 +264,30 @@ def _ExtractTmplArgOp(ins: ir.Ins, arg: P, ctx: regs.EmitContext) -> int:
         reg = ops[pos]
         assert isinstance(reg, ir.Reg)
         assert isinstance(reg.cpu_reg, ir.StackSlot)
-        return reg.cpu_reg.offset
+        return reg.cpu_reg.offset - ctx.red_zone_size
     elif arg is P.spill01:
         assert ops[0] == ops[1]
         reg = ops[0]
         assert isinstance(reg, ir.Reg)
         assert isinstance(reg.cpu_reg, ir.StackSlot)
-        return reg.cpu_reg.offset
+        return reg.cpu_reg.offset - ctx.red_zone_size
     elif arg is P.frame_size:
-        return ctx.FrameSize()
+        return ctx.FrameSize() - ctx.red_zone_size
     elif arg in _OP_TO_RELOC_KIND:
         return 0
     else:
         assert False, f"could not extract op for {ins} {ins.operands}  unsupported: {arg}"
 
 
+# How InsTmpl fills in an operand that depends on the IR instruction, see InsTmpl._fillers
+_FILL_REG = 0  # cpu reg number of the IR operand at the given index
+_FILL_NUM = 1  # value of the IR const operand at the given index
+_FILL_PARAM = 2  # anything else is handled by _ExtractTmplArgOp
+
+_REG_PARAMS = {P.reg0, P.reg1, P.reg2, P.reg3}
+_NUM_PARAMS = {P.num0, P.num1, P.num2, P.num3, P.num4}
+
+
 class InsTmpl:
     """Represents a template for an A32 instructions
 
@@ -344,24 +351,43 @@ class InsTmpl:
 
         self.opcode = opcode
         self.args: List[Any] = args
+        # The compiled form of args used by MakeInsFromTmpl:
+        # operands not depending on the IR instruction are computed once here,
+        # the others are described by (pos, _FILL_XXX, IR operand index or P)
+        # and relocations by (pos, P)
+        self._operands: List[int] = []
+        self._fillers: List[Tuple[int, int, Any]] = []
+        self._relocs: List[Tuple[int, P]] = []
+        for n, arg in enumerate(args):
+            if isinstance(arg, F):
+                self._operands.append(_F_TO_INT[arg])
+                continue
+            elif type(arg) == int:
+                self._operands.append(arg)
+                continue
+            # the value for relocs is filled in by _HandleReloc if needed
+            self._operands.append(0)
+            if arg in _OP_TO_RELOC_KIND:
+                self._relocs.append((n, arg))
+            elif arg in _REG_PARAMS:
+                self._fillers.append((n, _FILL_REG, arg.value - P.reg0.value))
+            elif arg in _NUM_PARAMS:
+                self._fillers.append((n, _FILL_NUM, arg.value - P.num0.value))
+            else:
+                self._fillers.append((n, _FILL_PARAM, arg))
 
     def MakeInsFromTmpl(self, ins: Optional[ir.Ins], ctx: regs.EmitContext) -> x64.Ins:
-        out = x64.Ins(self.opcode)
-        for n, arg in enumerate(self.args):
-            if type(arg) == int:
-                val = arg
-            elif isinstance(arg, F):
-                val = _F_TO_INT[arg]
-            elif isinstance(arg, P):
-                val = _ExtractTmplArgOp(ins, arg, ctx)
+        operands = self._operands.copy()
+        for pos, fill, arg in self._fillers:
+            if fill == _FILL_REG:
+                operands[pos] = ins.operands[arg].cpu_reg.no
+            elif fill == _FILL_NUM:
+                operands[pos] = ins.operands[arg].value
             else:
-                assert False, f"unknown param {repr(arg)}"
-
-            assert isinstance(val, int), f"expected int {val}"
-            out.operands.append(val)
-            # note: this may alter the value we just appended
-            if arg in _OP_TO_RELOC_KIND:
-                _HandleReloc(out, n, ins, arg)
+                operands[pos] = _ExtractTmplArgOp(ins, arg, ctx)
+        out = x64.Ins(self.opcode, operands)
+        for pos, arg in self._relocs:
+            _HandleReloc(out, pos, ins, arg)
         return out
 
 
@@ -385,6 +411,9 @@ class Pattern:
     """
     # groups all the patterns for a given opcode number together
     Table: Dict[int, List["Pattern"]] = collections.defaultdict(list)
+    # maps an opcode number plus operand shapes (see _OperandShape) to the
+    # patterns which can possibly match. Filled lazily by FindMatchingPattern.
+    Candidates: Dict[Tuple[int, Tuple], List["Pattern"]] = {}
 
     def __init__(self, opcode: o.Opcode, type_constraints: List[o.DK],
                  op_curbs: List[C], emit: List[InsTmpl]):
@@ -414,6 +443,34 @@ class Pattern:
 
         # we put all the patterns for given IR opcode into the same bucket
         Pattern.Table[opcode.no].append(self)
+        Pattern.Candidates.clear()
+
+    def MatchesShape(self, shapes: Tuple) -> bool:
+        """Like MatchesTypeCurbs and MatchesOpCurbs but ignoring immediate
+        ranges and fixed cpu regs
+
+        shapes are the _OperandShape()s of the instruction operands
+        """
+        for type_constr, op_curb, shape in zip(self.type_constraints, self.op_curbs, shapes):
+            if type_constr is o.DK.INVALID:
+                continue
+            assert shape is not None
+            kind, spilled = shape
+            if kind != type_constr:
+                return False
+            if op_curb is C.REG:
+                if spilled is not False:
+                    return False
+            elif op_curb is C.SP_REG:
+                if spilled is not True:
+                    return False
+            elif op_curb in {C.REG_RAX, C.REG_RCX, C.REG_RDX}:
+                if spilled is None:
+                    return False
+            elif spilled is not None:
+                # need an immediate
+                return False
+        return True
 
     def MatchesTypeCurbs(self, ins: ir.Ins) -> bool:
         for type_constr, op in zip(self.type_constraints, ins.operands):
@@ -512,12 +569,13 @@ def EmitFunProlog(ctx: regs.EmitContext) -> List[InsTmpl]:
     gpr_regs = regs.MaskToGprRegs(ctx.gpr_reg_mask)
     flt_regs = regs.MaskToFltRegs(ctx.flt_reg_mask)
     stk_size -= 8 * len(gpr_regs) + 8  # "8" is for the return address
+    stk_size -= ctx.red_zone_size
     while gpr_regs:
         out.append(
             InsTmpl("push_64_r", [F(F.RAX.value + gpr_regs.pop(-1).no)]))
     if stk_size > 0:
         out.append(InsTmpl("sub_64_mr_imm32", [F.RSP, stk_size]))
-    offset = ctx.stk_size
+    offset = ctx.stk_size - ctx.red_zone_size
     while flt_regs:
         out.append(InsTmpl("movsd_mbis32_x", Spilled(offset) +
                            [F(F.XMM0.value + flt_regs.pop(-1).no)]))
@@ -533,11 +591,12 @@ def EmitFunEpilog(ctx: regs.EmitContext) -> List[InsTmpl]:
     gpr_regs = regs.MaskToGprRegs(ctx.gpr_reg_mask)
     flt_regs = regs.MaskToFltRegs(ctx.flt_reg_mask)
     stk_size -= 8 * len(gpr_regs) + 8  # "8" is for the return address
+    stk_size -= ctx.red_zone_size
     while gpr_regs:
         out.append(InsTmpl("pop_64_r", [F(F.RAX.value + gpr_regs.pop(-1).no)]))
     if stk_size > 0:
         out.append(InsTmpl("add_64_mr_imm32", [F.RSP, stk_size]))
-    offset = ctx.stk_size
+    offset = ctx.stk_size - ctx.red_zone_size
     while flt_regs:
         out.append(
             InsTmpl("movsd_x_mbis32", [F(F.XMM0.value + flt_regs.pop(-1).no)] + Spilled(offset)))
@@ -688,12 +747,20 @@ def InitAluInt():
                     [InsTmpl(f"{x64_opc}_{bw}_mbis32_imm{iw}", Spilled(P.spill01) + [P.num2])])
 
     # there is not 8 bit mul - it is handled by lowering
-    # TODO: support some immediate variants
     for kind1 in [o.DK.U16, o.DK.S16, o.DK.U32, o.DK.S32, o.DK.U64, o.DK.S64]:
         bw = kind1.bitwidth()
         Pattern(o.MUL, [kind1] * 3,
                 [C.REG, C.REG, C.REG],
                 [InsTmpl(f"imul_{bw}_r_mr", [P.reg01, P.reg2])])
+        if bw >= 32:
+            # the peephole optimizer turns the multipliers 3, 5, 9 into an lea
+            Pattern(o.MUL, [kind1] * 3,
+                    [C.REG, C.REG, _KIND_TO_IMM[kind1]],
+                    [InsTmpl(f"imul_{bw}_r_mr_imm32", [P.reg01, P.reg01, P.num2])])
+            Pattern(o.MUL, [kind1] * 3,
+                    [C.SP_REG, C.SP_REG, _KIND_TO_IMM[kind1]],
+                    [InsTmpl(f"imul_{bw}_r_mbis32_imm32", [P.tmp_gpr] + Spilled(P.spill01) + [P.num2]),
+                     InsTmpl(f"mov_{bw}_mbis32_r", Spilled(P.spill01) + [P.tmp_gpr])])
         Pattern(o.MUL, [kind1] * 3,
                 [C.SP_REG, C.SP_REG, C.REG],
                 [InsTmpl(f"mov_{bw}_r_mbis32", [P.tmp_gpr] + Spilled(P.spill01)),
@@ -1469,21 +1536,239 @@ def InitBITCAST():
                  InsTmpl(f"mov_{bw_int}_mbis32_r", Spilled(P.spill0) + [P.tmp_gpr])])
 
 
+def _OperandShape(op) -> Optional[Tuple[o.DK, Optional[bool]]]:
+    """Returns the properties of an operand that pattern matching depends on,
+    except for immediate values and fixed cpu regs
+
+    The second component is None for consts and otherwise whether the reg is spilled
+    """
+    if isinstance(op, ir.Reg):
+        return op.kind, isinstance(op.cpu_reg, ir.StackSlot)
+    elif isinstance(op, ir.Const):
+        return op.kind, None
+    return None
+
+
 def FindMatchingPattern(ins: ir.Ins) -> Optional[Pattern]:
     """Returns the best pattern matching `ins` or None
 
     This can only be called AFTER the stack has been finalized
     """
-    patterns = Pattern.Table[ins.opcode.no]
+    key = (ins.opcode.no, tuple([_OperandShape(op) for op in ins.operands]))
+    patterns = Pattern.Candidates.get(key)
+    if patterns is None:
+        patterns = [p for p in Pattern.Table[ins.opcode.no] if p.MatchesShape(key[1])]
+        Pattern.Candidates[key] = patterns
     # print(f"@@ {ins} {ins.operands}")
     for p in patterns:
         # print(f"@@ trying pattern {p}")
-        if p.MatchesTypeCurbs(ins) and p.MatchesOpCurbs(ins):
+        if p.MatchesOpCurbs(ins):
             return p
     # assert False, f"Could not find a matching patterns for {ins}. tried:\n{patterns}"
     return None
 
 
+############################################################
+# Complex addressing modes: [base + index * scale + disp]
+#
+# The ld/st/lea patterns above only use [base + offset].
+# Here we additionally absorb the computation of the offset reg if it
+# precedes the memory op, i.e.:
+#
+#   [mov off = index]       # optional, from the AAB rewrite
+#   [shl off = off 1..3]
+#   [add off = off disp]
+#   ld/st/lea ... base off ...
+#
+# This runs after register allocation so the reaching defs are not
+# reliable anymore and the steps of the chain may use different regs
+# sharing the same cpu reg. Hence we compare cpu regs, only step over
+# simple instructions not touching the cpu regs involved and
+# require that the cpu reg of `off` is dead after the memory op.
+# Only 64 bit offsets are supported: narrower ones get extended after the
+# arithmetic which would change the semantics on overflow.
+############################################################
+
+class AddrMode:
+    """[base + index * (1 << scale) + disp] replacing the ins at `absorbed`"""
+
+    def __init__(self, absorbed: List[int], index: int, scale: int, disp: int):
+        self.absorbed = absorbed  # positions within the bbl
+        self.index = index  # cpu reg no
+        self.scale = scale
+        self.disp = disp
+
+
+def _InCpuReg(op) -> bool:
+    return isinstance(op, ir.Reg) and op.HasCpuReg()
+
+
+def _SameCpuReg(op, cpu_reg: ir.CpuReg) -> bool:
+    return _InCpuReg(op) and op.cpu_reg == cpu_reg
+
+
+# instructions without implicit register effects beyond their operands
+# (line markers emit no code and must not change the code of their neighbors)
+_SIMPLE_KINDS = {o.OPC_KIND.ALU, o.OPC_KIND.ALU1, o.OPC_KIND.MOV, o.OPC_KIND.LEA,
+                 o.OPC_KIND.LEA1, o.OPC_KIND.LD, o.OPC_KIND.ST, o.OPC_KIND.CONV,
+                 o.OPC_KIND.NOP1, o.OPC_KIND.LINE}
+
+# these only read their operands
+_BRANCH_KINDS = {o.OPC_KIND.COND_BRA, o.OPC_KIND.BRA, o.OPC_KIND.SWITCH}
+
+
+def _CpuRegsWritten(ins: ir.Ins):
+    if ins.opcode.kind is o.OPC_KIND.NOP1:
+        # the reg becomes the scratch of the next ins
+        return [ins.operands[0].cpu_reg]
+    return [op.cpu_reg for op in ins.operands[:ins.opcode.def_ops_count()]]
+
+
+def _CpuRegsRead(ins: ir.Ins):
+    if ins.opcode.kind is o.OPC_KIND.NOP1:
+        return []
+    return [op.cpu_reg for op in ins.operands[ins.opcode.def_ops_count():]
+            if _InCpuReg(op)]
+
+
+def _IsDeadAfter(cpu_reg: ir.CpuReg, inss: List[ir.Ins], pos: int, live_out) -> bool:
+    for ins in inss[pos + 1:]:
+        if ins.opcode.kind not in _SIMPLE_KINDS and ins.opcode.kind not in _BRANCH_KINDS:
+            return False
+        if cpu_reg in _CpuRegsRead(ins):
+            return False
+        if cpu_reg in _CpuRegsWritten(ins):
+            return True
+    return not any(_SameCpuReg(reg, cpu_reg) for reg in live_out)
+
+
+def _FindAddrMode(inss: List[ir.Ins], pos: int, live_out) -> Optional[AddrMode]:
+    ins = inss[pos]
+    ops = ins.operands
+    if ins.opcode is o.LD:
+        # a spilled dst would need a memory to memory move
+        if not _InCpuReg(ops[0]):
+            return None
+        base, off, others = ops[1], ops[2], []
+    elif ins.opcode is o.ST:
+        base, off, others = ops[0], ops[1], [ops[2]]
+    elif ins.opcode is o.LEA and ops[0] == ops[1]:
+        base, off, others = ops[1], ops[2], []
+    else:
+        return None
+    if not (_InCpuReg(off) and _InCpuReg(base) and all(_InCpuReg(x) for x in others)):
+        return None
+    if off.kind not in {o.DK.U64, o.DK.S64}:
+        return None
+    # regs pinned to a cpu reg may be read implicitly, e.g. by calls
+    if off.name == f"${off.cpu_reg.name}_{off.kind.name}":
+        return None
+    cpu_reg = off.cpu_reg
+    if any(_SameCpuReg(x, cpu_reg) for x in [base] + others):
+        return None
+
+    absorbed = []
+    disp = 0
+    scale = 0
+    n = pos
+
+    def find_prev():
+        """Returns the position of the closest ins before `n` touching cpu_reg"""
+        for i in range(n - 1, -1, -1):
+            prev = inss[i]
+            if prev.opcode.kind not in _SIMPLE_KINDS:
+                return -1
+            if cpu_reg in _CpuRegsRead(prev) or cpu_reg in _CpuRegsWritten(prev):
+                return i
+        return -1
+
+    def is_aab(i, opcode, kind) -> bool:
+        if i < 0:
+            return False
+        prev = inss[i]
+        return (prev.opcode is opcode and _SameCpuReg(prev.operands[0], cpu_reg) and
+                _SameCpuReg(prev.operands[1], cpu_reg) and
+                isinstance(prev.operands[2], ir.Const) and prev.operands[2].kind is kind)
+
+    i = find_prev()
+    if is_aab(i, o.ADD, off.kind):
+        disp = inss[i].operands[2].value
+        if (1 << 31) <= disp or disp < -(1 << 31):
+            return None
+        absorbed.append(i)
+        n = i
+        i = find_prev()
+    if is_aab(i, o.SHL, off.kind) and 1 <= inss[i].operands[2].value <= 3:
+        scale = inss[i].operands[2].value
+        absorbed.append(i)
+        n = i
+        i = find_prev()
+    if not absorbed:
+        return None
+    index = cpu_reg
+    if i >= 0 and inss[i].opcode is o.MOV and _SameCpuReg(inss[i].operands[0], cpu_reg):
+        src = inss[i].operands[1]
+        # src must still hold its value at the memory op
+        if (_InCpuReg(src) and src.kind is off.kind and
+                all(src.cpu_reg not in _CpuRegsWritten(x) for x in inss[i + 1:pos])):
+            index = src.cpu_reg
+            absorbed.append(i)
+    if index.no == _F_TO_INT[F.RSP]:
+        return None
+    overwritten = ins.opcode is o.LD and _SameCpuReg(ops[0], cpu_reg)
+    if not overwritten and not _IsDeadAfter(cpu_reg, inss, pos, live_out):
+        return None
+    return AddrMode(absorbed, index.no, scale, disp)
+
+
+def BblFindAddrModes(bbl: ir.Bbl) -> Dict[int, AddrMode]:
+    """Returns the AddrModes found for the ld/st/lea at the given positions in bbl
+
+    The instructions at AddrMode.absorbed must not be emitted.
+    """
+    out = {}
+    inss = bbl.inss
+    for pos, ins in enumerate(inss):
+        if ins.opcode in {o.LD, o.ST, o.LEA}:
+            mode = _FindAddrMode(inss, pos, bbl.live_out)
+            if mode:
+                out[pos] = mode
+    return out
+
+
+def _MemOpSuffix(disp: int) -> str:
+    return "mbis8" if -(1 << 7) <= disp < (1 << 7) else "mbis32"
+
+
+def EmitWithAddrMode(ins: ir.Ins, mode: AddrMode) -> List[x64.Ins]:
+    ops = ins.operands
+    addr = [mode.index, mode.scale, mode.disp]
+    mem = _MemOpSuffix(mode.disp)
+    if ins.opcode is o.LD:
+        dst = ops[0]
+        if dst.kind is o.DK.R32:
+            name = f"movss_x_{mem}"
+        elif dst.kind is o.DK.R64:
+            name = f"movsd_x_{mem}"
+        else:
+            name = f"mov_{dst.kind.bitwidth()}_r_{mem}"
+        operands = [dst.cpu_reg.no, ops[1].cpu_reg.no] + addr
+    elif ins.opcode is o.ST:
+        src = ops[2]
+        if src.kind is o.DK.R32:
+            name = f"movss_{mem}_x"
+        elif src.kind is o.DK.R64:
+            name = f"movsd_{mem}_x"
+        else:
+            name = f"mov_{src.kind.bitwidth()}_{mem}_r"
+        operands = [ops[0].cpu_reg.no] + addr + [src.cpu_reg.no]
+    else:
+        assert ins.opcode is o.LEA
+        name = f"lea_64_r_{mem}"
+        operands = [ops[0].cpu_reg.no, ops[1].cpu_reg.no] + addr
+    return [x64.Ins(x64.Opcode.name_to_opcode[name], operands)]
+
+
 InitAluInt()
 InitBitFiddle()
 InitAluFlt()
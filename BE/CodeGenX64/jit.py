@@ -0,0 +1,206 @@
+"""In-process JIT for x64
+
+Runs the regular pipeline (LegalizeAll, RegAllocAll, EmitUnitAsBinary) on an ir.Unit
+and places the resulting sections into anonymous mmap'ed memory instead of an
+Elf executable. The memory is a single mapping so that the pc relative
+relocations between .text and the data sections stay in range:
+
+    .text     RX
+    .rodata   R
+    .data     RW
+    .bss      RW
+
+Typical use:
+
+    code = jit.JitUnit(unit)
+    fib = code.GetFun("fib")
+    print(fib(10))
+    code.close()
+
+With `perf_map=True` the funs are also listed in /tmp/perf-<pid>.map so that
+`perf report` can symbolize samples in the JIT'ed code. close() removes them
+again since the address range may be reused by a later JitUnit.
+"""
+import collections
+import ctypes
+import mmap
+import os
+from typing import Dict, Any, List, Tuple
+
+from BE.Base import ir
+from BE.Base import opcode_tab as o
+from BE.CpuX64 import assembler
+from BE.CodeGenX64 import codegen
+from BE.Elf import elf_unit
+
+_LIBC = ctypes.CDLL(None, use_errno=True)
+_LIBC.mprotect.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+
+# Cwerg passes integers in the same regs as the Linux calling convention
+# but floats start at xmm1 (see regs.py), so only the kinds below can be
+# called via ctypes.
+_DK_TO_CTYPE = {
+    o.DK.S8: ctypes.c_int8,
+    o.DK.S16: ctypes.c_int16,
+    o.DK.S32: ctypes.c_int32,
+    o.DK.S64: ctypes.c_int64,
+    o.DK.U8: ctypes.c_uint8,
+    o.DK.U16: ctypes.c_uint16,
+    o.DK.U32: ctypes.c_uint32,
+    o.DK.U64: ctypes.c_uint64,
+    o.DK.A64: ctypes.c_void_p,
+    o.DK.C64: ctypes.c_void_p,
+}
+
+_MAX_INT_PARAMS = 6
+
+_SECTION_PROT = {
+    ".text": mmap.PROT_READ | mmap.PROT_EXEC,
+    ".rodata": mmap.PROT_READ,
+    ".data": mmap.PROT_READ | mmap.PROT_WRITE,
+    ".bss": mmap.PROT_READ | mmap.PROT_WRITE,
+}
+
+
+def _PageAlign(size: int) -> int:
+    return (size + mmap.PAGESIZE - 1) // mmap.PAGESIZE * mmap.PAGESIZE
+
+
+def PerfMapPath() -> str:
+    return f"/tmp/perf-{os.getpid()}.map"
+
+
+def FunRanges(elfunit: elf_unit.Unit) -> List[Tuple[int, int, str]]:
+    """Returns (start, size, name) for every fun in .text
+
+    The symbol values must already be absolute. A fun extends to the start of the
+    next one (which includes the alignment padding).
+    """
+    sec_text = elfunit.sec_text
+    starts = sorted((sym.st_value, sym.name) for sym in elfunit.global_symbol_map.values()
+                    if sym.section is sec_text)
+    ends = [start for start, _ in starts[1:]] + [sec_text.sh_addr + sec_text.sh_size]
+    return [(start, end - start, name) for (start, name), end in zip(starts, ends)]
+
+
+def WritePerfMap(elfunit: elf_unit.Unit, fout):
+    """Writes the funs in the format of perf's /tmp/perf-<pid>.map"""
+    for start, size, name in FunRanges(elfunit):
+        print(f"{start:x} {size:x} {name}", file=fout)
+
+
+def RemoveFromPerfMap(start: int, size: int):
+    """Drops the entries for funs in [start, start + size) from the perf map"""
+    path = PerfMapPath()
+    if not os.path.exists(path):
+        return
+    with open(path) as fin:
+        lines = fin.readlines()
+    keep = [line for line in lines if not start <= int(line.split()[0], 16) < start + size]
+    if len(keep) == len(lines):
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "w") as fout:
+        fout.writelines(keep)
+    os.replace(tmp, path)
+
+
+class JitUnit:
+    """Executable memory holding the code and data of an ir.Unit
+
+    The ir.Unit must be self-contained, i.e. it cannot reference EXTERN funs or mems.
+    Note: the unit is consumed by the code generator.
+    """
+
+    def __init__(self, unit: ir.Unit, loop_alignment: int = 0, perf_map: bool = False):
+        # record the signatures before the code generator rewrites the funs
+        self.signatures = {fun.name: (list(fun.output_types), list(fun.input_types))
+                           for fun in unit.funs if fun.kind is o.FUN_KIND.NORMAL}
+        opt_stats: Dict[str, int] = collections.defaultdict(int)
+        # all funs are potential entry points so nothing is unreachable
+        codegen.LegalizeAll(unit, opt_stats, None, remove_unreachable=False)
+        codegen.RegAllocAll(unit, opt_stats, None)
+        self.elfunit: elf_unit.Unit = codegen.EmitUnitAsBinary(unit, loop_alignment)
+        for sym in self.elfunit.symbols:
+            assert not sym.is_undefined(), f"undefined symbol: {sym.name}"
+
+        sections = [sec for sec in self.elfunit.sections() if sec.sh_size > 0]
+        # every section gets its own pages so it can have its own protection
+        offsets = []
+        size = 0
+        for sec in sections:
+            offsets.append(size)
+            size += _PageAlign(sec.sh_size)
+        self._buf = mmap.mmap(-1, size, prot=mmap.PROT_READ | mmap.PROT_WRITE)
+        self._base = ctypes.c_char.from_buffer(self._buf)
+        self.base_addr = ctypes.addressof(self._base)
+        self.size = size
+
+        for sec, offset in zip(sections, offsets):
+            sec.sh_addr = self.base_addr + offset
+        for sym in self.elfunit.symbols:
+            if sym.section:
+                sym.st_value += sym.section.sh_addr
+        for rel in self.elfunit.relocations:
+            assembler._ApplyRelocation(rel)
+        for sec, offset in zip(sections, offsets):
+            if sec.is_nobits():
+                continue
+            # mmap'ed memory is zeroed so the skipped zero runs need no copying
+            for chunk_offset, chunk in sec.data_chunks():
+                start = offset + chunk_offset
+                self._buf[start: start + len(chunk)] = chunk
+        for sec, offset in zip(sections, offsets):
+            if _LIBC.mprotect(sec.sh_addr, _PageAlign(sec.sh_size),
+                              _SECTION_PROT[sec.name]) != 0:
+                raise OSError(ctypes.get_errno(), f"mprotect failed for {sec.name}")
+        if perf_map:
+            # appending since there may be several JitUnits in this process
+            with open(PerfMapPath(), "a") as fout:
+                WritePerfMap(self.elfunit, fout)
+        self._perf_map = perf_map
+        self._funs: Dict[str, Any] = {}
+
+    def GetAddress(self, name: str) -> int:
+        """Returns the address of the global fun or mem `name`"""
+        sym = self.elfunit.global_symbol_map.get(name)
+        assert sym is not None and not sym.is_undefined(), f"unknown symbol {name}"
+        return sym.st_value
+
+    def GetFun(self, name: str):
+        """Returns a ctypes callable for the NORMAL fun `name`
+
+        The ctypes signature is derived from the one of the fun which may have
+        at most one result and must not use floating point kinds.
+        """
+        fun = self._funs.get(name)
+        if fun is None:
+            assert name in self.signatures, f"unknown fun {name}"
+            outputs, inputs = self.signatures[name]
+            assert len(outputs) <= 1, f"{name}: ctypes supports only one result"
+            assert len(inputs) <= _MAX_INT_PARAMS, f"{name}: too many params"
+            for kind in outputs + inputs:
+                assert kind in _DK_TO_CTYPE, f"{name}: unsupported kind {kind.name}"
+            restype = _DK_TO_CTYPE[outputs[0]] if outputs else None
+            ftype = ctypes.CFUNCTYPE(restype, *[_DK_TO_CTYPE[k] for k in inputs])
+            fun = ftype(self.GetAddress(name))
+            self._funs[name] = fun
+        return fun
+
+    def GetFuns(self) -> Dict[str, Any]:
+        """Returns ctypes callables for all NORMAL funs with a supported signature"""
+        out = {}
+        for name, (outputs, inputs) in self.signatures.items():
+            if (len(outputs) <= 1 and len(inputs) <= _MAX_INT_PARAMS and
+                    all(k in _DK_TO_CTYPE for k in outputs + inputs)):
+                out[name] = self.GetFun(name)
+        return out
+
+    def close(self):
+        """Releases the memory - all callables obtained earlier become invalid"""
+        self._funs.clear()
+        if self._perf_map:
+            RemoveFromPerfMap(self.base_addr, self.size)
+        # the ctypes object pins the mmap buffer
+        del self._base
+        self._buf.close()
@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include <iomanip>
+#include <map>
 
 #include "BE/Base/canonicalize.h"
 #include "BE/Base/cfg.h"
@@ -35,11 +36,14 @@ bool IsOutOfBoundImmediate(OPC opc, Handle op, unsigned pos) {
       return false;
     case OPC::DIV:
     case OPC::REM:
-    case OPC::MUL:
     case OPC::CNTLZ:
     case OPC::CNTTZ:
     case OPC::CONV:
       return true;
+    case OPC::MUL:
+      // imul has an immediate form only for the second source
+      if (pos != 2 || DKBitWidth(dk) < 32) return true;
+      break;
     case OPC::ST:
     case OPC::ST_STK:
     case OPC::ST_MEM:
@@ -428,6 +432,7 @@ void DumpRegStats(Fun fun, const DK_LAC_COUNTS& stats, std::ostream* output) {
 void GlobalRegAllocOneKind(Fun fun, CPU_REG_KIND kind,
                            const FunRegStats& needed, uint32_t regs_lac,
                            uint32_t regs_not_lac, uint32_t regs_lac_mask,
+                           const std::map<Reg, std::vector<CpuReg>>& clobbered,
                            std::vector<Reg>* regs, std::ostream* debug) {
   uint32_t pre_alloced = 0;
   for (Reg reg : FunRegIter(fun)) {
@@ -454,17 +459,32 @@ void GlobalRegAllocOneKind(Fun fun, CPU_REG_KIND kind,
     *debug << "@@ " << EnumToString(kind) << " POOL " << std::hex << global_lac
            << " " << global_not_lac << std::dec << "\n";
 
-  // handle is_lac global regs
-  regs->clear();
-  FunFilterGlobalRegs(fun, kind, true, DK_TO_CPU_REG_KIND_MAP, regs);
-  std::sort(regs->begin(), regs->end(), reg_cmp);  // make things deterministic
-  AssignCpuRegOrMarkForSpilling(*regs, global_lac, 0);
   // handle not is_lac global regs
   regs->clear();
   FunFilterGlobalRegs(fun, kind, false, DK_TO_CPU_REG_KIND_MAP, regs);
   std::sort(regs->begin(), regs->end(), reg_cmp);  // make things deterministic
   AssignCpuRegOrMarkForSpilling(*regs, global_not_lac & ~regs_lac_mask,
                                 global_not_lac & regs_lac_mask);
+  // lac globals which are only live across calls to funs with a clobber
+  // summary may use the leftover caller-saved regs not clobbered by those calls
+  uint32_t leftover = global_not_lac & ~regs_lac_mask;
+  for (Reg reg : *regs) {
+    const CpuReg cpu_reg(RegCpuReg(reg));
+    if (Kind(cpu_reg) == RefKind::CPU_REG) {
+      leftover &= ~CpuRegToAllocMask(cpu_reg);
+    }
+  }
+  // handle is_lac global regs
+  regs->clear();
+  FunFilterGlobalRegs(fun, kind, true, DK_TO_CPU_REG_KIND_MAP, regs);
+  std::sort(regs->begin(), regs->end(), reg_cmp);  // make things deterministic
+  std::map<Reg, uint32_t> excluded;
+  for (Reg reg : *regs) {
+    auto it = clobbered.find(reg);
+    excluded[reg] =
+        it == clobbered.end() ? leftover : CpuRegsToMask(it->second, kind);
+  }
+  AssignCpuRegOrMarkForSpilling(*regs, leftover, global_lac, &excluded);
 }
 
 void PhaseGlobalRegAlloc(Fun fun, Unit unit, std::ostream* fout) {
@@ -481,7 +501,8 @@ void PhaseGlobalRegAlloc(Fun fun, Unit unit, std::ostream* fout) {
   FunDropUnreferencedRegs(fun);
   FunNumberReg(fun);
   FunComputeLivenessInfo(fun);
-  FunComputeRegStatsLAC(fun);
+  std::map<Reg, std::vector<CpuReg>> clobbered;
+  FunComputeRegStatsLAC(fun, &clobbered);
 
   const DK_LAC_COUNTS local_reg_stats =
       FunComputeBblRegUsageStats(fun, DK_TO_CPU_REG_KIND_MAP);
@@ -503,7 +524,7 @@ void PhaseGlobalRegAlloc(Fun fun, Unit unit, std::ostream* fout) {
         fun, CPU_REG_KIND::GPR, needed,
         GPR_REGS_MASK & GPR_LAC_REGS_MASK & ~GPR_REG_IMPLICIT_MASK,
         GPR_REGS_MASK & ~GPR_LAC_REGS_MASK & ~GPR_REG_IMPLICIT_MASK,
-        GPR_LAC_REGS_MASK, &regs, debug);
+        GPR_LAC_REGS_MASK, clobbered, &regs, debug);
   }
   {
     const FunRegStats needed{global_reg_stats.lac[+CPU_REG_KIND::FLT],
@@ -512,7 +533,8 @@ void PhaseGlobalRegAlloc(Fun fun, Unit unit, std::ostream* fout) {
                              local_reg_stats.not_lac[+CPU_REG_KIND::FLT]};
     GlobalRegAllocOneKind(
         fun, CPU_REG_KIND::FLT, needed, FLT_REGS_MASK & FLT_LAC_REGS_MASK,
-        FLT_REGS_MASK & ~FLT_LAC_REGS_MASK, FLT_LAC_REGS_MASK, &regs, debug);
+        FLT_REGS_MASK & ~FLT_LAC_REGS_MASK, FLT_LAC_REGS_MASK, clobbered,
+        &regs, debug);
   }
 }
 
@@ -530,6 +552,10 @@ void PhaseFinalizeStackAndLocalRegAlloc(Fun fun, Unit unit,
   FunMoveEliminationCpu(fun, &inss);
 }
 
+void PhaseComputeClobberSummary(Fun fun, Unit unit, std::ostream* fout) {
+  FunComputeCpuLiveClobber(fun, IMPLICIT_CLOBBER_REGS, CALLEE_SAVED_REGS);
+}
+
 void LegalizeAll(Unit unit, bool verbose, std::ostream* fout) {
   std::vector<Fun> seeds;
   Fun fun = UnitFunFind(unit, StrNew("main"));
@@ -562,4 +588,13 @@ void RegAllocLocal(Unit unit, bool verbose, std::ostream* fout) {
   }
 }
 
+void RegAllocAll(Unit unit, bool verbose, std::ostream* fout) {
+  for (Fun fun : UnitFunsInCallGraphPostOrder(unit)) {
+    FunCheck(fun);
+    PhaseGlobalRegAlloc(fun, unit, fout);
+    PhaseFinalizeStackAndLocalRegAlloc(fun, unit, fout);
+    PhaseComputeClobberSummary(fun, unit, fout);
+  }
+}
+
 }  // namespace  cwerg::code_gen_x64
@@ -21,11 +21,22 @@ extern void PhaseFinalizeStackAndLocalRegAlloc(base::Fun fun,
                                                base::Unit unit,
                                                std::ostream* fout);
 
+// Must run after register allocation of fun and all its callees.
+// Callers register allocated afterwards benefit from the summary.
+extern void PhaseComputeClobberSummary(base::Fun fun,
+                                       base::Unit unit,
+                                       std::ostream* fout);
+
 void LegalizeAll(base::Unit unit, bool verbose, std::ostream* fout);
 
 void RegAllocGlobal(base::Unit unit, bool verbose, std::ostream* fout);
 
 void RegAllocLocal(base::Unit unit, bool verbose, std::ostream* fout);
 
+// Global and local reg alloc one fun at a time, callees first.
+// This way the clobber summaries of the callees are available when
+// allocating the callers.
+void RegAllocAll(base::Unit unit, bool verbose, std::ostream* fout);
+
 
 }  // namespace cwerg::code_gen_x64
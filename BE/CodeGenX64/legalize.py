@@ -37,7 +37,10 @@ def IsOutOfBoundImmediate(opcode, op, pos) -> bool:
         return True
     if opcode is o.MOV:
         return False
-    if opcode in {o.DIV, o.REM, o.MUL, o.CNTTZ, o.CNTLZ, o.CONV}:
+    if opcode in {o.DIV, o.REM, o.CNTTZ, o.CNTLZ, o.CONV}:
+        return True
+    # imul has an immediate form only for the second source
+    if opcode is o.MUL and (pos != 2 or op.kind.bitwidth() < 32):
         return True
     if pos == 2 and opcode in {o.ST, o.ST_STK, o.ST_MEM}:
         return True
@@ -366,7 +369,7 @@ def _GetRegPoolsForGlobals(needed: RegsNeeded, regs_lac: int,
 
 
 def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded, regs_lac,
-                          regs_not_lac, regs_lac_mask, global_reg_stats, debug):
+                          regs_not_lac, regs_lac_mask, global_reg_stats, clobbered, debug):
     pre_allocated = 0
     for reg in fun.regs:
         if reg.HasCpuReg() and reg.cpu_reg.kind == kind:
@@ -382,11 +385,22 @@ def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded
         print(f"@@ {kind.name} POOL {global_lac:x} {global_not_lac:x}", file=debug)
 
     if True:
-        regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], global_lac, 0)
         regs.AssignCpuRegOrMarkForSpilling(
             global_reg_stats[(kind, False)],
             global_not_lac & ~regs_lac_mask,
             global_not_lac & regs_lac_mask)
+        # lac globals which are only live across calls to funs with a clobber summary
+        # may use the leftover caller-saved regs not clobbered by those calls
+        leftover = global_not_lac & ~regs_lac_mask
+        for reg in global_reg_stats[(kind, False)]:
+            if reg.HasCpuReg():
+                leftover &= ~(1 << reg.cpu_reg.no)
+        excluded = {}
+        for reg in global_reg_stats[(kind, True)]:
+            cpu_regs = clobbered.get(reg)
+            excluded[reg] = leftover if cpu_regs is None else regs.CpuRegsToMask(cpu_regs, kind)
+        regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], leftover, global_lac,
+                                           excluded)
     else:
         regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], 0, 0)
         regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, False)], 0, 0)
@@ -421,7 +435,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
     liveness.FunComputeLivenessInfo(fun)
-    reg_stats.FunComputeRegStatsLAC(fun)
+    clobbered = reg_stats.FunComputeRegStatsLAC(fun)
 
     local_reg_stats = reg_stats.FunComputeBblRegUsageStats(fun,
                                                            regs.REG_KIND_TO_CPU_REG_FAMILY)
@@ -438,7 +452,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     GlobalRegAllocOneKind(fun, regs.CpuRegKind.GPR, needed_gpr,
                           regs.GPR_REGS_MASK & regs.GPR_LAC_REGS_MASK & ~regs.GPR_REG_IMPLICIT_MASK,
                           regs.GPR_REGS_MASK & ~regs.GPR_LAC_REGS_MASK & ~regs.GPR_REG_IMPLICIT_MASK,
-                          regs.GPR_LAC_REGS_MASK, global_reg_stats, debug)
+                          regs.GPR_LAC_REGS_MASK, global_reg_stats, clobbered, debug)
 
     needed_flt = RegsNeeded(len(global_reg_stats[(regs.CpuRegKind.FLT, True)]),
                             len(global_reg_stats[(regs.CpuRegKind.FLT, False)]),
@@ -447,7 +461,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     GlobalRegAllocOneKind(fun, regs.CpuRegKind.FLT, needed_flt,
                           regs.FLT_REGS_MASK & regs.FLT_LAC_REGS_MASK,
                           regs.FLT_REGS_MASK & ~regs.FLT_LAC_REGS_MASK,
-                          regs.FLT_LAC_REGS_MASK, global_reg_stats, debug)
+                          regs.FLT_LAC_REGS_MASK, global_reg_stats, clobbered, debug)
 
 
 def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
@@ -496,3 +510,12 @@ def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
     # cleanup
     _FunMoveEliminationCpu(fun)
     # print ("@@@@@@\n", "\n".join(serialize.FunRenderToAsm(fun)))
+
+
+def PhaseComputeClobberSummary(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
+    """Must run after register allocation of fun and all its callees.
+
+    Callers register allocated afterwards benefit from the summary.
+    """
+    reg_stats.FunComputeCpuLiveClobber(fun, regs.IMPLICIT_CLOBBER_REGS,
+                                       regs.CALLEE_SAVED_REGS)
@@ -0,0 +1,525 @@
+// (c) Robert Muth - see LICENSE for more info
+
+#include "BE/CodeGenX64/peephole.h"
+
+#include <map>
+#include <set>
+#include <string>
+#include <string_view>
+
+#include "BE/CodeGenX64/isel_gen.h"
+#include "Util/assert.h"
+
+namespace cwerg::code_gen_x64 {
+namespace {
+
+using x64::OK;
+using x64::OPC;
+
+// SIB index encoding meaning "no index", also: rsp
+constexpr int64_t NO_INDEX = 4;
+
+// A rule returns the number of instructions consumed (0 if it does not apply)
+// and appends their replacement to `out`.
+using Rule = int (*)(const std::vector<x64::Ins>& inss,
+                     size_t i,
+                     const std::vector<bool>& flags_live,
+                     std::vector<x64::Ins>* out);
+
+OPC Opc(const x64::Ins& ins) { return x64::OpcodeOPC(ins.opcode); }
+
+const x64::Opcode* Opcode(OPC opc) {
+  return &x64::OpcodeTableEncodings[unsigned(opc)];
+}
+
+OPC OpcFromName(std::string_view name) {
+  const x64::Opcode* opcode = x64::FindOpcodeForMnemonic(name);
+  return opcode == nullptr ? OPC::invalid : x64::OpcodeOPC(opcode);
+}
+
+std::string_view Mnemonic(OPC opc) {
+  std::string_view name = x64::OpcodeTableNames[unsigned(opc)];
+  return name.substr(0, name.find('_'));
+}
+
+unsigned MemWidth(const x64::Opcode* opcode) {
+  return opcode->mem_width_log == 0 ? 0 : 4U << opcode->mem_width_log;
+}
+
+int64_t Signed(int64_t v, unsigned bits) {
+  if (bits == 64) return v;
+  const uint64_t u = uint64_t(v) & ((uint64_t(1) << bits) - 1);
+  return u >> (bits - 1) ? int64_t(u) - (int64_t(1) << bits) : int64_t(u);
+}
+
+bool FitsSigned(int64_t v, unsigned bits) {
+  return -(int64_t(1) << (bits - 1)) <= v && v < (int64_t(1) << (bits - 1));
+}
+
+bool NoReloc(const x64::Ins& ins) { return !ins.has_reloc(); }
+
+bool IsGprReg(OK ok) {
+  return ok == OK::MODRM_REG8 || ok == OK::MODRM_REG16 ||
+         ok == OK::MODRM_REG32 || ok == OK::MODRM_REG64;
+}
+
+bool IsGprRmField(OK ok, unsigned bw) {
+  switch (bw) {
+    case 8:
+      return ok == OK::MODRM_RM_REG8;
+    case 16:
+      return ok == OK::MODRM_RM_REG16;
+    case 32:
+      return ok == OK::MODRM_RM_REG32;
+    case 64:
+      return ok == OK::MODRM_RM_REG64;
+    default:
+      return false;
+  }
+}
+
+// bitwidth of the register written by the first operand
+unsigned GprDstWidth(OK ok) {
+  switch (ok) {
+    case OK::MODRM_REG32:
+    case OK::MODRM_RM_REG32:
+      return 32;
+    case OK::MODRM_REG64:
+    case OK::MODRM_RM_REG64:
+      return 64;
+    default:
+      return 0;
+  }
+}
+
+x64::Ins AddImm(unsigned bw, int64_t reg, int64_t imm) {
+  if (FitsSigned(imm, 8)) {
+    return MakeIns(bw == 64 ? OPC::add_64_mr_imm8 : OPC::add_32_mr_imm8, reg,
+                   imm);
+  }
+  return MakeIns(bw == 64 ? OPC::add_64_mr_imm32 : OPC::add_32_mr_imm32, reg,
+                 imm);
+}
+
+x64::Ins Lea(unsigned bw, int64_t dst, int64_t base, int64_t index,
+             int64_t disp) {
+  if (FitsSigned(disp, 8)) {
+    return MakeIns(bw == 64 ? OPC::lea_64_r_mbis8 : OPC::lea_32_r_mbis8, dst,
+                   base, index, 0, disp);
+  }
+  return MakeIns(bw == 64 ? OPC::lea_64_r_mbis32 : OPC::lea_32_r_mbis32, dst,
+                 base, index, 0, disp);
+}
+
+// multiplier -> SIB scale for `lea r1, [r2 + r2 * scale]`
+int64_t LeaScale(int64_t multiplier) {
+  switch (multiplier) {
+    case 3:
+      return 1;
+    case 5:
+      return 2;
+    case 9:
+      return 3;
+    default:
+      return 0;
+  }
+}
+
+x64::Ins MulImm(unsigned bw, int64_t dst, int64_t src, int64_t imm,
+                bool flags_live) {
+  const int64_t scale = LeaScale(imm);
+  if (scale != 0 && src != NO_INDEX && !flags_live) {
+    return MakeIns(bw == 64 ? OPC::lea_64_r_mbis8 : OPC::lea_32_r_mbis8, dst,
+                   src, src, scale, 0);
+  }
+  if (FitsSigned(imm, 8)) {
+    return MakeIns(bw == 64 ? OPC::imul_64_r_mr_imm8 : OPC::imul_32_r_mr_imm8,
+                   dst, src, imm);
+  }
+  return MakeIns(bw == 64 ? OPC::imul_64_r_mr_imm32 : OPC::imul_32_r_mr_imm32,
+                 dst, src, imm);
+}
+
+struct AddSubInfo {
+  unsigned bw;
+  int sign;
+};
+
+struct MemReaderInfo {
+  unsigned pos;  // position of SIB_BASE
+  OPC reg_opc;   // variant taking a register instead of memory
+  OPC imm_opc;   // variant taking an immediate instead of memory
+};
+
+struct AluInfo {
+  unsigned bw;
+  const std::set<OPC>* jccs;
+};
+
+// Note: mov_32_r_mr is NOT a nop. It clears the upper bits.
+const std::set<OPC> REG_MOV_OPCODES = {OPC::mov_8_r_mr, OPC::mov_16_r_mr,
+                                       OPC::mov_64_r_mr};
+
+// opcode -> (bitwidth, sign) for `add/sub reg, imm`
+const std::map<OPC, AddSubInfo> ADD_SUB_IMM = {
+    {OPC::add_32_mr_imm8, {32, 1}},   {OPC::add_32_mr_imm32, {32, 1}},
+    {OPC::add_64_mr_imm8, {64, 1}},   {OPC::add_64_mr_imm32, {64, 1}},
+    {OPC::sub_32_mr_imm8, {32, -1}},  {OPC::sub_32_mr_imm32, {32, -1}},
+    {OPC::sub_64_mr_imm8, {64, -1}},  {OPC::sub_64_mr_imm32, {64, -1}},
+};
+
+// opcode -> bitwidth for `imul reg, reg, imm`
+const std::map<OPC, unsigned> MUL_IMM = {
+    {OPC::imul_32_r_mr_imm8, 32},
+    {OPC::imul_32_r_mr_imm32, 32},
+    {OPC::imul_64_r_mr_imm8, 64},
+    {OPC::imul_64_r_mr_imm32, 64},
+};
+
+const std::map<OPC, unsigned> CMP_ZERO = {
+    {OPC::cmp_32_mr_imm8, 32},
+    {OPC::cmp_32_mr_imm32, 32},
+    {OPC::cmp_64_mr_imm8, 64},
+    {OPC::cmp_64_mr_imm32, 64},
+};
+
+std::set<OPC> JCCS_ALL;
+std::set<OPC> JCCS_ZS;
+
+// opcode -> (bitwidth, jcc opcodes) for alu opcodes writing a register
+// whose flags the jccs cannot tell apart from those of `cmp reg, 0`.
+// For and/or/xor all flags match, for add/sub only ZF and SF do.
+std::map<OPC, AluInfo> ALU_WITH_CMP_ZERO;
+
+// opcodes only reading memory -> variants taking a register or an immediate
+std::map<OPC, MemReaderInfo> MEM_READERS;
+
+std::vector<std::vector<Rule>> RULES;
+
+int RuleSelfMov(const std::vector<x64::Ins>& inss,
+                size_t i,
+                const std::vector<bool>& flags_live,
+                std::vector<x64::Ins>* out) {
+  const x64::Ins& ins = inss[i];
+  return ins.operands[0] == ins.operands[1] ? 1 : 0;
+}
+
+int RuleMovImm(const std::vector<x64::Ins>& inss,
+               size_t i,
+               const std::vector<bool>& flags_live,
+               std::vector<x64::Ins>* out) {
+  const x64::Ins& ins = inss[i];
+  if (!NoReloc(ins)) return 0;
+  const int64_t reg = ins.operands[0];
+  const int64_t imm = ins.operands[1];
+  if (imm == 0 && !flags_live[i]) {
+    out->push_back(MakeIns(OPC::xor_32_r_mr, reg, reg));
+    return 1;
+  }
+  if (Opc(ins) == OPC::mov_64_r_imm64) {
+    if (0 <= imm && imm < (int64_t(1) << 32)) {
+      out->push_back(MakeIns(OPC::mov_32_r_imm32, reg, imm));
+      return 1;
+    }
+    if (FitsSigned(imm, 32)) {
+      out->push_back(MakeIns(OPC::mov_64_mr_imm32, reg, imm));
+      return 1;
+    }
+  }
+  return 0;
+}
+
+int RuleAddSubImm(const std::vector<x64::Ins>& inss,
+                  size_t i,
+                  const std::vector<bool>& flags_live,
+                  std::vector<x64::Ins>* out) {
+  if (i + 1 >= inss.size() || flags_live[i + 1]) return 0;
+  const x64::Ins& a = inss[i];
+  const x64::Ins& b = inss[i + 1];
+  const AddSubInfo& info_a = ADD_SUB_IMM.find(Opc(a))->second;
+  auto it_b = ADD_SUB_IMM.find(Opc(b));
+  if (it_b == ADD_SUB_IMM.end() || info_a.bw != it_b->second.bw ||
+      a.operands[0] != b.operands[0]) {
+    return 0;
+  }
+  if (!NoReloc(a) || !NoReloc(b)) return 0;
+  const unsigned bw = info_a.bw;
+  const int64_t reg = a.operands[0];
+  const int64_t imm =
+      Signed(int64_t(uint64_t(info_a.sign * a.operands[1]) +
+                     uint64_t(it_b->second.sign * b.operands[1])),
+             bw);
+  if (!FitsSigned(imm, 32)) return 0;
+  if (imm == 0) {
+    // the 32 bit variants clear the upper bits of the register
+    if (bw == 32) out->push_back(MakeIns(OPC::mov_32_r_mr, reg, reg));
+    return 2;
+  }
+  out->push_back(AddImm(bw, reg, imm));
+  return 2;
+}
+
+int RuleMovAdd(const std::vector<x64::Ins>& inss,
+               size_t i,
+               const std::vector<bool>& flags_live,
+               std::vector<x64::Ins>* out) {
+  if (i + 1 >= inss.size() || flags_live[i + 1]) return 0;
+  const x64::Ins& mov = inss[i];
+  const x64::Ins& op = inss[i + 1];
+  const unsigned bw = Opc(mov) == OPC::mov_64_r_mr ? 64 : 32;
+  const int64_t dst = mov.operands[0];
+  const int64_t src = mov.operands[1];
+  auto it = ADD_SUB_IMM.find(Opc(op));
+  if (it != ADD_SUB_IMM.end() && it->second.bw == bw) {
+    const int64_t disp = it->second.sign * Signed(op.operands[1], 32);
+    if (op.operands[0] == dst && FitsSigned(disp, 32) && NoReloc(mov) &&
+        NoReloc(op)) {
+      out->push_back(Lea(bw, dst, src, NO_INDEX, disp));
+      return 2;
+    }
+  } else if ((bw == 64 && (Opc(op) == OPC::add_64_r_mr ||
+                           Opc(op) == OPC::add_64_mr_r)) ||
+             (bw == 32 && (Opc(op) == OPC::add_32_r_mr ||
+                           Opc(op) == OPC::add_32_mr_r))) {
+    const int64_t index = op.operands[1] == dst ? src : op.operands[1];
+    if (op.operands[0] == dst && index != NO_INDEX) {
+      out->push_back(Lea(bw, dst, src, index, 0));
+      return 2;
+    }
+  }
+  return 0;
+}
+
+// imul r1, r2, 3/5/9  =>  lea r1, [r2 + r2 * 2/4/8]     (flags dead)
+// imul r1, r2, simm8  =>  shorter encoding
+int RuleMulImm(const std::vector<x64::Ins>& inss,
+               size_t i,
+               const std::vector<bool>& flags_live,
+               std::vector<x64::Ins>* out) {
+  const x64::Ins& ins = inss[i];
+  if (!NoReloc(ins)) return 0;
+  const unsigned bw = MUL_IMM.find(Opc(ins))->second;
+  const x64::Ins new_ins =
+      MulImm(bw, ins.operands[0], ins.operands[1],
+             Signed(ins.operands[2], 32), flags_live[i]);
+  if (new_ins.opcode == ins.opcode) return 0;
+  out->push_back(new_ins);
+  return 1;
+}
+
+// mov r1, r2; imul r1, r1, imm  =>  imul r1, r2, imm
+int RuleMovMulImm(const std::vector<x64::Ins>& inss,
+                  size_t i,
+                  const std::vector<bool>& flags_live,
+                  std::vector<x64::Ins>* out) {
+  if (i + 1 >= inss.size()) return 0;
+  const x64::Ins& mov = inss[i];
+  const x64::Ins& op = inss[i + 1];
+  auto it = MUL_IMM.find(Opc(op));
+  if (it == MUL_IMM.end()) return 0;
+  const unsigned bw = it->second;
+  if (Opc(mov) != (bw == 64 ? OPC::mov_64_r_mr : OPC::mov_32_r_mr)) return 0;
+  const int64_t dst = mov.operands[0];
+  const int64_t src = mov.operands[1];
+  if (op.operands[0] != dst || op.operands[1] != dst || !NoReloc(op)) return 0;
+  out->push_back(MulImm(bw, dst, src, Signed(op.operands[2], 32),
+                        flags_live[i + 1]));
+  return 2;
+}
+
+// mov [addr], r1; op ..., [addr]  =>  mov [addr], r1; op ..., r1
+// op must only read the memory and have a register variant.
+// Also handles stores of immediates if op is a plain (sign extending) load.
+int RuleStoreLoad(const std::vector<x64::Ins>& inss,
+                  size_t i,
+                  const std::vector<bool>& flags_live,
+                  std::vector<x64::Ins>* out) {
+  if (i + 1 >= inss.size()) return 0;
+  const x64::Ins& store = inss[i];
+  const x64::Ins& load = inss[i + 1];
+  auto it = MEM_READERS.find(Opc(load));
+  if (it == MEM_READERS.end() || !NoReloc(store) || !NoReloc(load)) return 0;
+  if (store.opcode->mem_width_log != load.opcode->mem_width_log) return 0;
+  const MemReaderInfo& info = it->second;
+  for (unsigned j = 0; j < 4; ++j) {
+    if (load.operands[info.pos + j] != store.operands[j]) return 0;
+  }
+  const int64_t src = store.operands[4];
+  if (IsGprReg(store.opcode->fields[4])) {
+    if (info.reg_opc == OPC::invalid) return 0;
+    x64::Ins new_load = MakeIns(info.reg_opc);
+    unsigned n = 0;
+    for (unsigned j = 0; j < info.pos; ++j) {
+      new_load.operands[n++] = load.operands[j];
+    }
+    new_load.operands[n++] = src;
+    for (unsigned j = info.pos + 4; j < load.opcode->num_fields; ++j) {
+      new_load.operands[n++] = load.operands[j];
+    }
+    out->push_back(store);
+    if (REG_MOV_OPCODES.count(info.reg_opc) == 0 ||
+        new_load.operands[0] != new_load.operands[1]) {
+      out->push_back(new_load);
+    }
+    return 2;
+  }
+  if (info.imm_opc == OPC::invalid) return 0;
+  out->push_back(store);
+  out->push_back(MakeIns(info.imm_opc, load.operands[0], Signed(src, 32)));
+  return 2;
+}
+
+// alu r, ...; cmp r, 0; jcc  =>  alu r, ...; jcc
+// The jcc must be the only consumer of the flags.
+int RuleCmpZero(const std::vector<x64::Ins>& inss,
+                size_t i,
+                const std::vector<bool>& flags_live,
+                std::vector<x64::Ins>* out) {
+  if (i + 2 >= inss.size() || flags_live[i + 2]) return 0;
+  const x64::Ins& op = inss[i];
+  const x64::Ins& cmp = inss[i + 1];
+  const x64::Ins& jcc = inss[i + 2];
+  const AluInfo& info = ALU_WITH_CMP_ZERO.find(Opc(op))->second;
+  auto it = CMP_ZERO.find(Opc(cmp));
+  if (it == CMP_ZERO.end() || it->second != info.bw ||
+      Signed(cmp.operands[1], 32) != 0 || cmp.operands[0] != op.operands[0] ||
+      info.jccs->count(Opc(jcc)) == 0) {
+    return 0;
+  }
+  if (!NoReloc(op) || !NoReloc(cmp)) return 0;
+  out->push_back(op);
+  return 2;
+}
+
+void InitTables() {
+  const std::set<std::string_view> non_loads = {"lea",  "xchg", "pop",
+                                                "push", "call", "jmp"};
+  for (unsigned i = 1; i < x64::NUM_OPCODES; ++i) {
+    const OPC opc = OPC(i);
+    const std::string_view mnemonic = Mnemonic(opc);
+    if (mnemonic[0] == 'j' && x64::OpcodeReadsFlags(Opcode(opc))) {
+      JCCS_ALL.insert(opc);
+      if (mnemonic == "je" || mnemonic == "jne" || mnemonic == "js" ||
+          mnemonic == "jns") {
+        JCCS_ZS.insert(opc);
+      }
+    }
+  }
+
+  for (unsigned i = 1; i < x64::NUM_OPCODES; ++i) {
+    const OPC opc = OPC(i);
+    const x64::Opcode* opcode = Opcode(opc);
+    const std::string_view mnemonic = Mnemonic(opc);
+    if (opcode->num_fields == 0) continue;
+    const bool logic = mnemonic == "and" || mnemonic == "or" || mnemonic == "xor";
+    if (logic || mnemonic == "add" || mnemonic == "sub") {
+      const unsigned bw = GprDstWidth(opcode->fields[0]);
+      if (bw != 0) {
+        ALU_WITH_CMP_ZERO[opc] = {bw, logic ? &JCCS_ALL : &JCCS_ZS};
+      }
+    }
+  }
+
+  for (unsigned i = 1; i < x64::NUM_OPCODES; ++i) {
+    const OPC opc = OPC(i);
+    const x64::Opcode* opcode = Opcode(opc);
+    const std::string_view mnemonic = Mnemonic(opc);
+    if (non_loads.count(mnemonic) > 0) continue;
+    unsigned pos = 0;
+    while (pos < opcode->num_fields && opcode->fields[pos] != OK::SIB_BASE) {
+      ++pos;
+    }
+    if (pos == opcode->num_fields) continue;
+    const std::string name = x64::OpcodeTableNames[i];
+    const std::string_view last = std::string_view(name).substr(name.rfind('_') + 1);
+    // the memory operand must be a source
+    if (last.substr(0, 4) != "mbis" && mnemonic != "cmp" && mnemonic != "test") {
+      continue;
+    }
+    const size_t mem_start = name.find("_mbis") + 1;
+    const size_t mem_end = name.find('_', mem_start);
+    const std::string reg_name =
+        name.substr(0, mem_start) + "mr" +
+        (mem_end == std::string::npos ? "" : name.substr(mem_end));
+    OPC reg_opc = OpcFromName(reg_name);
+    if (reg_opc != OPC::invalid &&
+        !IsGprRmField(Opcode(reg_opc)->fields[pos], MemWidth(opcode))) {
+      reg_opc = OPC::invalid;
+    }
+    OPC imm_opc = OPC::invalid;
+    if (name.rfind("mov_32_r_", 0) == 0) {
+      imm_opc = OPC::mov_32_r_imm32;
+    } else if (name.rfind("movsxd_64_r_", 0) == 0) {
+      imm_opc = OPC::mov_64_mr_imm32;
+    }
+    if (reg_opc != OPC::invalid || imm_opc != OPC::invalid) {
+      MEM_READERS[opc] = {pos, reg_opc, imm_opc};
+    }
+  }
+
+  RULES.resize(x64::NUM_OPCODES);
+  for (OPC opc : REG_MOV_OPCODES) RULES[unsigned(opc)].push_back(RuleSelfMov);
+  for (OPC opc : {OPC::mov_32_r_imm32, OPC::mov_64_r_imm64,
+                  OPC::mov_64_mr_imm32}) {
+    RULES[unsigned(opc)].push_back(RuleMovImm);
+  }
+  for (const auto& [opc, info] : ADD_SUB_IMM) {
+    RULES[unsigned(opc)].push_back(RuleAddSubImm);
+  }
+  for (OPC opc : {OPC::mov_32_r_mr, OPC::mov_64_r_mr}) {
+    RULES[unsigned(opc)].push_back(RuleMovAdd);
+    RULES[unsigned(opc)].push_back(RuleMovMulImm);
+  }
+  for (const auto& [opc, bw] : MUL_IMM) {
+    RULES[unsigned(opc)].push_back(RuleMulImm);
+  }
+  for (OPC opc :
+       {OPC::mov_8_mbis8_r, OPC::mov_8_mbis32_r, OPC::mov_8_mbis32_imm8,
+        OPC::mov_16_mbis8_r, OPC::mov_16_mbis32_r, OPC::mov_16_mbis32_imm16,
+        OPC::mov_32_mbis8_r, OPC::mov_32_mbis32_r, OPC::mov_32_mbis32_imm32,
+        OPC::mov_64_mbis8_r, OPC::mov_64_mbis32_r, OPC::mov_64_mbis32_imm32}) {
+    RULES[unsigned(opc)].push_back(RuleStoreLoad);
+  }
+  for (const auto& [opc, info] : ALU_WITH_CMP_ZERO) {
+    RULES[unsigned(opc)].push_back(RuleCmpZero);
+  }
+}
+
+}  // namespace
+
+std::vector<bool> FlagsLiveness(const std::vector<x64::Ins>& inss,
+                                bool live_out) {
+  std::vector<bool> out(inss.size());
+  bool live = live_out;
+  for (size_t i = inss.size(); i-- > 0;) {
+    out[i] = live;
+    if (x64::OpcodeReadsFlags(inss[i].opcode)) {
+      live = true;
+    } else if (x64::OpcodeKillsFlags(inss[i].opcode)) {
+      live = false;
+    }
+  }
+  return out;
+}
+
+void PeepholeOptimize(std::vector<x64::Ins>* inss, bool flags_live_out) {
+  if (RULES.empty()) InitTables();
+  const std::vector<bool> flags_live = FlagsLiveness(*inss, flags_live_out);
+  std::vector<x64::Ins> out;
+  out.reserve(inss->size());
+  for (size_t i = 0; i < inss->size();) {
+    int n = 0;
+    for (Rule rule : RULES[unsigned(Opc((*inss)[i]))]) {
+      n = rule(*inss, i, flags_live, &out);
+      if (n != 0) break;
+    }
+    if (n == 0) {
+      out.push_back((*inss)[i]);
+      n = 1;
+    }
+    i += n;
+  }
+  inss->swap(out);
+}
+
+}  // namespace cwerg::code_gen_x64
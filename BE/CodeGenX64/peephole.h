@@ -0,0 +1,22 @@
+#pragma once
+// (c) Robert Muth - see LICENSE for more info
+
+#include <vector>
+
+#include "BE/CpuX64/opcode_gen.h"
+
+namespace cwerg::code_gen_x64 {
+using namespace cwerg;
+
+// Peephole optimizer for X64 cpu instructions - see peephole.py for details.
+// It runs after instruction selection on the cpu instructions of a single bbl.
+
+// Returns for each instruction whether the status flags are live right after it
+extern std::vector<bool> FlagsLiveness(const std::vector<x64::Ins>& inss,
+                                       bool live_out);
+
+// Applies the peephole rules to the cpu instructions of a bbl in place.
+// Flags are assumed to be dead at the end unless flags_live_out is set.
+extern void PeepholeOptimize(std::vector<x64::Ins>* inss, bool flags_live_out);
+
+}  // namespace cwerg::code_gen_x64
@@ -0,0 +1,372 @@
+"""Peephole optimizer for X64 cpu instructions
+
+This runs after instruction selection on the cpu instructions of a single bbl
+and cleans up the locally redundant sequences produced by the isel templates.
+
+The rules are keyed by the opcode of the first instruction they match.
+A rule receives the instruction list, the current position and the flag
+liveness and returns the number of instructions consumed together with their
+replacement or None if it does not apply.
+
+Only status flag liveness is tracked. Flags are assumed to be dead at the end
+of a bbl unless the caller says otherwise.
+
+Instructions with relocations are never rewritten.
+"""
+
+from typing import List, Optional, Tuple, Dict, Callable, Any
+
+from BE.CpuX64 import opcode_tab as x64
+
+_OPC = x64.Opcode.name_to_opcode
+
+_NO_INDEX = 4  # SIB index encoding meaning "no index", also: rsp
+
+# Note: mov_32_r_mr is NOT a nop. It clears the upper bits.
+_REG_MOV_OPCODES = {_OPC[f"mov_{bw}_r_mr"] for bw in [8, 16, 64]}
+
+_GPR_RM_FIELD = {8: x64.OK.MODRM_RM_REG8, 16: x64.OK.MODRM_RM_REG16,
+                 32: x64.OK.MODRM_RM_REG32, 64: x64.OK.MODRM_RM_REG64}
+
+_GPR_REG_FIELDS = {x64.OK.MODRM_REG8, x64.OK.MODRM_REG16,
+                   x64.OK.MODRM_REG32, x64.OK.MODRM_REG64}
+
+# bitwidth of the register written by the first operand
+_GPR_DST_WIDTH = {x64.OK.MODRM_REG32: 32, x64.OK.MODRM_REG64: 64,
+                  x64.OK.MODRM_RM_REG32: 32, x64.OK.MODRM_RM_REG64: 64}
+
+
+def _Signed(v: int, bits: int) -> int:
+    v &= (1 << bits) - 1
+    return v - (1 << bits) if v >> (bits - 1) else v
+
+
+def _FitsSigned(v: int, bits: int) -> bool:
+    return -(1 << (bits - 1)) <= v < (1 << (bits - 1))
+
+
+def _NoReloc(*inss: x64.Ins) -> bool:
+    return not any(ins.has_reloc() for ins in inss)
+
+
+def _AddImm(bw: int, reg: int, imm: int) -> x64.Ins:
+    if _FitsSigned(imm, 8):
+        return x64.Ins(_OPC[f"add_{bw}_mr_imm8"], [reg, imm])
+    return x64.Ins(_OPC[f"add_{bw}_mr_imm32"], [reg, imm])
+
+
+def _Lea(bw: int, dst: int, base: int, index: int, disp: int) -> x64.Ins:
+    if _FitsSigned(disp, 8):
+        return x64.Ins(_OPC[f"lea_{bw}_r_mbis8"], [dst, base, index, 0, disp])
+    return x64.Ins(_OPC[f"lea_{bw}_r_mbis32"], [dst, base, index, 0, disp])
+
+
+# multiplier -> SIB scale for `lea r1, [r2 + r2 * scale]`
+_LEA_MULTIPLIERS = {3: 1, 5: 2, 9: 3}
+
+
+def _MulImm(bw: int, dst: int, src: int, imm: int, flags_live: bool) -> x64.Ins:
+    if imm in _LEA_MULTIPLIERS and src != _NO_INDEX and not flags_live:
+        return x64.Ins(_OPC[f"lea_{bw}_r_mbis8"], [dst, src, src, _LEA_MULTIPLIERS[imm], 0])
+    if _FitsSigned(imm, 8):
+        return x64.Ins(_OPC[f"imul_{bw}_r_mr_imm8"], [dst, src, imm])
+    return x64.Ins(_OPC[f"imul_{bw}_r_mr_imm32"], [dst, src, imm])
+
+
+def FlagsLiveness(inss: List[x64.Ins], live_out: bool = False) -> List[bool]:
+    """Returns for each instruction whether the flags are live right after it"""
+    out = [False] * len(inss)
+    live = live_out
+    for i in range(len(inss) - 1, -1, -1):
+        out[i] = live
+        opcode = inss[i].opcode
+        if opcode.reads_flags:
+            live = True
+        elif opcode.kills_flags:
+            live = False
+    return out
+
+
+Rule = Callable[[List[x64.Ins], int, List[bool]],
+                Optional[Tuple[int, List[x64.Ins]]]]
+
+
+def _RuleSelfMov(inss, i, _flags_live):
+    """mov r, r  =>  (nothing)"""
+    ins = inss[i]
+    if ins.operands[0] == ins.operands[1]:
+        return 1, []
+    return None
+
+
+def _RuleMovImm(inss, i, flags_live):
+    """mov r, 0  =>  xor r, r       (flags dead)
+       mov r64, imm64  =>  mov r32, imm32 / mov r64, simm32
+    """
+    ins = inss[i]
+    if not _NoReloc(ins):
+        return None
+    reg = ins.operands[0]
+    imm = _Signed(ins.operands[1], 64)
+    if imm == 0 and not flags_live[i]:
+        return 1, [x64.Ins(_OPC["xor_32_r_mr"], [reg, reg])]
+    if ins.opcode is _OPC["mov_64_r_imm64"]:
+        if 0 <= imm < (1 << 32):
+            return 1, [x64.Ins(_OPC["mov_32_r_imm32"], [reg, imm])]
+        if _FitsSigned(imm, 32):
+            return 1, [x64.Ins(_OPC["mov_64_mr_imm32"], [reg, imm])]
+    return None
+
+
+def _RuleAddSubImm(inss, i, flags_live):
+    """add/sub r, imm1; add/sub r, imm2  =>  add r, imm1+imm2    (flags dead)"""
+    if i + 1 >= len(inss) or flags_live[i + 1]:
+        return None
+    a, b = inss[i], inss[i + 1]
+    info_a = _ADD_SUB_IMM.get(a.opcode)
+    info_b = _ADD_SUB_IMM.get(b.opcode)
+    if not info_b or info_a[0] != info_b[0] or a.operands[0] != b.operands[0]:
+        return None
+    if not _NoReloc(a, b):
+        return None
+    bw, reg = info_a[0], a.operands[0]
+    imm = _Signed(info_a[1] * a.operands[1] + info_b[1] * b.operands[1], bw)
+    if not _FitsSigned(imm, 32):
+        return None
+    if imm == 0:
+        # the 32 bit variants clear the upper bits of the register
+        return 2, [] if bw == 64 else [x64.Ins(_OPC["mov_32_r_mr"], [reg, reg])]
+    return 2, [_AddImm(bw, reg, imm)]
+
+
+def _RuleMovAdd(inss, i, flags_live):
+    """mov r1, r2; add r1, imm  =>  lea r1, [r2 + imm]     (flags dead)
+       mov r1, r2; add r1, r3   =>  lea r1, [r2 + r3]      (flags dead)
+    """
+    if i + 1 >= len(inss) or flags_live[i + 1]:
+        return None
+    mov, op = inss[i], inss[i + 1]
+    bw = 64 if mov.opcode is _OPC["mov_64_r_mr"] else 32
+    dst, src = mov.operands
+    info = _ADD_SUB_IMM.get(op.opcode)
+    if info and info[0] == bw:
+        disp = info[1] * _Signed(op.operands[1], 32)
+        if op.operands[0] == dst and _FitsSigned(disp, 32) and _NoReloc(mov, op):
+            return 2, [_Lea(bw, dst, src, _NO_INDEX, disp)]
+    elif op.opcode in (_OPC[f"add_{bw}_r_mr"], _OPC[f"add_{bw}_mr_r"]):
+        index = src if op.operands[1] == dst else op.operands[1]
+        if op.operands[0] == dst and index != _NO_INDEX:
+            return 2, [_Lea(bw, dst, src, index, 0)]
+    return None
+
+
+def _RuleMulImm(inss, i, flags_live):
+    """imul r1, r2, 3/5/9  =>  lea r1, [r2 + r2 * 2/4/8]     (flags dead)
+       imul r1, r2, simm8  =>  shorter encoding
+    """
+    ins = inss[i]
+    if not _NoReloc(ins):
+        return None
+    bw = _MUL_IMM[ins.opcode]
+    dst, src, imm = ins.operands
+    imm = _Signed(imm, 32)
+    new = _MulImm(bw, dst, src, imm, flags_live[i])
+    if new.opcode is ins.opcode:
+        return None
+    return 1, [new]
+
+
+def _RuleMovMulImm(inss, i, flags_live):
+    """mov r1, r2; imul r1, r1, imm  =>  imul r1, r2, imm"""
+    if i + 1 >= len(inss):
+        return None
+    mov, op = inss[i], inss[i + 1]
+    bw = _MUL_IMM.get(op.opcode)
+    if bw is None or mov.opcode is not _OPC[f"mov_{bw}_r_mr"]:
+        return None
+    dst, src = mov.operands
+    if op.operands[0] != dst or op.operands[1] != dst or not _NoReloc(op):
+        return None
+    return 2, [_MulImm(bw, dst, src, _Signed(op.operands[2], 32), flags_live[i + 1])]
+
+
+def _RuleStoreLoad(inss, i, _flags_live):
+    """mov [addr], r1; op ..., [addr]  =>  mov [addr], r1; op ..., r1
+
+    op must only read the memory and have a register variant.
+    Also handles stores of immediates if op is a plain (sign extending) load.
+    """
+    if i + 1 >= len(inss):
+        return None
+    store, load = inss[i], inss[i + 1]
+    info = _MEM_READERS.get(load.opcode)
+    if not info or not _NoReloc(store, load):
+        return None
+    if store.opcode.mem_width != load.opcode.mem_width:
+        return None
+    pos, reg_opcode, imm_opcode = info
+    addr = store.operands[0:4]
+    if load.operands[pos: pos + 4] != addr:
+        return None
+    src = store.operands[4]
+    if store.opcode.fields[4] in _GPR_REG_FIELDS:
+        if reg_opcode is None:
+            return None
+        ops = load.operands[:pos] + [src] + load.operands[pos + 4:]
+        new_load = x64.Ins(reg_opcode, ops)
+        if reg_opcode in _REG_MOV_OPCODES and ops[0] == ops[1]:
+            return 2, [store]
+        return 2, [store, new_load]
+    if imm_opcode is None:
+        return None
+    return 2, [store, x64.Ins(imm_opcode, [load.operands[0], _Signed(src, 32)])]
+
+
+def _RuleCmpZero(inss, i, flags_live):
+    """alu r, ...; cmp r, 0; jcc  =>  alu r, ...; jcc
+
+    The jcc must be the only consumer of the flags.
+    """
+    if i + 2 >= len(inss) or flags_live[i + 2]:
+        return None
+    op, cmp, jcc = inss[i], inss[i + 1], inss[i + 2]
+    bw, jccs = _ALU_WITH_CMP_ZERO[op.opcode]
+    if (_CMP_ZERO.get(cmp.opcode) != bw or _Signed(cmp.operands[1], 32) != 0 or
+            cmp.operands[0] != op.operands[0] or jcc.opcode not in jccs):
+        return None
+    if not _NoReloc(op, cmp):
+        return None
+    return 2, [op]
+
+
+# opcode -> (bitwidth, sign) for `add/sub reg, imm`
+_ADD_SUB_IMM: Dict[x64.Opcode, Tuple[int, int]] = {
+    _OPC[f"{name}_{bw}_mr_imm{iw}"]: (bw, sign)
+    for name, sign in [("add", 1), ("sub", -1)] for bw in [32, 64] for iw in [8, 32]}
+
+# opcode -> bitwidth for `imul reg, reg, imm`
+_MUL_IMM: Dict[x64.Opcode, int] = {
+    _OPC[f"imul_{bw}_r_mr_imm{iw}"]: bw for bw in [32, 64] for iw in [8, 32]}
+
+_CMP_ZERO: Dict[x64.Opcode, int] = {
+    _OPC[f"cmp_{bw}_mr_imm{iw}"]: bw for bw in [32, 64] for iw in [8, 32]}
+
+
+def _InitAluWithCmpZero():
+    """Maps alu opcodes writing a register to the jccs which
+
+    cannot tell the difference between the flags set by the alu op and those
+    set by a subsequent `cmp reg, 0`.
+    opcode -> (bitwidth, jcc opcodes)
+    For and/or/xor all flags match, for add/sub only ZF and SF do.
+    """
+    jccs_all = {o for o in x64.Opcode.Opcodes if o.name.startswith("j") and o.reads_flags}
+    jccs_zs = {o for o in jccs_all if o.name in {"je", "jne", "js", "jns"}}
+    out = {}
+    for opcode in x64.Opcode.Opcodes:
+        if opcode.name in {"and", "or", "xor", "add", "sub"} and opcode.fields:
+            bw = _GPR_DST_WIDTH.get(opcode.fields[0])
+            if bw:
+                out[opcode] = (bw, jccs_all if opcode.name in {"and", "or", "xor"} else jccs_zs)
+    return out
+
+
+_ALU_WITH_CMP_ZERO = _InitAluWithCmpZero()
+
+# their memory operand is not a plain load: they write memory (xchg, pop, push),
+# only compute an address (lea) or transfer control (call, jmp)
+_MEM_WRITERS_OR_NON_LOADS = {"lea", "xchg", "pop", "push", "call", "jmp"}
+
+
+def _InitMemReaders():
+    """Maps opcodes only reading memory to variants taking a register or an immediate
+
+    opcode -> (position of SIB_BASE, variant with reg, variant with imm)
+    """
+    out = {}
+    for opcode in x64.Opcode.Opcodes:
+        if opcode.name in _MEM_WRITERS_OR_NON_LOADS or x64.OK.SIB_BASE not in opcode.fields:
+            continue
+        name = opcode.EnumName()
+        parts = name.split("_")
+        # the memory operand must be a source
+        if not parts[-1].startswith("mbis") and opcode.name not in {"cmp", "test"}:
+            continue
+        pos = opcode.fields.index(x64.OK.SIB_BASE)
+        mem = [p for p in parts if p.startswith("mbis")][0]
+        reg_opcode = _OPC.get(name.replace(mem, "mr"))
+        if reg_opcode and reg_opcode.fields[pos] is not _GPR_RM_FIELD.get(opcode.mem_width):
+            reg_opcode = None
+        imm_opcode = None
+        if parts[:3] == ["mov", "32", "r"]:
+            imm_opcode = _OPC["mov_32_r_imm32"]
+        elif parts[:3] == ["movsxd", "64", "r"]:
+            imm_opcode = _OPC["mov_64_mr_imm32"]
+        if reg_opcode or imm_opcode:
+            out[opcode] = (pos, reg_opcode, imm_opcode)
+    return out
+
+
+_MEM_READERS = _InitMemReaders()
+
+
+def _InitRules() -> Dict[x64.Opcode, List[Rule]]:
+    out: Dict[x64.Opcode, List[Rule]] = {}
+
+    def add(opcode, rule):
+        out.setdefault(opcode, []).append(rule)
+
+    for opcode in _REG_MOV_OPCODES:
+        add(opcode, _RuleSelfMov)
+    for name in ["mov_32_r_imm32", "mov_64_r_imm64", "mov_64_mr_imm32"]:
+        add(_OPC[name], _RuleMovImm)
+    for opcode in _ADD_SUB_IMM:
+        add(opcode, _RuleAddSubImm)
+    for name in ["mov_32_r_mr", "mov_64_r_mr"]:
+        add(_OPC[name], _RuleMovAdd)
+        add(_OPC[name], _RuleMovMulImm)
+    for opcode in _MUL_IMM:
+        add(opcode, _RuleMulImm)
+    for bw in [8, 16, 32, 64]:
+        for mod in ["8", "32"]:
+            add(_OPC[f"mov_{bw}_mbis{mod}_r"], _RuleStoreLoad)
+        add(_OPC[f"mov_{bw}_mbis32_imm{min(bw, 32)}"], _RuleStoreLoad)
+    for opcode in _ALU_WITH_CMP_ZERO:
+        add(opcode, _RuleCmpZero)
+    return out
+
+
+_RULES = _InitRules()
+
+
+def Optimize(inss: List[x64.Ins], flags_live_out: bool = False,
+             marks: Optional[Dict[int, Any]] = None) -> List[x64.Ins]:
+    """Applies the peephole rules to the cpu instructions of a bbl
+
+    `marks` optionally maps positions in `inss` to annotations (e.g. source lines)
+    and is updated in place to refer to the corresponding positions in the result.
+    """
+    flags_live = FlagsLiveness(inss, flags_live_out)
+    out: List[x64.Ins] = []
+    new_marks: Dict[int, Any] = {}
+    i = 0
+    while i < len(inss):
+        for rule in _RULES.get(inss[i].opcode, []):
+            res = rule(inss, i, flags_live)
+            if res is not None:
+                n, replacement = res
+                break
+        else:
+            n, replacement = 1, [inss[i]]
+        if marks:
+            for j in range(i, i + n):
+                if j in marks:
+                    new_marks[len(out)] = marks[j]
+        out += replacement
+        i += n
+    if marks:
+        if len(inss) in marks:
+            new_marks[len(out)] = marks[len(inss)]
+        marks.clear()
+        marks.update(new_marks)
+    return out
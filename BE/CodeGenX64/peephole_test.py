@@ -0,0 +1,134 @@
+#!/bin/env python3
+
+import unittest
+
+from BE.CodeGenX64 import peephole
+from BE.CpuX64 import opcode_tab as x64
+from BE.Elf import enum_tab
+
+_OPC = x64.Opcode.name_to_opcode
+
+RAX, RCX, RDX, RBX, RSP, RBP = range(6)
+
+
+def I(name, *operands) -> x64.Ins:
+    return x64.Ins(_OPC[name], list(operands))
+
+
+def Render(inss):
+    return [(ins.opcode.EnumName(), ins.operands) for ins in inss]
+
+
+class TestPeephole(unittest.TestCase):
+
+    def check(self, inss, expected, flags_live_out=False):
+        out = peephole.Optimize(inss, flags_live_out)
+        self.assertEqual(Render(expected), Render(out))
+
+    def unchanged(self, inss, flags_live_out=False):
+        self.check(inss, inss, flags_live_out)
+
+    def testFlagsLiveness(self):
+        inss = [I("cmp_64_mr_imm8", RAX, 0), I("mov_64_r_mr", RCX, RDX),
+                I("je_8", 0), I("add_64_mr_imm8", RAX, 1)]
+        self.assertEqual([True, True, False, False], peephole.FlagsLiveness(inss))
+        self.assertEqual([True, True, False, True], peephole.FlagsLiveness(inss, True))
+
+    def testSelfMov(self):
+        self.check([I("mov_64_r_mr", RCX, RCX)], [])
+        self.check([I("mov_8_r_mr", RCX, RCX)], [])
+        # clears the upper bits
+        self.unchanged([I("mov_32_r_mr", RCX, RCX)])
+        self.unchanged([I("mov_64_r_mr", RCX, RDX)])
+
+    def testMovImm(self):
+        self.check([I("mov_32_r_imm32", RCX, 0)], [I("xor_32_r_mr", RCX, RCX)])
+        self.check([I("mov_64_r_imm64", RCX, 5)], [I("mov_32_r_imm32", RCX, 5)])
+        self.check([I("mov_64_r_imm64", RCX, -5)], [I("mov_64_mr_imm32", RCX, -5)])
+        self.unchanged([I("mov_64_r_imm64", RCX, 1 << 40)])
+        # xor would clobber the flags
+        self.unchanged([I("mov_32_r_imm32", RCX, 0)], flags_live_out=True)
+        self.unchanged([I("cmp_64_mr_imm8", RAX, 0), I("mov_32_r_imm32", RCX, 0),
+                        I("je_8", 0)])
+        ins = I("mov_64_r_imm64", RCX, 0)
+        ins.set_reloc(enum_tab.RELOC_TYPE_X86_64.X_64, False, 1, "sym")
+        self.unchanged([ins])
+
+    def testAddSubImm(self):
+        self.check([I("add_64_mr_imm8", RCX, 8), I("sub_64_mr_imm8", RCX, 3)],
+                   [I("add_64_mr_imm8", RCX, 5)])
+        self.check([I("add_64_mr_imm8", RCX, 100), I("add_64_mr_imm8", RCX, 100)],
+                   [I("add_64_mr_imm32", RCX, 200)])
+        self.check([I("add_64_mr_imm8", RCX, 8), I("sub_64_mr_imm8", RCX, 8)], [])
+        self.check([I("add_32_mr_imm8", RCX, 8), I("sub_32_mr_imm8", RCX, 8)],
+                   [I("mov_32_r_mr", RCX, RCX)])
+        self.unchanged([I("add_64_mr_imm8", RCX, 8), I("sub_64_mr_imm8", RCX, 3)],
+                       flags_live_out=True)
+        self.unchanged([I("add_64_mr_imm8", RCX, 8), I("sub_64_mr_imm8", RDX, 3)])
+        self.unchanged([I("add_64_mr_imm8", RCX, 8), I("sub_32_mr_imm8", RCX, 3)])
+
+    def testMovAdd(self):
+        self.check([I("mov_64_r_mr", RCX, RDX), I("add_64_mr_imm8", RCX, 16)],
+                   [I("lea_64_r_mbis8", RCX, RDX, RSP, 0, 16)])
+        self.check([I("mov_32_r_mr", RCX, RDX), I("sub_32_mr_imm32", RCX, 1000)],
+                   [I("lea_32_r_mbis32", RCX, RDX, RSP, 0, -1000)])
+        self.check([I("mov_64_r_mr", RCX, RDX), I("add_64_r_mr", RCX, RBX)],
+                   [I("lea_64_r_mbis8", RCX, RDX, RBX, 0, 0)])
+        self.check([I("mov_64_r_mr", RCX, RDX), I("add_64_mr_r", RCX, RCX)],
+                   [I("lea_64_r_mbis8", RCX, RDX, RDX, 0, 0)])
+        self.unchanged([I("mov_64_r_mr", RCX, RDX), I("add_64_mr_imm8", RCX, 16)],
+                       flags_live_out=True)
+        self.unchanged([I("mov_64_r_mr", RCX, RDX), I("add_64_mr_imm8", RBX, 16)])
+        # rsp cannot be an index
+        self.unchanged([I("mov_64_r_mr", RCX, RDX), I("add_64_r_mr", RCX, RSP)])
+
+    def testMulImm(self):
+        self.check([I("imul_64_r_mr_imm32", RCX, RDX, 5)],
+                   [I("lea_64_r_mbis8", RCX, RDX, RDX, 2, 0)])
+        self.check([I("imul_32_r_mr_imm32", RCX, RDX, 7)],
+                   [I("imul_32_r_mr_imm8", RCX, RDX, 7)])
+        self.unchanged([I("imul_32_r_mr_imm32", RCX, RDX, 1000)])
+        # lea does not set the flags
+        self.check([I("imul_64_r_mr_imm32", RCX, RDX, 9)],
+                   [I("imul_64_r_mr_imm8", RCX, RDX, 9)], flags_live_out=True)
+        # rsp cannot be an index
+        self.check([I("imul_64_r_mr_imm32", RCX, RSP, 3)],
+                   [I("imul_64_r_mr_imm8", RCX, RSP, 3)])
+        self.check([I("mov_64_r_mr", RCX, RDX), I("imul_64_r_mr_imm32", RCX, RCX, 1000)],
+                   [I("imul_64_r_mr_imm32", RCX, RDX, 1000)])
+        self.check([I("mov_32_r_mr", RCX, RDX), I("imul_32_r_mr_imm32", RCX, RCX, 3)],
+                   [I("lea_32_r_mbis8", RCX, RDX, RDX, 1, 0)])
+        self.unchanged([I("mov_64_r_mr", RCX, RDX), I("imul_64_r_mr_imm32", RCX, RBX, 1000)])
+        self.unchanged([I("mov_32_r_mr", RCX, RDX), I("imul_64_r_mr_imm32", RCX, RCX, 1000)])
+
+    def testStoreLoad(self):
+        store = I("mov_64_mbis8_r", RBP, RSP, 0, -8, RAX)
+        self.check([store, I("mov_64_r_mbis8", RDX, RBP, RSP, 0, -8)],
+                   [store, I("mov_64_r_mr", RDX, RAX)])
+        self.check([store, I("add_64_r_mbis8", RDX, RBP, RSP, 0, -8)],
+                   [store, I("add_64_r_mr", RDX, RAX)])
+        # reloading the stored register
+        self.check([store, I("mov_64_r_mbis8", RAX, RBP, RSP, 0, -8)], [store])
+        self.unchanged([store, I("mov_64_r_mbis8", RDX, RBP, RSP, 0, -16)])
+        self.unchanged([store, I("mov_32_r_mbis8", RDX, RBP, RSP, 0, -8)])
+        store_imm = I("mov_32_mbis32_imm32", RBP, RSP, 0, -8, 7)
+        self.check([store_imm, I("mov_32_r_mbis32", RDX, RBP, RSP, 0, -8)],
+                   [store_imm, I("mov_32_r_imm32", RDX, 7)])
+        self.unchanged([store_imm, I("add_32_r_mbis32", RDX, RBP, RSP, 0, -8)])
+
+    def testCmpZero(self):
+        self.check([I("and_64_r_mr", RCX, RDX), I("cmp_64_mr_imm8", RCX, 0), I("jl_8", 0)],
+                   [I("and_64_r_mr", RCX, RDX), I("jl_8", 0)])
+        self.check([I("sub_32_mr_imm8", RCX, 1), I("cmp_32_mr_imm8", RCX, 0), I("jne_8", 0)],
+                   [I("sub_32_mr_imm8", RCX, 1), I("jne_8", 0)])
+        # add/sub set OF and CF differently
+        self.unchanged([I("sub_32_mr_imm8", RCX, 1), I("cmp_32_mr_imm8", RCX, 0), I("jl_8", 0)])
+        self.unchanged([I("and_64_r_mr", RCX, RDX), I("cmp_64_mr_imm8", RDX, 0), I("jl_8", 0)])
+        self.unchanged([I("and_64_r_mr", RCX, RDX), I("cmp_64_mr_imm8", RCX, 1), I("jl_8", 0)])
+        self.unchanged([I("and_64_r_mr", RCX, RDX), I("cmp_32_mr_imm8", RCX, 0), I("jl_8", 0)])
+        self.unchanged([I("and_64_r_mr", RCX, RDX), I("cmp_64_mr_imm8", RCX, 0), I("jl_8", 0)],
+                       flags_live_out=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
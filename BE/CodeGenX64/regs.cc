@@ -22,6 +22,9 @@ std::array<CpuReg, 8> FLT_IN_OUT_REGS;
 
 base::DK_MAP DK_TO_CPU_REG_KIND_MAP;
 
+std::vector<CpuReg> IMPLICIT_CLOBBER_REGS;
+std::set<CpuReg> CALLEE_SAVED_REGS;
+
 // +-prefix converts an enum the underlying type
 template <typename T>
 constexpr auto operator+(T e) noexcept
@@ -123,6 +126,24 @@ struct PushPopInterfaceX64 : base::PushPopInterface {
   }
 } PushPopInterfaceX64Impl;
 
+// System V: the 128 bytes below rsp are not clobbered by signal handlers
+constexpr uint32_t RED_ZONE_SIZE = 128;
+
+// The red zone survives as long as we do not call or push (syscall) and
+// the stack pointer itself does not escape.
+// Inline code is opaque and may do all of these (cf. BblNeedsFrame).
+bool FunCanUseRedZone(Fun fun) {
+  for (Bbl bbl : FunBblIter(fun)) {
+    for (Ins ins : BblInsIter(bbl)) {
+      const OPC opc = InsOPC(ins);
+      if (InsOpcode(ins).IsCall() || opc == OPC::GETSP || opc == OPC::INLINE) {
+        return false;
+      }
+    }
+  }
+  return true;
+}
+
 }  // namespace
 
 const base::PushPopInterface* const PushPopInterfaceX64 =
@@ -130,25 +151,28 @@ const base::PushPopInterface* const PushPopInterfaceX64 =
 
 void AssignCpuRegOrMarkForSpilling(const std::vector<Reg>& assign_to,
                                    uint32_t cpu_reg_mask_first_choice,
-                                   uint32_t cpu_reg_mask_second_choice) {
+                                   uint32_t cpu_reg_mask_second_choice,
+                                   const std::map<Reg, uint32_t>* excluded) {
   // std::cout << "@@ AssignCpuRegOrMarkForSpilling " << assign_to.size() << " "
   //         << std::hex
   //    << cpu_reg_mask_first_choice << " " << cpu_reg_mask_second_choice <<
   //    "\n";
-  uint32_t cpu_reg_mask = cpu_reg_mask_first_choice;
-  unsigned pos = 0;
   for (Reg reg : assign_to) {
     ASSERT(RegCpuReg(reg).isnull(), "");
-    if (cpu_reg_mask == 0 && cpu_reg_mask_second_choice != 0) {
-      cpu_reg_mask = cpu_reg_mask_second_choice;
-      cpu_reg_mask_second_choice = 0;
-      pos = 0;
+    uint32_t not_excluded = ~0U;
+    if (excluded != nullptr) {
+      auto it = excluded->find(reg);
+      if (it != excluded->end()) not_excluded = ~it->second;
+    }
+    uint32_t cpu_reg_mask = cpu_reg_mask_first_choice & not_excluded;
+    if (cpu_reg_mask == 0) {
+      cpu_reg_mask = cpu_reg_mask_second_choice & not_excluded;
     }
     if (cpu_reg_mask == 0) {
       RegCpuReg(reg) = StackSlotNew(0);
       continue;
     }
-    while (((1U << pos) & cpu_reg_mask) == 0) ++pos;
+    const unsigned pos = __builtin_ctz(cpu_reg_mask);
     const DK dk = RegKind(reg);
     if (DKFlavor(dk) == DK_FLAVOR_F) {
       RegCpuReg(reg) = FLT_REGS[pos];
@@ -157,18 +181,31 @@ void AssignCpuRegOrMarkForSpilling(const std::vector<Reg>& assign_to,
     }
     // std::cout << "@@@@ ASSIGN " << Name(reg) << " " <<
     //    EnumToString(dk) << " " << Name(RegCpuReg(reg)) << "\n";
-    cpu_reg_mask &= ~(1U << pos);
-    ++pos;
+    cpu_reg_mask_first_choice &= ~(1U << pos);
+    cpu_reg_mask_second_choice &= ~(1U << pos);
   }
 }
 
+const EmitContext FRAMELESS_EMIT_CONTEXT{0, 0, 0, true};
+
 EmitContext FunComputeEmitContext(Fun fun) {
   CpuRegMasks masks = FunCpuRegStats(fun);
   masks.gpr_mask &= GPR_LAC_REGS_MASK;
   masks.flt_mask &= FLT_LAC_REGS_MASK;
 
   const uint32_t stk_size = (FunStackSize(fun) + 15) / 16 * 16;
-  return EmitContext{masks.gpr_mask, masks.flt_mask, stk_size, FunIsLeaf(fun)};
+  EmitContext out{masks.gpr_mask, masks.flt_mask, stk_size, FunIsLeaf(fun)};
+  auto is_saved_cpu_reg = [&masks](CpuReg cpu_reg) {
+    const uint32_t mask = CpuRegKind(cpu_reg) == +CPU_REG_KIND::GPR
+                              ? masks.gpr_mask
+                              : masks.flt_mask;
+    return (mask & (1U << CpuRegNo(cpu_reg))) != 0;
+  };
+  out.prolog_bbl = FunShrinkWrap(fun, is_saved_cpu_reg, &out.frameless_bbls);
+  if (FunCanUseRedZone(fun) && out.StackAdjustment() <= RED_ZONE_SIZE) {
+    out.red_zone_size = out.StackAdjustment();
+  }
+  return out;
 }
 
 void AssignAllocatedRegsAndReturnSpilledRegs(
@@ -208,30 +245,23 @@ class CpuRegPool : public RegPool {
   }
 
   CpuReg get_available_reg(const LiveRange& lr) override {
-    const bool lac = lr.HasFlag(LR_FLAG::LAC);
+    bool lac = lr.HasFlag(LR_FLAG::LAC);
     const DK kind = RegKind(lr.reg);
     const bool is_gpr = DKFlavor(kind) != DK_FLAVOR_F;
-    const uint32_t available = get_available(lac, is_gpr);
-    if (!is_gpr) {
-      for (unsigned n = 0; n < 16; ++n) {
-        const uint32_t mask = 1U << n;
-        if ((mask & available) == mask) {
-          if (!flt_reserved_[n].has_conflict(lr)) {
-            set_available(lac, is_gpr, available & ~mask);
-            return FLT_REGS[n];
-          }
-        }
-      }
-    } else {
-      for (unsigned n = 0; n <= 16; ++n) {
-        const uint32_t mask = 1U << n;
-        if ((mask & available) == mask) {
-          if (!gpr_reserved_[n].has_conflict(lr)) {
-            set_available(lac, is_gpr, available & ~mask);
-            return GPR_REGS[n];
-          }
-        }
-      }
+    int n = -1;
+    if (lac && !lr.cpu_clobber.empty()) {
+      // only live across calls with a clobber summary: try the caller-saved
+      // regs these calls leave alone first
+      const uint32_t clobbered = CpuRegsToMask(
+          lr.cpu_clobber, is_gpr ? CPU_REG_KIND::GPR : CPU_REG_KIND::FLT);
+      n = find_unreserved_reg(get_available(false, is_gpr) & ~clobbered,
+                              is_gpr, lr);
+      if (n >= 0) lac = false;
+    }
+    if (n < 0) n = find_unreserved_reg(get_available(lac, is_gpr), is_gpr, lr);
+    if (n >= 0) {
+      set_available(lac, is_gpr, get_available(lac, is_gpr) & ~(1U << n));
+      return is_gpr ? GPR_REGS[n] : FLT_REGS[n];
     }
     ASSERT(allow_spilling_, "could not find reg for LiveRange " << lr);
     return CPU_REG_SPILL;
@@ -289,6 +319,19 @@ class CpuRegPool : public RegPool {
     }
   }
 
+  int find_unreserved_reg(uint32_t available, bool is_gpr,
+                          const LiveRange& lr) {
+    std::array<PreAllocation, 32>& reserved =
+        is_gpr ? gpr_reserved_ : flt_reserved_;
+    for (unsigned n = 0; n < 16; ++n) {
+      const uint32_t mask = 1U << n;
+      if ((mask & available) == mask && !reserved[n].has_conflict(lr)) {
+        return n;
+      }
+    }
+    return -1;
+  }
+
   void set_available(bool lac, bool is_gpr, uint32_t available) {
     if (is_gpr) {
       if (lac) {
@@ -313,7 +356,7 @@ class CpuRegPool : public RegPool {
   uint32_t gpr_available_not_lac_ = 0;
   uint32_t flt_available_lac_ = 0;
   uint32_t flt_available_not_lac_ = 0;
-  std::array<PreAllocation, 31> gpr_reserved_;  // r32 is stack/zero
+  std::array<PreAllocation, 32> gpr_reserved_;
   std::array<PreAllocation, 32> flt_reserved_;
 };
 
@@ -458,6 +501,14 @@ void InitCodeGenX64() {
   FLT_IN_OUT_REGS[6] = FLT_REGS[7];
   FLT_IN_OUT_REGS[7] = FLT_REGS[8];
 
+  IMPLICIT_CLOBBER_REGS = {GPR_REGS[0], GPR_REGS[10], FLT_REGS[0]};
+  for (unsigned i = 0; i < GPR_REGS.size(); ++i) {
+    if (GPR_LAC_REGS_MASK & (1U << i)) CALLEE_SAVED_REGS.insert(GPR_REGS[i]);
+  }
+  for (unsigned i = 0; i < FLT_REGS.size(); ++i) {
+    if (FLT_LAC_REGS_MASK & (1U << i)) CALLEE_SAVED_REGS.insert(FLT_REGS[i]);
+  }
+
   // ==================================================
   for (unsigned i = 0; i < DK_TO_CPU_REG_KIND_MAP.size(); ++i) {
     DK_TO_CPU_REG_KIND_MAP[i] = +CPU_REG_KIND::INVALID;
@@ -2,6 +2,8 @@
 // (c) Robert Muth - see LICENSE for more info
 
 #include <array>
+#include <map>
+#include <set>
 
 #include "BE/Base/ir.h"
 #include "BE/Base/lowering.h"
@@ -47,6 +49,15 @@ struct EmitContext {
   uint32_t stk_size = 0;
   bool is_leaf = false;
   base::CpuReg scratch_cpu_reg = base::CpuReg(base::HandleInvalid);
+  // shrink-wrapping: emit the prolog at the start of this bbl instead of the
+  // fun entry (null means fun entry)
+  base::Bbl prolog_bbl = base::Bbl(0);
+  // bbls executed without a frame, their RETs do not need an epilog
+  std::set<base::Bbl> frameless_bbls;
+  // leaf funs: the part of the frame below the saved gprs which lives in the
+  // red zone, i.e. rsp is not adjusted for it and rsp relative offsets shrink
+  // by it
+  uint32_t red_zone_size = 0;
 
   uint32_t FrameSize() const {
     // we assume that stk_size is 16B aligned. To that we add:
@@ -85,6 +96,23 @@ inline uint32_t CpuRegToAllocMask(base::CpuReg cpu_reg) {
   return 1U << CpuRegNo(cpu_reg);
 }
 
+inline uint32_t CpuRegsToMask(const std::vector<base::CpuReg>& cpu_regs,
+                              CPU_REG_KIND kind) {
+  uint32_t mask = 0;
+  for (base::CpuReg cpu_reg : cpu_regs) {
+    if (CPU_REG_KIND(CpuRegKind(cpu_reg)) == kind) {
+      mask |= CpuRegToAllocMask(cpu_reg);
+    }
+  }
+  return mask;
+}
+
+// regs changed by a fun that may not be mentioned in its IR:
+// the reserved regs and r10 which is set up by the syscall sequence
+// (initialized by InitCodeGenX64)
+extern std::vector<base::CpuReg> IMPLICIT_CLOBBER_REGS;
+extern std::set<base::CpuReg> CALLEE_SAVED_REGS;
+
 extern std::vector<base::CpuReg> GetCpuRegsForInSignature(
     unsigned count, const base::DK* kinds);
 
@@ -95,9 +123,13 @@ extern std::vector<base::CpuReg> GetCpuRegsForOutSignature(
 // floating point or all GPR
 // This will use up the "first_choice" regs first.  "second_choice"
 // may incur additional cost, e.g. due to the registers being "callee save".
+// Regs that cannot be assigned are spilled.
+// `excluded` optionally maps regs to the cpu regs (mask) they must not be
+// assigned, e.g. because they are clobbered by calls the reg is live across.
 extern void AssignCpuRegOrMarkForSpilling(
     const std::vector<base::Reg>& assign_to, uint32_t cpu_reg_mask_first_choice,
-    uint32_t cpu_reg_mask_second_choice);
+    uint32_t cpu_reg_mask_second_choice,
+    const std::map<base::Reg, uint32_t>* excluded = nullptr);
 
 // must be called early in main()
 extern void InitCodeGenX64();
@@ -108,6 +140,9 @@ extern void FunLocalRegAlloc(base::Fun fun, std::vector<base::Ins>* inss);
 
 extern EmitContext FunComputeEmitContext(base::Fun fun);
 
+// the context for bbls without a frame, i.e. plain returns
+extern const EmitContext FRAMELESS_EMIT_CONTEXT;
+
 extern void FunPushargConversion(base::Fun fun);
 extern void FunPopargConversion(base::Fun fun);
 
@@ -1,7 +1,8 @@
 import dataclasses
 import enum
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Optional, Set
 
+from BE.Base import cfg
 from BE.Base import ir
 from BE.Base import liveness
 from BE.Base import lowering
@@ -58,6 +59,13 @@ FLT_LAC_REGS_MASK = 0xff00  # xmm8 - xmm15
 
 REGS_RESERVED = {_GPR_REGS[0], _FLT_REGS[0]}  # we use these in the code generator
 
+# regs changed by a fun that may not be mentioned in its IR:
+# the reserved regs above and r10 which is set up by the syscall sequence
+IMPLICIT_CLOBBER_REGS = [_GPR_REGS[0], _GPR_REGS[10], _FLT_REGS[0]]
+
+CALLEE_SAVED_REGS = ({r for r in _GPR_REGS if (1 << r.no) & GPR_LAC_REGS_MASK} |
+                     {r for r in _FLT_REGS if (1 << r.no) & FLT_LAC_REGS_MASK})
+
 _KIND_TO_CPU_REG_LIST = {
     o.DK.S8: _GPR_REGS,
     o.DK.S16: _GPR_REGS,
@@ -120,6 +128,14 @@ def MaskToFltRegs(mask: int) -> List[ir.CpuReg]:
     return out
 
 
+def CpuRegsToMask(cpu_regs, kind: CpuRegKind) -> int:
+    mask = 0
+    for reg in cpu_regs:
+        if reg.kind == kind:
+            mask |= 1 << reg.no
+    return mask
+
+
 def _GetCpuRegsForSignature(kinds: List[o.DK], gpr_regs: List[ir.CpuReg],
                             flt_regs: List[ir.CpuReg]) -> List[ir.CpuReg]:
     out = []
@@ -181,7 +197,6 @@ class CpuRegPool(reg_alloc.RegPool):
         return CpuRegKind.FLT if kind in {o.DK.R64, o.DK.R32} else CpuRegKind.GPR
 
     def get_available(self, lac, is_gpr) -> int:
-        # TODO: use lac as fallback if no not_lac is available
         if is_gpr:
             return self._gpr_available_lac if lac else self._gpr_available_not_lac
         else:
@@ -220,23 +235,23 @@ class CpuRegPool(reg_alloc.RegPool):
     def get_available_reg(self, lr: reg_alloc.LiveRange) -> ir.CpuReg:
         lac = liveness.LiveRangeFlag.LAC in lr.flags
         is_gpr = lr.reg.kind.flavor() != o.DK_FLAVOR_R
-        available = self.get_available(lac, is_gpr)
+        reserved = self._gpr_reserved if is_gpr else self._flt_reserved
 
         # print(f"GET {lr} {self}  avail:{available:x}")
-        if not is_gpr:
-            for n in range(len(_FLT_REGS)):
-                mask = 1 << n
-                if available & mask == mask:
-                    if not self._flt_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
-        else:
-            for n in range(len(_GPR_REGS)):
-                mask = 1 << n
-                if mask & available == mask:
-                    if not self._gpr_reserved[n].has_conflict(lr):
-                        self.set_available(lac, is_gpr, available & ~mask)
-                        return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
+        n = -1
+        if lac and lr.cpu_clobber:
+            # only live across calls with a clobber summary: try the caller-saved
+            # regs these calls leave alone first
+            kind = CpuRegKind.GPR if is_gpr else CpuRegKind.FLT
+            available = self.get_available(False, is_gpr) & ~CpuRegsToMask(lr.cpu_clobber, kind)
+            n = reg_alloc.FindUnreservedReg(available, reserved, lr)
+            if n >= 0:
+                lac = False
+        if n < 0:
+            n = reg_alloc.FindUnreservedReg(self.get_available(lac, is_gpr), reserved, lr)
+        if n >= 0:
+            self.set_available(lac, is_gpr, self.get_available(lac, is_gpr) & ~(1 << n))
+            return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
         if self._allow_spilling:
             return ir.CPU_REG_SPILL
         print("@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@")
@@ -391,6 +406,13 @@ class EmitContext:
     stk_size: int = 0
     is_leaf: bool = False
     scratch_cpu_reg: ir.CpuReg = ir.CPU_REG_INVALID
+    # shrink-wrapping: emit the prolog at the start of this bbl instead of the fun entry
+    prolog_bbl: Optional[ir.Bbl] = None
+    # names of the bbls executed without a frame, their RETs do not need an epilog
+    frameless_bbls: Set[str] = dataclasses.field(default_factory=set)
+    # leaf funs: the part of the frame below the saved gprs which lives in the
+    # red zone, i.e. rsp is not adjusted for it and rsp relative offsets shrink by it
+    red_zone_size: int = 0
 
     def FrameSize(self):
         # includes the return address
@@ -423,28 +445,60 @@ def FunComputeEmitContext(fun: ir.Fun) -> EmitContext:
     gpr_mask &= GPR_LAC_REGS_MASK
     flt_mask &= FLT_LAC_REGS_MASK
     stk_size = (fun.stk_size + 15) // 16 * 16
-    return EmitContext(gpr_mask, flt_mask, stk_size, ir.FunIsLeaf(fun))
+    ctx = EmitContext(gpr_mask, flt_mask, stk_size, ir.FunIsLeaf(fun))
+
+    def is_saved_cpu_reg(cpu_reg: ir.CpuReg) -> bool:
+        mask = gpr_mask if cpu_reg.kind == CpuRegKind.GPR else flt_mask
+        return (mask & (1 << cpu_reg.no)) != 0
+
+    ctx.prolog_bbl, ctx.frameless_bbls = cfg.FunShrinkWrap(fun, is_saved_cpu_reg)
+    if _FunCanUseRedZone(fun):
+        below_saved_gprs = ctx.FrameSize() - 8 * len(MaskToGprRegs(gpr_mask)) - 8
+        if below_saved_gprs <= RED_ZONE_SIZE:
+            ctx.red_zone_size = below_saved_gprs
+    return ctx
+
+
+# System V: the 128 bytes below rsp are not clobbered by signal handlers
+RED_ZONE_SIZE = 128
+
+
+def _FunCanUseRedZone(fun: ir.Fun) -> bool:
+    """The red zone survives as long as we do not call or push (syscall) and
+    the stack pointer itself does not escape.
+    Inline code is opaque and may do all of these (cf. cfg.BblNeedsFrame)."""
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            if ins.opcode.is_call() or ins.opcode in {o.GETSP, o.INLINE}:
+                return False
+    return True
+
+
+# the context for bbls without a frame, i.e. plain returns
+FRAMELESS_EMIT_CONTEXT = EmitContext(is_leaf=True)
 
 
 def AssignCpuRegOrMarkForSpilling(assign_to: List[ir.Reg],
                                   cpu_reg_mask_first_choice: int,
-                                  cpu_reg_mask_second_choice: int):
+                                  cpu_reg_mask_second_choice: int,
+                                  excluded: Optional[Dict[ir.Reg, int]] = None):
     """
-    Returns the regs that could not be assigned.
+    Regs that cannot be assigned are spilled.
+
+    `excluded` optionally maps regs to the cpu regs (mask) they must not be assigned,
+    e.g. because they are clobbered by calls the reg is live across.
     """
     # print (f"@@ AssignCpuRegOrMarkForSpilling {len(assign_to)} {cpu_reg_mask_first_choice:x} {cpu_reg_mask_second_choice:x}")
-    mask = cpu_reg_mask_first_choice
-    pos = 0
     for reg in assign_to:
-        if mask == 0 and cpu_reg_mask_second_choice != 0:
-            mask = cpu_reg_mask_second_choice
-            cpu_reg_mask_second_choice = 0
-            pos = 0
+        not_excluded = ~excluded.get(reg, 0) if excluded else -1
+        mask = cpu_reg_mask_first_choice & not_excluded
+        if mask == 0:
+            mask = cpu_reg_mask_second_choice & not_excluded
         if mask == 0:
             reg.cpu_reg = ir.StackSlot()
             continue
-        while ((1 << pos) & mask) == 0: pos += 1
+        lowest = mask & -mask
         assert reg.cpu_reg is None
-        reg.cpu_reg = _KIND_TO_CPU_REG_LIST[reg.kind][pos]
-        mask &= ~(1 << pos)
-        pos += 1
+        reg.cpu_reg = _KIND_TO_CPU_REG_LIST[reg.kind][lowest.bit_length() - 1]
+        cpu_reg_mask_first_choice &= ~lowest
+        cpu_reg_mask_second_choice &= ~lowest
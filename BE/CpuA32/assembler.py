@@ -10,6 +10,7 @@ from BE.CpuA32 import symbolic
 from BE.Elf import elfhelper as elf
 from BE.Elf import elf_unit
 from BE.Elf import enum_tab
+from BE.Dwarf import debug_line
 
 from Util import parse
 
@@ -36,7 +37,11 @@ def AddIns(unit: elf_unit.Unit, ins: a32.Ins):
         unit.AddReloc(ins.reloc_kind, unit.sec_text,
                       sym, ins.operands[ins.reloc_pos])
         ins.clear_reloc()
-    unit.sec_text.AddData(a32.Assemble(ins).to_bytes(4, byteorder='little'))
+    sec = unit.sec_text
+    # sec.data may not contain all the bytes, see elfhelper.Run
+    start = len(sec.data)
+    a32.AssembleInto(ins, sec.data)
+    sec.sh_size += len(sec.data) - start
 
 
 def HandleOpcode(mnemonic, token: List[str], unit: elf_unit.Unit):
@@ -61,6 +66,8 @@ def UnitParse(fin) -> elf_unit.Unit:
         ".addr.bbl": lambda x, y: unit.AddBblAddr(enum_tab.RELOC_TYPE_ARM.ABS32, int(x, 0), y),
         ".addr.mem": lambda x, y, z: unit.AddMemAddr(enum_tab.RELOC_TYPE_ARM.ABS32, int(x, 0), y, int(z, 0)),
         ".bbl": lambda x, y: unit.AddLabel(x, int(y, 0), NOP_BYTES),
+        ".line": lambda x, y: unit.AddLine(
+            str(parse.QuotedEscapedStringToBytes(x), "utf-8"), int(y, 0)),
     }
     for line_num, line in enumerate(fin):
         token = parse.ParseLine(line)
@@ -98,10 +105,12 @@ def _branch_offset(rel: elf.Reloc, sym_val: int) -> int:
 
 def _ApplyRelocation(rel: elf.Reloc):
     sec_data = rel.section.data
+    # r_offset is relative to the section which may contain unmaterialized runs
+    pos = rel.section.DataPos(rel.r_offset)
     sym_val = rel.symbol.st_value + rel.r_addend
-    assert rel.r_offset + 4 <= len(sec_data)
+    assert pos + 4 <= len(sec_data)
     old_data = int.from_bytes(
-        sec_data[rel.r_offset:rel.r_offset + 4], "little")
+        sec_data[pos:pos + 4], "little")
 
     if rel.r_type == enum_tab.RELOC_TYPE_ARM.MOVW_ABS_NC.value:
         new_data = a32.Patch(old_data, _OPCODE_MOVW, 2, sym_val & 0xffff)
@@ -119,11 +128,13 @@ def _ApplyRelocation(rel: elf.Reloc):
     else:
         assert False, f"unknown kind reloc {rel}"
 
-    sec_data[rel.r_offset:rel.r_offset + 4] = new_data.to_bytes(4, "little")
+    sec_data[pos:pos + 4] = new_data.to_bytes(4, "little")
     # print(f"PATCH INS {rel.r_type} {rel.r_offset:x} {sym_val:x} {old_data:x} {new_data:x} {rel.symbol.name}")
 
 
 def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
+    for sym in unit.symbols:
+        assert not sym.is_undefined(), f"undefined symbol: {sym.name}"
     sections = []
     segments = []
 
@@ -140,24 +151,24 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     seg_exe.sections.append(sec_text)
 
     sec_rodata = unit.sec_rodata
-    if len(sec_rodata.data) > 0:
+    if sec_rodata.sh_size > 0:
         seg_ro = elf.Segment.MakeROSegment(65536)
         segments.append(seg_ro)
         #
         sections.append(sec_rodata)
         seg_ro.sections.append(sec_rodata)
 
-    if len(unit.sec_data.data) + len(unit.sec_bss.data) > 0:
+    if unit.sec_data.sh_size + unit.sec_bss.sh_size > 0:
         seg_rw = elf.Segment.MakeRWSegment(65536)
         segments.append(seg_rw)
 
     sec_data = unit.sec_data
-    if len(sec_data.data) > 0:
+    if sec_data.sh_size > 0:
         sections.append(sec_data)
         seg_rw.sections.append(sec_data)
 
     sec_bss = unit.sec_bss
-    if len(sec_bss.data) > 0:
+    if sec_bss.sh_size > 0:
         sections.append(sec_bss)
         seg_rw.sections.append(sec_bss)
 
@@ -169,6 +180,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     sec_attr.SetData(elf.ARM_ATTRIBUTES)
     seg_pseudo.sections.append(sec_attr)
 
+    debug_sections = debug_line.AddDebugSections(unit, sections, seg_pseudo, 4)
+
     if create_sym_tab:
         # we do not create the content here since we cannot really do this until
         # the section addresses are finalized
@@ -219,6 +232,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     for rel in unit.relocations:
         _ApplyRelocation(rel)
 
+    debug_line.UpdateDebugSections(unit, debug_sections, 4)
+
     if create_sym_tab:
         # we only put dummiess in the symtable above - do it for real now
         sec_symtab.data = bytearray()
@@ -4,6 +4,8 @@ import sys
 
 from BE.CpuA32 import symbolic
 from BE.CpuA32 import opcode_tab as a32
+from BE.Elf import elfhelper
+from BE.Elf import enum_tab
 
 
 def disass(data):
@@ -41,10 +43,32 @@ def batch():
             ins2.operands), f"{ins.operands} vs {ins2.operands}"
 
 
+def elf(filename: str):
+    """Disassembles all executable sections of an ELF file"""
+    exe = elfhelper.Executable()
+    with open(filename, "rb") as fin:
+        exe.load(fin, lazy=True)
+    for sec in exe.sections:
+        if not sec.sh_flags & enum_tab.SH_FLAGS.EXECINSTR.value:
+            continue
+        print(f"section {sec.name}")
+        for off, opcode, operands in a32.DisassembleBatch(sec.data):
+            addr = sec.sh_addr + off
+            word = int.from_bytes(sec.data[off:off + 4], "little")
+            if opcode is None:
+                print(f"{addr:08x} {word:08x} could not disassemble")
+                continue
+            enum_name, ops_str = symbolic.InsSymbolize(a32.Ins(opcode, operands))
+            print(f"{addr:08x} {word:08x} {enum_name}{' ' if ops_str else ''}{', '.join(ops_str)}")
+
+    exe.close()
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "batch":
             batch()
+        elif sys.argv[1] == "elf":
+            elf(sys.argv[2])
         else:
             for arg_hex_number in sys.argv[1:]:
                 disass(int(arg_hex_number, 16))
@@ -1216,6 +1216,10 @@ const Opcode OpcodeTable[] = {
  3, {OK::PRED_28_31, OK::DREG_12_15_22, OK::IMM_FLT_ZERO},
  VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
 },
+{"vcnt.8", "vcnt_8", 0xffbf0fd0, 0xf3b00500,
+ 2, {OK::DREG_12_15_22, OK::DREG_0_3_5},
+ VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
+},
 {"vcvt.f32.f64", "vcvt_f32_f64", 0x0fbf0fd0, 0x0eb70bc0,
  3, {OK::PRED_28_31, OK::SREG_12_15_22, OK::DREG_0_3_5},
  VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
@@ -1428,6 +1432,18 @@ const Opcode OpcodeTable[] = {
  4, {OK::PRED_28_31, OK::DREG_12_15_22, OK::DREG_16_19_7, OK::DREG_0_3_5},
  VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
 },
+{"vpaddl.u16", "vpaddl_u16", 0xffbf0fd0, 0xf3b40280,
+ 2, {OK::DREG_12_15_22, OK::DREG_0_3_5},
+ VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
+},
+{"vpaddl.u32", "vpaddl_u32", 0xffbf0fd0, 0xf3b80280,
+ 2, {OK::DREG_12_15_22, OK::DREG_0_3_5},
+ VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
+},
+{"vpaddl.u8", "vpaddl_u8", 0xffbf0fd0, 0xf3b00280,
+ 2, {OK::DREG_12_15_22, OK::DREG_0_3_5},
+ VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
+},
 {"vsqrt.f32", "vsqrt_f32", 0x0fbf0fd0, 0x0eb10ac0,
  3, {OK::PRED_28_31, OK::SREG_12_15_22, OK::SREG_0_3_5},
  VFP, MEM_WIDTH::NA, SR_UPDATE::NONE
@@ -1643,16 +1659,16 @@ const OPC ClusteredOpcodeTable[] = {
   OPC::orrs_imm,
   // cluster 58  size:1,
   OPC::mov_imm,
-  // cluster 59  size:1,
-  OPC::movs_imm,
+  // cluster 59  size:5,
+  OPC::vcnt_8, OPC::vpaddl_u8, OPC::vpaddl_u16, OPC::vpaddl_u32, OPC::movs_imm,
   // cluster 60  size:1,
   OPC::bic_imm,
   // cluster 61  size:1,
   OPC::bics_imm,
   // cluster 62  size:1,
   OPC::mvn_imm,
-  // cluster 63  size:1,
-  OPC::mvns_imm,
+  // cluster 63  size:5,
+  OPC::vcnt_8, OPC::vpaddl_u8, OPC::vpaddl_u16, OPC::vpaddl_u32, OPC::mvns_imm,
   // cluster 64  size:1,
   OPC::str_imm_sub_post,
   // cluster 65  size:1,
@@ -2068,90 +2084,74 @@ const int16_t OpcodeTableJumper[] = {
 183,
 184,
 185,
-186,
-187,
-188,
-189,
 190,
 191,
 192,
-192,
-192,
 193,
-195,
-195,
-195,
-196,
-197,
-197,
-197,
 198,
+199,
 200,
 200,
 200,
 201,
-202,
+203,
+203,
 203,
 204,
 205,
-207,
+205,
+205,
+206,
 208,
+208,
+208,
+209,
 210,
 211,
 212,
 213,
-214,
 215,
-217,
+216,
 218,
+219,
 220,
 221,
 222,
-222,
-222,
 223,
 225,
-225,
-225,
+226,
 228,
 229,
+230,
+230,
+230,
 231,
-235,
-238,
-240,
-242,
-245,
+233,
+233,
+233,
+236,
+237,
+239,
+243,
 246,
 248,
-249,
-251,
-252,
+250,
+253,
 254,
-255,
+256,
 257,
-258,
 259,
 260,
-261,
 262,
-264,
+263,
 265,
+266,
+267,
 268,
 269,
 270,
-271,
-272,
-272,
-272,
-272,
 272,
 273,
-274,
-275,
-276,
-276,
-276,
-276,
 276,
 277,
 278,
@@ -2173,10 +2173,18 @@ const int16_t OpcodeTableJumper[] = {
 286,
 287,
 288,
+288,
+288,
+288,
+288,
 289,
 290,
 291,
 292,
+292,
+292,
+292,
+292,
 293,
 294,
 295,
@@ -2201,15 +2209,19 @@ const int16_t OpcodeTableJumper[] = {
 314,
 315,
 316,
+317,
 318,
+319,
 320,
+321,
 322,
+323,
 324,
-327,
+326,
+328,
 330,
 332,
-334,
-336,
+335,
 338,
 340,
 342,
@@ -2217,45 +2229,41 @@ const int16_t OpcodeTableJumper[] = {
 346,
 348,
 350,
+352,
 354,
+356,
 358,
-360,
 362,
 366,
+368,
 370,
-372,
 374,
 378,
+380,
 382,
-384,
 386,
 390,
+392,
 394,
-396,
 398,
-403,
-408,
-412,
+402,
+404,
+406,
+411,
 416,
 420,
 424,
 428,
 432,
-434,
-434,
-434,
-460,
-462,
-462,
-462,
-489,
-490,
-491,
-492,
-493,
-494,
-495,
-496,
+436,
+440,
+442,
+442,
+442,
+468,
+470,
+470,
+470,
 497,
 498,
 499,
@@ -2264,7 +2272,15 @@ const int16_t OpcodeTableJumper[] = {
 502,
 503,
 504,
-505
+505,
+506,
+507,
+508,
+509,
+510,
+511,
+512,
+513
 };
 
 constexpr const unsigned MNEMONIC_HASH_TABLE_SIZE = 512;
@@ -2289,8 +2305,8 @@ static const OPC MnemonicHashTable[MNEMONIC_HASH_TABLE_SIZE] = {
    OPC::invalid, OPC::adds_regimm, OPC::rscs_imm, OPC::strexh,
    OPC::str_reg_add, OPC::vcvt_f64_f32, OPC::vstmib_f_update, OPC::invalid,
    OPC::vldmib_f, OPC::str_imm_sub, OPC::sub_regreg, OPC::vcmpe_f32,
-   OPC::vstmda_s_update, OPC::orrs_imm, OPC::str_imm_add_post, OPC::str_imm_sub_pre,
-   OPC::vldr_f32_sub, OPC::invalid, OPC::strd_imm_sub_post, OPC::sbcs_imm,
+   OPC::vpaddl_u8, OPC::orrs_imm, OPC::str_imm_add_post, OPC::str_imm_sub_pre,
+   OPC::vldr_f32_sub, OPC::vstmda_s_update, OPC::strd_imm_sub_post, OPC::sbcs_imm,
    OPC::invalid, OPC::bic_imm, OPC::vldmib_s, OPC::invalid,
    OPC::mvn_imm, OPC::rev16, OPC::ldrh_reg_sub_post, OPC::invalid,
    OPC::invalid, OPC::invalid, OPC::invalid, OPC::invalid,
@@ -2299,12 +2315,12 @@ static const OPC MnemonicHashTable[MNEMONIC_HASH_TABLE_SIZE] = {
    OPC::invalid, OPC::invalid, OPC::vcmp_f64, OPC::strh_reg_add,
    OPC::strb_imm_sub, OPC::strd_imm_sub, OPC::ldrsb_imm_sub_pre, OPC::ldrsh_reg_add_pre,
    OPC::adc_imm, OPC::strh_reg_sub_post, OPC::strh_imm_sub, OPC::strd_imm_sub_pre,
-   OPC::umull, OPC::ldrd_reg_add_post, OPC::clz, OPC::strh_imm_sub_pre,
-   OPC::teq_imm, OPC::ldr_imm_sub_post, OPC::ldrb_reg_sub_pre, OPC::strex,
-   OPC::adcs_regreg, OPC::sdiv, OPC::strb_reg_add_pre, OPC::rsbs_regimm,
-   OPC::cmp_regreg, OPC::vldr_f64_add, OPC::vsub_f64, OPC::vnmls_f32,
-   OPC::vmls_f32, OPC::vldmdb_s, OPC::eor_regreg, OPC::vldmdb_f_update,
-   OPC::invalid, OPC::invalid, OPC::teq_regreg, OPC::str_reg_sub_pre,
+   OPC::umull, OPC::ldrd_reg_add_post, OPC::clz, OPC::vcnt_8,
+   OPC::strh_imm_sub_pre, OPC::teq_imm, OPC::ldr_imm_sub_post, OPC::strex,
+   OPC::adcs_regreg, OPC::sdiv, OPC::ldrb_reg_sub_pre, OPC::rsbs_regimm,
+   OPC::cmp_regreg, OPC::strb_reg_add_pre, OPC::vldr_f64_add, OPC::vsub_f64,
+   OPC::vnmls_f32, OPC::vmls_f32, OPC::eor_regreg, OPC::vldmdb_s,
+   OPC::vldmdb_f_update, OPC::invalid, OPC::teq_regreg, OPC::str_reg_sub_pre,
    OPC::strd_reg_add_post, OPC::adc_regimm, OPC::vstmia_s_update, OPC::invalid,
    OPC::invalid, OPC::invalid, OPC::invalid, OPC::vmul_f32,
    OPC::ldrb_reg_sub_post, OPC::vsqrt_f64, OPC::smlabb, OPC::invalid,
@@ -2340,8 +2356,8 @@ static const OPC MnemonicHashTable[MNEMONIC_HASH_TABLE_SIZE] = {
    OPC::invalid, OPC::invalid, OPC::str_imm_add_pre, OPC::sub_regimm,
    OPC::strh_reg_add_post, OPC::mvn_regreg, OPC::mov_regreg, OPC::strb_imm_sub_post,
    OPC::vcvt_u32_f64, OPC::invalid, OPC::ldr_imm_add_post, OPC::vldmia_s_update,
-   OPC::invalid, OPC::invalid, OPC::invalid, OPC::vabs_f32,
-   OPC::smultb, OPC::invalid, OPC::invalid, OPC::invalid,
+   OPC::invalid, OPC::invalid, OPC::invalid, OPC::vpaddl_u16,
+   OPC::smultb, OPC::vabs_f32, OPC::invalid, OPC::invalid,
    OPC::vstmia_f_update, OPC::invalid, OPC::invalid, OPC::invalid,
    OPC::vneg_f64, OPC::cmn_imm, OPC::strb_reg_sub, OPC::ldrsb_reg_sub_post,
    OPC::strd_reg_sub, OPC::rsb_regreg, OPC::vstr_f32_sub, OPC::vcvt_s32_f32,
@@ -2356,7 +2372,7 @@ static const OPC MnemonicHashTable[MNEMONIC_HASH_TABLE_SIZE] = {
    OPC::str_reg_add_pre, OPC::vstr_f64_add, OPC::invalid, OPC::teq_regimm,
    OPC::invalid, OPC::invalid, OPC::ldrsh_imm_sub_post, OPC::rev,
    OPC::bl, OPC::invalid, OPC::invalid, OPC::invalid,
-   OPC::invalid, OPC::invalid, OPC::orr_imm, OPC::invalid,
+   OPC::invalid, OPC::vpaddl_u32, OPC::orr_imm, OPC::invalid,
    OPC::invalid, OPC::invalid, OPC::ldrh_imm_add_post, OPC::bx,
    OPC::vmla_f32, OPC::ldrsb_reg_add, OPC::bics_regreg, OPC::vstmia_f,
    OPC::vldmda_f_update, OPC::invalid, OPC::invalid, OPC::umulls,
@@ -504,6 +504,7 @@ enum class OPC : uint16_t {
     vcmpe_f32_zero,
     vcmpe_f64,
     vcmpe_f64_zero,
+    vcnt_8,
     vcvt_f32_f64,
     vcvt_f32_s32,
     vcvt_f32_u32,
@@ -557,6 +558,9 @@ enum class OPC : uint16_t {
     vnmls_f64,
     vnmul_f32,
     vnmul_f64,
+    vpaddl_u16,
+    vpaddl_u32,
+    vpaddl_u8,
     vsqrt_f32,
     vsqrt_f64,
     vstmda_f,
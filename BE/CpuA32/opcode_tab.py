@@ -37,6 +37,7 @@ import collections
 import dataclasses
 import enum
 import re
+import struct
 import sys
 
 _DEBUG = False
@@ -646,6 +647,16 @@ class Opcode:
         self.classes: OPC_FLAG = classes
         self.sr_update = sr_update
         self.mem_width = mem_width
+        # (mask, pos, width) triples per field in InsertOperand order
+        self.inserts: List[Tuple[Tuple[int, int, int], ...]] = [
+            tuple(((1 << width) - 1, pos, width)
+                  for width, pos in reversed(FIELD_DETAILS[f].ranges))
+            for f in fields]
+        # (pos, mask, width) triples per field in ExtractOperand order
+        self.extracts: List[Tuple[Tuple[int, int, int], ...]] = [
+            tuple((pos, (1 << width) - 1, width)
+                  for width, pos in FIELD_DETAILS[f].ranges)
+            for f in fields]
 
     def __lt__(self, other):
         return self.name < other.name
@@ -656,26 +667,53 @@ class Opcode:
     def AssembleOperandsRaw(self, operands: List[int]):
         assert len(operands) == len(
             self.fields), f"not enough operands for {self.name}"
-        bits = [(self.bit_mask, self.bit_value, 0)]
-        for f, o in zip(self.fields, operands):
-            bits += InsertOperand(f, o)
-        bit_mask, bit_value = Bits(*bits)
-        assert bit_mask == 0xffffffff, f"{self.name} BAD MASK {bit_mask:08x}"
-        return bit_value
+        # equivalent to combining InsertOperand() results with Bits() but
+        # without the intermediate lists (__init__ checked the coverage)
+        word = self.bit_value
+        for ranges, val in zip(self.inserts, operands):
+            for mask, pos, width in ranges:
+                word |= (val & mask) << pos
+                val >>= width
+        return word
 
     def DisassembleOperandsRaw(self, data: int) -> List[int]:
         assert data & self.bit_mask == self.bit_value
-        return [ExtractOperand(f, data)
-                for f in self.fields]
+        # same as calling ExtractOperand for each field
+        out = []
+        for ranges in self.extracts:
+            tmp = 0
+            for pos, mask, width in ranges:
+                tmp = tmp << width | ((data >> pos) & mask)
+            out.append(tmp)
+        return out
 
     @classmethod
     def FindOpcode(cls, data: int) -> Optional["Opcode"]:
-        for opcode in Opcode.ordered_opcodes[_OpcodeDiscriminant(data)]:
+        for opcode in _DispatchCandidates(data & _DISPATCH_MASK):
             if data & opcode.bit_mask == opcode.bit_value:
                 return opcode
         return None
 
 
+# Second level opcode dispatch: Opcode.ordered_opcodes partitions the
+# opcodes by the _INS_CLASSIFIER bits, this table further narrows each
+# partition by the condition bits and bits 4-7.
+# The entries preserve the order of ordered_opcodes so FindOpcode picks
+# the same opcode. The table is filled in lazily as new keys are encountered.
+_DISPATCH_MASK = _INS_CLASSIFIER | 0xf00000f0
+_DISPATCH: Dict[int, List[Opcode]] = {}
+
+
+def _DispatchCandidates(key: int) -> List[Opcode]:
+    candidates = _DISPATCH.get(key)
+    if candidates is None:
+        candidates = [opcode for opcode in
+                      Opcode.ordered_opcodes.get(_OpcodeDiscriminant(key), [])
+                      if key & opcode.bit_mask == opcode.bit_value & _DISPATCH_MASK]
+        _DISPATCH[key] = candidates
+    return candidates
+
+
 def _CheckDiscriminantSeparability():
     """Make sure we completely understand the case where the
      bit_mask and bit_value are not uniquely specifying an opcode.
@@ -722,6 +760,21 @@ def _CheckDiscriminantSeparability():
 root00 = (3, 0, 26)
 ########################################
 
+# Advanced SIMD (unconditional) - these must precede the data processing
+# opcodes sharing the same discriminant
+Opcode("vcnt.8", "",
+       [root00, (0xf, 0xf, 28), (7, 7, 23), (3, 3, 20), (0xf, 0, 16),
+        (0x1f, 0xa, 7), (1, 0, 6), (1, 0, 4)],
+       [OK.DREG_12_15_22, OK.DREG_0_3_5],
+       OPC_FLAG.VFP, has_pred=False)
+
+for size, width in [(0, "u8"), (1, "u16"), (2, "u32")]:
+    Opcode("vpaddl." + width, "",
+           [root00, (0xf, 0xf, 28), (7, 7, 23), (3, 3, 20), (0xf, size << 2, 16),
+            (0x1f, 0x5, 7), (1, 0, 6), (1, 0, 4)],
+           [OK.DREG_12_15_22, OK.DREG_0_3_5],
+           OPC_FLAG.VFP, has_pred=False)
+
 for ext, sr_update, s_bit in [("", SR_UPDATE.NONE, (1, 0, 20)),
                               ("s", SR_UPDATE.NZ, (1, 1, 20))]:
     Opcode("mul" + ext, "",
@@ -1222,11 +1275,43 @@ def Disassemble(data: int) -> Optional[Ins]:
     return Ins(opcode, ops)
 
 
+def DisassembleBatch(data) -> List[Tuple[int, Optional[Opcode], List[int]]]:
+    """Disassembles a whole code buffer (bytes, bytearray or memoryview)
+
+    Returns one (offset, opcode, operands) triple per instruction word.
+    Words that cannot be decoded have opcode None and no operands.
+    Trailing bytes that do not form a complete word are ignored.
+    """
+    out = []
+    view = memoryview(data)
+    view = view[:len(view) & ~3]
+    for n, (word,) in enumerate(struct.iter_unpack("<I", view)):
+        for opcode in _DispatchCandidates(word & _DISPATCH_MASK):
+            if word & opcode.bit_mask == opcode.bit_value:
+                out.append((n * 4, opcode, opcode.DisassembleOperandsRaw(word)))
+                break
+        else:
+            out.append((n * 4, None, []))
+    return out
+
+
 def Assemble(ins: Ins) -> int:
     assert ins.reloc_kind == 0, "reloc has not been resolved"
     return ins.opcode.AssembleOperandsRaw(ins.operands)
 
 
+_WORD = struct.Struct("<I")
+_ZERO_WORD = bytes(4)
+
+
+def AssembleInto(ins: Ins, out: bytearray) -> int:
+    """Like Assemble but appends the little endian encoding to `out`"""
+    offset = len(out)
+    out.extend(_ZERO_WORD)
+    _WORD.pack_into(out, offset, Assemble(ins))
+    return 4
+
+
 def Patch(data: int, opcode: Opcode, pos: int, value: int):
     """For relocation patching - note that the value is not run through the Encoder.
     But there will still be some range checking."""
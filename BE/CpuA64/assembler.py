@@ -9,6 +9,7 @@ from BE.CpuA64 import opcode_tab as a64
 from BE.CpuA64 import symbolic
 from BE.Elf import elfhelper as elf
 from BE.Elf import enum_tab
+from BE.Dwarf import debug_line
 from Util import parse
 from BE.Elf import elf_unit
 
@@ -35,7 +36,37 @@ def AddIns(unit: elf_unit.Unit, ins: a64.Ins):
         unit.AddReloc(ins.reloc_kind, unit.sec_text,
                       sym, ins.operands[ins.reloc_pos])
         ins.clear_reloc()
-    unit.sec_text.AddData(a64.Assemble(ins).to_bytes(4, byteorder='little'))
+    sec = unit.sec_text
+    # sec.data may not contain all the bytes, see elfhelper.Run
+    start = len(sec.data)
+    a64.AssembleInto(ins, sec.data)
+    sec.sh_size += len(sec.data) - start
+
+
+def AlignLabels(code: List[Any], start: int, alignments: Dict[str, int], padding_budget: int):
+    """Drops the label alignments that would exceed the padding budget
+
+    `code` holds the text of a single function: label names (str)
+    interleaved with a64.Ins. `start` is the section offset of the first item.
+    `alignments` maps labels to the alignment they should get.
+    Labels are aligned in order for as long as the total padding stays within
+    `padding_budget` bytes, the others are removed from `alignments`.
+    """
+    pos = start
+    padding = 0
+    for item in code:
+        if not isinstance(item, str):
+            pos += 4
+            continue
+        alignment = alignments.get(item)
+        if alignment is None:
+            continue
+        pad = -pos % alignment
+        if padding + pad > padding_budget:
+            del alignments[item]
+        else:
+            padding += pad
+            pos += pad
 
 
 def HandleOpcode(mnemonic, token: List[str], unit: elf_unit.Unit):
@@ -60,6 +91,8 @@ def UnitParse(fin) -> elf_unit.Unit:
         ".addr.bbl": lambda x, y: unit.AddBblAddr(enum_tab.RELOC_TYPE_ARM.ABS32, int(x, 0), y),
         ".addr.mem": lambda x, y, z: unit.AddMemAddr(enum_tab.RELOC_TYPE_ARM.ABS32, int(x, 0), y, int(z, 0)),
         ".bbl": lambda x, y: unit.AddLabel(x, int(y, 0), NOP_BYTES),
+        ".line": lambda x, y: unit.AddLine(
+            str(parse.QuotedEscapedStringToBytes(x), "utf-8"), int(y, 0)),
     }
     for line_num, line in enumerate(fin):
         token = parse.ParseLine(line)
@@ -112,11 +145,13 @@ def _RelWidth(rel_type: int):
 
 def _ApplyRelocation(rel: elf.Reloc):
     sec_data = rel.section.data
+    # r_offset is relative to the section which may contain unmaterialized runs
+    pos = rel.section.DataPos(rel.r_offset)
     sym_val = rel.symbol.st_value + rel.r_addend
     width = _RelWidth(rel.r_type)
-    assert rel.r_offset + width <= len(sec_data)
+    assert pos + width <= len(sec_data)
     old_data = int.from_bytes(
-        sec_data[rel.r_offset:rel.r_offset + width], "little")
+        sec_data[pos:pos + width], "little")
 
     if rel.r_type == enum_tab.RELOC_TYPE_AARCH64.ADR_PREL_PG_HI21.value:
         new_data = a64.Patch(old_data, _OPCODE_ADRP, 1,
@@ -139,12 +174,13 @@ def _ApplyRelocation(rel: elf.Reloc):
     else:
         assert False, f"unknown kind reloc {rel}"
 
-    sec_data[rel.r_offset:rel.r_offset +
-             width] = new_data.to_bytes(width, "little")
+    sec_data[pos:pos + width] = new_data.to_bytes(width, "little")
     # print(f"PATCH INS {rel.r_type} {rel.r_offset:x} {sym_val:x} {old_data:x} {new_data:x} {rel.symbol.name}")
 
 
 def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
+    for sym in unit.symbols:
+        assert not sym.is_undefined(), f"undefined symbol: {sym.name}"
     sections = []
     segments = []
 
@@ -161,24 +197,24 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     seg_exe.sections.append(sec_text)
 
     sec_rodata = unit.sec_rodata
-    if len(sec_rodata.data) > 0:
+    if sec_rodata.sh_size > 0:
         seg_ro = elf.Segment.MakeROSegment(65536)
         segments.append(seg_ro)
         #
         sections.append(sec_rodata)
         seg_ro.sections.append(sec_rodata)
 
-    if len(unit.sec_data.data) + len(unit.sec_bss.data) > 0:
+    if unit.sec_data.sh_size + unit.sec_bss.sh_size > 0:
         seg_rw = elf.Segment.MakeRWSegment(65536)
         segments.append(seg_rw)
 
     sec_data = unit.sec_data
-    if len(sec_data.data) > 0:
+    if sec_data.sh_size > 0:
         sections.append(sec_data)
         seg_rw.sections.append(sec_data)
 
     sec_bss = unit.sec_bss
-    if len(sec_bss.data) > 0:
+    if sec_bss.sh_size > 0:
         sections.append(sec_bss)
         seg_rw.sections.append(sec_bss)
 
@@ -186,6 +222,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     segments.append(seg_pseudo)
     #
 
+    debug_sections = debug_line.AddDebugSections(unit, sections, seg_pseudo, 8)
+
     if create_sym_tab:
         # we do not create the content here since we cannot really do this until
         # the section addresses are finalized
@@ -236,6 +274,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     for rel in unit.relocations:
         _ApplyRelocation(rel)
 
+    debug_line.UpdateDebugSections(unit, debug_sections, 8)
+
     if create_sym_tab:
         # we only put dummiess in the symtable above - do it for real now
         sec_symtab.data = bytearray()
@@ -0,0 +1,40 @@
+#!/bin/env python3
+
+import unittest
+
+from BE.CpuA64 import assembler
+from BE.CpuA64 import symbolic
+
+
+def Nops(n):
+    return [symbolic.InsFromSymbolized("nop", []) for _ in range(n)]
+
+
+class TestAlignLabels(unittest.TestCase):
+
+    def testWithinBudget(self):
+        code = Nops(3) + ["a"] + Nops(1) + ["b"]
+        alignments = {"a": 16, "b": 16}
+        # a needs 4 bytes of padding and b needs 12
+        assembler.AlignLabels(code, 0, alignments, 16)
+        self.assertEqual({"a": 16, "b": 16}, alignments)
+
+    def testBudgetExceeded(self):
+        code = Nops(3) + ["a"] + Nops(1) + ["b"]
+        alignments = {"a": 16, "b": 16}
+        assembler.AlignLabels(code, 0, alignments, 12)
+        self.assertEqual({"a": 16}, alignments)
+
+    def testStart(self):
+        code = ["a"] + Nops(2) + ["b"]
+        alignments = {"a": 16, "b": 16}
+        # a is already aligned, b needs 8 bytes of padding
+        assembler.AlignLabels(code, 0x1000, alignments, 4)
+        self.assertEqual({"a": 16}, alignments)
+        alignments = {"a": 16, "b": 16}
+        assembler.AlignLabels(code, 0x1000, alignments, 8)
+        self.assertEqual({"a": 16, "b": 16}, alignments)
+
+
+if __name__ == '__main__':
+    unittest.main()
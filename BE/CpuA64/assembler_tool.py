@@ -10,6 +10,9 @@ import sys
 from typing import Dict, Any
 
 from BE.CpuA64 import assembler as asm
+from BE.Elf import elf_unit
+from BE.Elf import enum_tab
+from BE.Elf import linker
 
 
 def lint(input):
@@ -17,12 +20,13 @@ def lint(input):
     print("UNIT", asm.UnitParse(src))
 
 
-def assemble_common(input, output):
+def assemble_common(input, output, gc):
     src = sys.stdin if input == "-" else open(input)
-    dst = sys.stdout if output == "-" else open(output, "wb")
     unit = asm.UnitParse(src)
     for sym in unit.symbols:
         assert sym.section, f"undefined symbol: {sym}"
+    if gc:
+        unit = linker.UnitRemoveUnreferenced(unit, linker.ROOTS)
 
     # print(unit)
     exe = asm.Assemble(unit, True)
@@ -31,13 +35,30 @@ def assemble_common(input, output):
     #    for sec in phdr.sections:
     #        print(sec)
     print("WRITING EXE")
-    exe.save(dst)
-    if output != "-":
+    if output == "-":
+        exe.save(sys.stdout.buffer)
+    else:
+        exe.save_to_path(output)
         os.chmod(output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
 
 
-def assemble(input, output):
-    assemble_common(input, output)
+def assemble(input, output, gc):
+    assemble_common(input, output, gc)
+
+
+def link(output, inputs, gc):
+    units = []
+    for input in inputs:
+        machine, unit = elf_unit.UnitLoadFromObject(open(input, "rb"))
+        assert machine == enum_tab.E_MACHINE.AARCH64, f"{input}: unexpected {machine.name}"
+        units.append(unit)
+    unit = linker.Link(units)
+    if gc:
+        unit = linker.UnitRemoveUnreferenced(unit, linker.ROOTS)
+    exe = asm.Assemble(unit, True)
+    print("WRITING EXE")
+    exe.save_to_path(output)
+    os.chmod(output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
 
 
 def main():
@@ -53,6 +74,15 @@ def main():
         description='parse and emit elf exe. Also add _start entry point calling main')
     parser_assemble.add_argument('input', type=str, help='input file')
     parser_assemble.add_argument('output', type=str, help='output file')
+    parser_assemble.add_argument('-gc', action='store_true',
+                                 help='strip funs and mems not reachable from _start')
+
+    parser_link = subparsers.add_parser(
+        'link', description='link object files produced by codegen.py -mode object into an elf exe')
+    parser_link.add_argument('output', type=str, help='output file')
+    parser_link.add_argument('-gc', action='store_true',
+                             help='strip funs and mems not reachable from _start')
+    parser_link.add_argument('inputs', type=str, nargs='+', help='input object files')
 
     # First extract all the parser members into a dict
     kwargs: Dict[str, Any] = vars(parser.parse_args())
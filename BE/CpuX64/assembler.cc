@@ -28,7 +28,7 @@ const std::array<const std::string_view, 10> kCodePaddingSequences = {
     std::string_view{"\x0f\x1f\x40\x00", 4},
     std::string_view{"\x0f\x1f\x44\x00\x00", 5},
     std::string_view{"\x66\x0f\x1f\x44\x00\x00", 6},
-    std::string_view{"\x0f\x1f\x08\x00\x00\x00\x00", 7},
+    std::string_view{"\x0f\x1f\x80\x00\x00\x00\x00", 7},
     std::string_view{"\x0f\x1f\x84\x00\x00\x00\x00\x00", 8},
     std::string_view{"\x66\x0f\x1f\x84\x00\x00\x00\x00\x00", 9}};
 
@@ -3,13 +3,14 @@
 """
 This files contains ELF like abstraction to help build an a64 assembler.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from BE.CpuX64 import opcode_tab as x64
 from BE.CpuX64 import symbolic
 from BE.Elf import elf_unit
 from BE.Elf import elfhelper as elf
 from BE.Elf import enum_tab
+from BE.Dwarf import debug_line
 from Util import parse
 
 NOP_SEQUENCES = [bytes(),
@@ -19,12 +20,16 @@ NOP_SEQUENCES = [bytes(),
                  bytes([0x0f, 0x1f, 0x40, 0x00]),
                  bytes([0x0f, 0x1f, 0x44, 0x00, 0x00]),
                  bytes([0x66, 0x0f, 0x1f, 0x44, 0x00, 0x00]),
-                 bytes([0x0f, 0x1f, 0x08, 0x00, 0x00, 0x00, 0x00]),
+                 bytes([0x0f, 0x1f, 0x80, 0x00, 0x00, 0x00, 0x00]),
                  bytes([0x0f, 0x1f, 0x84, 0x00, 0x00, 0x00, 0x00, 0x00]),
                  bytes([0x66, 0x0f, 0x1f, 0x84, 0x00, 0x00, 0x00, 0x00, 0x00]),
                  ]
 
 
+# size of the x64 large pages (for 4 level paging)
+LARGE_PAGE_SIZE = 2 * 1024 * 1024
+
+
 def TextPadder(size: int) -> bytes:
     out = bytes()
     largest = NOP_SEQUENCES[-1]
@@ -64,19 +69,105 @@ def _RelocFieldOffsetFromEndOfIns(opcode: x64.Opcode):
 
 
 def AddIns(unit: elf_unit.Unit, ins: x64.Ins):
+    sec = unit.sec_text
+    # sec.data may not contain all the bytes, see elfhelper.Run
+    start = len(sec.data)
     if ins.has_reloc():
         sym = unit.FindOrAddSymbol(ins.reloc_symbol, ins.is_local_sym)
         kind = ins.reloc_kind
         addend = ins.operands[ins.reloc_pos]
         ins.clear_reloc()  # we need to clear the reloc info BEFORE assembling
-        ins_data = bytes(x64.Assemble(ins))  # note we do not know the exact length because of prefixes
         distance_to_ins_end = _RelocFieldOffsetFromEndOfIns(ins.opcode)
         if kind in {enum_tab.RELOC_TYPE_X86_64.PC32}:
             addend -= distance_to_ins_end
-        unit.AddReloc(kind, unit.sec_text, sym, addend, len(ins_data) - distance_to_ins_end)
+        # note we do not know the exact length because of prefixes
+        # so the reloc offset is computed relative to the end of the ins
+        x64.AssembleInto(ins, sec.data)
+        sec.sh_size += len(sec.data) - start
+        unit.AddReloc(kind, sec, sym, addend, -distance_to_ins_end)
     else:
-        ins_data = bytes(x64.Assemble(ins))
-    unit.sec_text.AddData(ins_data)
+        x64.AssembleInto(ins, sec.data)
+        sec.sh_size += len(sec.data) - start
+
+
+# maps the rel32 branches to their rel8 counterparts
+_SHORT_BRANCHES = {
+    x64.Opcode.name_to_opcode[f"{name}_32"]: x64.Opcode.name_to_opcode[f"{name}_8"]
+    for name in ["jmp", "je", "jne", "jl", "jb", "jle", "jbe", "jg", "ja",
+                 "jge", "jae", "js", "jns", "jp", "jnp"]}
+
+
+def RelaxBranches(code: List[Any], start: int,
+                  alignments: Optional[Dict[str, int]] = None, padding_budget: int = 0):
+    """Selects the rel8 form for local branches whose target is close enough
+
+    `code` holds the text of a single function: label names (str)
+    interleaved with x64.Ins. `start` is the section offset of the first item.
+
+    All candidate branches start out short and are grown to their rel32 form
+    when the displacement does not fit. Since branches only ever grow this
+    reaches a fixpoint. The short branches are rewritten in place with the
+    displacement resolved, so they no longer carry a relocation.
+
+    `alignments` optionally maps labels to the alignment they should get.
+    Labels are aligned in order for as long as the total padding stays within
+    `padding_budget` bytes, the others are removed from `alignments`.
+    Like the branches, this decision is only ever revised in one direction.
+    """
+    if alignments is None:
+        alignments = {}
+    labels = {item for item in code if isinstance(item, str)}
+    short: Dict[int, x64.Opcode] = {}
+    lengths: List[int] = []
+    for n, item in enumerate(code):
+        if isinstance(item, str):
+            lengths.append(0)
+            continue
+        opcode = _SHORT_BRANCHES.get(item.opcode)
+        if (opcode is not None and item.has_reloc() and item.is_local_sym and
+                item.reloc_symbol in labels and item.operands[item.reloc_pos] == 0):
+            short[n] = opcode
+            lengths.append(len(opcode.data))
+        else:
+            lengths.append(x64.InsLength(item))
+    if not short and not alignments:
+        return
+
+    while True:
+        changed = False
+        label_pos: Dict[str, int] = {}
+        ins_end: List[int] = []
+        pos = start
+        padding = 0
+        for item, length in zip(code, lengths):
+            if isinstance(item, str):
+                alignment = alignments.get(item)
+                if alignment is not None:
+                    pad = -pos % alignment
+                    if padding + pad > padding_budget:
+                        del alignments[item]
+                        changed = True
+                    else:
+                        padding += pad
+                        pos += pad
+                label_pos[item] = pos
+            pos += length
+            ins_end.append(pos)
+        for n in list(short.keys()):
+            ins = code[n]
+            if not -128 <= label_pos[ins.reloc_symbol] - ins_end[n] < 128:
+                del short[n]
+                lengths[n] = x64.InsLength(ins)
+                changed = True
+        if not changed:
+            break
+
+    for n, opcode in short.items():
+        ins = code[n]
+        disp = label_pos[ins.reloc_symbol] - ins_end[n]
+        ins.clear_reloc()
+        ins.opcode = opcode
+        ins.operands = [disp]
 
 
 def HandleOpcode(mnemonic, token: List[str], unit: elf_unit.Unit):
@@ -100,6 +191,8 @@ def UnitParse(fin) -> elf_unit.Unit:
         ".addr.bbl": lambda x, y: unit.AddBblAddr(enum_tab.RELOC_TYPE_X86_64.X_64, int(x, 0), y),
         ".addr.mem": lambda x, y, z: unit.AddMemAddr(enum_tab.RELOC_TYPE_X86_64.X_64, int(x, 0), y, int(z, 0)),
         ".bbl": lambda x, y: unit.AddLabel(x, int(y, 0), TextPadder),
+        ".line": lambda x, y: unit.AddLine(
+            str(parse.QuotedEscapedStringToBytes(x), "utf-8"), int(y, 0)),
     }
     for line_num, line in enumerate(fin):
         token = parse.ParseLine(line)
@@ -135,24 +228,36 @@ def _RelWidth(rel_type: int):
 
 def _ApplyRelocation(rel: elf.Reloc):
     sec_data = rel.section.data
+    # r_offset is relative to the section which may contain unmaterialized runs
+    pos = rel.section.DataPos(rel.r_offset)
     sym_val = rel.symbol.st_value + rel.r_addend
     width = _RelWidth(rel.r_type)
     if rel.r_type == enum_tab.RELOC_TYPE_X86_64.PC32.value:
-        assert rel.r_offset + width <= len(sec_data)
+        assert pos + width <= len(sec_data)
         new_data = _pc_offset(rel, sym_val)
         assert -(1 << 31) <= new_data < (1 << 31), f"out of range reloc {rel.symbol.name} {new_data}"
-        sec_data[rel.r_offset:rel.r_offset + width] = new_data.to_bytes(width, "little", signed=True)
+        sec_data[pos:pos + width] = new_data.to_bytes(width, "little", signed=True)
     elif rel.r_type == enum_tab.RELOC_TYPE_X86_64.X_64.value:
-        sec_data[rel.r_offset:rel.r_offset + width] = sym_val.to_bytes(width, "little")
+        sec_data[pos:pos + width] = sym_val.to_bytes(width, "little")
     else:
         assert False, f"unknown kind reloc {rel}"
 
 
-def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
+def Assemble(unit: elf_unit.Unit, create_sym_tab: bool,
+             large_pages: bool = False) -> elf.Executable:
+    """With `large_pages` the exe segment is padded to a multiple of LARGE_PAGE_SIZE
+
+    The exe segment starts at file offset 0 and at the large page aligned
+    vaddr 0x400000, so the text can be backed by transparent huge pages.
+    To get the most out of this the hot funs should be placed first
+    (see linker.UnitReorderFuns).
+    """
+    for sym in unit.symbols:
+        assert not sym.is_undefined(), f"undefined symbol: {sym.name}"
     sections = []
     segments = []
 
-    seg_exe = elf.Segment.MakeExeSegment(65536)
+    seg_exe = elf.Segment.MakeExeSegment(LARGE_PAGE_SIZE if large_pages else 65536)
     segments.append(seg_exe)
 
     sec_null = elf.Section.MakeSectionNull()
@@ -165,24 +270,24 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     seg_exe.sections.append(sec_text)
 
     sec_rodata = unit.sec_rodata
-    if len(sec_rodata.data) > 0:
+    if sec_rodata.sh_size > 0:
         seg_ro = elf.Segment.MakeROSegment(65536)
         segments.append(seg_ro)
         #
         sections.append(sec_rodata)
         seg_ro.sections.append(sec_rodata)
 
-    if len(unit.sec_data.data) + len(unit.sec_bss.data) > 0:
+    if unit.sec_data.sh_size + unit.sec_bss.sh_size > 0:
         seg_rw = elf.Segment.MakeRWSegment(65536)
         segments.append(seg_rw)
 
     sec_data = unit.sec_data
-    if len(sec_data.data) > 0:
+    if sec_data.sh_size > 0:
         sections.append(sec_data)
         seg_rw.sections.append(sec_data)
 
     sec_bss = unit.sec_bss
-    if len(sec_bss.data) > 0:
+    if sec_bss.sh_size > 0:
         sections.append(sec_bss)
         seg_rw.sections.append(sec_bss)
 
@@ -190,6 +295,19 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     segments.append(seg_pseudo)
     #
 
+    if large_pages:
+        # the padding must be added before the size of .text gets baked into the
+        # debug sections, so compute the offset of .text the same way as
+        # elf.Executable.update_vaddrs_and_offset()
+        which = enum_tab.EI_CLASS.X_64
+        num_phdrs = len([seg for seg in segments if not seg.is_pseudo])
+        text_offset = elf.Align(elf.EHdrIdent.SIZE + elf.EHdr.SIZE[which] +
+                                num_phdrs * elf.Segment.SIZE[which], sec_text.sh_addralign)
+        sec_text.AddFill(NOP_SEQUENCES[1],
+                         -(text_offset + sec_text.sh_size) % LARGE_PAGE_SIZE)
+
+    debug_sections = debug_line.AddDebugSections(unit, sections, seg_pseudo, 8)
+
     if create_sym_tab:
         # we do not create the content here since we cannot really do this until
         # the section addresses are finalized
@@ -221,6 +339,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
 
     exe = elf.Executable.MakeExecutableX64(0x400000, sections, segments)
     exe.update_vaddrs_and_offset()
+    if large_pages:
+        assert (sec_text.sh_offset + sec_text.sh_size) % LARGE_PAGE_SIZE == 0
 
     if False:
         for sym in unit.symbols:
@@ -238,6 +358,8 @@ def Assemble(unit: elf_unit.Unit, create_sym_tab: bool) -> elf.Executable:
     for rel in unit.relocations:
         _ApplyRelocation(rel)
 
+    debug_line.UpdateDebugSections(unit, debug_sections, 8)
+
     if create_sym_tab:
         # we only put dummiess in the symtable above - do it for real now
         sec_symtab.data = bytearray()
@@ -0,0 +1,86 @@
+#!/bin/env python3
+
+import unittest
+
+from BE.CpuX64 import assembler
+from BE.CpuX64 import symbolic
+
+
+def I(name, *operands):
+    return symbolic.InsFromSymbolized(name, list(operands))
+
+
+def Filler(n):
+    """n instructions of 10 bytes each"""
+    return [I("mov_64_r_imm64", "rax", "0") for _ in range(n)]
+
+
+def Render(ins):
+    return ins.opcode.EnumName(), ins.operands, ins.has_reloc()
+
+
+class TestRelaxBranches(unittest.TestCase):
+
+    def testForward(self):
+        br = I("je_32", "expr:loc_pcrel32:target")
+        code = [br] + Filler(12) + ["target"]
+        assembler.RelaxBranches(code, 0)
+        self.assertEqual(("je_8", [120], False), Render(br))
+
+    def testForwardTooFar(self):
+        br = I("je_32", "expr:loc_pcrel32:target")
+        code = [br] + Filler(13) + ["target"]
+        assembler.RelaxBranches(code, 0)
+        self.assertEqual(("je_32", [0], True), Render(br))
+
+    def testBackward(self):
+        br = I("jmp_32", "expr:loc_pcrel32:loop")
+        code = ["loop"] + Filler(12) + [br]
+        assembler.RelaxBranches(code, 0)
+        self.assertEqual(("jmp_8", [-122], False), Render(br))
+
+    def testChain(self):
+        # the first branch only fits once the second one shrank
+        br1 = I("jne_32", "expr:loc_pcrel32:target")
+        br2 = I("jmp_32", "expr:loc_pcrel32:other")
+        code = [br1] + Filler(11) + [br2] + ["target", "other"]
+        assembler.RelaxBranches(code, 0)
+        self.assertEqual(("jne_8", [112], False), Render(br1))
+        self.assertEqual(("jmp_8", [0], False), Render(br2))
+
+    def testNonLocal(self):
+        br = I("je_32", "expr:pcrel32:target")
+        code = [br] + ["target"]
+        assembler.RelaxBranches(code, 0)
+        self.assertEqual(("je_32", [0], True), Render(br))
+
+
+class TestAlignment(unittest.TestCase):
+
+    def testBranchAcrossPad(self):
+        # without the pad the target would be 120 bytes away
+        br = I("je_32", "expr:loc_pcrel32:target")
+        code = [br] + Filler(12) + ["target"]
+        alignments = {"target": 32}
+        assembler.RelaxBranches(code, 8, alignments, 32)
+        self.assertEqual(("je_32", [0], True), Render(br))
+        self.assertEqual({"target": 32}, alignments)
+
+    def testBudgetTooSmall(self):
+        br = I("je_32", "expr:loc_pcrel32:target")
+        code = [br] + Filler(12) + ["target"]
+        alignments = {"target": 32}
+        assembler.RelaxBranches(code, 8, alignments, 16)
+        self.assertEqual(("je_8", [120], False), Render(br))
+        self.assertEqual({}, alignments)
+
+    def testBudgetInOrder(self):
+        code = ["a"] + Filler(1) + ["b"] + Filler(1) + ["c"]
+        alignments = {"a": 16, "b": 16, "c": 16}
+        # a needs no pad, b needs 6 and c needs 6 more
+        assembler.RelaxBranches(code, 0, alignments, 8)
+        self.assertEqual({"a": 16, "b": 16}, alignments)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,11 @@
 
 import sys
 
+from BE.CpuX64 import assembler
 from BE.CpuX64 import symbolic
 from BE.CpuX64 import opcode_tab as x64
+from BE.Elf import elfhelper
+from BE.Elf import enum_tab
 
 
 def disass(data):
@@ -57,10 +60,32 @@ def batch():
             ins2.operands), f"{ins.operands} vs {ins2.operands}"
 
 
+def elf(filename: str):
+    """Disassembles all executable sections of an ELF file"""
+    exe = elfhelper.Executable()
+    with open(filename, "rb") as fin:
+        exe.load(fin, lazy=True)
+    for sec in exe.sections:
+        if not sec.sh_flags & enum_tab.SH_FLAGS.EXECINSTR.value:
+            continue
+        print(f"section {sec.name}")
+        for off, opcode, operands in x64.DisassembleBatch(sec.data, assembler.NOP_SEQUENCES):
+            addr = sec.sh_addr + off
+            if opcode is None:
+                print(f"{addr:08x} nop or unknown opcode {sec.data[off]:02x}")
+                continue
+            ins = x64.Ins(opcode, operands)
+            _, ops_str = symbolic.InsSymbolize(ins, True)
+            print(f"{addr:08x} {opcode.name}_{opcode.variant} {', '.join(ops_str)}")
+
+    exe.close()
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "batch":
             batch()
+        elif sys.argv[1] == "elf":
+            elf(sys.argv[2])
         else:
             for seq in sys.argv[1:]:
                 disass(HexToData(seq))
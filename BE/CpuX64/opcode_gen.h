@@ -22,6 +22,7 @@ constexpr const unsigned MAX_INSTRUCTION_LENGTH = 11;
 constexpr const unsigned MAX_INSTRUCTION_LENGTH_WITH_PREFIXES = 15;
 constexpr const unsigned MAX_INSTRUCTION_NAME_LENGTH = 27;
 constexpr const unsigned MAX_FINGERPRINT = 6000;
+constexpr const unsigned NUM_OPCODES = 3402;
 
 enum class MEM_WIDTH : uint8_t {
     NONE = 1,
@@ -111,6 +112,18 @@ inline OPC OpcodeOPC(const Opcode* opcode) {
   return OPC(opcode - OpcodeTableEncodings);
 }
 
+// Indexed by OPC: bit 0 = reads the status flags, bit 1 = overwrites all of
+// them without reading any ("kills" them). Used for flag liveness.
+extern const uint8_t OpcodeTableFlagEffects[];
+
+inline bool OpcodeReadsFlags(const Opcode* opcode) {
+  return (OpcodeTableFlagEffects[opcode - OpcodeTableEncodings] & 1) != 0;
+}
+
+inline bool OpcodeKillsFlags(const Opcode* opcode) {
+  return (OpcodeTableFlagEffects[opcode - OpcodeTableEncodings] & 2) != 0;
+}
+
 extern const Opcode* FindOpcode(std::string_view data);
 
 // Find the Opcode or null with the given name
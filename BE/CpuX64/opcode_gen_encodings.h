@@ -13608,3 +13608,3409 @@ const Opcode OpcodeTableEncodings[] = {
    {0xff, 0xc0}},
 };
 
+// Indexed by OPC: bit 0 = reads flags, bit 1 = kills flags
+const uint8_t OpcodeTableFlagEffects[] = {
+  0,  // invalid
+  2,  // add_16_ax_imm16
+  2,  // add_16_mB32_imm16
+  2,  // add_16_mB32_imm8
+  2,  // add_16_mB32_r
+  2,  // add_16_mB8_imm16
+  2,  // add_16_mB8_imm8
+  2,  // add_16_mB8_r
+  2,  // add_16_mB_imm16
+  2,  // add_16_mB_imm8
+  2,  // add_16_mB_r
+  2,  // add_16_mbis32_imm16
+  2,  // add_16_mbis32_imm8
+  2,  // add_16_mbis32_r
+  2,  // add_16_mbis8_imm16
+  2,  // add_16_mbis8_imm8
+  2,  // add_16_mbis8_r
+  2,  // add_16_mbis_imm16
+  2,  // add_16_mbis_imm8
+  2,  // add_16_mbis_r
+  2,  // add_16_mi32_imm16
+  2,  // add_16_mi32_imm8
+  2,  // add_16_mi32_r
+  2,  // add_16_mpc32_imm16
+  2,  // add_16_mpc32_imm8
+  2,  // add_16_mpc32_r
+  2,  // add_16_mr_imm16
+  2,  // add_16_mr_imm8
+  2,  // add_16_mr_r
+  2,  // add_16_r_mB
+  2,  // add_16_r_mB32
+  2,  // add_16_r_mB8
+  2,  // add_16_r_mbis
+  2,  // add_16_r_mbis32
+  2,  // add_16_r_mbis8
+  2,  // add_16_r_mi32
+  2,  // add_16_r_mpc32
+  2,  // add_16_r_mr
+  2,  // add_32_eax_imm32
+  2,  // add_32_mB32_imm32
+  2,  // add_32_mB32_imm8
+  2,  // add_32_mB32_r
+  2,  // add_32_mB8_imm32
+  2,  // add_32_mB8_imm8
+  2,  // add_32_mB8_r
+  2,  // add_32_mB_imm32
+  2,  // add_32_mB_imm8
+  2,  // add_32_mB_r
+  2,  // add_32_mbis32_imm32
+  2,  // add_32_mbis32_imm8
+  2,  // add_32_mbis32_r
+  2,  // add_32_mbis8_imm32
+  2,  // add_32_mbis8_imm8
+  2,  // add_32_mbis8_r
+  2,  // add_32_mbis_imm32
+  2,  // add_32_mbis_imm8
+  2,  // add_32_mbis_r
+  2,  // add_32_mi32_imm32
+  2,  // add_32_mi32_imm8
+  2,  // add_32_mi32_r
+  2,  // add_32_mpc32_imm32
+  2,  // add_32_mpc32_imm8
+  2,  // add_32_mpc32_r
+  2,  // add_32_mr_imm32
+  2,  // add_32_mr_imm8
+  2,  // add_32_mr_r
+  2,  // add_32_r_mB
+  2,  // add_32_r_mB32
+  2,  // add_32_r_mB8
+  2,  // add_32_r_mbis
+  2,  // add_32_r_mbis32
+  2,  // add_32_r_mbis8
+  2,  // add_32_r_mi32
+  2,  // add_32_r_mpc32
+  2,  // add_32_r_mr
+  2,  // add_64_mB32_imm32
+  2,  // add_64_mB32_imm8
+  2,  // add_64_mB32_r
+  2,  // add_64_mB8_imm32
+  2,  // add_64_mB8_imm8
+  2,  // add_64_mB8_r
+  2,  // add_64_mB_imm32
+  2,  // add_64_mB_imm8
+  2,  // add_64_mB_r
+  2,  // add_64_mbis32_imm32
+  2,  // add_64_mbis32_imm8
+  2,  // add_64_mbis32_r
+  2,  // add_64_mbis8_imm32
+  2,  // add_64_mbis8_imm8
+  2,  // add_64_mbis8_r
+  2,  // add_64_mbis_imm32
+  2,  // add_64_mbis_imm8
+  2,  // add_64_mbis_r
+  2,  // add_64_mi32_imm32
+  2,  // add_64_mi32_imm8
+  2,  // add_64_mi32_r
+  2,  // add_64_mpc32_imm32
+  2,  // add_64_mpc32_imm8
+  2,  // add_64_mpc32_r
+  2,  // add_64_mr_imm32
+  2,  // add_64_mr_imm8
+  2,  // add_64_mr_r
+  2,  // add_64_r_mB
+  2,  // add_64_r_mB32
+  2,  // add_64_r_mB8
+  2,  // add_64_r_mbis
+  2,  // add_64_r_mbis32
+  2,  // add_64_r_mbis8
+  2,  // add_64_r_mi32
+  2,  // add_64_r_mpc32
+  2,  // add_64_r_mr
+  2,  // add_64_rax_imm32
+  2,  // add_8_al_imm8
+  2,  // add_8_mB32_imm8
+  2,  // add_8_mB32_r
+  2,  // add_8_mB8_imm8
+  2,  // add_8_mB8_r
+  2,  // add_8_mB_imm8
+  2,  // add_8_mB_r
+  2,  // add_8_mbis32_imm8
+  2,  // add_8_mbis32_r
+  2,  // add_8_mbis8_imm8
+  2,  // add_8_mbis8_r
+  2,  // add_8_mbis_imm8
+  2,  // add_8_mbis_r
+  2,  // add_8_mi32_imm8
+  2,  // add_8_mi32_r
+  2,  // add_8_mpc32_imm8
+  2,  // add_8_mpc32_r
+  2,  // add_8_mr_imm8
+  2,  // add_8_mr_r
+  2,  // add_8_r_mB
+  2,  // add_8_r_mB32
+  2,  // add_8_r_mB8
+  2,  // add_8_r_mbis
+  2,  // add_8_r_mbis32
+  2,  // add_8_r_mbis8
+  2,  // add_8_r_mi32
+  2,  // add_8_r_mpc32
+  2,  // add_8_r_mr
+  0,  // addsd_x_mB
+  0,  // addsd_x_mB32
+  0,  // addsd_x_mB8
+  0,  // addsd_x_mbis
+  0,  // addsd_x_mbis32
+  0,  // addsd_x_mbis8
+  0,  // addsd_x_mi32
+  0,  // addsd_x_mpc32
+  0,  // addsd_x_mx
+  0,  // addss_x_mB
+  0,  // addss_x_mB32
+  0,  // addss_x_mB8
+  0,  // addss_x_mbis
+  0,  // addss_x_mbis32
+  0,  // addss_x_mbis8
+  0,  // addss_x_mi32
+  0,  // addss_x_mpc32
+  0,  // addss_x_mx
+  2,  // and_16_ax_imm16
+  2,  // and_16_mB32_imm16
+  2,  // and_16_mB32_imm8
+  2,  // and_16_mB32_r
+  2,  // and_16_mB8_imm16
+  2,  // and_16_mB8_imm8
+  2,  // and_16_mB8_r
+  2,  // and_16_mB_imm16
+  2,  // and_16_mB_imm8
+  2,  // and_16_mB_r
+  2,  // and_16_mbis32_imm16
+  2,  // and_16_mbis32_imm8
+  2,  // and_16_mbis32_r
+  2,  // and_16_mbis8_imm16
+  2,  // and_16_mbis8_imm8
+  2,  // and_16_mbis8_r
+  2,  // and_16_mbis_imm16
+  2,  // and_16_mbis_imm8
+  2,  // and_16_mbis_r
+  2,  // and_16_mi32_imm16
+  2,  // and_16_mi32_imm8
+  2,  // and_16_mi32_r
+  2,  // and_16_mpc32_imm16
+  2,  // and_16_mpc32_imm8
+  2,  // and_16_mpc32_r
+  2,  // and_16_mr_imm16
+  2,  // and_16_mr_imm8
+  2,  // and_16_mr_r
+  2,  // and_16_r_mB
+  2,  // and_16_r_mB32
+  2,  // and_16_r_mB8
+  2,  // and_16_r_mbis
+  2,  // and_16_r_mbis32
+  2,  // and_16_r_mbis8
+  2,  // and_16_r_mi32
+  2,  // and_16_r_mpc32
+  2,  // and_16_r_mr
+  2,  // and_32_eax_imm32
+  2,  // and_32_mB32_imm32
+  2,  // and_32_mB32_imm8
+  2,  // and_32_mB32_r
+  2,  // and_32_mB8_imm32
+  2,  // and_32_mB8_imm8
+  2,  // and_32_mB8_r
+  2,  // and_32_mB_imm32
+  2,  // and_32_mB_imm8
+  2,  // and_32_mB_r
+  2,  // and_32_mbis32_imm32
+  2,  // and_32_mbis32_imm8
+  2,  // and_32_mbis32_r
+  2,  // and_32_mbis8_imm32
+  2,  // and_32_mbis8_imm8
+  2,  // and_32_mbis8_r
+  2,  // and_32_mbis_imm32
+  2,  // and_32_mbis_imm8
+  2,  // and_32_mbis_r
+  2,  // and_32_mi32_imm32
+  2,  // and_32_mi32_imm8
+  2,  // and_32_mi32_r
+  2,  // and_32_mpc32_imm32
+  2,  // and_32_mpc32_imm8
+  2,  // and_32_mpc32_r
+  2,  // and_32_mr_imm32
+  2,  // and_32_mr_imm8
+  2,  // and_32_mr_r
+  2,  // and_32_r_mB
+  2,  // and_32_r_mB32
+  2,  // and_32_r_mB8
+  2,  // and_32_r_mbis
+  2,  // and_32_r_mbis32
+  2,  // and_32_r_mbis8
+  2,  // and_32_r_mi32
+  2,  // and_32_r_mpc32
+  2,  // and_32_r_mr
+  2,  // and_64_mB32_imm32
+  2,  // and_64_mB32_imm8
+  2,  // and_64_mB32_r
+  2,  // and_64_mB8_imm32
+  2,  // and_64_mB8_imm8
+  2,  // and_64_mB8_r
+  2,  // and_64_mB_imm32
+  2,  // and_64_mB_imm8
+  2,  // and_64_mB_r
+  2,  // and_64_mbis32_imm32
+  2,  // and_64_mbis32_imm8
+  2,  // and_64_mbis32_r
+  2,  // and_64_mbis8_imm32
+  2,  // and_64_mbis8_imm8
+  2,  // and_64_mbis8_r
+  2,  // and_64_mbis_imm32
+  2,  // and_64_mbis_imm8
+  2,  // and_64_mbis_r
+  2,  // and_64_mi32_imm32
+  2,  // and_64_mi32_imm8
+  2,  // and_64_mi32_r
+  2,  // and_64_mpc32_imm32
+  2,  // and_64_mpc32_imm8
+  2,  // and_64_mpc32_r
+  2,  // and_64_mr_imm32
+  2,  // and_64_mr_imm8
+  2,  // and_64_mr_r
+  2,  // and_64_r_mB
+  2,  // and_64_r_mB32
+  2,  // and_64_r_mB8
+  2,  // and_64_r_mbis
+  2,  // and_64_r_mbis32
+  2,  // and_64_r_mbis8
+  2,  // and_64_r_mi32
+  2,  // and_64_r_mpc32
+  2,  // and_64_r_mr
+  2,  // and_64_rax_imm32
+  2,  // and_8_al_imm8
+  2,  // and_8_mB32_imm8
+  2,  // and_8_mB32_r
+  2,  // and_8_mB8_imm8
+  2,  // and_8_mB8_r
+  2,  // and_8_mB_imm8
+  2,  // and_8_mB_r
+  2,  // and_8_mbis32_imm8
+  2,  // and_8_mbis32_r
+  2,  // and_8_mbis8_imm8
+  2,  // and_8_mbis8_r
+  2,  // and_8_mbis_imm8
+  2,  // and_8_mbis_r
+  2,  // and_8_mi32_imm8
+  2,  // and_8_mi32_r
+  2,  // and_8_mpc32_imm8
+  2,  // and_8_mpc32_r
+  2,  // and_8_mr_imm8
+  2,  // and_8_mr_r
+  2,  // and_8_r_mB
+  2,  // and_8_r_mB32
+  2,  // and_8_r_mB8
+  2,  // and_8_r_mbis
+  2,  // and_8_r_mbis32
+  2,  // and_8_r_mbis8
+  2,  // and_8_r_mi32
+  2,  // and_8_r_mpc32
+  2,  // and_8_r_mr
+  2,  // call_32
+  2,  // call_64_mB
+  2,  // call_64_mB32
+  2,  // call_64_mB8
+  2,  // call_64_mbis
+  2,  // call_64_mbis32
+  2,  // call_64_mbis8
+  2,  // call_64_mi32
+  2,  // call_64_mpc32
+  2,  // call_64_mr
+  0,  // cdq_32_edx_eax
+  1,  // cmova_16_r_mB
+  1,  // cmova_16_r_mB32
+  1,  // cmova_16_r_mB8
+  1,  // cmova_16_r_mbis
+  1,  // cmova_16_r_mbis32
+  1,  // cmova_16_r_mbis8
+  1,  // cmova_16_r_mi32
+  1,  // cmova_16_r_mpc32
+  1,  // cmova_16_r_mr
+  1,  // cmova_32_r_mB
+  1,  // cmova_32_r_mB32
+  1,  // cmova_32_r_mB8
+  1,  // cmova_32_r_mbis
+  1,  // cmova_32_r_mbis32
+  1,  // cmova_32_r_mbis8
+  1,  // cmova_32_r_mi32
+  1,  // cmova_32_r_mpc32
+  1,  // cmova_32_r_mr
+  1,  // cmova_64_r_mB
+  1,  // cmova_64_r_mB32
+  1,  // cmova_64_r_mB8
+  1,  // cmova_64_r_mbis
+  1,  // cmova_64_r_mbis32
+  1,  // cmova_64_r_mbis8
+  1,  // cmova_64_r_mi32
+  1,  // cmova_64_r_mpc32
+  1,  // cmova_64_r_mr
+  1,  // cmovae_16_r_mB
+  1,  // cmovae_16_r_mB32
+  1,  // cmovae_16_r_mB8
+  1,  // cmovae_16_r_mbis
+  1,  // cmovae_16_r_mbis32
+  1,  // cmovae_16_r_mbis8
+  1,  // cmovae_16_r_mi32
+  1,  // cmovae_16_r_mpc32
+  1,  // cmovae_16_r_mr
+  1,  // cmovae_32_r_mB
+  1,  // cmovae_32_r_mB32
+  1,  // cmovae_32_r_mB8
+  1,  // cmovae_32_r_mbis
+  1,  // cmovae_32_r_mbis32
+  1,  // cmovae_32_r_mbis8
+  1,  // cmovae_32_r_mi32
+  1,  // cmovae_32_r_mpc32
+  1,  // cmovae_32_r_mr
+  1,  // cmovae_64_r_mB
+  1,  // cmovae_64_r_mB32
+  1,  // cmovae_64_r_mB8
+  1,  // cmovae_64_r_mbis
+  1,  // cmovae_64_r_mbis32
+  1,  // cmovae_64_r_mbis8
+  1,  // cmovae_64_r_mi32
+  1,  // cmovae_64_r_mpc32
+  1,  // cmovae_64_r_mr
+  1,  // cmovb_16_r_mB
+  1,  // cmovb_16_r_mB32
+  1,  // cmovb_16_r_mB8
+  1,  // cmovb_16_r_mbis
+  1,  // cmovb_16_r_mbis32
+  1,  // cmovb_16_r_mbis8
+  1,  // cmovb_16_r_mi32
+  1,  // cmovb_16_r_mpc32
+  1,  // cmovb_16_r_mr
+  1,  // cmovb_32_r_mB
+  1,  // cmovb_32_r_mB32
+  1,  // cmovb_32_r_mB8
+  1,  // cmovb_32_r_mbis
+  1,  // cmovb_32_r_mbis32
+  1,  // cmovb_32_r_mbis8
+  1,  // cmovb_32_r_mi32
+  1,  // cmovb_32_r_mpc32
+  1,  // cmovb_32_r_mr
+  1,  // cmovb_64_r_mB
+  1,  // cmovb_64_r_mB32
+  1,  // cmovb_64_r_mB8
+  1,  // cmovb_64_r_mbis
+  1,  // cmovb_64_r_mbis32
+  1,  // cmovb_64_r_mbis8
+  1,  // cmovb_64_r_mi32
+  1,  // cmovb_64_r_mpc32
+  1,  // cmovb_64_r_mr
+  1,  // cmovbe_16_r_mB
+  1,  // cmovbe_16_r_mB32
+  1,  // cmovbe_16_r_mB8
+  1,  // cmovbe_16_r_mbis
+  1,  // cmovbe_16_r_mbis32
+  1,  // cmovbe_16_r_mbis8
+  1,  // cmovbe_16_r_mi32
+  1,  // cmovbe_16_r_mpc32
+  1,  // cmovbe_16_r_mr
+  1,  // cmovbe_32_r_mB
+  1,  // cmovbe_32_r_mB32
+  1,  // cmovbe_32_r_mB8
+  1,  // cmovbe_32_r_mbis
+  1,  // cmovbe_32_r_mbis32
+  1,  // cmovbe_32_r_mbis8
+  1,  // cmovbe_32_r_mi32
+  1,  // cmovbe_32_r_mpc32
+  1,  // cmovbe_32_r_mr
+  1,  // cmovbe_64_r_mB
+  1,  // cmovbe_64_r_mB32
+  1,  // cmovbe_64_r_mB8
+  1,  // cmovbe_64_r_mbis
+  1,  // cmovbe_64_r_mbis32
+  1,  // cmovbe_64_r_mbis8
+  1,  // cmovbe_64_r_mi32
+  1,  // cmovbe_64_r_mpc32
+  1,  // cmovbe_64_r_mr
+  1,  // cmove_16_r_mB
+  1,  // cmove_16_r_mB32
+  1,  // cmove_16_r_mB8
+  1,  // cmove_16_r_mbis
+  1,  // cmove_16_r_mbis32
+  1,  // cmove_16_r_mbis8
+  1,  // cmove_16_r_mi32
+  1,  // cmove_16_r_mpc32
+  1,  // cmove_16_r_mr
+  1,  // cmove_32_r_mB
+  1,  // cmove_32_r_mB32
+  1,  // cmove_32_r_mB8
+  1,  // cmove_32_r_mbis
+  1,  // cmove_32_r_mbis32
+  1,  // cmove_32_r_mbis8
+  1,  // cmove_32_r_mi32
+  1,  // cmove_32_r_mpc32
+  1,  // cmove_32_r_mr
+  1,  // cmove_64_r_mB
+  1,  // cmove_64_r_mB32
+  1,  // cmove_64_r_mB8
+  1,  // cmove_64_r_mbis
+  1,  // cmove_64_r_mbis32
+  1,  // cmove_64_r_mbis8
+  1,  // cmove_64_r_mi32
+  1,  // cmove_64_r_mpc32
+  1,  // cmove_64_r_mr
+  1,  // cmovg_16_r_mB
+  1,  // cmovg_16_r_mB32
+  1,  // cmovg_16_r_mB8
+  1,  // cmovg_16_r_mbis
+  1,  // cmovg_16_r_mbis32
+  1,  // cmovg_16_r_mbis8
+  1,  // cmovg_16_r_mi32
+  1,  // cmovg_16_r_mpc32
+  1,  // cmovg_16_r_mr
+  1,  // cmovg_32_r_mB
+  1,  // cmovg_32_r_mB32
+  1,  // cmovg_32_r_mB8
+  1,  // cmovg_32_r_mbis
+  1,  // cmovg_32_r_mbis32
+  1,  // cmovg_32_r_mbis8
+  1,  // cmovg_32_r_mi32
+  1,  // cmovg_32_r_mpc32
+  1,  // cmovg_32_r_mr
+  1,  // cmovg_64_r_mB
+  1,  // cmovg_64_r_mB32
+  1,  // cmovg_64_r_mB8
+  1,  // cmovg_64_r_mbis
+  1,  // cmovg_64_r_mbis32
+  1,  // cmovg_64_r_mbis8
+  1,  // cmovg_64_r_mi32
+  1,  // cmovg_64_r_mpc32
+  1,  // cmovg_64_r_mr
+  1,  // cmovge_16_r_mB
+  1,  // cmovge_16_r_mB32
+  1,  // cmovge_16_r_mB8
+  1,  // cmovge_16_r_mbis
+  1,  // cmovge_16_r_mbis32
+  1,  // cmovge_16_r_mbis8
+  1,  // cmovge_16_r_mi32
+  1,  // cmovge_16_r_mpc32
+  1,  // cmovge_16_r_mr
+  1,  // cmovge_32_r_mB
+  1,  // cmovge_32_r_mB32
+  1,  // cmovge_32_r_mB8
+  1,  // cmovge_32_r_mbis
+  1,  // cmovge_32_r_mbis32
+  1,  // cmovge_32_r_mbis8
+  1,  // cmovge_32_r_mi32
+  1,  // cmovge_32_r_mpc32
+  1,  // cmovge_32_r_mr
+  1,  // cmovge_64_r_mB
+  1,  // cmovge_64_r_mB32
+  1,  // cmovge_64_r_mB8
+  1,  // cmovge_64_r_mbis
+  1,  // cmovge_64_r_mbis32
+  1,  // cmovge_64_r_mbis8
+  1,  // cmovge_64_r_mi32
+  1,  // cmovge_64_r_mpc32
+  1,  // cmovge_64_r_mr
+  1,  // cmovl_16_r_mB
+  1,  // cmovl_16_r_mB32
+  1,  // cmovl_16_r_mB8
+  1,  // cmovl_16_r_mbis
+  1,  // cmovl_16_r_mbis32
+  1,  // cmovl_16_r_mbis8
+  1,  // cmovl_16_r_mi32
+  1,  // cmovl_16_r_mpc32
+  1,  // cmovl_16_r_mr
+  1,  // cmovl_32_r_mB
+  1,  // cmovl_32_r_mB32
+  1,  // cmovl_32_r_mB8
+  1,  // cmovl_32_r_mbis
+  1,  // cmovl_32_r_mbis32
+  1,  // cmovl_32_r_mbis8
+  1,  // cmovl_32_r_mi32
+  1,  // cmovl_32_r_mpc32
+  1,  // cmovl_32_r_mr
+  1,  // cmovl_64_r_mB
+  1,  // cmovl_64_r_mB32
+  1,  // cmovl_64_r_mB8
+  1,  // cmovl_64_r_mbis
+  1,  // cmovl_64_r_mbis32
+  1,  // cmovl_64_r_mbis8
+  1,  // cmovl_64_r_mi32
+  1,  // cmovl_64_r_mpc32
+  1,  // cmovl_64_r_mr
+  1,  // cmovle_16_r_mB
+  1,  // cmovle_16_r_mB32
+  1,  // cmovle_16_r_mB8
+  1,  // cmovle_16_r_mbis
+  1,  // cmovle_16_r_mbis32
+  1,  // cmovle_16_r_mbis8
+  1,  // cmovle_16_r_mi32
+  1,  // cmovle_16_r_mpc32
+  1,  // cmovle_16_r_mr
+  1,  // cmovle_32_r_mB
+  1,  // cmovle_32_r_mB32
+  1,  // cmovle_32_r_mB8
+  1,  // cmovle_32_r_mbis
+  1,  // cmovle_32_r_mbis32
+  1,  // cmovle_32_r_mbis8
+  1,  // cmovle_32_r_mi32
+  1,  // cmovle_32_r_mpc32
+  1,  // cmovle_32_r_mr
+  1,  // cmovle_64_r_mB
+  1,  // cmovle_64_r_mB32
+  1,  // cmovle_64_r_mB8
+  1,  // cmovle_64_r_mbis
+  1,  // cmovle_64_r_mbis32
+  1,  // cmovle_64_r_mbis8
+  1,  // cmovle_64_r_mi32
+  1,  // cmovle_64_r_mpc32
+  1,  // cmovle_64_r_mr
+  1,  // cmovne_16_r_mB
+  1,  // cmovne_16_r_mB32
+  1,  // cmovne_16_r_mB8
+  1,  // cmovne_16_r_mbis
+  1,  // cmovne_16_r_mbis32
+  1,  // cmovne_16_r_mbis8
+  1,  // cmovne_16_r_mi32
+  1,  // cmovne_16_r_mpc32
+  1,  // cmovne_16_r_mr
+  1,  // cmovne_32_r_mB
+  1,  // cmovne_32_r_mB32
+  1,  // cmovne_32_r_mB8
+  1,  // cmovne_32_r_mbis
+  1,  // cmovne_32_r_mbis32
+  1,  // cmovne_32_r_mbis8
+  1,  // cmovne_32_r_mi32
+  1,  // cmovne_32_r_mpc32
+  1,  // cmovne_32_r_mr
+  1,  // cmovne_64_r_mB
+  1,  // cmovne_64_r_mB32
+  1,  // cmovne_64_r_mB8
+  1,  // cmovne_64_r_mbis
+  1,  // cmovne_64_r_mbis32
+  1,  // cmovne_64_r_mbis8
+  1,  // cmovne_64_r_mi32
+  1,  // cmovne_64_r_mpc32
+  1,  // cmovne_64_r_mr
+  1,  // cmovno_16_r_mB
+  1,  // cmovno_16_r_mB32
+  1,  // cmovno_16_r_mB8
+  1,  // cmovno_16_r_mbis
+  1,  // cmovno_16_r_mbis32
+  1,  // cmovno_16_r_mbis8
+  1,  // cmovno_16_r_mi32
+  1,  // cmovno_16_r_mpc32
+  1,  // cmovno_16_r_mr
+  1,  // cmovno_32_r_mB
+  1,  // cmovno_32_r_mB32
+  1,  // cmovno_32_r_mB8
+  1,  // cmovno_32_r_mbis
+  1,  // cmovno_32_r_mbis32
+  1,  // cmovno_32_r_mbis8
+  1,  // cmovno_32_r_mi32
+  1,  // cmovno_32_r_mpc32
+  1,  // cmovno_32_r_mr
+  1,  // cmovno_64_r_mB
+  1,  // cmovno_64_r_mB32
+  1,  // cmovno_64_r_mB8
+  1,  // cmovno_64_r_mbis
+  1,  // cmovno_64_r_mbis32
+  1,  // cmovno_64_r_mbis8
+  1,  // cmovno_64_r_mi32
+  1,  // cmovno_64_r_mpc32
+  1,  // cmovno_64_r_mr
+  1,  // cmovnp_16_r_mB
+  1,  // cmovnp_16_r_mB32
+  1,  // cmovnp_16_r_mB8
+  1,  // cmovnp_16_r_mbis
+  1,  // cmovnp_16_r_mbis32
+  1,  // cmovnp_16_r_mbis8
+  1,  // cmovnp_16_r_mi32
+  1,  // cmovnp_16_r_mpc32
+  1,  // cmovnp_16_r_mr
+  1,  // cmovnp_32_r_mB
+  1,  // cmovnp_32_r_mB32
+  1,  // cmovnp_32_r_mB8
+  1,  // cmovnp_32_r_mbis
+  1,  // cmovnp_32_r_mbis32
+  1,  // cmovnp_32_r_mbis8
+  1,  // cmovnp_32_r_mi32
+  1,  // cmovnp_32_r_mpc32
+  1,  // cmovnp_32_r_mr
+  1,  // cmovnp_64_r_mB
+  1,  // cmovnp_64_r_mB32
+  1,  // cmovnp_64_r_mB8
+  1,  // cmovnp_64_r_mbis
+  1,  // cmovnp_64_r_mbis32
+  1,  // cmovnp_64_r_mbis8
+  1,  // cmovnp_64_r_mi32
+  1,  // cmovnp_64_r_mpc32
+  1,  // cmovnp_64_r_mr
+  1,  // cmovns_16_r_mB
+  1,  // cmovns_16_r_mB32
+  1,  // cmovns_16_r_mB8
+  1,  // cmovns_16_r_mbis
+  1,  // cmovns_16_r_mbis32
+  1,  // cmovns_16_r_mbis8
+  1,  // cmovns_16_r_mi32
+  1,  // cmovns_16_r_mpc32
+  1,  // cmovns_16_r_mr
+  1,  // cmovns_32_r_mB
+  1,  // cmovns_32_r_mB32
+  1,  // cmovns_32_r_mB8
+  1,  // cmovns_32_r_mbis
+  1,  // cmovns_32_r_mbis32
+  1,  // cmovns_32_r_mbis8
+  1,  // cmovns_32_r_mi32
+  1,  // cmovns_32_r_mpc32
+  1,  // cmovns_32_r_mr
+  1,  // cmovns_64_r_mB
+  1,  // cmovns_64_r_mB32
+  1,  // cmovns_64_r_mB8
+  1,  // cmovns_64_r_mbis
+  1,  // cmovns_64_r_mbis32
+  1,  // cmovns_64_r_mbis8
+  1,  // cmovns_64_r_mi32
+  1,  // cmovns_64_r_mpc32
+  1,  // cmovns_64_r_mr
+  1,  // cmovo_16_r_mB
+  1,  // cmovo_16_r_mB32
+  1,  // cmovo_16_r_mB8
+  1,  // cmovo_16_r_mbis
+  1,  // cmovo_16_r_mbis32
+  1,  // cmovo_16_r_mbis8
+  1,  // cmovo_16_r_mi32
+  1,  // cmovo_16_r_mpc32
+  1,  // cmovo_16_r_mr
+  1,  // cmovo_32_r_mB
+  1,  // cmovo_32_r_mB32
+  1,  // cmovo_32_r_mB8
+  1,  // cmovo_32_r_mbis
+  1,  // cmovo_32_r_mbis32
+  1,  // cmovo_32_r_mbis8
+  1,  // cmovo_32_r_mi32
+  1,  // cmovo_32_r_mpc32
+  1,  // cmovo_32_r_mr
+  1,  // cmovo_64_r_mB
+  1,  // cmovo_64_r_mB32
+  1,  // cmovo_64_r_mB8
+  1,  // cmovo_64_r_mbis
+  1,  // cmovo_64_r_mbis32
+  1,  // cmovo_64_r_mbis8
+  1,  // cmovo_64_r_mi32
+  1,  // cmovo_64_r_mpc32
+  1,  // cmovo_64_r_mr
+  1,  // cmovp_16_r_mB
+  1,  // cmovp_16_r_mB32
+  1,  // cmovp_16_r_mB8
+  1,  // cmovp_16_r_mbis
+  1,  // cmovp_16_r_mbis32
+  1,  // cmovp_16_r_mbis8
+  1,  // cmovp_16_r_mi32
+  1,  // cmovp_16_r_mpc32
+  1,  // cmovp_16_r_mr
+  1,  // cmovp_32_r_mB
+  1,  // cmovp_32_r_mB32
+  1,  // cmovp_32_r_mB8
+  1,  // cmovp_32_r_mbis
+  1,  // cmovp_32_r_mbis32
+  1,  // cmovp_32_r_mbis8
+  1,  // cmovp_32_r_mi32
+  1,  // cmovp_32_r_mpc32
+  1,  // cmovp_32_r_mr
+  1,  // cmovp_64_r_mB
+  1,  // cmovp_64_r_mB32
+  1,  // cmovp_64_r_mB8
+  1,  // cmovp_64_r_mbis
+  1,  // cmovp_64_r_mbis32
+  1,  // cmovp_64_r_mbis8
+  1,  // cmovp_64_r_mi32
+  1,  // cmovp_64_r_mpc32
+  1,  // cmovp_64_r_mr
+  1,  // cmovs_16_r_mB
+  1,  // cmovs_16_r_mB32
+  1,  // cmovs_16_r_mB8
+  1,  // cmovs_16_r_mbis
+  1,  // cmovs_16_r_mbis32
+  1,  // cmovs_16_r_mbis8
+  1,  // cmovs_16_r_mi32
+  1,  // cmovs_16_r_mpc32
+  1,  // cmovs_16_r_mr
+  1,  // cmovs_32_r_mB
+  1,  // cmovs_32_r_mB32
+  1,  // cmovs_32_r_mB8
+  1,  // cmovs_32_r_mbis
+  1,  // cmovs_32_r_mbis32
+  1,  // cmovs_32_r_mbis8
+  1,  // cmovs_32_r_mi32
+  1,  // cmovs_32_r_mpc32
+  1,  // cmovs_32_r_mr
+  1,  // cmovs_64_r_mB
+  1,  // cmovs_64_r_mB32
+  1,  // cmovs_64_r_mB8
+  1,  // cmovs_64_r_mbis
+  1,  // cmovs_64_r_mbis32
+  1,  // cmovs_64_r_mbis8
+  1,  // cmovs_64_r_mi32
+  1,  // cmovs_64_r_mpc32
+  1,  // cmovs_64_r_mr
+  2,  // cmp_16_ax_imm16
+  2,  // cmp_16_mB32_imm16
+  2,  // cmp_16_mB32_imm8
+  2,  // cmp_16_mB32_r
+  2,  // cmp_16_mB8_imm16
+  2,  // cmp_16_mB8_imm8
+  2,  // cmp_16_mB8_r
+  2,  // cmp_16_mB_imm16
+  2,  // cmp_16_mB_imm8
+  2,  // cmp_16_mB_r
+  2,  // cmp_16_mbis32_imm16
+  2,  // cmp_16_mbis32_imm8
+  2,  // cmp_16_mbis32_r
+  2,  // cmp_16_mbis8_imm16
+  2,  // cmp_16_mbis8_imm8
+  2,  // cmp_16_mbis8_r
+  2,  // cmp_16_mbis_imm16
+  2,  // cmp_16_mbis_imm8
+  2,  // cmp_16_mbis_r
+  2,  // cmp_16_mi32_imm16
+  2,  // cmp_16_mi32_imm8
+  2,  // cmp_16_mi32_r
+  2,  // cmp_16_mpc32_imm16
+  2,  // cmp_16_mpc32_imm8
+  2,  // cmp_16_mpc32_r
+  2,  // cmp_16_mr_imm16
+  2,  // cmp_16_mr_imm8
+  2,  // cmp_16_mr_r
+  2,  // cmp_16_r_mB
+  2,  // cmp_16_r_mB32
+  2,  // cmp_16_r_mB8
+  2,  // cmp_16_r_mbis
+  2,  // cmp_16_r_mbis32
+  2,  // cmp_16_r_mbis8
+  2,  // cmp_16_r_mi32
+  2,  // cmp_16_r_mpc32
+  2,  // cmp_16_r_mr
+  2,  // cmp_32_eax_imm32
+  2,  // cmp_32_mB32_imm32
+  2,  // cmp_32_mB32_imm8
+  2,  // cmp_32_mB32_r
+  2,  // cmp_32_mB8_imm32
+  2,  // cmp_32_mB8_imm8
+  2,  // cmp_32_mB8_r
+  2,  // cmp_32_mB_imm32
+  2,  // cmp_32_mB_imm8
+  2,  // cmp_32_mB_r
+  2,  // cmp_32_mbis32_imm32
+  2,  // cmp_32_mbis32_imm8
+  2,  // cmp_32_mbis32_r
+  2,  // cmp_32_mbis8_imm32
+  2,  // cmp_32_mbis8_imm8
+  2,  // cmp_32_mbis8_r
+  2,  // cmp_32_mbis_imm32
+  2,  // cmp_32_mbis_imm8
+  2,  // cmp_32_mbis_r
+  2,  // cmp_32_mi32_imm32
+  2,  // cmp_32_mi32_imm8
+  2,  // cmp_32_mi32_r
+  2,  // cmp_32_mpc32_imm32
+  2,  // cmp_32_mpc32_imm8
+  2,  // cmp_32_mpc32_r
+  2,  // cmp_32_mr_imm32
+  2,  // cmp_32_mr_imm8
+  2,  // cmp_32_mr_r
+  2,  // cmp_32_r_mB
+  2,  // cmp_32_r_mB32
+  2,  // cmp_32_r_mB8
+  2,  // cmp_32_r_mbis
+  2,  // cmp_32_r_mbis32
+  2,  // cmp_32_r_mbis8
+  2,  // cmp_32_r_mi32
+  2,  // cmp_32_r_mpc32
+  2,  // cmp_32_r_mr
+  2,  // cmp_64_mB32_imm32
+  2,  // cmp_64_mB32_imm8
+  2,  // cmp_64_mB32_r
+  2,  // cmp_64_mB8_imm32
+  2,  // cmp_64_mB8_imm8
+  2,  // cmp_64_mB8_r
+  2,  // cmp_64_mB_imm32
+  2,  // cmp_64_mB_imm8
+  2,  // cmp_64_mB_r
+  2,  // cmp_64_mbis32_imm32
+  2,  // cmp_64_mbis32_imm8
+  2,  // cmp_64_mbis32_r
+  2,  // cmp_64_mbis8_imm32
+  2,  // cmp_64_mbis8_imm8
+  2,  // cmp_64_mbis8_r
+  2,  // cmp_64_mbis_imm32
+  2,  // cmp_64_mbis_imm8
+  2,  // cmp_64_mbis_r
+  2,  // cmp_64_mi32_imm32
+  2,  // cmp_64_mi32_imm8
+  2,  // cmp_64_mi32_r
+  2,  // cmp_64_mpc32_imm32
+  2,  // cmp_64_mpc32_imm8
+  2,  // cmp_64_mpc32_r
+  2,  // cmp_64_mr_imm32
+  2,  // cmp_64_mr_imm8
+  2,  // cmp_64_mr_r
+  2,  // cmp_64_r_mB
+  2,  // cmp_64_r_mB32
+  2,  // cmp_64_r_mB8
+  2,  // cmp_64_r_mbis
+  2,  // cmp_64_r_mbis32
+  2,  // cmp_64_r_mbis8
+  2,  // cmp_64_r_mi32
+  2,  // cmp_64_r_mpc32
+  2,  // cmp_64_r_mr
+  2,  // cmp_64_rax_imm32
+  2,  // cmp_8_al_imm8
+  2,  // cmp_8_mB32_imm8
+  2,  // cmp_8_mB32_r
+  2,  // cmp_8_mB8_imm8
+  2,  // cmp_8_mB8_r
+  2,  // cmp_8_mB_imm8
+  2,  // cmp_8_mB_r
+  2,  // cmp_8_mbis32_imm8
+  2,  // cmp_8_mbis32_r
+  2,  // cmp_8_mbis8_imm8
+  2,  // cmp_8_mbis8_r
+  2,  // cmp_8_mbis_imm8
+  2,  // cmp_8_mbis_r
+  2,  // cmp_8_mi32_imm8
+  2,  // cmp_8_mi32_r
+  2,  // cmp_8_mpc32_imm8
+  2,  // cmp_8_mpc32_r
+  2,  // cmp_8_mr_imm8
+  2,  // cmp_8_mr_r
+  2,  // cmp_8_r_mB
+  2,  // cmp_8_r_mB32
+  2,  // cmp_8_r_mB8
+  2,  // cmp_8_r_mbis
+  2,  // cmp_8_r_mbis32
+  2,  // cmp_8_r_mbis8
+  2,  // cmp_8_r_mi32
+  2,  // cmp_8_r_mpc32
+  2,  // cmp_8_r_mr
+  2,  // cmpxchg_16_mB32_r_ax
+  2,  // cmpxchg_16_mB8_r_ax
+  2,  // cmpxchg_16_mB_r_ax
+  2,  // cmpxchg_16_mbis32_r_ax
+  2,  // cmpxchg_16_mbis8_r_ax
+  2,  // cmpxchg_16_mbis_r_ax
+  2,  // cmpxchg_16_mi32_r_ax
+  2,  // cmpxchg_16_mpc32_r_ax
+  2,  // cmpxchg_16_mr_r_ax
+  2,  // cmpxchg_32_mB32_r_eax
+  2,  // cmpxchg_32_mB8_r_eax
+  2,  // cmpxchg_32_mB_r_eax
+  2,  // cmpxchg_32_mbis32_r_eax
+  2,  // cmpxchg_32_mbis8_r_eax
+  2,  // cmpxchg_32_mbis_r_eax
+  2,  // cmpxchg_32_mi32_r_eax
+  2,  // cmpxchg_32_mpc32_r_eax
+  2,  // cmpxchg_32_mr_r_eax
+  2,  // cmpxchg_64_mB32_r_rax
+  2,  // cmpxchg_64_mB8_r_rax
+  2,  // cmpxchg_64_mB_r_rax
+  2,  // cmpxchg_64_mbis32_r_rax
+  2,  // cmpxchg_64_mbis8_r_rax
+  2,  // cmpxchg_64_mbis_r_rax
+  2,  // cmpxchg_64_mi32_r_rax
+  2,  // cmpxchg_64_mpc32_r_rax
+  2,  // cmpxchg_64_mr_r_rax
+  2,  // cmpxchg_8_mB32_r_al
+  2,  // cmpxchg_8_mB8_r_al
+  2,  // cmpxchg_8_mB_r_al
+  2,  // cmpxchg_8_mbis32_r_al
+  2,  // cmpxchg_8_mbis8_r_al
+  2,  // cmpxchg_8_mbis_r_al
+  2,  // cmpxchg_8_mi32_r_al
+  2,  // cmpxchg_8_mpc32_r_al
+  2,  // cmpxchg_8_mr_r_al
+  2,  // comisd_x_mB
+  2,  // comisd_x_mB32
+  2,  // comisd_x_mB8
+  2,  // comisd_x_mbis
+  2,  // comisd_x_mbis32
+  2,  // comisd_x_mbis8
+  2,  // comisd_x_mi32
+  2,  // comisd_x_mpc32
+  2,  // comisd_x_mx
+  2,  // comiss_x_mB
+  2,  // comiss_x_mB32
+  2,  // comiss_x_mB8
+  2,  // comiss_x_mbis
+  2,  // comiss_x_mbis32
+  2,  // comiss_x_mbis8
+  2,  // comiss_x_mi32
+  2,  // comiss_x_mpc32
+  2,  // comiss_x_mx
+  0,  // cqo_64_rdx_rax
+  0,  // cvtsd2si_32_r_mB
+  0,  // cvtsd2si_32_r_mB32
+  0,  // cvtsd2si_32_r_mB8
+  0,  // cvtsd2si_32_r_mbis
+  0,  // cvtsd2si_32_r_mbis32
+  0,  // cvtsd2si_32_r_mbis8
+  0,  // cvtsd2si_32_r_mi32
+  0,  // cvtsd2si_32_r_mpc32
+  0,  // cvtsd2si_32_r_mx
+  0,  // cvtsd2si_64_r_mB
+  0,  // cvtsd2si_64_r_mB32
+  0,  // cvtsd2si_64_r_mB8
+  0,  // cvtsd2si_64_r_mbis
+  0,  // cvtsd2si_64_r_mbis32
+  0,  // cvtsd2si_64_r_mbis8
+  0,  // cvtsd2si_64_r_mi32
+  0,  // cvtsd2si_64_r_mpc32
+  0,  // cvtsd2si_64_r_mx
+  0,  // cvtsd2ss_x_mB
+  0,  // cvtsd2ss_x_mB32
+  0,  // cvtsd2ss_x_mB8
+  0,  // cvtsd2ss_x_mbis
+  0,  // cvtsd2ss_x_mbis32
+  0,  // cvtsd2ss_x_mbis8
+  0,  // cvtsd2ss_x_mi32
+  0,  // cvtsd2ss_x_mpc32
+  0,  // cvtsd2ss_x_mx
+  0,  // cvtsi2sd_32_x_mB
+  0,  // cvtsi2sd_32_x_mB32
+  0,  // cvtsi2sd_32_x_mB8
+  0,  // cvtsi2sd_32_x_mbis
+  0,  // cvtsi2sd_32_x_mbis32
+  0,  // cvtsi2sd_32_x_mbis8
+  0,  // cvtsi2sd_32_x_mi32
+  0,  // cvtsi2sd_32_x_mpc32
+  0,  // cvtsi2sd_32_x_mr
+  0,  // cvtsi2sd_64_x_mB
+  0,  // cvtsi2sd_64_x_mB32
+  0,  // cvtsi2sd_64_x_mB8
+  0,  // cvtsi2sd_64_x_mbis
+  0,  // cvtsi2sd_64_x_mbis32
+  0,  // cvtsi2sd_64_x_mbis8
+  0,  // cvtsi2sd_64_x_mi32
+  0,  // cvtsi2sd_64_x_mpc32
+  0,  // cvtsi2sd_64_x_mr
+  0,  // cvtsi2ss_32_x_mB
+  0,  // cvtsi2ss_32_x_mB32
+  0,  // cvtsi2ss_32_x_mB8
+  0,  // cvtsi2ss_32_x_mbis
+  0,  // cvtsi2ss_32_x_mbis32
+  0,  // cvtsi2ss_32_x_mbis8
+  0,  // cvtsi2ss_32_x_mi32
+  0,  // cvtsi2ss_32_x_mpc32
+  0,  // cvtsi2ss_32_x_mr
+  0,  // cvtsi2ss_64_x_mB
+  0,  // cvtsi2ss_64_x_mB32
+  0,  // cvtsi2ss_64_x_mB8
+  0,  // cvtsi2ss_64_x_mbis
+  0,  // cvtsi2ss_64_x_mbis32
+  0,  // cvtsi2ss_64_x_mbis8
+  0,  // cvtsi2ss_64_x_mi32
+  0,  // cvtsi2ss_64_x_mpc32
+  0,  // cvtsi2ss_64_x_mr
+  0,  // cvtss2sd_x_mB
+  0,  // cvtss2sd_x_mB32
+  0,  // cvtss2sd_x_mB8
+  0,  // cvtss2sd_x_mbis
+  0,  // cvtss2sd_x_mbis32
+  0,  // cvtss2sd_x_mbis8
+  0,  // cvtss2sd_x_mi32
+  0,  // cvtss2sd_x_mpc32
+  0,  // cvtss2sd_x_mx
+  0,  // cvtss2si_32_r_mB
+  0,  // cvtss2si_32_r_mB32
+  0,  // cvtss2si_32_r_mB8
+  0,  // cvtss2si_32_r_mbis
+  0,  // cvtss2si_32_r_mbis32
+  0,  // cvtss2si_32_r_mbis8
+  0,  // cvtss2si_32_r_mi32
+  0,  // cvtss2si_32_r_mpc32
+  0,  // cvtss2si_32_r_mx
+  0,  // cvtss2si_64_r_mB
+  0,  // cvtss2si_64_r_mB32
+  0,  // cvtss2si_64_r_mB8
+  0,  // cvtss2si_64_r_mbis
+  0,  // cvtss2si_64_r_mbis32
+  0,  // cvtss2si_64_r_mbis8
+  0,  // cvtss2si_64_r_mi32
+  0,  // cvtss2si_64_r_mpc32
+  0,  // cvtss2si_64_r_mx
+  0,  // cvttsd2si_32_r_mB
+  0,  // cvttsd2si_32_r_mB32
+  0,  // cvttsd2si_32_r_mB8
+  0,  // cvttsd2si_32_r_mbis
+  0,  // cvttsd2si_32_r_mbis32
+  0,  // cvttsd2si_32_r_mbis8
+  0,  // cvttsd2si_32_r_mi32
+  0,  // cvttsd2si_32_r_mpc32
+  0,  // cvttsd2si_32_r_mx
+  0,  // cvttsd2si_64_r_mB
+  0,  // cvttsd2si_64_r_mB32
+  0,  // cvttsd2si_64_r_mB8
+  0,  // cvttsd2si_64_r_mbis
+  0,  // cvttsd2si_64_r_mbis32
+  0,  // cvttsd2si_64_r_mbis8
+  0,  // cvttsd2si_64_r_mi32
+  0,  // cvttsd2si_64_r_mpc32
+  0,  // cvttsd2si_64_r_mx
+  0,  // cvttss2si_32_r_mB
+  0,  // cvttss2si_32_r_mB32
+  0,  // cvttss2si_32_r_mB8
+  0,  // cvttss2si_32_r_mbis
+  0,  // cvttss2si_32_r_mbis32
+  0,  // cvttss2si_32_r_mbis8
+  0,  // cvttss2si_32_r_mi32
+  0,  // cvttss2si_32_r_mpc32
+  0,  // cvttss2si_32_r_mx
+  0,  // cvttss2si_64_r_mB
+  0,  // cvttss2si_64_r_mB32
+  0,  // cvttss2si_64_r_mB8
+  0,  // cvttss2si_64_r_mbis
+  0,  // cvttss2si_64_r_mbis32
+  0,  // cvttss2si_64_r_mbis8
+  0,  // cvttss2si_64_r_mi32
+  0,  // cvttss2si_64_r_mpc32
+  0,  // cvttss2si_64_r_mx
+  0,  // cwd_16_dx_ax
+  2,  // div_16_ax_mB
+  2,  // div_16_ax_mB32
+  2,  // div_16_ax_mB8
+  2,  // div_16_ax_mbis
+  2,  // div_16_ax_mbis32
+  2,  // div_16_ax_mbis8
+  2,  // div_16_ax_mi32
+  2,  // div_16_ax_mpc32
+  2,  // div_16_ax_mr
+  2,  // div_16_dx_ax_mB
+  2,  // div_16_dx_ax_mB32
+  2,  // div_16_dx_ax_mB8
+  2,  // div_16_dx_ax_mbis
+  2,  // div_16_dx_ax_mbis32
+  2,  // div_16_dx_ax_mbis8
+  2,  // div_16_dx_ax_mi32
+  2,  // div_16_dx_ax_mpc32
+  2,  // div_16_dx_ax_mr
+  2,  // div_32_edx_eax_mB
+  2,  // div_32_edx_eax_mB32
+  2,  // div_32_edx_eax_mB8
+  2,  // div_32_edx_eax_mbis
+  2,  // div_32_edx_eax_mbis32
+  2,  // div_32_edx_eax_mbis8
+  2,  // div_32_edx_eax_mi32
+  2,  // div_32_edx_eax_mpc32
+  2,  // div_32_edx_eax_mr
+  2,  // div_64_rdx_rax_mB
+  2,  // div_64_rdx_rax_mB32
+  2,  // div_64_rdx_rax_mB8
+  2,  // div_64_rdx_rax_mbis
+  2,  // div_64_rdx_rax_mbis32
+  2,  // div_64_rdx_rax_mbis8
+  2,  // div_64_rdx_rax_mi32
+  2,  // div_64_rdx_rax_mpc32
+  2,  // div_64_rdx_rax_mr
+  0,  // divsd_x_mB
+  0,  // divsd_x_mB32
+  0,  // divsd_x_mB8
+  0,  // divsd_x_mbis
+  0,  // divsd_x_mbis32
+  0,  // divsd_x_mbis8
+  0,  // divsd_x_mi32
+  0,  // divsd_x_mpc32
+  0,  // divsd_x_mx
+  0,  // divss_x_mB
+  0,  // divss_x_mB32
+  0,  // divss_x_mB8
+  0,  // divss_x_mbis
+  0,  // divss_x_mbis32
+  0,  // divss_x_mbis8
+  0,  // divss_x_mi32
+  0,  // divss_x_mpc32
+  0,  // divss_x_mx
+  0,  // endbr64
+  2,  // idiv_16_ax_mB
+  2,  // idiv_16_ax_mB32
+  2,  // idiv_16_ax_mB8
+  2,  // idiv_16_ax_mbis
+  2,  // idiv_16_ax_mbis32
+  2,  // idiv_16_ax_mbis8
+  2,  // idiv_16_ax_mi32
+  2,  // idiv_16_ax_mpc32
+  2,  // idiv_16_ax_mr
+  2,  // idiv_16_dx_ax_mB
+  2,  // idiv_16_dx_ax_mB32
+  2,  // idiv_16_dx_ax_mB8
+  2,  // idiv_16_dx_ax_mbis
+  2,  // idiv_16_dx_ax_mbis32
+  2,  // idiv_16_dx_ax_mbis8
+  2,  // idiv_16_dx_ax_mi32
+  2,  // idiv_16_dx_ax_mpc32
+  2,  // idiv_16_dx_ax_mr
+  2,  // idiv_32_edx_eax_mB
+  2,  // idiv_32_edx_eax_mB32
+  2,  // idiv_32_edx_eax_mB8
+  2,  // idiv_32_edx_eax_mbis
+  2,  // idiv_32_edx_eax_mbis32
+  2,  // idiv_32_edx_eax_mbis8
+  2,  // idiv_32_edx_eax_mi32
+  2,  // idiv_32_edx_eax_mpc32
+  2,  // idiv_32_edx_eax_mr
+  2,  // idiv_64_rdx_rax_mB
+  2,  // idiv_64_rdx_rax_mB32
+  2,  // idiv_64_rdx_rax_mB8
+  2,  // idiv_64_rdx_rax_mbis
+  2,  // idiv_64_rdx_rax_mbis32
+  2,  // idiv_64_rdx_rax_mbis8
+  2,  // idiv_64_rdx_rax_mi32
+  2,  // idiv_64_rdx_rax_mpc32
+  2,  // idiv_64_rdx_rax_mr
+  2,  // imul_16_ax_mB
+  2,  // imul_16_ax_mB32
+  2,  // imul_16_ax_mB8
+  2,  // imul_16_ax_mbis
+  2,  // imul_16_ax_mbis32
+  2,  // imul_16_ax_mbis8
+  2,  // imul_16_ax_mi32
+  2,  // imul_16_ax_mpc32
+  2,  // imul_16_ax_mr
+  2,  // imul_16_dx_ax_mB
+  2,  // imul_16_dx_ax_mB32
+  2,  // imul_16_dx_ax_mB8
+  2,  // imul_16_dx_ax_mbis
+  2,  // imul_16_dx_ax_mbis32
+  2,  // imul_16_dx_ax_mbis8
+  2,  // imul_16_dx_ax_mi32
+  2,  // imul_16_dx_ax_mpc32
+  2,  // imul_16_dx_ax_mr
+  2,  // imul_16_r_mB
+  2,  // imul_16_r_mB32
+  2,  // imul_16_r_mB32_imm16
+  2,  // imul_16_r_mB32_imm8
+  2,  // imul_16_r_mB8
+  2,  // imul_16_r_mB8_imm16
+  2,  // imul_16_r_mB8_imm8
+  2,  // imul_16_r_mB_imm16
+  2,  // imul_16_r_mB_imm8
+  2,  // imul_16_r_mbis
+  2,  // imul_16_r_mbis32
+  2,  // imul_16_r_mbis32_imm16
+  2,  // imul_16_r_mbis32_imm8
+  2,  // imul_16_r_mbis8
+  2,  // imul_16_r_mbis8_imm16
+  2,  // imul_16_r_mbis8_imm8
+  2,  // imul_16_r_mbis_imm16
+  2,  // imul_16_r_mbis_imm8
+  2,  // imul_16_r_mi32
+  2,  // imul_16_r_mi32_imm16
+  2,  // imul_16_r_mi32_imm8
+  2,  // imul_16_r_mpc32
+  2,  // imul_16_r_mpc32_imm16
+  2,  // imul_16_r_mpc32_imm8
+  2,  // imul_16_r_mr
+  2,  // imul_16_r_mr_imm16
+  2,  // imul_16_r_mr_imm8
+  2,  // imul_32_edx_eax_mB
+  2,  // imul_32_edx_eax_mB32
+  2,  // imul_32_edx_eax_mB8
+  2,  // imul_32_edx_eax_mbis
+  2,  // imul_32_edx_eax_mbis32
+  2,  // imul_32_edx_eax_mbis8
+  2,  // imul_32_edx_eax_mi32
+  2,  // imul_32_edx_eax_mpc32
+  2,  // imul_32_edx_eax_mr
+  2,  // imul_32_r_mB
+  2,  // imul_32_r_mB32
+  2,  // imul_32_r_mB32_imm32
+  2,  // imul_32_r_mB32_imm8
+  2,  // imul_32_r_mB8
+  2,  // imul_32_r_mB8_imm32
+  2,  // imul_32_r_mB8_imm8
+  2,  // imul_32_r_mB_imm32
+  2,  // imul_32_r_mB_imm8
+  2,  // imul_32_r_mbis
+  2,  // imul_32_r_mbis32
+  2,  // imul_32_r_mbis32_imm32
+  2,  // imul_32_r_mbis32_imm8
+  2,  // imul_32_r_mbis8
+  2,  // imul_32_r_mbis8_imm32
+  2,  // imul_32_r_mbis8_imm8
+  2,  // imul_32_r_mbis_imm32
+  2,  // imul_32_r_mbis_imm8
+  2,  // imul_32_r_mi32
+  2,  // imul_32_r_mi32_imm32
+  2,  // imul_32_r_mi32_imm8
+  2,  // imul_32_r_mpc32
+  2,  // imul_32_r_mpc32_imm32
+  2,  // imul_32_r_mpc32_imm8
+  2,  // imul_32_r_mr
+  2,  // imul_32_r_mr_imm32
+  2,  // imul_32_r_mr_imm8
+  2,  // imul_64_r_mB
+  2,  // imul_64_r_mB32
+  2,  // imul_64_r_mB32_imm32
+  2,  // imul_64_r_mB32_imm8
+  2,  // imul_64_r_mB8
+  2,  // imul_64_r_mB8_imm32
+  2,  // imul_64_r_mB8_imm8
+  2,  // imul_64_r_mB_imm32
+  2,  // imul_64_r_mB_imm8
+  2,  // imul_64_r_mbis
+  2,  // imul_64_r_mbis32
+  2,  // imul_64_r_mbis32_imm32
+  2,  // imul_64_r_mbis32_imm8
+  2,  // imul_64_r_mbis8
+  2,  // imul_64_r_mbis8_imm32
+  2,  // imul_64_r_mbis8_imm8
+  2,  // imul_64_r_mbis_imm32
+  2,  // imul_64_r_mbis_imm8
+  2,  // imul_64_r_mi32
+  2,  // imul_64_r_mi32_imm32
+  2,  // imul_64_r_mi32_imm8
+  2,  // imul_64_r_mpc32
+  2,  // imul_64_r_mpc32_imm32
+  2,  // imul_64_r_mpc32_imm8
+  2,  // imul_64_r_mr
+  2,  // imul_64_r_mr_imm32
+  2,  // imul_64_r_mr_imm8
+  2,  // imul_64_rdx_rax_mB
+  2,  // imul_64_rdx_rax_mB32
+  2,  // imul_64_rdx_rax_mB8
+  2,  // imul_64_rdx_rax_mbis
+  2,  // imul_64_rdx_rax_mbis32
+  2,  // imul_64_rdx_rax_mbis8
+  2,  // imul_64_rdx_rax_mi32
+  2,  // imul_64_rdx_rax_mpc32
+  2,  // imul_64_rdx_rax_mr
+  0,  // inc_16_mB
+  0,  // inc_16_mB32
+  0,  // inc_16_mB8
+  0,  // inc_16_mbis
+  0,  // inc_16_mbis32
+  0,  // inc_16_mbis8
+  0,  // inc_16_mi32
+  0,  // inc_16_mpc32
+  0,  // inc_16_mr
+  0,  // inc_32_mB
+  0,  // inc_32_mB32
+  0,  // inc_32_mB8
+  0,  // inc_32_mbis
+  0,  // inc_32_mbis32
+  0,  // inc_32_mbis8
+  0,  // inc_32_mi32
+  0,  // inc_32_mpc32
+  0,  // inc_32_mr
+  0,  // inc_64_mB
+  0,  // inc_64_mB32
+  0,  // inc_64_mB8
+  0,  // inc_64_mbis
+  0,  // inc_64_mbis32
+  0,  // inc_64_mbis8
+  0,  // inc_64_mi32
+  0,  // inc_64_mpc32
+  0,  // inc_64_mr
+  0,  // inc_8_mB
+  0,  // inc_8_mB32
+  0,  // inc_8_mB8
+  0,  // inc_8_mbis
+  0,  // inc_8_mbis32
+  0,  // inc_8_mbis8
+  0,  // inc_8_mi32
+  0,  // inc_8_mpc32
+  0,  // inc_8_mr
+  0,  // int3
+  1,  // ja_32
+  1,  // ja_8
+  1,  // jae_32
+  1,  // jae_8
+  1,  // jb_32
+  1,  // jb_8
+  1,  // jbe_32
+  1,  // jbe_8
+  1,  // je_32
+  1,  // je_8
+  1,  // jg_32
+  1,  // jg_8
+  1,  // jge_32
+  1,  // jge_8
+  1,  // jl_32
+  1,  // jl_8
+  1,  // jle_32
+  1,  // jle_8
+  0,  // jmp_32
+  0,  // jmp_64_mB
+  0,  // jmp_64_mB32
+  0,  // jmp_64_mB8
+  0,  // jmp_64_mbis
+  0,  // jmp_64_mbis32
+  0,  // jmp_64_mbis8
+  0,  // jmp_64_mi32
+  0,  // jmp_64_mpc32
+  0,  // jmp_64_mr
+  0,  // jmp_8
+  1,  // jne_32
+  1,  // jne_8
+  1,  // jnp_32
+  1,  // jnp_8
+  1,  // jns_32
+  1,  // jns_8
+  1,  // jp_32
+  1,  // jp_8
+  1,  // js_32
+  1,  // js_8
+  0,  // ldmxcsr_32_mB
+  0,  // ldmxcsr_32_mB32
+  0,  // ldmxcsr_32_mB8
+  0,  // ldmxcsr_32_mbis
+  0,  // ldmxcsr_32_mbis32
+  0,  // ldmxcsr_32_mbis8
+  0,  // ldmxcsr_32_mi32
+  0,  // ldmxcsr_32_mpc32
+  0,  // ldmxcsr_32_mr
+  0,  // lea_16_r_mB
+  0,  // lea_16_r_mB32
+  0,  // lea_16_r_mB8
+  0,  // lea_16_r_mbis
+  0,  // lea_16_r_mbis32
+  0,  // lea_16_r_mbis8
+  0,  // lea_16_r_mi32
+  0,  // lea_16_r_mpc32
+  0,  // lea_32_r_mB
+  0,  // lea_32_r_mB32
+  0,  // lea_32_r_mB8
+  0,  // lea_32_r_mbis
+  0,  // lea_32_r_mbis32
+  0,  // lea_32_r_mbis8
+  0,  // lea_32_r_mi32
+  0,  // lea_32_r_mpc32
+  0,  // lea_64_r_mB
+  0,  // lea_64_r_mB32
+  0,  // lea_64_r_mB8
+  0,  // lea_64_r_mbis
+  0,  // lea_64_r_mbis32
+  0,  // lea_64_r_mbis8
+  0,  // lea_64_r_mi32
+  0,  // lea_64_r_mpc32
+  0,  // lfence
+  2,  // lockcmpxchg_16_mB32_r_ax
+  2,  // lockcmpxchg_16_mB8_r_ax
+  2,  // lockcmpxchg_16_mB_r_ax
+  2,  // lockcmpxchg_16_mbis32_r_ax
+  2,  // lockcmpxchg_16_mbis8_r_ax
+  2,  // lockcmpxchg_16_mbis_r_ax
+  2,  // lockcmpxchg_16_mi32_r_ax
+  2,  // lockcmpxchg_16_mpc32_r_ax
+  2,  // lockcmpxchg_16_mr_r_ax
+  2,  // lockcmpxchg_32_mB32_r_eax
+  2,  // lockcmpxchg_32_mB8_r_eax
+  2,  // lockcmpxchg_32_mB_r_eax
+  2,  // lockcmpxchg_32_mbis32_r_eax
+  2,  // lockcmpxchg_32_mbis8_r_eax
+  2,  // lockcmpxchg_32_mbis_r_eax
+  2,  // lockcmpxchg_32_mi32_r_eax
+  2,  // lockcmpxchg_32_mpc32_r_eax
+  2,  // lockcmpxchg_32_mr_r_eax
+  2,  // lockcmpxchg_64_mB32_r_rax
+  2,  // lockcmpxchg_64_mB8_r_rax
+  2,  // lockcmpxchg_64_mB_r_rax
+  2,  // lockcmpxchg_64_mbis32_r_rax
+  2,  // lockcmpxchg_64_mbis8_r_rax
+  2,  // lockcmpxchg_64_mbis_r_rax
+  2,  // lockcmpxchg_64_mi32_r_rax
+  2,  // lockcmpxchg_64_mpc32_r_rax
+  2,  // lockcmpxchg_64_mr_r_rax
+  2,  // lockcmpxchg_8_mB32_r_al
+  2,  // lockcmpxchg_8_mB8_r_al
+  2,  // lockcmpxchg_8_mB_r_al
+  2,  // lockcmpxchg_8_mbis32_r_al
+  2,  // lockcmpxchg_8_mbis8_r_al
+  2,  // lockcmpxchg_8_mbis_r_al
+  2,  // lockcmpxchg_8_mi32_r_al
+  2,  // lockcmpxchg_8_mpc32_r_al
+  2,  // lockcmpxchg_8_mr_r_al
+  2,  // lzcnt_16_r_mB
+  2,  // lzcnt_16_r_mB32
+  2,  // lzcnt_16_r_mB8
+  2,  // lzcnt_16_r_mbis
+  2,  // lzcnt_16_r_mbis32
+  2,  // lzcnt_16_r_mbis8
+  2,  // lzcnt_16_r_mi32
+  2,  // lzcnt_16_r_mpc32
+  2,  // lzcnt_16_r_mr
+  2,  // lzcnt_32_r_mB
+  2,  // lzcnt_32_r_mB32
+  2,  // lzcnt_32_r_mB8
+  2,  // lzcnt_32_r_mbis
+  2,  // lzcnt_32_r_mbis32
+  2,  // lzcnt_32_r_mbis8
+  2,  // lzcnt_32_r_mi32
+  2,  // lzcnt_32_r_mpc32
+  2,  // lzcnt_32_r_mr
+  2,  // lzcnt_64_r_mB
+  2,  // lzcnt_64_r_mB32
+  2,  // lzcnt_64_r_mB8
+  2,  // lzcnt_64_r_mbis
+  2,  // lzcnt_64_r_mbis32
+  2,  // lzcnt_64_r_mbis8
+  2,  // lzcnt_64_r_mi32
+  2,  // lzcnt_64_r_mpc32
+  2,  // lzcnt_64_r_mr
+  0,  // maxsd_x_mB
+  0,  // maxsd_x_mB32
+  0,  // maxsd_x_mB8
+  0,  // maxsd_x_mbis
+  0,  // maxsd_x_mbis32
+  0,  // maxsd_x_mbis8
+  0,  // maxsd_x_mi32
+  0,  // maxsd_x_mpc32
+  0,  // maxsd_x_mx
+  0,  // maxss_x_mB
+  0,  // maxss_x_mB32
+  0,  // maxss_x_mB8
+  0,  // maxss_x_mbis
+  0,  // maxss_x_mbis32
+  0,  // maxss_x_mbis8
+  0,  // maxss_x_mi32
+  0,  // maxss_x_mpc32
+  0,  // maxss_x_mx
+  0,  // mfence
+  0,  // minsd_x_mB
+  0,  // minsd_x_mB32
+  0,  // minsd_x_mB8
+  0,  // minsd_x_mbis
+  0,  // minsd_x_mbis32
+  0,  // minsd_x_mbis8
+  0,  // minsd_x_mi32
+  0,  // minsd_x_mpc32
+  0,  // minsd_x_mx
+  0,  // minss_x_mB
+  0,  // minss_x_mB32
+  0,  // minss_x_mB8
+  0,  // minss_x_mbis
+  0,  // minss_x_mbis32
+  0,  // minss_x_mbis8
+  0,  // minss_x_mi32
+  0,  // minss_x_mpc32
+  0,  // minss_x_mx
+  0,  // mov_16_mB32_imm16
+  0,  // mov_16_mB32_r
+  0,  // mov_16_mB8_imm16
+  0,  // mov_16_mB8_r
+  0,  // mov_16_mB_imm16
+  0,  // mov_16_mB_r
+  0,  // mov_16_mbis32_imm16
+  0,  // mov_16_mbis32_r
+  0,  // mov_16_mbis8_imm16
+  0,  // mov_16_mbis8_r
+  0,  // mov_16_mbis_imm16
+  0,  // mov_16_mbis_r
+  0,  // mov_16_mi32_imm16
+  0,  // mov_16_mi32_r
+  0,  // mov_16_mpc32_imm16
+  0,  // mov_16_mpc32_r
+  0,  // mov_16_mr_imm16
+  0,  // mov_16_mr_r
+  0,  // mov_16_r_imm16
+  0,  // mov_16_r_mB
+  0,  // mov_16_r_mB32
+  0,  // mov_16_r_mB8
+  0,  // mov_16_r_mbis
+  0,  // mov_16_r_mbis32
+  0,  // mov_16_r_mbis8
+  0,  // mov_16_r_mi32
+  0,  // mov_16_r_mpc32
+  0,  // mov_16_r_mr
+  0,  // mov_32_mB32_imm32
+  0,  // mov_32_mB32_r
+  0,  // mov_32_mB8_imm32
+  0,  // mov_32_mB8_r
+  0,  // mov_32_mB_imm32
+  0,  // mov_32_mB_r
+  0,  // mov_32_mbis32_imm32
+  0,  // mov_32_mbis32_r
+  0,  // mov_32_mbis8_imm32
+  0,  // mov_32_mbis8_r
+  0,  // mov_32_mbis_imm32
+  0,  // mov_32_mbis_r
+  0,  // mov_32_mi32_imm32
+  0,  // mov_32_mi32_r
+  0,  // mov_32_mpc32_imm32
+  0,  // mov_32_mpc32_r
+  0,  // mov_32_mr_imm32
+  0,  // mov_32_mr_r
+  0,  // mov_32_r_imm32
+  0,  // mov_32_r_mB
+  0,  // mov_32_r_mB32
+  0,  // mov_32_r_mB8
+  0,  // mov_32_r_mbis
+  0,  // mov_32_r_mbis32
+  0,  // mov_32_r_mbis8
+  0,  // mov_32_r_mi32
+  0,  // mov_32_r_mpc32
+  0,  // mov_32_r_mr
+  0,  // mov_64_mB32_imm32
+  0,  // mov_64_mB32_r
+  0,  // mov_64_mB8_imm32
+  0,  // mov_64_mB8_r
+  0,  // mov_64_mB_imm32
+  0,  // mov_64_mB_r
+  0,  // mov_64_mbis32_imm32
+  0,  // mov_64_mbis32_r
+  0,  // mov_64_mbis8_imm32
+  0,  // mov_64_mbis8_r
+  0,  // mov_64_mbis_imm32
+  0,  // mov_64_mbis_r
+  0,  // mov_64_mi32_imm32
+  0,  // mov_64_mi32_r
+  0,  // mov_64_mpc32_imm32
+  0,  // mov_64_mpc32_r
+  0,  // mov_64_mr_imm32
+  0,  // mov_64_mr_r
+  0,  // mov_64_r_imm64
+  0,  // mov_64_r_mB
+  0,  // mov_64_r_mB32
+  0,  // mov_64_r_mB8
+  0,  // mov_64_r_mbis
+  0,  // mov_64_r_mbis32
+  0,  // mov_64_r_mbis8
+  0,  // mov_64_r_mi32
+  0,  // mov_64_r_mpc32
+  0,  // mov_64_r_mr
+  0,  // mov_8_mB32_imm8
+  0,  // mov_8_mB32_r
+  0,  // mov_8_mB8_imm8
+  0,  // mov_8_mB8_r
+  0,  // mov_8_mB_imm8
+  0,  // mov_8_mB_r
+  0,  // mov_8_mbis32_imm8
+  0,  // mov_8_mbis32_r
+  0,  // mov_8_mbis8_imm8
+  0,  // mov_8_mbis8_r
+  0,  // mov_8_mbis_imm8
+  0,  // mov_8_mbis_r
+  0,  // mov_8_mi32_imm8
+  0,  // mov_8_mi32_r
+  0,  // mov_8_mpc32_imm8
+  0,  // mov_8_mpc32_r
+  0,  // mov_8_mr_imm8
+  0,  // mov_8_mr_r
+  0,  // mov_8_r_imm8
+  0,  // mov_8_r_mB
+  0,  // mov_8_r_mB32
+  0,  // mov_8_r_mB8
+  0,  // mov_8_r_mbis
+  0,  // mov_8_r_mbis32
+  0,  // mov_8_r_mbis8
+  0,  // mov_8_r_mi32
+  0,  // mov_8_r_mpc32
+  0,  // mov_8_r_mr
+  0,  // movapd_mB32_x
+  0,  // movapd_mB8_x
+  0,  // movapd_mB_x
+  0,  // movapd_mbis32_x
+  0,  // movapd_mbis8_x
+  0,  // movapd_mbis_x
+  0,  // movapd_mi32_x
+  0,  // movapd_mpc32_x
+  0,  // movapd_mx_x
+  0,  // movapd_x_mB
+  0,  // movapd_x_mB32
+  0,  // movapd_x_mB8
+  0,  // movapd_x_mbis
+  0,  // movapd_x_mbis32
+  0,  // movapd_x_mbis8
+  0,  // movapd_x_mi32
+  0,  // movapd_x_mpc32
+  0,  // movapd_x_mx
+  0,  // movaps_mB32_x
+  0,  // movaps_mB8_x
+  0,  // movaps_mB_x
+  0,  // movaps_mbis32_x
+  0,  // movaps_mbis8_x
+  0,  // movaps_mbis_x
+  0,  // movaps_mi32_x
+  0,  // movaps_mpc32_x
+  0,  // movaps_mx_x
+  0,  // movaps_x_mB
+  0,  // movaps_x_mB32
+  0,  // movaps_x_mB8
+  0,  // movaps_x_mbis
+  0,  // movaps_x_mbis32
+  0,  // movaps_x_mbis8
+  0,  // movaps_x_mi32
+  0,  // movaps_x_mpc32
+  0,  // movaps_x_mx
+  0,  // movd_32_mB32_x
+  0,  // movd_32_mB8_x
+  0,  // movd_32_mB_x
+  0,  // movd_32_mbis32_x
+  0,  // movd_32_mbis8_x
+  0,  // movd_32_mbis_x
+  0,  // movd_32_mi32_x
+  0,  // movd_32_mpc32_x
+  0,  // movd_32_mr_x
+  0,  // movd_x_mB
+  0,  // movd_x_mB32
+  0,  // movd_x_mB8
+  0,  // movd_x_mbis
+  0,  // movd_x_mbis32
+  0,  // movd_x_mbis8
+  0,  // movd_x_mi32
+  0,  // movd_x_mpc32
+  0,  // movd_x_mr
+  0,  // movdqa_mB32_x
+  0,  // movdqa_mB8_x
+  0,  // movdqa_mB_x
+  0,  // movdqa_mbis32_x
+  0,  // movdqa_mbis8_x
+  0,  // movdqa_mbis_x
+  0,  // movdqa_mi32_x
+  0,  // movdqa_mpc32_x
+  0,  // movdqa_mx_x
+  0,  // movdqa_x_mB
+  0,  // movdqa_x_mB32
+  0,  // movdqa_x_mB8
+  0,  // movdqa_x_mbis
+  0,  // movdqa_x_mbis32
+  0,  // movdqa_x_mbis8
+  0,  // movdqa_x_mi32
+  0,  // movdqa_x_mpc32
+  0,  // movdqa_x_mx
+  0,  // movdqu_mB32_x
+  0,  // movdqu_mB8_x
+  0,  // movdqu_mB_x
+  0,  // movdqu_mbis32_x
+  0,  // movdqu_mbis8_x
+  0,  // movdqu_mbis_x
+  0,  // movdqu_mi32_x
+  0,  // movdqu_mpc32_x
+  0,  // movdqu_mx_x
+  0,  // movdqu_x_mB
+  0,  // movdqu_x_mB32
+  0,  // movdqu_x_mB8
+  0,  // movdqu_x_mbis
+  0,  // movdqu_x_mbis32
+  0,  // movdqu_x_mbis8
+  0,  // movdqu_x_mi32
+  0,  // movdqu_x_mpc32
+  0,  // movdqu_x_mx
+  0,  // movq_64_mB32_x
+  0,  // movq_64_mB8_x
+  0,  // movq_64_mB_x
+  0,  // movq_64_mbis32_x
+  0,  // movq_64_mbis8_x
+  0,  // movq_64_mbis_x
+  0,  // movq_64_mi32_x
+  0,  // movq_64_mpc32_x
+  0,  // movq_64_mr_x
+  0,  // movq_mB32_x
+  0,  // movq_mB8_x
+  0,  // movq_mB_x
+  0,  // movq_mbis32_x
+  0,  // movq_mbis8_x
+  0,  // movq_mbis_x
+  0,  // movq_mi32_x
+  0,  // movq_mpc32_x
+  0,  // movq_mx_x
+  0,  // movq_x_mB
+  0,  // movq_x_mB32
+  0,  // movq_x_mB32_alt
+  0,  // movq_x_mB8
+  0,  // movq_x_mB8_alt
+  0,  // movq_x_mB_alt
+  0,  // movq_x_mbis
+  0,  // movq_x_mbis32
+  0,  // movq_x_mbis32_alt
+  0,  // movq_x_mbis8
+  0,  // movq_x_mbis8_alt
+  0,  // movq_x_mbis_alt
+  0,  // movq_x_mi32
+  0,  // movq_x_mi32_alt
+  0,  // movq_x_mpc32
+  0,  // movq_x_mpc32_alt
+  0,  // movq_x_mr
+  0,  // movq_x_mx_alt
+  0,  // movsd_mB32_x
+  0,  // movsd_mB8_x
+  0,  // movsd_mB_x
+  0,  // movsd_mbis32_x
+  0,  // movsd_mbis8_x
+  0,  // movsd_mbis_x
+  0,  // movsd_mi32_x
+  0,  // movsd_mpc32_x
+  0,  // movsd_mx_x
+  0,  // movsd_x_mB
+  0,  // movsd_x_mB32
+  0,  // movsd_x_mB8
+  0,  // movsd_x_mbis
+  0,  // movsd_x_mbis32
+  0,  // movsd_x_mbis8
+  0,  // movsd_x_mi32
+  0,  // movsd_x_mpc32
+  0,  // movsd_x_mx
+  0,  // movss_mB32_x
+  0,  // movss_mB8_x
+  0,  // movss_mB_x
+  0,  // movss_mbis32_x
+  0,  // movss_mbis8_x
+  0,  // movss_mbis_x
+  0,  // movss_mi32_x
+  0,  // movss_mpc32_x
+  0,  // movss_mx_x
+  0,  // movss_x_mB
+  0,  // movss_x_mB32
+  0,  // movss_x_mB8
+  0,  // movss_x_mbis
+  0,  // movss_x_mbis32
+  0,  // movss_x_mbis8
+  0,  // movss_x_mi32
+  0,  // movss_x_mpc32
+  0,  // movss_x_mx
+  0,  // movsx_16_8_r_mB
+  0,  // movsx_16_8_r_mB32
+  0,  // movsx_16_8_r_mB8
+  0,  // movsx_16_8_r_mbis
+  0,  // movsx_16_8_r_mbis32
+  0,  // movsx_16_8_r_mbis8
+  0,  // movsx_16_8_r_mi32
+  0,  // movsx_16_8_r_mpc32
+  0,  // movsx_16_8_r_mr
+  0,  // movsx_32_16_r_mB
+  0,  // movsx_32_16_r_mB32
+  0,  // movsx_32_16_r_mB8
+  0,  // movsx_32_16_r_mbis
+  0,  // movsx_32_16_r_mbis32
+  0,  // movsx_32_16_r_mbis8
+  0,  // movsx_32_16_r_mi32
+  0,  // movsx_32_16_r_mpc32
+  0,  // movsx_32_16_r_mr
+  0,  // movsx_32_8_r_mB
+  0,  // movsx_32_8_r_mB32
+  0,  // movsx_32_8_r_mB8
+  0,  // movsx_32_8_r_mbis
+  0,  // movsx_32_8_r_mbis32
+  0,  // movsx_32_8_r_mbis8
+  0,  // movsx_32_8_r_mi32
+  0,  // movsx_32_8_r_mpc32
+  0,  // movsx_32_8_r_mr
+  0,  // movsx_64_16_r_mB
+  0,  // movsx_64_16_r_mB32
+  0,  // movsx_64_16_r_mB8
+  0,  // movsx_64_16_r_mbis
+  0,  // movsx_64_16_r_mbis32
+  0,  // movsx_64_16_r_mbis8
+  0,  // movsx_64_16_r_mi32
+  0,  // movsx_64_16_r_mpc32
+  0,  // movsx_64_16_r_mr
+  0,  // movsx_64_8_r_mB
+  0,  // movsx_64_8_r_mB32
+  0,  // movsx_64_8_r_mB8
+  0,  // movsx_64_8_r_mbis
+  0,  // movsx_64_8_r_mbis32
+  0,  // movsx_64_8_r_mbis8
+  0,  // movsx_64_8_r_mi32
+  0,  // movsx_64_8_r_mpc32
+  0,  // movsx_64_8_r_mr
+  0,  // movsxd_16_r_mB
+  0,  // movsxd_16_r_mB32
+  0,  // movsxd_16_r_mB8
+  0,  // movsxd_16_r_mbis
+  0,  // movsxd_16_r_mbis32
+  0,  // movsxd_16_r_mbis8
+  0,  // movsxd_16_r_mi32
+  0,  // movsxd_16_r_mpc32
+  0,  // movsxd_16_r_mr
+  0,  // movsxd_32_r_mB
+  0,  // movsxd_32_r_mB32
+  0,  // movsxd_32_r_mB8
+  0,  // movsxd_32_r_mbis
+  0,  // movsxd_32_r_mbis32
+  0,  // movsxd_32_r_mbis8
+  0,  // movsxd_32_r_mi32
+  0,  // movsxd_32_r_mpc32
+  0,  // movsxd_32_r_mr
+  0,  // movsxd_64_r_mB
+  0,  // movsxd_64_r_mB32
+  0,  // movsxd_64_r_mB8
+  0,  // movsxd_64_r_mbis
+  0,  // movsxd_64_r_mbis32
+  0,  // movsxd_64_r_mbis8
+  0,  // movsxd_64_r_mi32
+  0,  // movsxd_64_r_mpc32
+  0,  // movsxd_64_r_mr
+  0,  // movupd_mB32_x
+  0,  // movupd_mB8_x
+  0,  // movupd_mB_x
+  0,  // movupd_mbis32_x
+  0,  // movupd_mbis8_x
+  0,  // movupd_mbis_x
+  0,  // movupd_mi32_x
+  0,  // movupd_mpc32_x
+  0,  // movupd_mx_x
+  0,  // movupd_x_mB
+  0,  // movupd_x_mB32
+  0,  // movupd_x_mB8
+  0,  // movupd_x_mbis
+  0,  // movupd_x_mbis32
+  0,  // movupd_x_mbis8
+  0,  // movupd_x_mi32
+  0,  // movupd_x_mpc32
+  0,  // movupd_x_mx
+  0,  // movups_mB32_x
+  0,  // movups_mB8_x
+  0,  // movups_mB_x
+  0,  // movups_mbis32_x
+  0,  // movups_mbis8_x
+  0,  // movups_mbis_x
+  0,  // movups_mi32_x
+  0,  // movups_mpc32_x
+  0,  // movups_mx_x
+  0,  // movups_x_mB
+  0,  // movups_x_mB32
+  0,  // movups_x_mB8
+  0,  // movups_x_mbis
+  0,  // movups_x_mbis32
+  0,  // movups_x_mbis8
+  0,  // movups_x_mi32
+  0,  // movups_x_mpc32
+  0,  // movups_x_mx
+  0,  // movzx_16_8_r_mB
+  0,  // movzx_16_8_r_mB32
+  0,  // movzx_16_8_r_mB8
+  0,  // movzx_16_8_r_mbis
+  0,  // movzx_16_8_r_mbis32
+  0,  // movzx_16_8_r_mbis8
+  0,  // movzx_16_8_r_mi32
+  0,  // movzx_16_8_r_mpc32
+  0,  // movzx_16_8_r_mr
+  0,  // movzx_32_16_r_mB
+  0,  // movzx_32_16_r_mB32
+  0,  // movzx_32_16_r_mB8
+  0,  // movzx_32_16_r_mbis
+  0,  // movzx_32_16_r_mbis32
+  0,  // movzx_32_16_r_mbis8
+  0,  // movzx_32_16_r_mi32
+  0,  // movzx_32_16_r_mpc32
+  0,  // movzx_32_16_r_mr
+  0,  // movzx_32_8_r_mB
+  0,  // movzx_32_8_r_mB32
+  0,  // movzx_32_8_r_mB8
+  0,  // movzx_32_8_r_mbis
+  0,  // movzx_32_8_r_mbis32
+  0,  // movzx_32_8_r_mbis8
+  0,  // movzx_32_8_r_mi32
+  0,  // movzx_32_8_r_mpc32
+  0,  // movzx_32_8_r_mr
+  0,  // movzx_64_16_r_mB
+  0,  // movzx_64_16_r_mB32
+  0,  // movzx_64_16_r_mB8
+  0,  // movzx_64_16_r_mbis
+  0,  // movzx_64_16_r_mbis32
+  0,  // movzx_64_16_r_mbis8
+  0,  // movzx_64_16_r_mi32
+  0,  // movzx_64_16_r_mpc32
+  0,  // movzx_64_16_r_mr
+  0,  // movzx_64_8_r_mB
+  0,  // movzx_64_8_r_mB32
+  0,  // movzx_64_8_r_mB8
+  0,  // movzx_64_8_r_mbis
+  0,  // movzx_64_8_r_mbis32
+  0,  // movzx_64_8_r_mbis8
+  0,  // movzx_64_8_r_mi32
+  0,  // movzx_64_8_r_mpc32
+  0,  // movzx_64_8_r_mr
+  0,  // mulsd_x_mB
+  0,  // mulsd_x_mB32
+  0,  // mulsd_x_mB8
+  0,  // mulsd_x_mbis
+  0,  // mulsd_x_mbis32
+  0,  // mulsd_x_mbis8
+  0,  // mulsd_x_mi32
+  0,  // mulsd_x_mpc32
+  0,  // mulsd_x_mx
+  0,  // mulss_x_mB
+  0,  // mulss_x_mB32
+  0,  // mulss_x_mB8
+  0,  // mulss_x_mbis
+  0,  // mulss_x_mbis32
+  0,  // mulss_x_mbis8
+  0,  // mulss_x_mi32
+  0,  // mulss_x_mpc32
+  0,  // mulss_x_mx
+  2,  // neg_16_mB
+  2,  // neg_16_mB32
+  2,  // neg_16_mB8
+  2,  // neg_16_mbis
+  2,  // neg_16_mbis32
+  2,  // neg_16_mbis8
+  2,  // neg_16_mi32
+  2,  // neg_16_mpc32
+  2,  // neg_16_mr
+  2,  // neg_32_mB
+  2,  // neg_32_mB32
+  2,  // neg_32_mB8
+  2,  // neg_32_mbis
+  2,  // neg_32_mbis32
+  2,  // neg_32_mbis8
+  2,  // neg_32_mi32
+  2,  // neg_32_mpc32
+  2,  // neg_32_mr
+  2,  // neg_64_mB
+  2,  // neg_64_mB32
+  2,  // neg_64_mB8
+  2,  // neg_64_mbis
+  2,  // neg_64_mbis32
+  2,  // neg_64_mbis8
+  2,  // neg_64_mi32
+  2,  // neg_64_mpc32
+  2,  // neg_64_mr
+  2,  // neg_8_mB
+  2,  // neg_8_mB32
+  2,  // neg_8_mB8
+  2,  // neg_8_mbis
+  2,  // neg_8_mbis32
+  2,  // neg_8_mbis8
+  2,  // neg_8_mi32
+  2,  // neg_8_mpc32
+  2,  // neg_8_mr
+  0,  // not_16_mB
+  0,  // not_16_mB32
+  0,  // not_16_mB8
+  0,  // not_16_mbis
+  0,  // not_16_mbis32
+  0,  // not_16_mbis8
+  0,  // not_16_mi32
+  0,  // not_16_mpc32
+  0,  // not_16_mr
+  0,  // not_32_mB
+  0,  // not_32_mB32
+  0,  // not_32_mB8
+  0,  // not_32_mbis
+  0,  // not_32_mbis32
+  0,  // not_32_mbis8
+  0,  // not_32_mi32
+  0,  // not_32_mpc32
+  0,  // not_32_mr
+  0,  // not_64_mB
+  0,  // not_64_mB32
+  0,  // not_64_mB8
+  0,  // not_64_mbis
+  0,  // not_64_mbis32
+  0,  // not_64_mbis8
+  0,  // not_64_mi32
+  0,  // not_64_mpc32
+  0,  // not_64_mr
+  0,  // not_8_mB
+  0,  // not_8_mB32
+  0,  // not_8_mB8
+  0,  // not_8_mbis
+  0,  // not_8_mbis32
+  0,  // not_8_mbis8
+  0,  // not_8_mi32
+  0,  // not_8_mpc32
+  0,  // not_8_mr
+  2,  // or_16_ax_imm16
+  2,  // or_16_mB32_imm16
+  2,  // or_16_mB32_imm8
+  2,  // or_16_mB32_r
+  2,  // or_16_mB8_imm16
+  2,  // or_16_mB8_imm8
+  2,  // or_16_mB8_r
+  2,  // or_16_mB_imm16
+  2,  // or_16_mB_imm8
+  2,  // or_16_mB_r
+  2,  // or_16_mbis32_imm16
+  2,  // or_16_mbis32_imm8
+  2,  // or_16_mbis32_r
+  2,  // or_16_mbis8_imm16
+  2,  // or_16_mbis8_imm8
+  2,  // or_16_mbis8_r
+  2,  // or_16_mbis_imm16
+  2,  // or_16_mbis_imm8
+  2,  // or_16_mbis_r
+  2,  // or_16_mi32_imm16
+  2,  // or_16_mi32_imm8
+  2,  // or_16_mi32_r
+  2,  // or_16_mpc32_imm16
+  2,  // or_16_mpc32_imm8
+  2,  // or_16_mpc32_r
+  2,  // or_16_mr_imm16
+  2,  // or_16_mr_imm8
+  2,  // or_16_mr_r
+  2,  // or_16_r_mB
+  2,  // or_16_r_mB32
+  2,  // or_16_r_mB8
+  2,  // or_16_r_mbis
+  2,  // or_16_r_mbis32
+  2,  // or_16_r_mbis8
+  2,  // or_16_r_mi32
+  2,  // or_16_r_mpc32
+  2,  // or_16_r_mr
+  2,  // or_32_eax_imm32
+  2,  // or_32_mB32_imm32
+  2,  // or_32_mB32_imm8
+  2,  // or_32_mB32_r
+  2,  // or_32_mB8_imm32
+  2,  // or_32_mB8_imm8
+  2,  // or_32_mB8_r
+  2,  // or_32_mB_imm32
+  2,  // or_32_mB_imm8
+  2,  // or_32_mB_r
+  2,  // or_32_mbis32_imm32
+  2,  // or_32_mbis32_imm8
+  2,  // or_32_mbis32_r
+  2,  // or_32_mbis8_imm32
+  2,  // or_32_mbis8_imm8
+  2,  // or_32_mbis8_r
+  2,  // or_32_mbis_imm32
+  2,  // or_32_mbis_imm8
+  2,  // or_32_mbis_r
+  2,  // or_32_mi32_imm32
+  2,  // or_32_mi32_imm8
+  2,  // or_32_mi32_r
+  2,  // or_32_mpc32_imm32
+  2,  // or_32_mpc32_imm8
+  2,  // or_32_mpc32_r
+  2,  // or_32_mr_imm32
+  2,  // or_32_mr_imm8
+  2,  // or_32_mr_r
+  2,  // or_32_r_mB
+  2,  // or_32_r_mB32
+  2,  // or_32_r_mB8
+  2,  // or_32_r_mbis
+  2,  // or_32_r_mbis32
+  2,  // or_32_r_mbis8
+  2,  // or_32_r_mi32
+  2,  // or_32_r_mpc32
+  2,  // or_32_r_mr
+  2,  // or_64_mB32_imm32
+  2,  // or_64_mB32_imm8
+  2,  // or_64_mB32_r
+  2,  // or_64_mB8_imm32
+  2,  // or_64_mB8_imm8
+  2,  // or_64_mB8_r
+  2,  // or_64_mB_imm32
+  2,  // or_64_mB_imm8
+  2,  // or_64_mB_r
+  2,  // or_64_mbis32_imm32
+  2,  // or_64_mbis32_imm8
+  2,  // or_64_mbis32_r
+  2,  // or_64_mbis8_imm32
+  2,  // or_64_mbis8_imm8
+  2,  // or_64_mbis8_r
+  2,  // or_64_mbis_imm32
+  2,  // or_64_mbis_imm8
+  2,  // or_64_mbis_r
+  2,  // or_64_mi32_imm32
+  2,  // or_64_mi32_imm8
+  2,  // or_64_mi32_r
+  2,  // or_64_mpc32_imm32
+  2,  // or_64_mpc32_imm8
+  2,  // or_64_mpc32_r
+  2,  // or_64_mr_imm32
+  2,  // or_64_mr_imm8
+  2,  // or_64_mr_r
+  2,  // or_64_r_mB
+  2,  // or_64_r_mB32
+  2,  // or_64_r_mB8
+  2,  // or_64_r_mbis
+  2,  // or_64_r_mbis32
+  2,  // or_64_r_mbis8
+  2,  // or_64_r_mi32
+  2,  // or_64_r_mpc32
+  2,  // or_64_r_mr
+  2,  // or_64_rax_imm32
+  2,  // or_8_al_imm8
+  2,  // or_8_mB32_imm8
+  2,  // or_8_mB32_r
+  2,  // or_8_mB8_imm8
+  2,  // or_8_mB8_r
+  2,  // or_8_mB_imm8
+  2,  // or_8_mB_r
+  2,  // or_8_mbis32_imm8
+  2,  // or_8_mbis32_r
+  2,  // or_8_mbis8_imm8
+  2,  // or_8_mbis8_r
+  2,  // or_8_mbis_imm8
+  2,  // or_8_mbis_r
+  2,  // or_8_mi32_imm8
+  2,  // or_8_mi32_r
+  2,  // or_8_mpc32_imm8
+  2,  // or_8_mpc32_r
+  2,  // or_8_mr_imm8
+  2,  // or_8_mr_r
+  2,  // or_8_r_mB
+  2,  // or_8_r_mB32
+  2,  // or_8_r_mB8
+  2,  // or_8_r_mbis
+  2,  // or_8_r_mbis32
+  2,  // or_8_r_mbis8
+  2,  // or_8_r_mi32
+  2,  // or_8_r_mpc32
+  2,  // or_8_r_mr
+  0,  // pand_x_mB
+  0,  // pand_x_mB32
+  0,  // pand_x_mB8
+  0,  // pand_x_mbis
+  0,  // pand_x_mbis32
+  0,  // pand_x_mbis8
+  0,  // pand_x_mi32
+  0,  // pand_x_mpc32
+  0,  // pand_x_mx
+  0,  // pop_16_mB
+  0,  // pop_16_mB32
+  0,  // pop_16_mB8
+  0,  // pop_16_mbis
+  0,  // pop_16_mbis32
+  0,  // pop_16_mbis8
+  0,  // pop_16_mi32
+  0,  // pop_16_mpc32
+  0,  // pop_16_mr
+  0,  // pop_16_r
+  0,  // pop_64_mB
+  0,  // pop_64_mB32
+  0,  // pop_64_mB8
+  0,  // pop_64_mbis
+  0,  // pop_64_mbis32
+  0,  // pop_64_mbis8
+  0,  // pop_64_mi32
+  0,  // pop_64_mpc32
+  0,  // pop_64_mr
+  0,  // pop_64_r
+  2,  // popcnt_16_r_mB
+  2,  // popcnt_16_r_mB32
+  2,  // popcnt_16_r_mB8
+  2,  // popcnt_16_r_mbis
+  2,  // popcnt_16_r_mbis32
+  2,  // popcnt_16_r_mbis8
+  2,  // popcnt_16_r_mi32
+  2,  // popcnt_16_r_mpc32
+  2,  // popcnt_16_r_mr
+  2,  // popcnt_32_r_mB
+  2,  // popcnt_32_r_mB32
+  2,  // popcnt_32_r_mB8
+  2,  // popcnt_32_r_mbis
+  2,  // popcnt_32_r_mbis32
+  2,  // popcnt_32_r_mbis8
+  2,  // popcnt_32_r_mi32
+  2,  // popcnt_32_r_mpc32
+  2,  // popcnt_32_r_mr
+  2,  // popcnt_64_r_mB
+  2,  // popcnt_64_r_mB32
+  2,  // popcnt_64_r_mB8
+  2,  // popcnt_64_r_mbis
+  2,  // popcnt_64_r_mbis32
+  2,  // popcnt_64_r_mbis8
+  2,  // popcnt_64_r_mi32
+  2,  // popcnt_64_r_mpc32
+  2,  // popcnt_64_r_mr
+  0,  // por_x_mB
+  0,  // por_x_mB32
+  0,  // por_x_mB8
+  0,  // por_x_mbis
+  0,  // por_x_mbis32
+  0,  // por_x_mbis8
+  0,  // por_x_mi32
+  0,  // por_x_mpc32
+  0,  // por_x_mx
+  0,  // push_16_imm16
+  0,  // push_16_mB
+  0,  // push_16_mB32
+  0,  // push_16_mB8
+  0,  // push_16_mbis
+  0,  // push_16_mbis32
+  0,  // push_16_mbis8
+  0,  // push_16_mi32
+  0,  // push_16_mpc32
+  0,  // push_16_mr
+  0,  // push_16_r
+  0,  // push_64_imm32
+  0,  // push_64_imm8
+  0,  // push_64_mB
+  0,  // push_64_mB32
+  0,  // push_64_mB8
+  0,  // push_64_mbis
+  0,  // push_64_mbis32
+  0,  // push_64_mbis8
+  0,  // push_64_mi32
+  0,  // push_64_mpc32
+  0,  // push_64_mr
+  0,  // push_64_r
+  0,  // pxor_x_mB
+  0,  // pxor_x_mB32
+  0,  // pxor_x_mB8
+  0,  // pxor_x_mbis
+  0,  // pxor_x_mbis32
+  0,  // pxor_x_mbis8
+  0,  // pxor_x_mi32
+  0,  // pxor_x_mpc32
+  0,  // pxor_x_mx
+  0,  // ret
+  0,  // ret_imm16
+  0,  // rol_16_mB32_1
+  0,  // rol_16_mB32_cl
+  0,  // rol_16_mB32_imm8
+  0,  // rol_16_mB8_1
+  0,  // rol_16_mB8_cl
+  0,  // rol_16_mB8_imm8
+  0,  // rol_16_mB_1
+  0,  // rol_16_mB_cl
+  0,  // rol_16_mB_imm8
+  0,  // rol_16_mbis32_1
+  0,  // rol_16_mbis32_cl
+  0,  // rol_16_mbis32_imm8
+  0,  // rol_16_mbis8_1
+  0,  // rol_16_mbis8_cl
+  0,  // rol_16_mbis8_imm8
+  0,  // rol_16_mbis_1
+  0,  // rol_16_mbis_cl
+  0,  // rol_16_mbis_imm8
+  0,  // rol_16_mi32_1
+  0,  // rol_16_mi32_cl
+  0,  // rol_16_mi32_imm8
+  0,  // rol_16_mpc32_1
+  0,  // rol_16_mpc32_cl
+  0,  // rol_16_mpc32_imm8
+  0,  // rol_16_mr_1
+  0,  // rol_16_mr_cl
+  0,  // rol_16_mr_imm8
+  0,  // rol_32_mB32_1
+  0,  // rol_32_mB32_cl
+  0,  // rol_32_mB32_imm8
+  0,  // rol_32_mB8_1
+  0,  // rol_32_mB8_cl
+  0,  // rol_32_mB8_imm8
+  0,  // rol_32_mB_1
+  0,  // rol_32_mB_cl
+  0,  // rol_32_mB_imm8
+  0,  // rol_32_mbis32_1
+  0,  // rol_32_mbis32_cl
+  0,  // rol_32_mbis32_imm8
+  0,  // rol_32_mbis8_1
+  0,  // rol_32_mbis8_cl
+  0,  // rol_32_mbis8_imm8
+  0,  // rol_32_mbis_1
+  0,  // rol_32_mbis_cl
+  0,  // rol_32_mbis_imm8
+  0,  // rol_32_mi32_1
+  0,  // rol_32_mi32_cl
+  0,  // rol_32_mi32_imm8
+  0,  // rol_32_mpc32_1
+  0,  // rol_32_mpc32_cl
+  0,  // rol_32_mpc32_imm8
+  0,  // rol_32_mr_1
+  0,  // rol_32_mr_cl
+  0,  // rol_32_mr_imm8
+  0,  // rol_64_mB32_1
+  0,  // rol_64_mB32_cl
+  0,  // rol_64_mB32_imm8
+  0,  // rol_64_mB8_1
+  0,  // rol_64_mB8_cl
+  0,  // rol_64_mB8_imm8
+  0,  // rol_64_mB_1
+  0,  // rol_64_mB_cl
+  0,  // rol_64_mB_imm8
+  0,  // rol_64_mbis32_1
+  0,  // rol_64_mbis32_cl
+  0,  // rol_64_mbis32_imm8
+  0,  // rol_64_mbis8_1
+  0,  // rol_64_mbis8_cl
+  0,  // rol_64_mbis8_imm8
+  0,  // rol_64_mbis_1
+  0,  // rol_64_mbis_cl
+  0,  // rol_64_mbis_imm8
+  0,  // rol_64_mi32_1
+  0,  // rol_64_mi32_cl
+  0,  // rol_64_mi32_imm8
+  0,  // rol_64_mpc32_1
+  0,  // rol_64_mpc32_cl
+  0,  // rol_64_mpc32_imm8
+  0,  // rol_64_mr_1
+  0,  // rol_64_mr_cl
+  0,  // rol_64_mr_imm8
+  0,  // rol_8_mB32_1
+  0,  // rol_8_mB32_cl
+  0,  // rol_8_mB32_imm8
+  0,  // rol_8_mB8_1
+  0,  // rol_8_mB8_cl
+  0,  // rol_8_mB8_imm8
+  0,  // rol_8_mB_1
+  0,  // rol_8_mB_cl
+  0,  // rol_8_mB_imm8
+  0,  // rol_8_mbis32_1
+  0,  // rol_8_mbis32_cl
+  0,  // rol_8_mbis32_imm8
+  0,  // rol_8_mbis8_1
+  0,  // rol_8_mbis8_cl
+  0,  // rol_8_mbis8_imm8
+  0,  // rol_8_mbis_1
+  0,  // rol_8_mbis_cl
+  0,  // rol_8_mbis_imm8
+  0,  // rol_8_mi32_1
+  0,  // rol_8_mi32_cl
+  0,  // rol_8_mi32_imm8
+  0,  // rol_8_mpc32_1
+  0,  // rol_8_mpc32_cl
+  0,  // rol_8_mpc32_imm8
+  0,  // rol_8_mr_1
+  0,  // rol_8_mr_cl
+  0,  // rol_8_mr_imm8
+  0,  // ror_16_mB32_1
+  0,  // ror_16_mB32_cl
+  0,  // ror_16_mB32_imm8
+  0,  // ror_16_mB8_1
+  0,  // ror_16_mB8_cl
+  0,  // ror_16_mB8_imm8
+  0,  // ror_16_mB_1
+  0,  // ror_16_mB_cl
+  0,  // ror_16_mB_imm8
+  0,  // ror_16_mbis32_1
+  0,  // ror_16_mbis32_cl
+  0,  // ror_16_mbis32_imm8
+  0,  // ror_16_mbis8_1
+  0,  // ror_16_mbis8_cl
+  0,  // ror_16_mbis8_imm8
+  0,  // ror_16_mbis_1
+  0,  // ror_16_mbis_cl
+  0,  // ror_16_mbis_imm8
+  0,  // ror_16_mi32_1
+  0,  // ror_16_mi32_cl
+  0,  // ror_16_mi32_imm8
+  0,  // ror_16_mpc32_1
+  0,  // ror_16_mpc32_cl
+  0,  // ror_16_mpc32_imm8
+  0,  // ror_16_mr_1
+  0,  // ror_16_mr_cl
+  0,  // ror_16_mr_imm8
+  0,  // ror_32_mB32_1
+  0,  // ror_32_mB32_cl
+  0,  // ror_32_mB32_imm8
+  0,  // ror_32_mB8_1
+  0,  // ror_32_mB8_cl
+  0,  // ror_32_mB8_imm8
+  0,  // ror_32_mB_1
+  0,  // ror_32_mB_cl
+  0,  // ror_32_mB_imm8
+  0,  // ror_32_mbis32_1
+  0,  // ror_32_mbis32_cl
+  0,  // ror_32_mbis32_imm8
+  0,  // ror_32_mbis8_1
+  0,  // ror_32_mbis8_cl
+  0,  // ror_32_mbis8_imm8
+  0,  // ror_32_mbis_1
+  0,  // ror_32_mbis_cl
+  0,  // ror_32_mbis_imm8
+  0,  // ror_32_mi32_1
+  0,  // ror_32_mi32_cl
+  0,  // ror_32_mi32_imm8
+  0,  // ror_32_mpc32_1
+  0,  // ror_32_mpc32_cl
+  0,  // ror_32_mpc32_imm8
+  0,  // ror_32_mr_1
+  0,  // ror_32_mr_cl
+  0,  // ror_32_mr_imm8
+  0,  // ror_64_mB32_1
+  0,  // ror_64_mB32_cl
+  0,  // ror_64_mB32_imm8
+  0,  // ror_64_mB8_1
+  0,  // ror_64_mB8_cl
+  0,  // ror_64_mB8_imm8
+  0,  // ror_64_mB_1
+  0,  // ror_64_mB_cl
+  0,  // ror_64_mB_imm8
+  0,  // ror_64_mbis32_1
+  0,  // ror_64_mbis32_cl
+  0,  // ror_64_mbis32_imm8
+  0,  // ror_64_mbis8_1
+  0,  // ror_64_mbis8_cl
+  0,  // ror_64_mbis8_imm8
+  0,  // ror_64_mbis_1
+  0,  // ror_64_mbis_cl
+  0,  // ror_64_mbis_imm8
+  0,  // ror_64_mi32_1
+  0,  // ror_64_mi32_cl
+  0,  // ror_64_mi32_imm8
+  0,  // ror_64_mpc32_1
+  0,  // ror_64_mpc32_cl
+  0,  // ror_64_mpc32_imm8
+  0,  // ror_64_mr_1
+  0,  // ror_64_mr_cl
+  0,  // ror_64_mr_imm8
+  0,  // ror_8_mB32_1
+  0,  // ror_8_mB32_cl
+  0,  // ror_8_mB32_imm8
+  0,  // ror_8_mB8_1
+  0,  // ror_8_mB8_cl
+  0,  // ror_8_mB8_imm8
+  0,  // ror_8_mB_1
+  0,  // ror_8_mB_cl
+  0,  // ror_8_mB_imm8
+  0,  // ror_8_mbis32_1
+  0,  // ror_8_mbis32_cl
+  0,  // ror_8_mbis32_imm8
+  0,  // ror_8_mbis8_1
+  0,  // ror_8_mbis8_cl
+  0,  // ror_8_mbis8_imm8
+  0,  // ror_8_mbis_1
+  0,  // ror_8_mbis_cl
+  0,  // ror_8_mbis_imm8
+  0,  // ror_8_mi32_1
+  0,  // ror_8_mi32_cl
+  0,  // ror_8_mi32_imm8
+  0,  // ror_8_mpc32_1
+  0,  // ror_8_mpc32_cl
+  0,  // ror_8_mpc32_imm8
+  0,  // ror_8_mr_1
+  0,  // ror_8_mr_cl
+  0,  // ror_8_mr_imm8
+  0,  // sar_16_mB32_1
+  0,  // sar_16_mB32_cl
+  0,  // sar_16_mB32_imm8
+  0,  // sar_16_mB8_1
+  0,  // sar_16_mB8_cl
+  0,  // sar_16_mB8_imm8
+  0,  // sar_16_mB_1
+  0,  // sar_16_mB_cl
+  0,  // sar_16_mB_imm8
+  0,  // sar_16_mbis32_1
+  0,  // sar_16_mbis32_cl
+  0,  // sar_16_mbis32_imm8
+  0,  // sar_16_mbis8_1
+  0,  // sar_16_mbis8_cl
+  0,  // sar_16_mbis8_imm8
+  0,  // sar_16_mbis_1
+  0,  // sar_16_mbis_cl
+  0,  // sar_16_mbis_imm8
+  0,  // sar_16_mi32_1
+  0,  // sar_16_mi32_cl
+  0,  // sar_16_mi32_imm8
+  0,  // sar_16_mpc32_1
+  0,  // sar_16_mpc32_cl
+  0,  // sar_16_mpc32_imm8
+  0,  // sar_16_mr_1
+  0,  // sar_16_mr_cl
+  0,  // sar_16_mr_imm8
+  0,  // sar_32_mB32_1
+  0,  // sar_32_mB32_cl
+  0,  // sar_32_mB32_imm8
+  0,  // sar_32_mB8_1
+  0,  // sar_32_mB8_cl
+  0,  // sar_32_mB8_imm8
+  0,  // sar_32_mB_1
+  0,  // sar_32_mB_cl
+  0,  // sar_32_mB_imm8
+  0,  // sar_32_mbis32_1
+  0,  // sar_32_mbis32_cl
+  0,  // sar_32_mbis32_imm8
+  0,  // sar_32_mbis8_1
+  0,  // sar_32_mbis8_cl
+  0,  // sar_32_mbis8_imm8
+  0,  // sar_32_mbis_1
+  0,  // sar_32_mbis_cl
+  0,  // sar_32_mbis_imm8
+  0,  // sar_32_mi32_1
+  0,  // sar_32_mi32_cl
+  0,  // sar_32_mi32_imm8
+  0,  // sar_32_mpc32_1
+  0,  // sar_32_mpc32_cl
+  0,  // sar_32_mpc32_imm8
+  0,  // sar_32_mr_1
+  0,  // sar_32_mr_cl
+  0,  // sar_32_mr_imm8
+  0,  // sar_64_mB32_1
+  0,  // sar_64_mB32_cl
+  0,  // sar_64_mB32_imm8
+  0,  // sar_64_mB8_1
+  0,  // sar_64_mB8_cl
+  0,  // sar_64_mB8_imm8
+  0,  // sar_64_mB_1
+  0,  // sar_64_mB_cl
+  0,  // sar_64_mB_imm8
+  0,  // sar_64_mbis32_1
+  0,  // sar_64_mbis32_cl
+  0,  // sar_64_mbis32_imm8
+  0,  // sar_64_mbis8_1
+  0,  // sar_64_mbis8_cl
+  0,  // sar_64_mbis8_imm8
+  0,  // sar_64_mbis_1
+  0,  // sar_64_mbis_cl
+  0,  // sar_64_mbis_imm8
+  0,  // sar_64_mi32_1
+  0,  // sar_64_mi32_cl
+  0,  // sar_64_mi32_imm8
+  0,  // sar_64_mpc32_1
+  0,  // sar_64_mpc32_cl
+  0,  // sar_64_mpc32_imm8
+  0,  // sar_64_mr_1
+  0,  // sar_64_mr_cl
+  0,  // sar_64_mr_imm8
+  0,  // sar_8_mB32_1
+  0,  // sar_8_mB32_cl
+  0,  // sar_8_mB32_imm8
+  0,  // sar_8_mB8_1
+  0,  // sar_8_mB8_cl
+  0,  // sar_8_mB8_imm8
+  0,  // sar_8_mB_1
+  0,  // sar_8_mB_cl
+  0,  // sar_8_mB_imm8
+  0,  // sar_8_mbis32_1
+  0,  // sar_8_mbis32_cl
+  0,  // sar_8_mbis32_imm8
+  0,  // sar_8_mbis8_1
+  0,  // sar_8_mbis8_cl
+  0,  // sar_8_mbis8_imm8
+  0,  // sar_8_mbis_1
+  0,  // sar_8_mbis_cl
+  0,  // sar_8_mbis_imm8
+  0,  // sar_8_mi32_1
+  0,  // sar_8_mi32_cl
+  0,  // sar_8_mi32_imm8
+  0,  // sar_8_mpc32_1
+  0,  // sar_8_mpc32_cl
+  0,  // sar_8_mpc32_imm8
+  0,  // sar_8_mr_1
+  0,  // sar_8_mr_cl
+  0,  // sar_8_mr_imm8
+  1,  // seta_8_mB
+  1,  // seta_8_mB32
+  1,  // seta_8_mB8
+  1,  // seta_8_mbis
+  1,  // seta_8_mbis32
+  1,  // seta_8_mbis8
+  1,  // seta_8_mi32
+  1,  // seta_8_mpc32
+  1,  // seta_8_mr
+  1,  // setae_8_mB
+  1,  // setae_8_mB32
+  1,  // setae_8_mB8
+  1,  // setae_8_mbis
+  1,  // setae_8_mbis32
+  1,  // setae_8_mbis8
+  1,  // setae_8_mi32
+  1,  // setae_8_mpc32
+  1,  // setae_8_mr
+  1,  // setb_8_mB
+  1,  // setb_8_mB32
+  1,  // setb_8_mB8
+  1,  // setb_8_mbis
+  1,  // setb_8_mbis32
+  1,  // setb_8_mbis8
+  1,  // setb_8_mi32
+  1,  // setb_8_mpc32
+  1,  // setb_8_mr
+  1,  // setbe_8_mB
+  1,  // setbe_8_mB32
+  1,  // setbe_8_mB8
+  1,  // setbe_8_mbis
+  1,  // setbe_8_mbis32
+  1,  // setbe_8_mbis8
+  1,  // setbe_8_mi32
+  1,  // setbe_8_mpc32
+  1,  // setbe_8_mr
+  1,  // sete_8_mB
+  1,  // sete_8_mB32
+  1,  // sete_8_mB8
+  1,  // sete_8_mbis
+  1,  // sete_8_mbis32
+  1,  // sete_8_mbis8
+  1,  // sete_8_mi32
+  1,  // sete_8_mpc32
+  1,  // sete_8_mr
+  1,  // setg_8_mB
+  1,  // setg_8_mB32
+  1,  // setg_8_mB8
+  1,  // setg_8_mbis
+  1,  // setg_8_mbis32
+  1,  // setg_8_mbis8
+  1,  // setg_8_mi32
+  1,  // setg_8_mpc32
+  1,  // setg_8_mr
+  1,  // setge_8_mB
+  1,  // setge_8_mB32
+  1,  // setge_8_mB8
+  1,  // setge_8_mbis
+  1,  // setge_8_mbis32
+  1,  // setge_8_mbis8
+  1,  // setge_8_mi32
+  1,  // setge_8_mpc32
+  1,  // setge_8_mr
+  1,  // setl_8_mB
+  1,  // setl_8_mB32
+  1,  // setl_8_mB8
+  1,  // setl_8_mbis
+  1,  // setl_8_mbis32
+  1,  // setl_8_mbis8
+  1,  // setl_8_mi32
+  1,  // setl_8_mpc32
+  1,  // setl_8_mr
+  1,  // setle_8_mB
+  1,  // setle_8_mB32
+  1,  // setle_8_mB8
+  1,  // setle_8_mbis
+  1,  // setle_8_mbis32
+  1,  // setle_8_mbis8
+  1,  // setle_8_mi32
+  1,  // setle_8_mpc32
+  1,  // setle_8_mr
+  1,  // setne_8_mB
+  1,  // setne_8_mB32
+  1,  // setne_8_mB8
+  1,  // setne_8_mbis
+  1,  // setne_8_mbis32
+  1,  // setne_8_mbis8
+  1,  // setne_8_mi32
+  1,  // setne_8_mpc32
+  1,  // setne_8_mr
+  1,  // setno_8_mB
+  1,  // setno_8_mB32
+  1,  // setno_8_mB8
+  1,  // setno_8_mbis
+  1,  // setno_8_mbis32
+  1,  // setno_8_mbis8
+  1,  // setno_8_mi32
+  1,  // setno_8_mpc32
+  1,  // setno_8_mr
+  1,  // setnp_8_mB
+  1,  // setnp_8_mB32
+  1,  // setnp_8_mB8
+  1,  // setnp_8_mbis
+  1,  // setnp_8_mbis32
+  1,  // setnp_8_mbis8
+  1,  // setnp_8_mi32
+  1,  // setnp_8_mpc32
+  1,  // setnp_8_mr
+  1,  // setns_8_mB
+  1,  // setns_8_mB32
+  1,  // setns_8_mB8
+  1,  // setns_8_mbis
+  1,  // setns_8_mbis32
+  1,  // setns_8_mbis8
+  1,  // setns_8_mi32
+  1,  // setns_8_mpc32
+  1,  // setns_8_mr
+  1,  // seto_8_mB
+  1,  // seto_8_mB32
+  1,  // seto_8_mB8
+  1,  // seto_8_mbis
+  1,  // seto_8_mbis32
+  1,  // seto_8_mbis8
+  1,  // seto_8_mi32
+  1,  // seto_8_mpc32
+  1,  // seto_8_mr
+  1,  // setp_8_mB
+  1,  // setp_8_mB32
+  1,  // setp_8_mB8
+  1,  // setp_8_mbis
+  1,  // setp_8_mbis32
+  1,  // setp_8_mbis8
+  1,  // setp_8_mi32
+  1,  // setp_8_mpc32
+  1,  // setp_8_mr
+  1,  // sets_8_mB
+  1,  // sets_8_mB32
+  1,  // sets_8_mB8
+  1,  // sets_8_mbis
+  1,  // sets_8_mbis32
+  1,  // sets_8_mbis8
+  1,  // sets_8_mi32
+  1,  // sets_8_mpc32
+  1,  // sets_8_mr
+  0,  // shl_16_mB32_1
+  0,  // shl_16_mB32_cl
+  0,  // shl_16_mB32_imm8
+  0,  // shl_16_mB8_1
+  0,  // shl_16_mB8_cl
+  0,  // shl_16_mB8_imm8
+  0,  // shl_16_mB_1
+  0,  // shl_16_mB_cl
+  0,  // shl_16_mB_imm8
+  0,  // shl_16_mbis32_1
+  0,  // shl_16_mbis32_cl
+  0,  // shl_16_mbis32_imm8
+  0,  // shl_16_mbis8_1
+  0,  // shl_16_mbis8_cl
+  0,  // shl_16_mbis8_imm8
+  0,  // shl_16_mbis_1
+  0,  // shl_16_mbis_cl
+  0,  // shl_16_mbis_imm8
+  0,  // shl_16_mi32_1
+  0,  // shl_16_mi32_cl
+  0,  // shl_16_mi32_imm8
+  0,  // shl_16_mpc32_1
+  0,  // shl_16_mpc32_cl
+  0,  // shl_16_mpc32_imm8
+  0,  // shl_16_mr_1
+  0,  // shl_16_mr_cl
+  0,  // shl_16_mr_imm8
+  0,  // shl_32_mB32_1
+  0,  // shl_32_mB32_cl
+  0,  // shl_32_mB32_imm8
+  0,  // shl_32_mB8_1
+  0,  // shl_32_mB8_cl
+  0,  // shl_32_mB8_imm8
+  0,  // shl_32_mB_1
+  0,  // shl_32_mB_cl
+  0,  // shl_32_mB_imm8
+  0,  // shl_32_mbis32_1
+  0,  // shl_32_mbis32_cl
+  0,  // shl_32_mbis32_imm8
+  0,  // shl_32_mbis8_1
+  0,  // shl_32_mbis8_cl
+  0,  // shl_32_mbis8_imm8
+  0,  // shl_32_mbis_1
+  0,  // shl_32_mbis_cl
+  0,  // shl_32_mbis_imm8
+  0,  // shl_32_mi32_1
+  0,  // shl_32_mi32_cl
+  0,  // shl_32_mi32_imm8
+  0,  // shl_32_mpc32_1
+  0,  // shl_32_mpc32_cl
+  0,  // shl_32_mpc32_imm8
+  0,  // shl_32_mr_1
+  0,  // shl_32_mr_cl
+  0,  // shl_32_mr_imm8
+  0,  // shl_64_mB32_1
+  0,  // shl_64_mB32_cl
+  0,  // shl_64_mB32_imm8
+  0,  // shl_64_mB8_1
+  0,  // shl_64_mB8_cl
+  0,  // shl_64_mB8_imm8
+  0,  // shl_64_mB_1
+  0,  // shl_64_mB_cl
+  0,  // shl_64_mB_imm8
+  0,  // shl_64_mbis32_1
+  0,  // shl_64_mbis32_cl
+  0,  // shl_64_mbis32_imm8
+  0,  // shl_64_mbis8_1
+  0,  // shl_64_mbis8_cl
+  0,  // shl_64_mbis8_imm8
+  0,  // shl_64_mbis_1
+  0,  // shl_64_mbis_cl
+  0,  // shl_64_mbis_imm8
+  0,  // shl_64_mi32_1
+  0,  // shl_64_mi32_cl
+  0,  // shl_64_mi32_imm8
+  0,  // shl_64_mpc32_1
+  0,  // shl_64_mpc32_cl
+  0,  // shl_64_mpc32_imm8
+  0,  // shl_64_mr_1
+  0,  // shl_64_mr_cl
+  0,  // shl_64_mr_imm8
+  0,  // shl_8_mB32_1
+  0,  // shl_8_mB32_cl
+  0,  // shl_8_mB32_imm8
+  0,  // shl_8_mB8_1
+  0,  // shl_8_mB8_cl
+  0,  // shl_8_mB8_imm8
+  0,  // shl_8_mB_1
+  0,  // shl_8_mB_cl
+  0,  // shl_8_mB_imm8
+  0,  // shl_8_mbis32_1
+  0,  // shl_8_mbis32_cl
+  0,  // shl_8_mbis32_imm8
+  0,  // shl_8_mbis8_1
+  0,  // shl_8_mbis8_cl
+  0,  // shl_8_mbis8_imm8
+  0,  // shl_8_mbis_1
+  0,  // shl_8_mbis_cl
+  0,  // shl_8_mbis_imm8
+  0,  // shl_8_mi32_1
+  0,  // shl_8_mi32_cl
+  0,  // shl_8_mi32_imm8
+  0,  // shl_8_mpc32_1
+  0,  // shl_8_mpc32_cl
+  0,  // shl_8_mpc32_imm8
+  0,  // shl_8_mr_1
+  0,  // shl_8_mr_cl
+  0,  // shl_8_mr_imm8
+  0,  // shr_16_mB32_1
+  0,  // shr_16_mB32_cl
+  0,  // shr_16_mB32_imm8
+  0,  // shr_16_mB8_1
+  0,  // shr_16_mB8_cl
+  0,  // shr_16_mB8_imm8
+  0,  // shr_16_mB_1
+  0,  // shr_16_mB_cl
+  0,  // shr_16_mB_imm8
+  0,  // shr_16_mbis32_1
+  0,  // shr_16_mbis32_cl
+  0,  // shr_16_mbis32_imm8
+  0,  // shr_16_mbis8_1
+  0,  // shr_16_mbis8_cl
+  0,  // shr_16_mbis8_imm8
+  0,  // shr_16_mbis_1
+  0,  // shr_16_mbis_cl
+  0,  // shr_16_mbis_imm8
+  0,  // shr_16_mi32_1
+  0,  // shr_16_mi32_cl
+  0,  // shr_16_mi32_imm8
+  0,  // shr_16_mpc32_1
+  0,  // shr_16_mpc32_cl
+  0,  // shr_16_mpc32_imm8
+  0,  // shr_16_mr_1
+  0,  // shr_16_mr_cl
+  0,  // shr_16_mr_imm8
+  0,  // shr_32_mB32_1
+  0,  // shr_32_mB32_cl
+  0,  // shr_32_mB32_imm8
+  0,  // shr_32_mB8_1
+  0,  // shr_32_mB8_cl
+  0,  // shr_32_mB8_imm8
+  0,  // shr_32_mB_1
+  0,  // shr_32_mB_cl
+  0,  // shr_32_mB_imm8
+  0,  // shr_32_mbis32_1
+  0,  // shr_32_mbis32_cl
+  0,  // shr_32_mbis32_imm8
+  0,  // shr_32_mbis8_1
+  0,  // shr_32_mbis8_cl
+  0,  // shr_32_mbis8_imm8
+  0,  // shr_32_mbis_1
+  0,  // shr_32_mbis_cl
+  0,  // shr_32_mbis_imm8
+  0,  // shr_32_mi32_1
+  0,  // shr_32_mi32_cl
+  0,  // shr_32_mi32_imm8
+  0,  // shr_32_mpc32_1
+  0,  // shr_32_mpc32_cl
+  0,  // shr_32_mpc32_imm8
+  0,  // shr_32_mr_1
+  0,  // shr_32_mr_cl
+  0,  // shr_32_mr_imm8
+  0,  // shr_64_mB32_1
+  0,  // shr_64_mB32_cl
+  0,  // shr_64_mB32_imm8
+  0,  // shr_64_mB8_1
+  0,  // shr_64_mB8_cl
+  0,  // shr_64_mB8_imm8
+  0,  // shr_64_mB_1
+  0,  // shr_64_mB_cl
+  0,  // shr_64_mB_imm8
+  0,  // shr_64_mbis32_1
+  0,  // shr_64_mbis32_cl
+  0,  // shr_64_mbis32_imm8
+  0,  // shr_64_mbis8_1
+  0,  // shr_64_mbis8_cl
+  0,  // shr_64_mbis8_imm8
+  0,  // shr_64_mbis_1
+  0,  // shr_64_mbis_cl
+  0,  // shr_64_mbis_imm8
+  0,  // shr_64_mi32_1
+  0,  // shr_64_mi32_cl
+  0,  // shr_64_mi32_imm8
+  0,  // shr_64_mpc32_1
+  0,  // shr_64_mpc32_cl
+  0,  // shr_64_mpc32_imm8
+  0,  // shr_64_mr_1
+  0,  // shr_64_mr_cl
+  0,  // shr_64_mr_imm8
+  0,  // shr_8_mB32_1
+  0,  // shr_8_mB32_cl
+  0,  // shr_8_mB32_imm8
+  0,  // shr_8_mB8_1
+  0,  // shr_8_mB8_cl
+  0,  // shr_8_mB8_imm8
+  0,  // shr_8_mB_1
+  0,  // shr_8_mB_cl
+  0,  // shr_8_mB_imm8
+  0,  // shr_8_mbis32_1
+  0,  // shr_8_mbis32_cl
+  0,  // shr_8_mbis32_imm8
+  0,  // shr_8_mbis8_1
+  0,  // shr_8_mbis8_cl
+  0,  // shr_8_mbis8_imm8
+  0,  // shr_8_mbis_1
+  0,  // shr_8_mbis_cl
+  0,  // shr_8_mbis_imm8
+  0,  // shr_8_mi32_1
+  0,  // shr_8_mi32_cl
+  0,  // shr_8_mi32_imm8
+  0,  // shr_8_mpc32_1
+  0,  // shr_8_mpc32_cl
+  0,  // shr_8_mpc32_imm8
+  0,  // shr_8_mr_1
+  0,  // shr_8_mr_cl
+  0,  // shr_8_mr_imm8
+  0,  // sqrtsd_x_mB
+  0,  // sqrtsd_x_mB32
+  0,  // sqrtsd_x_mB8
+  0,  // sqrtsd_x_mbis
+  0,  // sqrtsd_x_mbis32
+  0,  // sqrtsd_x_mbis8
+  0,  // sqrtsd_x_mi32
+  0,  // sqrtsd_x_mpc32
+  0,  // sqrtsd_x_mx
+  0,  // sqrtss_x_mB
+  0,  // sqrtss_x_mB32
+  0,  // sqrtss_x_mB8
+  0,  // sqrtss_x_mbis
+  0,  // sqrtss_x_mbis32
+  0,  // sqrtss_x_mbis8
+  0,  // sqrtss_x_mi32
+  0,  // sqrtss_x_mpc32
+  0,  // sqrtss_x_mx
+  0,  // stmxcsr_32_mB
+  0,  // stmxcsr_32_mB32
+  0,  // stmxcsr_32_mB8
+  0,  // stmxcsr_32_mbis
+  0,  // stmxcsr_32_mbis32
+  0,  // stmxcsr_32_mbis8
+  0,  // stmxcsr_32_mi32
+  0,  // stmxcsr_32_mpc32
+  0,  // stmxcsr_32_mr
+  2,  // sub_16_ax_imm16
+  2,  // sub_16_mB32_imm16
+  2,  // sub_16_mB32_imm8
+  2,  // sub_16_mB32_r
+  2,  // sub_16_mB8_imm16
+  2,  // sub_16_mB8_imm8
+  2,  // sub_16_mB8_r
+  2,  // sub_16_mB_imm16
+  2,  // sub_16_mB_imm8
+  2,  // sub_16_mB_r
+  2,  // sub_16_mbis32_imm16
+  2,  // sub_16_mbis32_imm8
+  2,  // sub_16_mbis32_r
+  2,  // sub_16_mbis8_imm16
+  2,  // sub_16_mbis8_imm8
+  2,  // sub_16_mbis8_r
+  2,  // sub_16_mbis_imm16
+  2,  // sub_16_mbis_imm8
+  2,  // sub_16_mbis_r
+  2,  // sub_16_mi32_imm16
+  2,  // sub_16_mi32_imm8
+  2,  // sub_16_mi32_r
+  2,  // sub_16_mpc32_imm16
+  2,  // sub_16_mpc32_imm8
+  2,  // sub_16_mpc32_r
+  2,  // sub_16_mr_imm16
+  2,  // sub_16_mr_imm8
+  2,  // sub_16_mr_r
+  2,  // sub_16_r_mB
+  2,  // sub_16_r_mB32
+  2,  // sub_16_r_mB8
+  2,  // sub_16_r_mbis
+  2,  // sub_16_r_mbis32
+  2,  // sub_16_r_mbis8
+  2,  // sub_16_r_mi32
+  2,  // sub_16_r_mpc32
+  2,  // sub_16_r_mr
+  2,  // sub_32_eax_imm32
+  2,  // sub_32_mB32_imm32
+  2,  // sub_32_mB32_imm8
+  2,  // sub_32_mB32_r
+  2,  // sub_32_mB8_imm32
+  2,  // sub_32_mB8_imm8
+  2,  // sub_32_mB8_r
+  2,  // sub_32_mB_imm32
+  2,  // sub_32_mB_imm8
+  2,  // sub_32_mB_r
+  2,  // sub_32_mbis32_imm32
+  2,  // sub_32_mbis32_imm8
+  2,  // sub_32_mbis32_r
+  2,  // sub_32_mbis8_imm32
+  2,  // sub_32_mbis8_imm8
+  2,  // sub_32_mbis8_r
+  2,  // sub_32_mbis_imm32
+  2,  // sub_32_mbis_imm8
+  2,  // sub_32_mbis_r
+  2,  // sub_32_mi32_imm32
+  2,  // sub_32_mi32_imm8
+  2,  // sub_32_mi32_r
+  2,  // sub_32_mpc32_imm32
+  2,  // sub_32_mpc32_imm8
+  2,  // sub_32_mpc32_r
+  2,  // sub_32_mr_imm32
+  2,  // sub_32_mr_imm8
+  2,  // sub_32_mr_r
+  2,  // sub_32_r_mB
+  2,  // sub_32_r_mB32
+  2,  // sub_32_r_mB8
+  2,  // sub_32_r_mbis
+  2,  // sub_32_r_mbis32
+  2,  // sub_32_r_mbis8
+  2,  // sub_32_r_mi32
+  2,  // sub_32_r_mpc32
+  2,  // sub_32_r_mr
+  2,  // sub_64_mB32_imm32
+  2,  // sub_64_mB32_imm8
+  2,  // sub_64_mB32_r
+  2,  // sub_64_mB8_imm32
+  2,  // sub_64_mB8_imm8
+  2,  // sub_64_mB8_r
+  2,  // sub_64_mB_imm32
+  2,  // sub_64_mB_imm8
+  2,  // sub_64_mB_r
+  2,  // sub_64_mbis32_imm32
+  2,  // sub_64_mbis32_imm8
+  2,  // sub_64_mbis32_r
+  2,  // sub_64_mbis8_imm32
+  2,  // sub_64_mbis8_imm8
+  2,  // sub_64_mbis8_r
+  2,  // sub_64_mbis_imm32
+  2,  // sub_64_mbis_imm8
+  2,  // sub_64_mbis_r
+  2,  // sub_64_mi32_imm32
+  2,  // sub_64_mi32_imm8
+  2,  // sub_64_mi32_r
+  2,  // sub_64_mpc32_imm32
+  2,  // sub_64_mpc32_imm8
+  2,  // sub_64_mpc32_r
+  2,  // sub_64_mr_imm32
+  2,  // sub_64_mr_imm8
+  2,  // sub_64_mr_r
+  2,  // sub_64_r_mB
+  2,  // sub_64_r_mB32
+  2,  // sub_64_r_mB8
+  2,  // sub_64_r_mbis
+  2,  // sub_64_r_mbis32
+  2,  // sub_64_r_mbis8
+  2,  // sub_64_r_mi32
+  2,  // sub_64_r_mpc32
+  2,  // sub_64_r_mr
+  2,  // sub_64_rax_imm32
+  2,  // sub_8_al_imm8
+  2,  // sub_8_mB32_imm8
+  2,  // sub_8_mB32_r
+  2,  // sub_8_mB8_imm8
+  2,  // sub_8_mB8_r
+  2,  // sub_8_mB_imm8
+  2,  // sub_8_mB_r
+  2,  // sub_8_mbis32_imm8
+  2,  // sub_8_mbis32_r
+  2,  // sub_8_mbis8_imm8
+  2,  // sub_8_mbis8_r
+  2,  // sub_8_mbis_imm8
+  2,  // sub_8_mbis_r
+  2,  // sub_8_mi32_imm8
+  2,  // sub_8_mi32_r
+  2,  // sub_8_mpc32_imm8
+  2,  // sub_8_mpc32_r
+  2,  // sub_8_mr_imm8
+  2,  // sub_8_mr_r
+  2,  // sub_8_r_mB
+  2,  // sub_8_r_mB32
+  2,  // sub_8_r_mB8
+  2,  // sub_8_r_mbis
+  2,  // sub_8_r_mbis32
+  2,  // sub_8_r_mbis8
+  2,  // sub_8_r_mi32
+  2,  // sub_8_r_mpc32
+  2,  // sub_8_r_mr
+  0,  // subsd_x_mB
+  0,  // subsd_x_mB32
+  0,  // subsd_x_mB8
+  0,  // subsd_x_mbis
+  0,  // subsd_x_mbis32
+  0,  // subsd_x_mbis8
+  0,  // subsd_x_mi32
+  0,  // subsd_x_mpc32
+  0,  // subsd_x_mx
+  0,  // subss_x_mB
+  0,  // subss_x_mB32
+  0,  // subss_x_mB8
+  0,  // subss_x_mbis
+  0,  // subss_x_mbis32
+  0,  // subss_x_mbis8
+  0,  // subss_x_mi32
+  0,  // subss_x_mpc32
+  0,  // subss_x_mx
+  0,  // syscall
+  2,  // test_16_ax_imm16
+  2,  // test_16_mB32_imm16
+  2,  // test_16_mB32_r
+  2,  // test_16_mB8_imm16
+  2,  // test_16_mB8_r
+  2,  // test_16_mB_imm16
+  2,  // test_16_mB_r
+  2,  // test_16_mbis32_imm16
+  2,  // test_16_mbis32_r
+  2,  // test_16_mbis8_imm16
+  2,  // test_16_mbis8_r
+  2,  // test_16_mbis_imm16
+  2,  // test_16_mbis_r
+  2,  // test_16_mi32_imm16
+  2,  // test_16_mi32_r
+  2,  // test_16_mpc32_imm16
+  2,  // test_16_mpc32_r
+  2,  // test_16_mr_imm16
+  2,  // test_16_mr_r
+  2,  // test_32_eax_imm32
+  2,  // test_32_mB32_imm32
+  2,  // test_32_mB32_r
+  2,  // test_32_mB8_imm32
+  2,  // test_32_mB8_r
+  2,  // test_32_mB_imm32
+  2,  // test_32_mB_r
+  2,  // test_32_mbis32_imm32
+  2,  // test_32_mbis32_r
+  2,  // test_32_mbis8_imm32
+  2,  // test_32_mbis8_r
+  2,  // test_32_mbis_imm32
+  2,  // test_32_mbis_r
+  2,  // test_32_mi32_imm32
+  2,  // test_32_mi32_r
+  2,  // test_32_mpc32_imm32
+  2,  // test_32_mpc32_r
+  2,  // test_32_mr_imm32
+  2,  // test_32_mr_r
+  2,  // test_64_mB32_imm32
+  2,  // test_64_mB32_r
+  2,  // test_64_mB8_imm32
+  2,  // test_64_mB8_r
+  2,  // test_64_mB_imm32
+  2,  // test_64_mB_r
+  2,  // test_64_mbis32_imm32
+  2,  // test_64_mbis32_r
+  2,  // test_64_mbis8_imm32
+  2,  // test_64_mbis8_r
+  2,  // test_64_mbis_imm32
+  2,  // test_64_mbis_r
+  2,  // test_64_mi32_imm32
+  2,  // test_64_mi32_r
+  2,  // test_64_mpc32_imm32
+  2,  // test_64_mpc32_r
+  2,  // test_64_mr_imm32
+  2,  // test_64_mr_r
+  2,  // test_64_rax_imm32
+  2,  // test_8_al_imm8
+  2,  // test_8_mB32_imm8
+  2,  // test_8_mB32_r
+  2,  // test_8_mB8_imm8
+  2,  // test_8_mB8_r
+  2,  // test_8_mB_imm8
+  2,  // test_8_mB_r
+  2,  // test_8_mbis32_imm8
+  2,  // test_8_mbis32_r
+  2,  // test_8_mbis8_imm8
+  2,  // test_8_mbis8_r
+  2,  // test_8_mbis_imm8
+  2,  // test_8_mbis_r
+  2,  // test_8_mi32_imm8
+  2,  // test_8_mi32_r
+  2,  // test_8_mpc32_imm8
+  2,  // test_8_mpc32_r
+  2,  // test_8_mr_imm8
+  2,  // test_8_mr_r
+  2,  // tzcnt_16_r_mB
+  2,  // tzcnt_16_r_mB32
+  2,  // tzcnt_16_r_mB8
+  2,  // tzcnt_16_r_mbis
+  2,  // tzcnt_16_r_mbis32
+  2,  // tzcnt_16_r_mbis8
+  2,  // tzcnt_16_r_mi32
+  2,  // tzcnt_16_r_mpc32
+  2,  // tzcnt_16_r_mr
+  2,  // tzcnt_32_r_mB
+  2,  // tzcnt_32_r_mB32
+  2,  // tzcnt_32_r_mB8
+  2,  // tzcnt_32_r_mbis
+  2,  // tzcnt_32_r_mbis32
+  2,  // tzcnt_32_r_mbis8
+  2,  // tzcnt_32_r_mi32
+  2,  // tzcnt_32_r_mpc32
+  2,  // tzcnt_32_r_mr
+  2,  // tzcnt_64_r_mB
+  2,  // tzcnt_64_r_mB32
+  2,  // tzcnt_64_r_mB8
+  2,  // tzcnt_64_r_mbis
+  2,  // tzcnt_64_r_mbis32
+  2,  // tzcnt_64_r_mbis8
+  2,  // tzcnt_64_r_mi32
+  2,  // tzcnt_64_r_mpc32
+  2,  // tzcnt_64_r_mr
+  2,  // ucomisd_x_mB
+  2,  // ucomisd_x_mB32
+  2,  // ucomisd_x_mB8
+  2,  // ucomisd_x_mbis
+  2,  // ucomisd_x_mbis32
+  2,  // ucomisd_x_mbis8
+  2,  // ucomisd_x_mi32
+  2,  // ucomisd_x_mpc32
+  2,  // ucomisd_x_mx
+  2,  // ucomiss_x_mB
+  2,  // ucomiss_x_mB32
+  2,  // ucomiss_x_mB8
+  2,  // ucomiss_x_mbis
+  2,  // ucomiss_x_mbis32
+  2,  // ucomiss_x_mbis8
+  2,  // ucomiss_x_mi32
+  2,  // ucomiss_x_mpc32
+  2,  // ucomiss_x_mx
+  0,  // xchg_16_mB32_r
+  0,  // xchg_16_mB8_r
+  0,  // xchg_16_mB_r
+  0,  // xchg_16_mbis32_r
+  0,  // xchg_16_mbis8_r
+  0,  // xchg_16_mbis_r
+  0,  // xchg_16_mi32_r
+  0,  // xchg_16_mpc32_r
+  0,  // xchg_16_mr_r
+  0,  // xchg_16_r_ax
+  0,  // xchg_32_mB32_r
+  0,  // xchg_32_mB8_r
+  0,  // xchg_32_mB_r
+  0,  // xchg_32_mbis32_r
+  0,  // xchg_32_mbis8_r
+  0,  // xchg_32_mbis_r
+  0,  // xchg_32_mi32_r
+  0,  // xchg_32_mpc32_r
+  0,  // xchg_32_mr_r
+  0,  // xchg_32_r_eax
+  0,  // xchg_64_mB32_r
+  0,  // xchg_64_mB8_r
+  0,  // xchg_64_mB_r
+  0,  // xchg_64_mbis32_r
+  0,  // xchg_64_mbis8_r
+  0,  // xchg_64_mbis_r
+  0,  // xchg_64_mi32_r
+  0,  // xchg_64_mpc32_r
+  0,  // xchg_64_mr_r
+  0,  // xchg_64_r_rax
+  0,  // xchg_8_mB32_r
+  0,  // xchg_8_mB8_r
+  0,  // xchg_8_mB_r
+  0,  // xchg_8_mbis32_r
+  0,  // xchg_8_mbis8_r
+  0,  // xchg_8_mbis_r
+  0,  // xchg_8_mi32_r
+  0,  // xchg_8_mpc32_r
+  0,  // xchg_8_mr_r
+  2,  // xor_16_ax_imm16
+  2,  // xor_16_mB32_imm16
+  2,  // xor_16_mB32_imm8
+  2,  // xor_16_mB32_r
+  2,  // xor_16_mB8_imm16
+  2,  // xor_16_mB8_imm8
+  2,  // xor_16_mB8_r
+  2,  // xor_16_mB_imm16
+  2,  // xor_16_mB_imm8
+  2,  // xor_16_mB_r
+  2,  // xor_16_mbis32_imm16
+  2,  // xor_16_mbis32_imm8
+  2,  // xor_16_mbis32_r
+  2,  // xor_16_mbis8_imm16
+  2,  // xor_16_mbis8_imm8
+  2,  // xor_16_mbis8_r
+  2,  // xor_16_mbis_imm16
+  2,  // xor_16_mbis_imm8
+  2,  // xor_16_mbis_r
+  2,  // xor_16_mi32_imm16
+  2,  // xor_16_mi32_imm8
+  2,  // xor_16_mi32_r
+  2,  // xor_16_mpc32_imm16
+  2,  // xor_16_mpc32_imm8
+  2,  // xor_16_mpc32_r
+  2,  // xor_16_mr_imm16
+  2,  // xor_16_mr_imm8
+  2,  // xor_16_mr_r
+  2,  // xor_16_r_mB
+  2,  // xor_16_r_mB32
+  2,  // xor_16_r_mB8
+  2,  // xor_16_r_mbis
+  2,  // xor_16_r_mbis32
+  2,  // xor_16_r_mbis8
+  2,  // xor_16_r_mi32
+  2,  // xor_16_r_mpc32
+  2,  // xor_16_r_mr
+  2,  // xor_32_eax_imm32
+  2,  // xor_32_mB32_imm32
+  2,  // xor_32_mB32_imm8
+  2,  // xor_32_mB32_r
+  2,  // xor_32_mB8_imm32
+  2,  // xor_32_mB8_imm8
+  2,  // xor_32_mB8_r
+  2,  // xor_32_mB_imm32
+  2,  // xor_32_mB_imm8
+  2,  // xor_32_mB_r
+  2,  // xor_32_mbis32_imm32
+  2,  // xor_32_mbis32_imm8
+  2,  // xor_32_mbis32_r
+  2,  // xor_32_mbis8_imm32
+  2,  // xor_32_mbis8_imm8
+  2,  // xor_32_mbis8_r
+  2,  // xor_32_mbis_imm32
+  2,  // xor_32_mbis_imm8
+  2,  // xor_32_mbis_r
+  2,  // xor_32_mi32_imm32
+  2,  // xor_32_mi32_imm8
+  2,  // xor_32_mi32_r
+  2,  // xor_32_mpc32_imm32
+  2,  // xor_32_mpc32_imm8
+  2,  // xor_32_mpc32_r
+  2,  // xor_32_mr_imm32
+  2,  // xor_32_mr_imm8
+  2,  // xor_32_mr_r
+  2,  // xor_32_r_mB
+  2,  // xor_32_r_mB32
+  2,  // xor_32_r_mB8
+  2,  // xor_32_r_mbis
+  2,  // xor_32_r_mbis32
+  2,  // xor_32_r_mbis8
+  2,  // xor_32_r_mi32
+  2,  // xor_32_r_mpc32
+  2,  // xor_32_r_mr
+  2,  // xor_64_mB32_imm32
+  2,  // xor_64_mB32_imm8
+  2,  // xor_64_mB32_r
+  2,  // xor_64_mB8_imm32
+  2,  // xor_64_mB8_imm8
+  2,  // xor_64_mB8_r
+  2,  // xor_64_mB_imm32
+  2,  // xor_64_mB_imm8
+  2,  // xor_64_mB_r
+  2,  // xor_64_mbis32_imm32
+  2,  // xor_64_mbis32_imm8
+  2,  // xor_64_mbis32_r
+  2,  // xor_64_mbis8_imm32
+  2,  // xor_64_mbis8_imm8
+  2,  // xor_64_mbis8_r
+  2,  // xor_64_mbis_imm32
+  2,  // xor_64_mbis_imm8
+  2,  // xor_64_mbis_r
+  2,  // xor_64_mi32_imm32
+  2,  // xor_64_mi32_imm8
+  2,  // xor_64_mi32_r
+  2,  // xor_64_mpc32_imm32
+  2,  // xor_64_mpc32_imm8
+  2,  // xor_64_mpc32_r
+  2,  // xor_64_mr_imm32
+  2,  // xor_64_mr_imm8
+  2,  // xor_64_mr_r
+  2,  // xor_64_r_mB
+  2,  // xor_64_r_mB32
+  2,  // xor_64_r_mB8
+  2,  // xor_64_r_mbis
+  2,  // xor_64_r_mbis32
+  2,  // xor_64_r_mbis8
+  2,  // xor_64_r_mi32
+  2,  // xor_64_r_mpc32
+  2,  // xor_64_r_mr
+  2,  // xor_64_rax_imm32
+  2,  // xor_8_al_imm8
+  2,  // xor_8_mB32_imm8
+  2,  // xor_8_mB32_r
+  2,  // xor_8_mB8_imm8
+  2,  // xor_8_mB8_r
+  2,  // xor_8_mB_imm8
+  2,  // xor_8_mB_r
+  2,  // xor_8_mbis32_imm8
+  2,  // xor_8_mbis32_r
+  2,  // xor_8_mbis8_imm8
+  2,  // xor_8_mbis8_r
+  2,  // xor_8_mbis_imm8
+  2,  // xor_8_mbis_r
+  2,  // xor_8_mi32_imm8
+  2,  // xor_8_mi32_r
+  2,  // xor_8_mpc32_imm8
+  2,  // xor_8_mpc32_r
+  2,  // xor_8_mr_imm8
+  2,  // xor_8_mr_r
+  2,  // xor_8_r_mB
+  2,  // xor_8_r_mB32
+  2,  // xor_8_r_mB8
+  2,  // xor_8_r_mbis
+  2,  // xor_8_r_mbis32
+  2,  // xor_8_r_mbis8
+  2,  // xor_8_r_mi32
+  2,  // xor_8_r_mpc32
+  2,  // xor_8_r_mr
+};
+
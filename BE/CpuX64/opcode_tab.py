@@ -11,9 +11,12 @@ Enough for code generation.
 import collections
 import dataclasses
 import enum
+import glob
+import hashlib
 import itertools
 import json
 import os
+import pickle
 import re
 import sys
 from typing import List, Dict, Tuple, Optional
@@ -449,6 +452,40 @@ _IMPLICIT_TO_OK: Dict[str, OK] = {
 
 OK_TO_IMPLICIT: Dict[OK, str] = {v: k for k, v in _IMPLICIT_TO_OK.items()}
 
+# Kinds of in place patches applied to the byte template of an Opcode
+# (see Opcode.AssembleOperandsInto)
+_PATCH_REG = 0  # (pos, shift, rex_shift)
+_PATCH_REG8 = 1  # like _PATCH_REG but regs 4-7 force a rex byte
+_PATCH_INDEX_AS_BASE = 2  # like _PATCH_REG but rsp is not allowed
+_PATCH_SCALE = 3  # (pos, -, -)
+_PATCH_INT = 4  # (pos, byte-width, mask)
+
+_OK_TO_PATCH: Dict[OK, Tuple[int, int, int]] = {
+    OK.MODRM_RM_REG8: (_PATCH_REG8, 0, 0),
+    OK.MODRM_RM_REG16: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_REG32: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_REG64: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_XREG32: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_XREG64: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_XREG128: (_PATCH_REG, 0, 0),
+    OK.MODRM_RM_BASE: (_PATCH_REG, 0, 0),
+    OK.MODRM_REG8: (_PATCH_REG8, 3, 2),
+    OK.MODRM_REG16: (_PATCH_REG, 3, 2),
+    OK.MODRM_REG32: (_PATCH_REG, 3, 2),
+    OK.MODRM_REG64: (_PATCH_REG, 3, 2),
+    OK.MODRM_XREG32: (_PATCH_REG, 3, 2),
+    OK.MODRM_XREG64: (_PATCH_REG, 3, 2),
+    OK.MODRM_XREG128: (_PATCH_REG, 3, 2),
+    OK.SIB_BASE: (_PATCH_REG, 0, 0),
+    OK.SIB_INDEX_AS_BASE: (_PATCH_INDEX_AS_BASE, 3, 1),
+    OK.SIB_INDEX: (_PATCH_REG, 3, 1),
+    OK.SIB_SCALE: (_PATCH_SCALE, 0, 0),
+    OK.BYTE_WITH_REG8: (_PATCH_REG8, 0, 0),
+    OK.BYTE_WITH_REG16: (_PATCH_REG, 0, 0),
+    OK.BYTE_WITH_REG32: (_PATCH_REG, 0, 0),
+    OK.BYTE_WITH_REG64: (_PATCH_REG, 0, 0),
+}
+
 
 def _FP(bf0, b66, bf2, bf3, b0f, b48, d):
     return (bf0 << 13) | (b66 << 12) | (bf2 << 11) | (bf3 << 10) | (b0f << 9) | (b48 << 8) | d
@@ -569,6 +606,13 @@ class Opcode:
         self.fields: List[OK] = []
         self.mask: List[int] = []
         self.data: List[int] = []
+        # precomputed by Finalize() for AssembleOperandsInto()
+        self.template: bytes = b""
+        self.rex_pos = 0
+        self.patches: List[Tuple[int, int, int, int, int]] = []
+        # effect on the status flags, see SetFlagEffects()
+        self.reads_flags = False
+        self.kills_flags = False
 
     def __str__(self):
         fields_str = ' '.join([str(f) for f in self.fields])
@@ -620,8 +664,43 @@ class Opcode:
                 expected_len += 2
         for fp in FingerPrintOpcode(self):
             Opcode.OpcodesByFP[fp].append(self)
+        self.FinalizeTemplate()
             # assert len(self.fields) == expected_len, f"{self.fields} vs {self.operands}"
 
+    def FinalizeTemplate(self):
+        """Precompute the byte template and the operand patches
+
+        This turns the per-field dispatch in AssembleOperands into a
+        table lookup that is done once per opcode.
+        """
+        self.template = bytes(self.data)
+        self.rex_pos = 0
+        for b in self.data:
+            if b not in {0xf0, 0xf2, 0xf3, 0x66}:
+                break
+            self.rex_pos += 1
+        self.patches = []
+        for n, o in enumerate(self.fields):
+            if o in OK_TO_IMPLICIT or o is OK.RIP_BASE:
+                continue
+            elif o in OK_IMM_TO_SIZE or o in OK_OFF_TO_SIZE:
+                if o in OK_IMM_TO_SIZE:
+                    pos, width = self.imm_pos, OK_IMM_TO_SIZE[o][0]
+                else:
+                    pos, width = self.offset_pos, OK_OFF_TO_SIZE[o][0]
+                self.patches.append((n, _PATCH_INT, pos, width // 8, (1 << width) - 1))
+            elif o in _OK_TO_PATCH:
+                kind, shift, rex_shift = _OK_TO_PATCH[o]
+                if o.name.startswith("MODRM"):
+                    pos = self.modrm_pos
+                elif o.name.startswith("SIB"):
+                    pos = self.sib_pos
+                else:
+                    pos = self.byte_with_reg_pos
+                self.patches.append((n, kind, pos, shift, rex_shift))
+            else:
+                assert False, f"{o}"
+
     def AddRexW(self):
         self.rexw = True
 
@@ -802,144 +881,63 @@ class Opcode:
 
     def DisassembleOperands(self, data: List) -> List[int]:
         rex, data = StripRex(data)
-
-        out: List[int] = []
-
-        def GetRegBits(offset: int, data_bit_pos, rex_bit_pos: int) -> int:
-            nonlocal rex
-            r = (data[offset] >> data_bit_pos) & 0x7
-            if rex:
-                r |= ((rex >> rex_bit_pos) & 1) << 3
-            return r
-
-        def GetSInt(pos, src_width, dst_width):
-            x = int.from_bytes(
-                data[pos: pos + src_width // 8], "little", signed=True)
-            if dst_width is not None and dst_width != 64:
-                return x & (1 << dst_width) - 1
-            return x
-
-        for o in self.fields:
-            if o in OK_TO_IMPLICIT:
-                out.append(0)  # dummy
-            elif o in {OK.MODRM_RM_REG8, OK.MODRM_RM_REG16, OK.MODRM_RM_REG32, OK.MODRM_RM_REG64}:
-                out.append(GetRegBits(self.modrm_pos, 0, 0))
-                if o is OK.MODRM_RM_REG8 and 4 <= out[-1] <= 7:
-                    assert rex
-            elif o in {OK.MODRM_RM_XREG32, OK.MODRM_RM_XREG64, OK.MODRM_RM_XREG128}:
-                out.append(GetRegBits(self.modrm_pos, 0, 0))
-            elif o is OK.MODRM_RM_BASE:
-                out.append(GetRegBits(self.modrm_pos, 0, 0))
-            elif o in {OK.MODRM_REG8, OK.MODRM_REG16, OK.MODRM_REG32, OK.MODRM_REG64}:
-                out.append(GetRegBits(self.modrm_pos, 3, 2))
-                if o is OK.MODRM_REG8 and 4 <= out[-1] <= 7:
-                    assert rex
-            elif o in {OK.MODRM_XREG32, OK.MODRM_XREG64, OK.MODRM_XREG128}:
-                out.append(GetRegBits(self.modrm_pos, 3, 2))
-            elif o is OK.RIP_BASE:
-                out.append(0)  # dummy
-            elif o is OK.SIB_BASE:
-                out.append(GetRegBits(self.sib_pos, 0, 0))
-            elif o in {OK.SIB_INDEX_AS_BASE, OK.SIB_INDEX}:
-                out.append(GetRegBits(self.sib_pos, 3, 1))
-                assert o != OK.SIB_INDEX_AS_BASE or out[-1] != 0x4
-            elif o is OK.SIB_SCALE:
-                out.append(data[self.sib_pos] >> 6)
-            elif o is OK.BYTE_WITH_REG8:
-                r = GetRegBits(self.byte_with_reg_pos, 0, 0)
-                if 4 <= r <= 7:
-                    assert rex, f"xH (high byte) regs are not supported"
-                out.append(r)
-            elif o in {OK.BYTE_WITH_REG16, OK.BYTE_WITH_REG32, OK.BYTE_WITH_REG64}:
-                out.append(GetRegBits(self.byte_with_reg_pos, 0, 0))
-            elif o in OK_IMM_TO_SIZE:
-                out.append(GetSInt(self.imm_pos, *OK_IMM_TO_SIZE[o]))
-            elif o in OK_OFF_TO_SIZE:
-                out.append(GetSInt(self.offset_pos, *OK_OFF_TO_SIZE[o]))
+        # implicit operands and RIP_BASE get a dummy 0
+        out: List[int] = [0] * len(self.fields)
+        for n, kind, pos, a, b in self.patches:
+            if kind == _PATCH_INT:
+                x = int.from_bytes(data[pos: pos + a], "little", signed=True)
+                dst_width = OK_IMM_TO_SIZE.get(self.fields[n], (0, None))[1]
+                if dst_width is not None and dst_width != 64:
+                    x &= (1 << dst_width) - 1
+                out[n] = x
+            elif kind == _PATCH_SCALE:
+                out[n] = data[pos] >> 6
             else:
-                assert False, f"{o}"
-        assert len(self.fields) == len(out), f"{self} {out}"
+                r = (data[pos] >> a) & 0x7
+                if rex:
+                    r |= ((rex >> b) & 1) << 3
+                if kind == _PATCH_REG8:
+                    if 4 <= r <= 7:
+                        assert rex, f"xH (high byte) regs are not supported"
+                elif kind == _PATCH_INDEX_AS_BASE:
+                    assert r != 0x4
+                out[n] = r
         return out
 
     def AssembleOperands(self, operands: List[int]) -> List[int]:
-        assert len(operands) == len(self.fields)
-        rex = 0
-        if self.rexw:
-            rex |= 0x08
-        out = self.data[:]
-
-        def SetRegBits(reg, pos, shift, rex_shift):
-            nonlocal rex
-            out[pos] |= (reg & 0x7) << shift
-            rex |= ((reg >> 3) & 1) << rex_shift
-
-        def SetSInt(v, pos, dst_width, src_width):
-            # print (f"{self.name}:  {v} {pos} {dst_byte_width}  {src_bit_width}")
-            # if not src_bit_width:
-            #    v += (8 << dst_byte_width)
-
-            v &= (1 << dst_width) - 1
-            # TODO: check
-            # assert -(8) <= v < (8 << dst_byte_width)
-            while v:
-                out[pos] = v & 0xff
-                pos += 1
-                v >>= 8
+        out = bytearray()
+        self.AssembleOperandsInto(operands, out)
+        return list(out)
 
-        for v, o in zip(operands, self.fields):
-            if o in OK_TO_IMPLICIT:
-                continue
-            elif o in {OK.MODRM_RM_REG8, OK.MODRM_RM_REG16, OK.MODRM_RM_REG32,
-                       OK.MODRM_RM_REG64}:
-                if o is OK.MODRM_RM_REG8 and (4 <= v <= 7):
-                    rex |= 0x40  # force rex, otherwise we select ah, ch, dh, bh
-                SetRegBits(v, self.modrm_pos, 0, 0)
-            elif o in {OK.MODRM_RM_XREG32, OK.MODRM_RM_XREG64, OK.MODRM_RM_XREG128}:
-                SetRegBits(v, self.modrm_pos, 0, 0)
-            elif o is OK.MODRM_RM_BASE:
-                SetRegBits(v, self.modrm_pos, 0, 0)
-            elif o in {OK.MODRM_REG8, OK.MODRM_REG16, OK.MODRM_REG32,
-                       OK.MODRM_REG64}:
-                if o is OK.MODRM_REG8 and (4 <= v <= 7):
-                    rex |= 0x40  # force rex, otherwise we select ah, ch, dh, bh
-                SetRegBits(v, self.modrm_pos, 3, 2)
-            elif o in {OK.MODRM_XREG32, OK.MODRM_XREG64, OK.MODRM_XREG128}:
-                SetRegBits(v, self.modrm_pos, 3, 2)
-            elif o is OK.RIP_BASE:
-                continue
-            elif o is OK.SIB_BASE:
-                SetRegBits(v, self.sib_pos, 0, 0)
-            elif o is OK.SIB_INDEX_AS_BASE:
-                assert v != 4
-                SetRegBits(v, self.sib_pos, 3, 1)
-            elif o is OK.SIB_INDEX:
-                SetRegBits(v, self.sib_pos, 3, 1)
-            elif o is OK.SIB_SCALE:
+    def AssembleOperandsInto(self, operands: List[int], out: bytearray) -> int:
+        """Appends the encoded instruction to `out` and returns its length
+
+        The precomputed template is appended and then patched in place,
+        so no intermediate lists are created.
+        """
+        assert len(operands) == len(self.fields)
+        start = len(out)
+        out += self.template
+        rex = 0x08 if self.rexw else 0
+        for n, kind, pos, a, b in self.patches:
+            v = operands[n]
+            pos += start
+            if kind == _PATCH_INT:
+                out[pos:pos + a] = (v & b).to_bytes(a, "little")
+            elif kind == _PATCH_SCALE:
                 assert 0 <= v <= 3
-                out[self.sib_pos] |= v << 6
-            elif o is OK.BYTE_WITH_REG8:
-                if 4 <= v <= 7:  # otherwise we use high byte regs (ah, ...)
-                    rex |= 0x40
-                SetRegBits(v, self.byte_with_reg_pos, 0, 0)
-            elif o in {OK.BYTE_WITH_REG16, OK.BYTE_WITH_REG32,
-                       OK.BYTE_WITH_REG64}:
-                SetRegBits(v, self.byte_with_reg_pos, 0, 0)
-            elif o in OK_IMM_TO_SIZE:
-                SetSInt(v, self.imm_pos, *OK_IMM_TO_SIZE[o])
-            elif o in OK_OFF_TO_SIZE:
-                SetSInt(v, self.offset_pos, *OK_OFF_TO_SIZE[o])
+                out[pos] |= v << 6
             else:
-                assert False, f"{o}"
-
+                if kind == _PATCH_REG8:
+                    if 4 <= v <= 7:
+                        rex |= 0x40  # force rex, otherwise we select ah, ch, dh, bh
+                elif kind == _PATCH_INDEX_AS_BASE:
+                    assert v != 4
+                out[pos] |= (v & 0x7) << a
+                rex |= ((v >> 3) & 1) << b
         if rex:
-            pos = 0
-            for b in out:
-                if b in {0xf0, 0xf2, 0xf3, 0x66}:
-                    pos += 1
-                else:
-                    break
-            out.insert(pos, rex | 0x40)
-        return out
+            out.insert(start + self.rex_pos, rex | 0x40)
+        return len(out) - start
 
     def UsesRex(self, operands: List[int]) -> bool:
         assert len(operands) == len(self.fields)
@@ -962,15 +960,50 @@ class Opcode:
 
     @classmethod
     def FindOpcode(cls, data: List) -> Optional["Opcode"]:
-        rules = Opcode.OpcodesByFP[FingerPrintRawInstructions(data)]
+        # only the first few bytes matter, do not copy the rest
+        data = data[:MAX_INSTRUCTION_LENGTH_WITH_PREFIXES]
+        fp = FingerPrintRawInstructions(data)
         _, data = StripRex(data)
-        discriminant = int.from_bytes(data, "little")
-        for r in rules:
+        discriminant = int.from_bytes(data[:6], "little")
+        for r in _DispatchCandidates(fp, discriminant):
             if (r.discriminant_mask & discriminant) == r.discriminant_data:
                 return r
         return None
 
 
+# Second level opcode dispatch: Opcode.OpcodesByFP partitions the opcodes
+# by their finger print, this table further narrows each partition by the
+# byte following the opcode byte (usually the modrm byte).
+# The entries preserve the order of OpcodesByFP so FindOpcode picks the
+# same opcode. The table is filled in lazily as new keys are encountered.
+_DISPATCH: Dict[Tuple[int, int], List[Opcode]] = {}
+
+
+def _DispatchPos(fp: int) -> int:
+    """Returns the discriminant byte following the opcode byte for a finger print"""
+    pos = 1 + ((fp >> 9) & 1)  # optional 0x0f and the opcode byte
+    for bit in (10, 11, 12, 13):  # prefixes
+        pos += (fp >> bit) & 1
+    return pos
+
+
+def _DispatchCandidates(fp: int, discriminant: int) -> List[Opcode]:
+    shift = 8 * _DispatchPos(fp)
+    if shift >= 48:
+        key = (fp, 0)
+        mask = 0
+    else:
+        key = (fp, (discriminant >> shift) & 0xff)
+        mask = 0xff << shift
+    candidates = _DISPATCH.get(key)
+    if candidates is None:
+        val = key[1] << shift if mask else 0
+        candidates = [r for r in Opcode.OpcodesByFP.get(fp, [])
+                      if r.discriminant_mask & mask & val == r.discriminant_data & mask]
+        _DISPATCH[key] = candidates
+    return candidates
+
+
 _RELOC_TYPE_X64_NONE = 0  # avoid elf dependency
 
 
@@ -1024,6 +1057,44 @@ def Assemble(ins: Ins) -> List[int]:
     return ins.opcode.AssembleOperands(ins.operands)
 
 
+def AssembleInto(ins: Ins, out: bytearray) -> int:
+    """Like Assemble but appends the encoding to `out` and returns its length"""
+    assert not ins.has_reloc(), "reloc has not been resolved"
+    return ins.opcode.AssembleOperandsInto(ins.operands, out)
+
+
+def DisassembleBatch(data, padding: Optional[List[bytes]] = None
+                     ) -> List[Tuple[int, Optional[Opcode], List[int]]]:
+    """Disassembles a whole code buffer (bytes, bytearray or memoryview)
+
+    Returns one (offset, opcode, operands) triple per instruction.
+    Byte sequences in `padding` (e.g. the multi-byte nops used by the
+    assembler which are not in the opcode table) are skipped as a unit.
+    Other bytes that cannot be decoded are reported one at a time.
+    Both have opcode None and no operands.
+    """
+    padding = sorted((p for p in padding or [] if p), key=len, reverse=True)
+    out = []
+    view = memoryview(data)
+    off = 0
+    while off < len(view):
+        window = list(view[off:off + MAX_INSTRUCTION_LENGTH_WITH_PREFIXES])
+        opcode = Opcode.FindOpcode(window)
+        if opcode is None:
+            out.append((off, None, []))
+            for p in padding:
+                if view[off:off + len(p)] == p:
+                    off += len(p)
+                    break
+            else:
+                off += 1
+            continue
+        out.append((off, opcode, opcode.DisassembleOperands(window)))
+        rex, _ = StripRex(window)
+        off += len(opcode.data) + (rex != 0)
+    return out
+
+
 def InsLength(ins: Ins) -> int:
     return len(ins.opcode.data) + ins.opcode.UsesRex(ins.operands)
 
@@ -1308,6 +1379,28 @@ def SkipInstruction(name, format, ops):
     return False
 
 
+_STATUS_FLAGS = ("OF", "SF", "ZF", "AF", "PF", "CF")
+
+# these leave the flags untouched if the shift count is zero
+_OPCODES_WITH_CONDITIONAL_FLAG_WRITE = {"sar", "shr", "shl", "ror", "rol"}
+
+
+def SetFlagEffects(opcode: Opcode, metadata: List[str]):
+    """Derive the status flag effects from the x86data.js metadata (e.g. "ZF=W")
+
+    An opcode "kills" the flags if it overwrites all of them without reading any.
+    This is used by the peephole optimizer to compute flag liveness.
+    """
+    effects = {}
+    for m in metadata:
+        flag, _, effect = m.partition("=")
+        if flag in _STATUS_FLAGS:
+            effects[flag] = effect
+    opcode.reads_flags = any(e in {"R", "X"} for e in effects.values())
+    opcode.kills_flags = (len(effects) == len(_STATUS_FLAGS) and not opcode.reads_flags and
+                          opcode.name not in _OPCODES_WITH_CONDITIONAL_FLAG_WRITE)
+
+
 def CreateOpcodes(instructions: List, verbose: bool):
     count = collections.defaultdict(int)
     for name, ops, format, encoding, metadata in instructions:
@@ -1349,12 +1442,15 @@ def CreateOpcodes(instructions: List, verbose: bool):
         assert format in _SUPPORTED_FORMATS, f"{format}"
         if verbose:
             print(name, ops, format, encoding, metadata)
+        start = len(Opcode.Opcodes)
         HandlePattern(name, ops, format, encoding, metadata)
         if "_XLock" in metadata:
             name = "lock" + name
             if name in SUPPORTED_OPCODES:
                 HandlePattern(name, ops, format, ["F0"] + encoding,  metadata)
                 count[name] += 1
+        for opcode in Opcode.Opcodes[start:]:
+            SetFlagEffects(opcode, metadata)
 
     for k in SUPPORTED_OPCODES:
         assert count[k], f"unknown opcode [{k}]"
@@ -1375,6 +1471,56 @@ def LoadOpcodes(filename: str):
     CreateOpcodes(tables["instructions"], False)
 
 
+# bump this when the pickled representation changes in a way not reflected
+# in the content of this file
+_OPCODE_CACHE_VERSION = 1
+
+
+def _OpcodeCachePath(filename: str) -> str:
+    """The cache is keyed on x86data.js, this file and the python implementation
+
+    so it is rebuilt automatically whenever any of them changes.
+    """
+    h = hashlib.sha256(str(_OPCODE_CACHE_VERSION).encode())
+    for fn in [filename, __file__]:
+        with open(fn, "rb") as fin:
+            h.update(fin.read())
+    tag = sys.implementation.cache_tag
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__",
+                        f"opcode_tab.{tag}.{h.hexdigest()[:16]}.pickle")
+
+
+def LoadOpcodesCached(filename: str):
+    """Like LoadOpcodes but uses a pickled copy of the fully built tables if available
+
+    Parsing x86data.js and building the tables dominates the startup time of
+    every x64 tool. Failure to read or write the cache is not an error.
+    """
+    path = _OpcodeCachePath(filename)
+    try:
+        with open(path, "rb") as fin:
+            Opcode.Opcodes, Opcode.OpcodesByFP, Opcode.name_to_opcode = pickle.load(fin)
+        return
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    LoadOpcodes(filename)
+    tables = (Opcode.Opcodes, Opcode.OpcodesByFP, Opcode.name_to_opcode)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # only our own implementation's caches - others (e.g. pypy) may still be current
+        tag = glob.escape(sys.implementation.cache_tag)
+        for stale in glob.glob(os.path.join(os.path.dirname(path),
+                                            f"opcode_tab.{tag}.*.pickle")):
+            os.remove(stale)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fout:
+            pickle.dump(tables, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def _render_enum_simple(symbols, name, fout):
     print("\n%s {" % name, file=fout)
     for sym in symbols:
@@ -1393,6 +1539,9 @@ def _EmitCodeH(fout):
         f"constexpr const unsigned MAX_INSTRUCTION_NAME_LENGTH = {MAX_INSTRUCTION_NAME_LENGTH};", file=fout)
     print(
         f"constexpr const unsigned MAX_FINGERPRINT = {MAX_FINGERPRINT};", file=fout)
+    # including the invalid first entry
+    print(
+        f"constexpr const unsigned NUM_OPCODES = {len(Opcode.name_to_opcode) + 1};", file=fout)
 
     cgen.RenderEnum(cgen.NameValues(MEM_MODE),
                     "class MEM_WIDTH : uint8_t", fout)
@@ -1439,6 +1588,13 @@ def _EmitEncodings(fout):
     print("const Opcode OpcodeTableEncodings[] = {", file=fout)
     print("\n".join(_RenderOpcodeTable()), file=fout)
     print("};\n", file=fout)
+    print("// Indexed by OPC: bit 0 = reads flags, bit 1 = kills flags", file=fout)
+    print("const uint8_t OpcodeTableFlagEffects[] = {", file=fout)
+    print("  0,  // invalid", file=fout)
+    for name, opc in sorted(Opcode.name_to_opcode.items()):
+        effects = int(opc.reads_flags) | int(opc.kills_flags) << 1
+        print(f"  {effects},  // {name}", file=fout)
+    print("};\n", file=fout)
 
 
 _MNEMONIC_HASH_TABLE_SIZE = 8192
@@ -1516,7 +1672,11 @@ def _EmitCodeC(fout):
     cgen.RenderEnumToStringFun("OK", "EnumToString", "OK_ToStringMap",  fout)
 
 
-LoadOpcodes(os.path.join(os.path.dirname(__file__), "x86data.js"))
+if __name__ == "__main__":
+    # the pickled tables refer to this module by its package name
+    LoadOpcodes(os.path.join(os.path.dirname(__file__), "x86data.js"))
+else:
+    LoadOpcodesCached(os.path.join(os.path.dirname(__file__), "x86data.js"))
 
 if __name__ == "__main__":
     if len(sys.argv) <= 1:
@@ -0,0 +1,248 @@
+"""
+Emitter for minimal DWARF 5 line number info
+
+The line table maps .text offsets to (file, line) pairs (see elf_unit.Unit.AddLine).
+It is turned into a single sequence line number program (.debug_line, .debug_line_str)
+plus a compile unit which only references it (.debug_info, .debug_abbrev) so that
+tools like addr2line and `perf annotate` can find it.
+"""
+
+import enum
+import struct
+from typing import List, Dict, Tuple
+
+from BE.Elf import elfhelper as elf
+from BE.Elf import elf_unit
+from Util import parse
+
+
+@enum.unique
+class DW_LNCT(enum.IntEnum):
+    path = 1
+    directory_index = 2
+    timestamp = 3
+    size = 4
+    MD5 = 5
+    LLVM_source = 8193
+    lo_user = 8192
+    hi_user = 16383
+
+
+@enum.unique
+class DW_FORM(enum.IntEnum):
+    addr = 0x01
+    block2 = 0x03
+    block4 = 0x04
+    data2 = 0x05
+    data4 = 0x06
+    data8 = 0x07
+    string = 0x08
+    block = 0x09
+    block1 = 0x0a
+    data1 = 0x0b
+    flag = 0x0c
+    sdata = 0x0d
+    strp = 0x0e
+    udata = 0x0f
+    ref_addr = 0x10
+    ref1 = 0x11
+    ref2 = 0x12
+    ref4 = 0x13
+    ref8 = 0x14
+    ref_udata = 0x15
+    indirect = 0x16
+    sec_offset = 0x17
+    exprloc = 0x18
+    flag_present = 0x19
+    strx = 0x1a
+    addrx = 0x1b
+    ref_sup4 = 0x1c
+    strp_sup = 0x1d
+    data16 = 0x1e
+    line_strp = 0x1f
+    ref_sig8 = 0x20
+    implicit_const = 0x21
+    loclistx = 0x22
+    rnglistx = 0x23
+    ref_sup8 = 0x24
+    strx1 = 0x25
+    strx2 = 0x26
+    strx3 = 0x27
+    strx4 = 0x28
+    addrx1 = 0x29
+    addrx2 = 0x2a
+    addrx3 = 0x2b
+    addrx4 = 0x2c
+
+
+@enum.unique
+class DW_LNS(enum.IntEnum):
+    copy = 1
+    advance_pc = 2
+    advance_line = 3
+    set_file = 4
+    set_column = 5
+    negate_stmt = 6
+    set_basic_block = 7
+    const_add_pc = 8
+    fixed_advance_pc = 9
+    set_prologue_end = 10
+    set_epilogue_begin = 11
+    set_isa = 12
+
+
+@enum.unique
+class DW_LNE(enum.IntEnum):
+    end_sequence = 1
+    set_address = 2
+    set_file = 3
+    set_discriminator = 4
+    lo_user = 0x80
+    hi_user = 0xff
+
+
+# the few remaining constants needed for the compile unit
+DW_UT_compile = 0x01
+DW_TAG_compile_unit = 0x11
+DW_CHILDREN_no = 0
+DW_AT_name = 0x03
+DW_AT_stmt_list = 0x10
+DW_AT_low_pc = 0x11
+DW_AT_high_pc = 0x12
+
+VERSION = 5
+LINE_BASE = -5
+LINE_RANGE = 14
+OPCODE_BASE = 13
+# number of uleb operands of the standard opcodes DW_LNS.copy ... DW_LNS.set_isa
+STD_OPCODE_LENGTHS = [0, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1]
+
+# (text offset, file name, line)
+LineTable = List[Tuple[int, str, int]]
+
+
+def _EncodeProgram(lines: LineTable, file_index: Dict[str, int], text_addr: int,
+                   text_size: int, address_size: int) -> bytearray:
+    out = bytearray()
+    out += bytes([0, 1 + address_size, DW_LNE.set_address])
+    out += text_addr.to_bytes(address_size, "little")
+    addr = 0
+    file = 1
+    line = 1
+    for offset, name, new_line in lines:
+        if file_index[name] != file:
+            file = file_index[name]
+            out.append(DW_LNS.set_file)
+            out += bytes(parse.write_leb128(file))
+        ad = offset - addr
+        ld = new_line - line
+        special = (ld - LINE_BASE) + LINE_RANGE * ad + OPCODE_BASE
+        if LINE_BASE <= ld < LINE_BASE + LINE_RANGE and special <= 255:
+            out.append(special)
+        else:
+            if ad:
+                out.append(DW_LNS.advance_pc)
+                out += bytes(parse.write_leb128(ad))
+            if ld:
+                out.append(DW_LNS.advance_line)
+                out += bytes(parse.write_leb128(ld, True))
+            out.append(DW_LNS.copy)
+        addr = offset
+        line = new_line
+    if text_size > addr:
+        out.append(DW_LNS.advance_pc)
+        out += bytes(parse.write_leb128(text_size - addr))
+    out += bytes([0, 1, DW_LNE.end_sequence])
+    return out
+
+
+def MakeDebugSections(lines: LineTable, text_addr: int, text_size: int,
+                      address_size: int) -> Dict[str, bytes]:
+    """Returns the contents of the debug sections keyed by section name
+
+    The sizes do not depend on `text_addr` so the sections can be laid out with
+    a dummy address and be regenerated once the real one is known.
+    """
+    assert lines
+    files: List[str] = []
+    for _, name, _ in lines:
+        if name not in files:
+            files.append(name)
+    # DWARF 5 numbers files from 0 but consumers expecting earlier versions
+    # start at 1, so like other compilers we list the primary file twice.
+    file_index = {name: n + 1 for n, name in enumerate(files)}
+    line_str = bytearray(b".\0")
+    str_offsets = {}
+    for name in files:
+        str_offsets[name] = len(line_str)
+        line_str += bytes(name, "utf-8") + b"\0"
+
+    hdr = bytearray()
+    hdr += struct.pack("<BBBbBB", 1, 1, 1, LINE_BASE, LINE_RANGE, OPCODE_BASE)
+    hdr += bytes(STD_OPCODE_LENGTHS)
+    # directories: just the compilation dir
+    hdr += bytes([1, DW_LNCT.path, DW_FORM.line_strp, 1])
+    hdr += struct.pack("<I", 0)
+    # files
+    hdr += bytes([2, DW_LNCT.path, DW_FORM.line_strp,
+                  DW_LNCT.directory_index, DW_FORM.udata])
+    hdr += bytes(parse.write_leb128(len(files) + 1))
+    for name in [files[0]] + files:
+        hdr += struct.pack("<I", str_offsets[name])
+        hdr += bytes(parse.write_leb128(0))
+    program = _EncodeProgram(lines, file_index, text_addr, text_size, address_size)
+    unit = struct.pack("<HBBI", VERSION, address_size, 0, len(hdr)) + hdr + program
+    debug_line = struct.pack("<I", len(unit)) + unit
+
+    abbrev = bytearray([1, DW_TAG_compile_unit, DW_CHILDREN_no,
+                        DW_AT_name, DW_FORM.string,
+                        DW_AT_stmt_list, DW_FORM.sec_offset,
+                        DW_AT_low_pc, DW_FORM.addr,
+                        DW_AT_high_pc, DW_FORM.data4,
+                        0, 0, 0])
+    die = bytearray([1])
+    die += bytes(files[0], "utf-8") + b"\0"
+    die += struct.pack("<I", 0)
+    die += text_addr.to_bytes(address_size, "little")
+    die += struct.pack("<I", text_size)
+    unit = struct.pack("<HBBI", VERSION, DW_UT_compile, address_size, 0) + die
+    debug_info = struct.pack("<I", len(unit)) + unit
+
+    return {
+        ".debug_abbrev": bytes(abbrev),
+        ".debug_info": debug_info,
+        ".debug_line": debug_line,
+        ".debug_line_str": bytes(line_str),
+    }
+
+
+def AddDebugSections(unit: elf_unit.Unit, sections: List[elf.Section],
+                     seg: elf.Segment, address_size: int) -> List[elf.Section]:
+    """Appends the debug sections for `unit.lines` (if any) to `sections` and `seg`
+
+    Like the symtab, the contents are only final once the address of .text
+    is known, see UpdateDebugSections().
+    """
+    if not unit.lines:
+        return []
+    out = []
+    for name, data in MakeDebugSections(unit.lines, 0, unit.sec_text.sh_size,
+                                        address_size).items():
+        sec = elf.Section.MakeSectionDebug(name)
+        sec.SetData(bytearray(data))
+        sections.append(sec)
+        seg.sections.append(sec)
+        out.append(sec)
+    return out
+
+
+def UpdateDebugSections(unit: elf_unit.Unit, debug_sections: List[elf.Section],
+                        address_size: int):
+    if not debug_sections:
+        return
+    contents = MakeDebugSections(unit.lines, unit.sec_text.sh_addr,
+                                 unit.sec_text.sh_size, address_size)
+    for sec in debug_sections:
+        data = contents[sec.name]
+        assert len(data) == sec.sh_size
+        sec.SetData(bytearray(data))
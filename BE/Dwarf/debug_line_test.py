@@ -0,0 +1,101 @@
+#!/bin/env python3
+
+import contextlib
+import io
+import unittest
+
+from BE.CpuX64 import assembler
+from BE.Dwarf import debug_line
+from BE.Dwarf import dump_line_numbers
+from BE.Elf import elfhelper as elf
+
+TEXT_ADDR = 0x401000
+
+
+def DecodeRows(debug_line_data: bytes, debug_line_str: bytes):
+    """Returns the (address, file name, line, end_sequence) rows of the line program"""
+    lnp = dump_line_numbers.LineNumberProgram()
+    # the decoder is also the dump tool and narrates every opcode
+    with contextlib.redirect_stdout(io.StringIO()):
+        lnp.unpack(io.BytesIO(debug_line_data))
+
+    def name(file):
+        offset = lnp.file_names[file][0]
+        return str(debug_line_str[offset:debug_line_str.index(0, offset)], "utf-8")
+
+    return [(sm.address, name(sm.file), sm.line, sm.end_sequence) for sm in lnp.matrix]
+
+
+class TestDebugLine(unittest.TestCase):
+
+    def check(self, lines, text_size, expected):
+        sections = debug_line.MakeDebugSections(lines, TEXT_ADDR, text_size, 8)
+        rows = DecodeRows(sections[".debug_line"], sections[".debug_line_str"])
+        self.assertEqual(expected, rows)
+
+    def testSpecialOpcodes(self):
+        self.check([(0, "a.c", 1), (4, "a.c", 2), (7, "a.c", 5), (9, "a.c", 3)], 12,
+                   [(TEXT_ADDR + 0, "a.c", 1, False),
+                    (TEXT_ADDR + 4, "a.c", 2, False),
+                    (TEXT_ADDR + 7, "a.c", 5, False),
+                    (TEXT_ADDR + 9, "a.c", 3, False),
+                    (TEXT_ADDR + 12, "a.c", 3, True)])
+
+    def testLargeDeltas(self):
+        # neither of these fit a special opcode
+        self.check([(0, "a.c", 100), (1000, "a.c", 7), (1001, "a.c", 0)], 1001,
+                   [(TEXT_ADDR + 0, "a.c", 100, False),
+                    (TEXT_ADDR + 1000, "a.c", 7, False),
+                    (TEXT_ADDR + 1001, "a.c", 0, False),
+                    (TEXT_ADDR + 1001, "a.c", 0, True)])
+
+    def testFiles(self):
+        self.check([(0, "a.c", 10), (8, "b.c", 10), (16, "a.c", 11)], 20,
+                   [(TEXT_ADDR + 0, "a.c", 10, False),
+                    (TEXT_ADDR + 8, "b.c", 10, False),
+                    (TEXT_ADDR + 16, "a.c", 11, False),
+                    (TEXT_ADDR + 20, "a.c", 11, True)])
+
+    def testSizeIndependentOfAddress(self):
+        lines = [(0, "a.c", 1), (300, "b.c", 2000)]
+        a = debug_line.MakeDebugSections(lines, 0, 400, 8)
+        b = debug_line.MakeDebugSections(lines, TEXT_ADDR, 400, 8)
+        for name, data in a.items():
+            self.assertEqual(len(data), len(b[name]), name)
+
+    def testExecutable(self):
+        asm = """
+.fun _start 16
+.line "start.c" 3
+    xor_64_mr_r rdi rdi
+.line "start.c" 4
+    mov_64_mr_imm32 rax 0x3c
+    syscall
+.endfun
+.fun helper 16
+.line "helper.c" 20
+    ret
+.endfun
+"""
+        unit = assembler.UnitParse(io.StringIO(asm))
+        exe = assembler.Assemble(unit, True)
+        stream = io.BytesIO()
+        exe.save(stream)
+        stream.seek(0)
+        obj = elf.Executable()
+        obj.load(stream)
+        sections = {sec.name: sec for sec in obj.sections}
+        text = sections[".text"]
+        rows = DecodeRows(sections[".debug_line"].data,
+                          sections[".debug_line_str"].data)
+        expected = [(text.sh_addr + offset, name, line, False)
+                    for offset, name, line in unit.lines]
+        expected.append((text.sh_addr + text.sh_size, "helper.c", 0, True))
+        self.assertEqual(expected, rows)
+        self.assertEqual([("start.c", 3), ("start.c", 4), ("start.c", 0),
+                          ("helper.c", 20), ("helper.c", 0)],
+                         [(name, line) for _, name, line in unit.lines])
+
+
+if __name__ == '__main__':
+    unittest.main()
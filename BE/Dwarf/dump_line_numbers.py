@@ -7,100 +7,15 @@ from ctypes.wintypes import SIZE
 import dataclasses
 import struct
 import io
-import enum
 from typing import List, Dict, Optional, Set, Tuple, Any, BinaryIO
 
 
+from BE.Dwarf.debug_line import DW_LNCT, DW_FORM, DW_LNS, DW_LNE
 from BE.Elf.elfhelper import Executable
 from BE.Elf.enum_tab import EI_CLASS
 from Util import parse
 
 
-@enum.unique
-class DW_LNCT(enum.IntEnum):
-    path = 1
-    directory_index = 2
-    timestamp = 3
-    size = 4
-    MD5 = 5
-    LLVM_source = 8193
-    lo_user = 8192
-    hi_user = 16383
-
-
-@enum.unique
-class DW_FORM(enum.IntEnum):
-    addr = 0x01
-    block2 = 0x03
-    block4 = 0x04
-    data2 = 0x05
-    data4 = 0x06
-    data8 = 0x07
-    string = 0x08
-    block = 0x09
-    block1 = 0x0a
-    data1 = 0x0b
-    flag = 0x0c
-    sdata = 0x0d
-    strp = 0x0e
-    udata = 0x0f
-    ref_addr = 0x10
-    ref1 = 0x11
-    ref2 = 0x12
-    ref4 = 0x13
-    ref8 = 0x14
-    ref_udata = 0x15
-    indirect = 0x16
-    sec_offset = 0x17
-    exprloc = 0x18
-    flag_present = 0x19
-    strx = 0x1a
-    addrx = 0x1b
-    ref_sup4 = 0x1c
-    strp_sup = 0x1d
-    data16 = 0x1e
-    line_strp = 0x1f
-    ref_sig8 = 0x20
-    implicit_const = 0x21
-    loclistx = 0x22
-    rnglistx = 0x23
-    ref_sup8 = 0x24
-    strx1 = 0x25
-    strx2 = 0x26
-    strx3 = 0x27
-    strx4 = 0x28
-    addrx1 = 0x29
-    addrx2 = 0x2a
-    addrx3 = 0x2b
-    addrx4 = 0x2c
-
-
-@enum.unique
-class DW_LNS(enum.IntEnum):
-    copy = 1
-    advance_pc = 2
-    advance_line = 3
-    set_file = 4
-    set_column = 5
-    negate_stmt = 6
-    set_basic_block = 7
-    const_add_pc = 8
-    fixed_advance_pc = 9
-    set_prologue_end = 10
-    set_epilogue_begin = 11
-    set_isa = 12
-
-
-@enum.unique
-class DW_LNE(enum.IntEnum):
-    end_sequence = 1
-    set_address = 2
-    set_file = 3
-    set_discriminator = 4
-    lo_user = 0x80
-    hi_user = 0xff
-
-
 def ReadEntryList(data) -> Tuple[List, List]:
     format_count = ord(data.read(1))
     format = []
@@ -418,6 +333,8 @@ class LineNumberProgram:
 
     commands: List = dataclasses.field(
         default_factory=list)
+    matrix: List[StateMachine] = dataclasses.field(
+        default_factory=list)
 
     FORMAT = "<IHBBIBBBbB"
     SIZE = struct.calcsize(FORMAT)
@@ -456,6 +373,7 @@ class LineNumberProgram:
         assert len(matrix) == len(matrix2), f"{len(matrix)} vs {len(matrix2)}_"
         for a, b in zip(matrix, matrix2):
             assert a == b, f"{a} {b}"
+        self.matrix = matrix
 
         # print(orig_size, len(data))
 
@@ -467,7 +385,7 @@ if __name__ == "__main__":
     exe = sys.argv.pop(0)
     fin = open(exe, "rb")
     obj = Executable()
-    obj.load(fin)
+    obj.load(fin, lazy=True)
     sec_line = None
     sec_line_str = None
     for sec in obj.sections:
@@ -480,6 +398,7 @@ if __name__ == "__main__":
         exit(1)
     # print(len(sec_line.data))
     data = io.BytesIO(sec_line.data)
+    obj.close()
 
     units = []
     while data.tell() < len(sec_line.data):
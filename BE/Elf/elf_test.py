@@ -0,0 +1,237 @@
+#!/bin/env python3
+
+import io
+import os
+import tempfile
+import unittest
+
+from BE.CpuX64 import assembler
+from BE.Elf import elf_unit
+from BE.Elf import elfhelper as elf
+from BE.Elf import linker
+from BE.Elf.enum_tab import ST_INFO_BIND
+
+# the runs are only used from MIN_RUN_SIZE bytes on
+BIG = elf.MIN_RUN_SIZE * 4
+
+ASM = """
+.mem big 8 data
+.data %d "\\x00"
+.addr.mem 8 small 0
+.addr.fun 8 _start
+.endmem
+.mem small 8 data
+.data 1 "\\x07"
+.endmem
+.fun _start 16
+    mov_64_mr_imm32 rax 0x3c
+    syscall
+.endfun
+"""
+
+
+def Load(unit: elf_unit.Unit):
+    """Returns the symbols and sections (keyed by name) of the assembled `unit`"""
+    exe = assembler.Assemble(unit, True)
+    stream = io.BytesIO()
+    exe.save(stream)
+    stream.seek(0)
+    obj = elf.Executable()
+    obj.load(stream)
+    return ({sym.name: sym for sym in obj.symbols},
+            {sec.name: sec for sec in obj.sections})
+
+
+class TestRuns(unittest.TestCase):
+
+    def testDataPos(self):
+        unit = elf_unit.Unit()
+        unit.MemStart("m", 8, "data", False)
+        sec = unit.mem_sec
+        unit.AddData(1, b"\x01\x02")
+        unit.AddData(BIG, b"\x00")
+        unit.AddData(1, b"\x03")
+        unit.AddData(2, b"\xff")
+        unit.MemEnd()
+        self.assertEqual(1, len(sec.runs))
+        self.assertEqual(BIG + 5, sec.sh_size)
+        self.assertEqual(5, len(sec.data))
+        self.assertEqual(1, sec.DataPos(1))
+        self.assertEqual(2, sec.DataPos(BIG + 2))
+        self.assertEqual(4, sec.DataPos(BIG + 4))
+        stream = io.BytesIO()
+        sec.write_data(stream)
+        self.assertEqual(b"\x01\x02" + bytes(BIG) + b"\x03\xff\xff", stream.getvalue())
+
+    def testRelocAfterRun(self):
+        unit = assembler.UnitParse(io.StringIO(ASM % BIG))
+        self.assertEqual(1, len(unit.sec_data.runs))
+        symbols, sections = Load(unit)
+        data = sections[".data"]
+        self.assertEqual(bytes(BIG), data.data[:BIG])
+        self.assertEqual(symbols["small"].st_value,
+                         int.from_bytes(data.data[BIG:BIG + 8], "little"))
+        self.assertEqual(symbols["_start"].st_value,
+                         int.from_bytes(data.data[BIG + 8:BIG + 16], "little"))
+
+
+GC_ASM = """
+.mem used_mem 8 data
+.addr.fun 8 indirect
+.endmem
+.mem unused_mem 8 data
+.addr.fun 8 used
+.endmem
+.fun used 16
+    ret
+.endfun
+.fun indirect 16
+    ret
+.endfun
+.fun unused 16
+    call_32 expr:pcrel32:used
+    ret
+.endfun
+.fun _start 16
+.localmem tab 8 rodata
+.addr.bbl 8 exit
+.endmem
+    lea_64_r_mpc32 rax rip expr:pcrel32:used_mem
+    lea_64_r_mpc32 rax rip expr:loc_pcrel32:tab
+    call_32 expr:pcrel32:used
+.bbl exit 1
+    mov_64_mr_imm32 rax 0x3c
+    syscall
+.endfun
+"""
+
+
+def GlobalNames(unit: elf_unit.Unit):
+    return sorted(sym.name for sym in unit.symbols if not sym.is_undefined() and
+                  sym.st_bind != ST_INFO_BIND.LOCAL)
+
+
+class TestRemoveUnreferenced(unittest.TestCase):
+
+    def testReachable(self):
+        unit = assembler.UnitParse(io.StringIO(GC_ASM))
+        out = linker.UnitRemoveUnreferenced(unit, linker.ROOTS)
+        self.assertEqual(sorted(["used_mem", "used", "indirect", "_start", elf_unit.RW_DATA_END]),
+                         GlobalNames(out))
+        # the jump table only holds a local symbol but is reached from _start
+        self.assertEqual(unit.sec_rodata.sh_size, out.sec_rodata.sh_size)
+        # the three in _start plus the ones in used_mem and tab
+        self.assertEqual(5, len(out.relocations))
+        self.assertLess(out.sec_text.sh_size, unit.sec_text.sh_size)
+        symbols, sections = Load(out)
+        self.assertEqual(symbols["indirect"].st_value,
+                         int.from_bytes(sections[".data"].data[0:8], "little"))
+
+    def testNoRoots(self):
+        unit = assembler.UnitParse(io.StringIO(GC_ASM))
+        out = linker.UnitRemoveUnreferenced(unit, [])
+        self.assertEqual([], GlobalNames(out))
+        self.assertEqual(0, out.sec_text.sh_size)
+        self.assertEqual([], out.relocations)
+
+
+class TestLazyLoad(unittest.TestCase):
+
+    def testClose(self):
+        unit = assembler.UnitParse(io.StringIO(ASM % BIG))
+        exe = assembler.Assemble(unit, True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "exe")
+            with open(path, "wb") as fout:
+                exe.save(fout)
+            obj = elf.Executable()
+            with open(path, "rb") as fin:
+                obj.load(fin, lazy=True)
+            data = {sec.name: sec for sec in obj.sections}[".data"]
+            self.assertEqual(bytes(BIG), bytes(data.data[:BIG]))
+            self.assertIn("small", {sym.name for sym in obj.symbols})
+            obj.close()
+            # a second close is harmless
+            obj.close()
+
+
+class TestSave(unittest.TestCase):
+
+    def check(self, exe: elf.Executable):
+        stream = io.BytesIO()
+        exe.save(stream)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "exe")
+            exe.save_to_path(path)
+            with open(path, "rb") as fin:
+                self.assertEqual(stream.getvalue(), fin.read())
+
+    def testRuns(self):
+        asm = ASM % BIG + """
+.mem zeros 16 bss
+.data %d "\\x00"
+.endmem
+""" % BIG
+        for create_sym_tab in [True, False]:
+            unit = assembler.UnitParse(io.StringIO(asm))
+            self.check(assembler.Assemble(unit, create_sym_tab))
+
+    def testLargePages(self):
+        unit = assembler.UnitParse(io.StringIO(ASM % 8))
+        self.check(assembler.Assemble(unit, True, large_pages=True))
+
+
+REORDER_ASM = """
+.fun a 16
+    call_32 expr:pcrel32:c
+    ret
+.endfun
+.fun b 16
+    ret
+.endfun
+.fun c 16
+    call_32 expr:pcrel32:a
+    ret
+.endfun
+.fun _start 16
+    call_32 expr:pcrel32:b
+    mov_64_mr_imm32 rax 0x3c
+    syscall
+.endfun
+"""
+
+
+def FunOrder(unit: elf_unit.Unit):
+    return [sym.name for sym in sorted(
+        (sym for sym in unit.symbols if sym.section is unit.sec_text and
+         sym.st_bind != ST_INFO_BIND.LOCAL), key=lambda sym: sym.st_value)]
+
+
+class TestReorderFuns(unittest.TestCase):
+
+    def check(self, hot, expected):
+        unit = assembler.UnitParse(io.StringIO(REORDER_ASM))
+        out = linker.UnitReorderFuns(unit, hot)
+        self.assertEqual(expected, FunOrder(out))
+        return out
+
+    def testNoHot(self):
+        self.check([], ["a", "b", "c", "_start"])
+
+    def testHot(self):
+        self.check(["_start", "c"], ["_start", "c", "a", "b"])
+
+    def testRepeatsAndUnknown(self):
+        self.check(["c", "nosuchfun", "c", "b", "c"], ["c", "b", "a", "_start"])
+
+    def testCalls(self):
+        out = self.check(["c", "_start"], ["c", "_start", "a", "b"])
+        symbols, sections = Load(out)
+        text = sections[".text"]
+        # the pcrel32 displacement of the first call in c must reach a
+        disp = int.from_bytes(text.data[1:5], "little", signed=True)
+        self.assertEqual(symbols["a"].st_value, text.sh_addr + 5 + disp)
+
+
+if __name__ == '__main__':
+    unittest.main()
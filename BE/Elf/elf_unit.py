@@ -1,8 +1,28 @@
-from typing import List, Dict, Optional, Any
+import dataclasses
+import io
+from typing import List, Dict, Optional, Any, Tuple
 import BE.Elf.elfhelper as elf
+from BE.Elf.enum_tab import E_MACHINE, E_TYPE, EI_CLASS, SH_TYPE, ST_INFO_BIND
 
 ZERO_BYTE = bytes([0])
 
+# symbol defined by AddLinkerDefs()
+RW_DATA_END = "$$rw_data_end"
+
+
+def DumpData(data: bytes, addr: int, syms: Dict[int, Any]) -> str:
+    out = []
+    first_address = True
+    for n, b in enumerate(data):
+        if first_address or (addr + n) % 8 == 0 or (addr + n) in syms:
+            out.append(f"{addr + n:06x}")
+            first_address = False
+            name = syms.get(addr + n)
+            if name:
+                out[-1] += f" [{name}]"
+        out[-1] += f" {b:02x}"
+    return "\n".join(out)
+
 
 class Unit:
     """Hold a collection of Elf Section comprising an Elf Exe
@@ -19,6 +39,8 @@ class Unit:
         self.global_symbol_map: Dict[str, elf.Symbol] = {}
         self.symbols: List[elf.Symbol] = []
         self.relocations: List[elf.Reloc] = []
+        # (.text offset, file name, line) sorted by offset
+        self.lines: List[Tuple[int, str, int]] = []
 
         # used while processing
         self.local_symbol_map: Dict[str, elf.Symbol] = {}
@@ -30,7 +52,7 @@ class Unit:
         sym = the_map.get(name)
         if sym is None:
             # ~0 is our undefined symbol marker. It is checked in
-            val = ~0 if sec is None else len(sec.data)
+            val = ~0 if sec is None else sec.sh_size
             sym = elf.Symbol.Init(name, is_local, sec, val)
             self.symbols.append(sym)
             the_map[name] = sym
@@ -39,7 +61,7 @@ class Unit:
             # the symbol was forward declared and now we are filling in the missing info
             assert sym.is_undefined(), f"{sym} already defined"
             sym.section = sec
-            sym.st_value = len(sec.data)
+            sym.st_value = sec.sh_size
         return sym
 
     def FindOrAddSymbol(self, name, is_local) -> elf.Symbol:
@@ -54,7 +76,7 @@ class Unit:
                  extra: int, reloc_offset_addend=0):
         self.relocations.append(
             elf.Reloc.Init(reloc_kind.value, sec,
-                           len(sec.data) + reloc_offset_addend, symbol, extra))
+                           sec.sh_size + reloc_offset_addend, symbol, extra))
 
     def FunStart(self, name: str, alignment: int, padding_or_padder: Any):
         self.sec_text.PadData(alignment, padding_or_padder)
@@ -64,10 +86,13 @@ class Unit:
 
     def FunEnd(self):
         assert self.current_fun is not None
+        if self.lines and self.lines[-1][2] != 0:
+            # line 0 means no source line so the next fun does not inherit ours
+            self.AddLine(self.lines[-1][1], 0)
         self.current_fun = None
         self.local_symbol_map.clear()
 
-    def MemStart(self, name: str, alignment: int, kind: str, is_local_sym):
+    def MemStart(self, name: str, alignment: int, kind: str, is_local_sym) -> elf.Symbol:
         assert self.mem_sec is None
         if kind == "rodata":
             self.mem_sec = self.sec_rodata
@@ -78,7 +103,7 @@ class Unit:
         else:
             assert False, f"bad mem kind {kind}"
         self.mem_sec.PadData(alignment, ZERO_BYTE)
-        self.AddSymbol(name, self.mem_sec, is_local_sym)
+        return self.AddSymbol(name, self.mem_sec, is_local_sym)
 
     def MemEnd(self):
         assert self.mem_sec is not None
@@ -86,7 +111,8 @@ class Unit:
 
     def AddData(self, repeats: int, data: bytes):
         assert self.mem_sec is not None
-        self.mem_sec.AddData(data * repeats)
+        # large zero buffers only cost their size
+        self.mem_sec.AddFill(data, repeats)
 
     def AddFunAddr(self, reloc_type, size: int, fun_name: str):
         assert self.mem_sec is not None
@@ -112,24 +138,187 @@ class Unit:
         assert self.current_fun is not None
         self.AddSymbol(name, self.sec_text, True)
 
+    def AddLine(self, filename: str, line: int):
+        """Attributes the code emitted from here on to the given source line"""
+        assert self.current_fun is not None
+        entry = (self.sec_text.sh_size, filename, line)
+        if self.lines and self.lines[-1][0] == entry[0]:
+            # no code for the previous line
+            self.lines.pop()
+        if not self.lines or self.lines[-1][1:] != entry[1:]:
+            self.lines.append(entry)
+
     def AddLinkerDefs(self):
         """must be called last - do we really need linkerdefs?"""
         if self.sec_bss.sh_size > 0:
             self.sec_bss.PadData(16, ZERO_BYTE)
-            self.AddSymbol("$$rw_data_end", self.sec_bss, False)
+            self.AddSymbol(RW_DATA_END, self.sec_bss, False)
         elif self.sec_data.sh_size > 0:
             self.sec_data.PadData(16, ZERO_BYTE)
-            self.AddSymbol("$$rw_data_end", self.sec_data, False)
+            self.AddSymbol(RW_DATA_END, self.sec_data, False)
+
+    def sections(self) -> List[elf.Section]:
+        return [self.sec_text, self.sec_rodata, self.sec_data, self.sec_bss]
 
     def __str__(self):
         syms = {}
         return f"""UNIT
-SECTION[text] {len(self.sec_text.data)}
+SECTION[text] {self.sec_text.sh_size}
 {DumpData(self.sec_text.data, 0, syms)}
-SECTION[rodata] {len(self.sec_rodata.data)}
+SECTION[rodata] {self.sec_rodata.sh_size}
 {DumpData(self.sec_rodata.data, 0, syms)}     
-SECTION[data] {len(self.sec_data.data)}
+SECTION[data] {self.sec_data.sh_size}
 {DumpData(self.sec_data.data, 0, syms)}    
-SECTION[bss] {len(self.sec_bss.data)}
+SECTION[bss] {self.sec_bss.sh_size}
 {DumpData(self.sec_bss.data, 0, syms)}    
 """
+
+
+def _InitHeaders(machine: E_MACHINE, shnum: int, shstrndx: int) -> elf.Executable:
+    exe = elf.Executable()
+    if machine == E_MACHINE.X86_64:
+        exe.ehdr_ident.InitX64()
+        exe.ehdr.InitX64Exec(shnum, 0, shstrndx)
+    elif machine == E_MACHINE.AARCH64:
+        exe.ehdr_ident.InitA64()
+        exe.ehdr.InitA64Exec(shnum, 0, shstrndx)
+    elif machine == E_MACHINE.ARM:
+        exe.ehdr_ident.InitA32()
+        exe.ehdr.InitA32Exec(shnum, 0, shstrndx)
+    else:
+        assert False, f"unsupported machine {machine}"
+    exe.ehdr.MakeRel()
+    return exe
+
+
+def UnitSaveAsObject(unit: Unit, machine: E_MACHINE, stream: io.BytesIO):
+    """Writes the unit as a relocatable (ET_REL) object file
+
+    Unlike the assemblers' Assemble() this does not resolve anything:
+    symbol values stay section relative, undefined symbols are emitted as such
+    and the relocations go into a .rela.<section> for each section.
+    The unit itself is not modified.
+    """
+    null = elf.Section.MakeSectionNull()
+    content = unit.sections()
+    targets = [sec for sec in content
+               if any(rel.section is sec for rel in unit.relocations)]
+    symtab_ndx = 1 + len(content) + len(targets)
+    sec_index = {id(sec): n + 1 for n, sec in enumerate(content)}
+
+    exe = _InitHeaders(machine, symtab_ndx + 3, symtab_ndx + 2)
+    which = exe.ehdr_ident.ei_class
+    # locals must precede globals in the symbol table
+    symbols = ([sym for sym in unit.symbols if sym.st_bind == ST_INFO_BIND.LOCAL] +
+               [sym for sym in unit.symbols if sym.st_bind != ST_INFO_BIND.LOCAL])
+    sym_index = {id(sym): n + 1 for n, sym in enumerate(symbols)}
+
+    sec_symtab = elf.Section.MakeSectionSymTab(".symtab", which, symtab_ndx + 1)
+    sec_symtab.sh_addralign = 8 if which == EI_CLASS.X_64 else 4
+    # index of the first global symbol
+    sec_symtab.sh_info = 1 + len(
+        [sym for sym in unit.symbols if sym.st_bind == ST_INFO_BIND.LOCAL])
+    sym_names = bytearray(ZERO_BYTE)
+    sym_data = bytearray(elf.Symbol().pack(which))
+    for sym in symbols:
+        name = 0
+        if sym.name:
+            name = len(sym_names)
+            sym_names += bytes(sym.name, "utf-8") + ZERO_BYTE
+        if sym.is_undefined():
+            out = dataclasses.replace(sym, st_name=name, st_value=0, st_shndx=0)
+        else:
+            out = dataclasses.replace(sym, st_name=name,
+                                      st_shndx=sec_index[id(sym.section)])
+        sym_data += out.pack(which)
+    sec_symtab.SetData(sym_data)
+    sec_strtab = elf.Section.MakeSectionStrTab(".strtab")
+    sec_strtab.SetData(sym_names)
+
+    relas = []
+    for sec in targets:
+        rela = elf.Section.MakeSectionRela(sec, which, symtab_ndx, sec_index[id(sec)])
+        for rel in unit.relocations:
+            if rel.section is sec:
+                rela.AddData(dataclasses.replace(
+                    rel, r_sym=sym_index[id(rel.symbol)]).pack(which))
+        relas.append(rela)
+
+    # the content sections are shallow copies so we can fill in the
+    # object file specific shdr fields without disturbing the unit
+    sections = ([null] + [dataclasses.replace(sec, sh_addr=0) for sec in content] +
+                relas + [sec_symtab, sec_strtab])
+    sec_shstrtab = elf.Section.MakeSectionStrTab(".shstrtab")
+    sections.append(sec_shstrtab)
+    sec_shstrtab.SetData(elf.MakeSecStrTabContents(sections))
+
+    header_size = elf.EHdrIdent.SIZE + elf.EHdr.SIZE[which]
+    offset = header_size
+    null.sh_offset = 0
+    for sec in sections:
+        sec.sh_addr = 0
+        if sec is null:
+            continue
+        offset = elf.Align(offset, max(1, sec.sh_addralign))
+        sec.sh_offset = offset
+        if not sec.is_nobits():
+            offset += sec.sh_size
+    exe.ehdr.e_shoff = elf.Align(offset, 8 if which == EI_CLASS.X_64 else 4)
+
+    stream.write(exe.ehdr_ident.pack())
+    stream.write(exe.ehdr.pack(which))
+    offset = header_size
+    for sec in sections:
+        if sec is null or sec.is_nobits():
+            continue
+        assert sec.sh_size == sec.file_size()
+        stream.write(ZERO_BYTE * (sec.sh_offset - offset))
+        sec.write_data(stream)
+        offset = sec.sh_offset + sec.sh_size
+    stream.write(ZERO_BYTE * (exe.ehdr.e_shoff - offset))
+    for sec in sections:
+        stream.write(sec.pack(which))
+
+
+def UnitLoadFromObject(fin: io.BytesIO) -> Tuple[E_MACHINE, Unit]:
+    """Reads a relocatable object file written by UnitSaveAsObject()"""
+    exe = elf.Executable()
+    exe.load(fin)
+    assert exe.ehdr.e_type == E_TYPE.REL, f"not an object file"
+    which = exe.ehdr_ident.ei_class
+    unit = Unit()
+    by_name = {sec.name: sec for sec in unit.sections()}
+    sec_map: Dict[int, elf.Section] = {}
+    for n, sec in enumerate(exe.sections):
+        dst = by_name.get(sec.name)
+        if dst is None:
+            continue
+        sec_map[n] = dst
+        dst.sh_addralign = max(1, sec.sh_addralign)
+        if dst.is_nobits():
+            dst.sh_size = sec.sh_size
+        else:
+            dst.SetData(bytearray(sec.data))
+
+    symbols: List[Optional[elf.Symbol]] = [None]
+    for sym in exe.symbols[1:]:
+        sec = sec_map.get(sym.st_shndx)
+        is_local = sym.st_bind == ST_INFO_BIND.LOCAL
+        out = elf.Symbol.Init(sym.name, is_local, sec, ~0 if sec is None else sym.st_value)
+        out.st_bind = sym.st_bind
+        unit.symbols.append(out)
+        if not is_local:
+            unit.global_symbol_map[sym.name] = out
+        symbols.append(out)
+
+    size = elf.Reloc.SIZE[which]
+    for sec in exe.sections:
+        if sec.sh_type != SH_TYPE.RELA:
+            continue
+        target = sec_map[sec.sh_info]
+        for pos in range(0, sec.sh_size, size):
+            rel = elf.Reloc()
+            rel.unpack(which, sec.data[pos:pos + size])
+            unit.relocations.append(elf.Reloc.Init(
+                rel.r_type, target, rel.r_offset, symbols[rel.r_sym], rel.r_addend))
+    return E_MACHINE(exe.ehdr.e_machine), unit
@@ -44,8 +44,10 @@ s64 -> q
 
 import dataclasses
 import io
+import mmap
+import os
 import struct
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Iterator
 
 from BE.Elf.enum_tab import E_MACHINE, EI_CLASS, EI_DATA, E_TYPE, E_FLAGS_ARM, ST_INFO_BIND, \
     ST_INFO_TYPE
@@ -206,6 +208,14 @@ class EHdr:
         self.e_phnum = phnum
         self.e_shstrndx = shstrndx
 
+    def MakeRel(self):
+        """Turns a header initialized by one of the Init*Exec() into an object file header"""
+        self.e_type = E_TYPE.REL.value
+        self.e_entry = 0
+        self.e_phoff = 0
+        self.e_phentsize = 0
+        self.e_phnum = 0
+
     def unpack(self, which, data: bytes):
         fmt = EHdr.FORMAT[which]
         (self.e_type, self.e_machine, self.e_version, self.e_entry, self.e_phoff,
@@ -240,6 +250,27 @@ ARM_ATTRIBUTES = bytes([0x41, 0x11, 0, 0,
                         8, 1])
 
 
+# fills smaller than this are simply materialized
+MIN_RUN_SIZE = 4096
+
+_WRITE_BLOCK_SIZE = 1 << 16
+
+
+@dataclasses.dataclass
+class Run:
+    """`pattern` repeated `repeats` times starting at section `offset`
+
+    The bytes are not stored in Section.data but would be inserted at `data_pos`.
+    """
+    offset: int
+    data_pos: int
+    pattern: bytes
+    repeats: int
+
+    def size(self) -> int:
+        return len(self.pattern) * self.repeats
+
+
 @dataclasses.dataclass
 class Section:
     """An Elf Section (glorified Shdr)"""
@@ -257,24 +288,110 @@ class Section:
     name: str = ""  # maybe switch to bytes and propagate to Section in CodeGenXXX
     data: bytearray = dataclasses.field(default_factory=bytearray)
     index: int = TO_BE_FILLED_IN_LATER
+    # repeated data not materialized in `data`, see AddFill()
+    runs: List[Run] = dataclasses.field(default_factory=list)
 
     FORMAT = {EI_CLASS.X_32: "10I", EI_CLASS.X_64: "2I4Q2I2Q"}
     SIZE = {k: struct.calcsize(v) for k, v in FORMAT.items()}
 
+    def is_nobits(self) -> bool:
+        return self.sh_type == SH_TYPE.NOBITS
+
     def PadData(self, n: int, padding_or_padder: Any):
         if self.sh_addralign < n:
             self.sh_addralign = n
-        Pad(self.data, n, padding_or_padder)
-        self.sh_size = len(self.data)
+        if self.is_nobits():
+            self.sh_size = Align(self.sh_size, n)
+        elif self.runs:
+            # `data` is shorter than the section so we cannot use Pad()
+            delta = Align(self.sh_size, n) - self.sh_size
+            assert isinstance(padding_or_padder, bytes) and len(padding_or_padder) == 1
+            self.AddData(padding_or_padder * delta)
+        else:
+            Pad(self.data, n, padding_or_padder)
+            self.sh_size = len(self.data)
 
     def AddData(self, data: bytes):
-        self.data += data
-        self.sh_size = len(self.data)
+        if self.is_nobits():
+            self.sh_size += len(data)
+        else:
+            self.data += data
+            self.sh_size = self.file_size()
+
+    def AddFill(self, pattern: bytes, repeats: int):
+        """Adds `pattern * repeats` without necessarily materializing it
+
+        For NOBITS sections only the size changes, otherwise large fills are
+        recorded as a Run and expanded when the section is written out.
+        The content of a fill cannot be patched (e.g. by relocations).
+        """
+        size = len(pattern) * repeats
+        if self.is_nobits():
+            self.sh_size += size
+        elif size < MIN_RUN_SIZE:
+            self.AddData(pattern * repeats)
+        else:
+            self.runs.append(Run(self.sh_size, len(self.data), pattern, repeats))
+            self.sh_size += size
 
     def SetData(self, data: bytes):
+        assert not self.runs
         self.data = data
         self.sh_size = len(self.data)
 
+    def DataPos(self, offset: int) -> int:
+        """Maps an offset within the section to the position in `data`"""
+        for run in reversed(self.runs):
+            if run.offset <= offset:
+                assert offset >= run.offset + run.size(), "cannot access data inside a run"
+                return run.data_pos + offset - run.offset - run.size()
+        return offset
+
+    def file_size(self) -> int:
+        return len(self.data) + sum(run.size() for run in self.runs)
+
+    def write_data(self, stream: io.BytesIO):
+        """Writes `data` with all the runs expanded"""
+        pos = 0
+        for run in self.runs:
+            stream.write(self.data[pos:run.data_pos])
+            pos = run.data_pos
+            # bound the memory needed for the expansion
+            block_repeats = max(1, _WRITE_BLOCK_SIZE // len(run.pattern))
+            block = run.pattern * min(run.repeats, block_repeats)
+            left = run.repeats
+            while left >= block_repeats:
+                stream.write(block)
+                left -= block_repeats
+            stream.write(run.pattern * left)
+        stream.write(self.data[pos:])
+
+    def data_chunks(self) -> Iterator[Tuple[int, Any]]:
+        """Yields (offset, buffer) pairs for the content with all runs expanded
+
+        Runs of zeros are skipped, callers must make sure the gaps read as zero.
+        """
+        data = memoryview(self.data)
+        pos = 0
+        offset = 0
+        for run in self.runs:
+            if run.data_pos > pos:
+                yield offset, data[pos:run.data_pos]
+                offset += run.data_pos - pos
+                pos = run.data_pos
+            if any(run.pattern):
+                block_repeats = max(1, _WRITE_BLOCK_SIZE // len(run.pattern))
+                block = run.pattern * min(run.repeats, block_repeats)
+                left = run.repeats
+                while left >= block_repeats:
+                    yield offset + (run.repeats - left) * len(run.pattern), block
+                    left -= block_repeats
+                if left:
+                    yield offset + (run.repeats - left) * len(run.pattern), run.pattern * left
+            offset += run.size()
+        if pos < len(data):
+            yield offset, data[pos:]
+
     @classmethod
     def MakeSection(cls, name: str, alignment: int, kind: SH_TYPE, flags: SH_FLAGS) -> "Section":
         self = Section()
@@ -320,6 +437,20 @@ class Section:
         sec.sh_entsize = Symbol.SIZE[which]
         return sec
 
+    @classmethod
+    def MakeSectionRela(cls, target: "Section", which, symtab_ndx: int,
+                        target_ndx: int) -> "Section":
+        sec = Section.MakeSection(".rela" + target.name, 8 if which == EI_CLASS.X_64 else 4,
+                                  SH_TYPE.RELA, SH_FLAGS.INFO_LINK)
+        sec.sh_link = symtab_ndx
+        sec.sh_info = target_ndx
+        sec.sh_entsize = Reloc.SIZE[which]
+        return sec
+
+    @classmethod
+    def MakeSectionDebug(cls, name: str) -> "Section":
+        return Section.MakeSection(name, 1, SH_TYPE.PROGBITS, SH_FLAGS(0))
+
     @classmethod
     def MakeSectionArmAttributes(cls) -> "Section":
         return Section.MakeSection(".ARM.attributes", 1, SH_TYPE.ARM_ATTRIBUTES, SH_FLAGS(0))
@@ -392,7 +523,7 @@ class Section:
                 vaddr += self.sh_size
             return vaddr, offset
 
-        assert self.sh_size == len(self.data), f"{self}"
+        assert self.sh_size == self.file_size(), f"{self}"
         offset = Align(offset, self.sh_addralign)
         vaddr = Align(vaddr, self.sh_addralign)
         self.sh_offset = offset
@@ -651,8 +782,8 @@ class Reloc:
                                self.r_addend)
         else:
             return struct.pack(Reloc.FORMAT[which], self.r_offset,
-                               self.r_type | (self.r_sym << 8, self.r_addend))
-    
+                               self.r_type | (self.r_sym << 8), self.r_addend)
+
     def __str__(self):
         return f"{self.section.name}  {self.r_offset} {self.r_type} {self.symbol.name}"
 
@@ -678,11 +809,10 @@ def is_inside(src, dst):
 
 def str_offset_to_name(offset, sec_symtab: Section):
     data = sec_symtab.data
-    name = bytearray()
-    while data[offset] != 0:
-        name.append(data[offset])
-        offset += 1
-    return name.decode("utf-8")
+    end = offset
+    while data[end] != 0:
+        end += 1
+    return bytes(data[offset:end]).decode("utf-8")
 
 
 def MakeSecStrTabContents(sections: List[Section]):
@@ -697,6 +827,35 @@ def MakeSecStrTabContents(sections: List[Section]):
     return out
 
 
+_IOV_MAX = 1024
+
+
+def _WriteChunks(fd: int, chunks: List[Tuple[int, Any]]):
+    """Writes the (file offset, buffer) chunks which must be sorted by offset
+
+    Adjacent chunks are combined into a single os.pwritev() call.
+    """
+    i = 0
+    while i < len(chunks):
+        start, data = chunks[i]
+        buffers = [data]
+        end = start + len(data)
+        i += 1
+        while i < len(chunks) and chunks[i][0] == end and len(buffers) < _IOV_MAX:
+            buffers.append(chunks[i][1])
+            end += len(chunks[i][1])
+            i += 1
+        while start < end:
+            written = os.pwritev(fd, buffers, start)
+            start += written
+            # deal with partial writes
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers[0])
+                buffers.pop(0)
+            if written:
+                buffers[0] = memoryview(buffers[0])[written:]
+
+
 class Executable:
     """An ELF Executable"""
 
@@ -706,7 +865,23 @@ class Executable:
         self.sections: List[Section] = []
         self.segments: List[Segment] = []
         self.start_vaddr = 0
-        self.symbols: List[Symbol] = []
+        self._symbols: List[Symbol] = []
+        # set by load(lazy=True) and consumed by the first access of `symbols`
+        self._symbols_pending = False
+        self._mmap: Optional[mmap.mmap] = None
+        self._image: Optional[memoryview] = None
+
+    @property
+    def symbols(self) -> List[Symbol]:
+        if self._symbols_pending:
+            self._symbols_pending = False
+            self._symbols = self._parse_symbols(self.ehdr_ident.ei_class, self.sections)
+        return self._symbols
+
+    @symbols.setter
+    def symbols(self, symbols: List[Symbol]):
+        self._symbols_pending = False
+        self._symbols = symbols
 
     def InitWithSectionsAndSegments(self, start_vaddr: int,
                                     sections: List[Section],
@@ -819,10 +994,10 @@ class Executable:
                     offset += len(padding)
                     stream.write(padding)
 
-                assert shdr.sh_size == len(
-                    shdr.data), f"size mismatch {shdr.sh_size:x} vs {len(shdr.data):x}"
-                offset += len(shdr.data)
-                stream.write(shdr.data)
+                assert shdr.sh_size == shdr.file_size(), (
+                    f"size mismatch {shdr.sh_size:x} vs {shdr.file_size():x}")
+                offset += shdr.sh_size
+                shdr.write_data(stream)
 
         # hack
         new_offset = Align(offset, 16 if which == EI_CLASS.X_64 else 4)
@@ -839,9 +1014,56 @@ class Executable:
                 offset += len(data)
                 stream.write(data)
 
+    def save_to_path(self, path: str):
+        """Same output as save() but written without assembling a stream
+
+        The file is truncated to its final size first, then every header and
+        section chunk is written straight to its final offset using os.pwritev().
+        Alignment padding and zero runs are not written at all, they are
+        holes in the file which read as zeros.
+        """
+        which = self.ehdr_ident.ei_class
+        headers = [self.ehdr_ident.pack(), self.ehdr.pack(which)]
+        assert sum(len(h) for h in headers) == self.ehdr.e_phoff
+        headers += [phdr.pack(which) for phdr in self.segments if not phdr.is_pseudo]
+        chunks: List[Tuple[int, Any]] = []
+        offset = 0
+        for data in headers:
+            chunks.append((offset, data))
+            offset += len(data)
+
+        shdrs = []
+        # Note pseudo segment will be last
+        for phdr in self.segments:
+            if phdr.is_auxiliary:
+                continue
+            for shdr in phdr.sections:
+                shdrs.append(shdr.pack(which))
+                if shdr.sh_size == 0 or shdr.sh_type == SH_TYPE.NOBITS:
+                    continue
+                assert shdr.sh_offset >= offset, f"offset corruption"
+                assert shdr.sh_size == shdr.file_size(), (
+                    f"size mismatch {shdr.sh_size:x} vs {shdr.file_size():x}")
+                chunks += [(shdr.sh_offset + o, d) for o, d in shdr.data_chunks()]
+                offset = shdr.sh_offset + shdr.sh_size
+
+        assert Align(offset, 16 if which == EI_CLASS.X_64 else 4) == self.ehdr.e_shoff, (
+            f"e_shoff mismatch {offset:x} vs {self.ehdr.e_shoff:x}")
+        offset = self.ehdr.e_shoff
+        for data in shdrs:
+            chunks.append((offset, data))
+            offset += len(data)
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.ftruncate(fd, offset)
+            _WriteChunks(fd, chunks)
+        finally:
+            os.close(fd)
+
     def _load_segements(self, fin: io.BytesIO, which) -> Tuple[int, List[Segment]]:
         size = Segment.SIZE[which]
-        assert size == self.ehdr.e_phentsize
+        assert size == self.ehdr.e_phentsize or self.ehdr.e_phnum == 0
         fin.seek(self.ehdr.e_phoff)
         start_vaddr = 0
         segments = []
@@ -855,7 +1077,7 @@ class Executable:
             phdr.is_auxiliary = (phdr.p_type in _AUXILIARY_PHDR_TYPE)
         return start_vaddr, segments
 
-    def _load_sections(self, fin: io.BytesIO, which) -> List[Section]:
+    def _load_sections(self, fin: io.BytesIO, which, image: Optional[memoryview]) -> List[Section]:
         size = Section.SIZE[which]
         assert size == self.ehdr.e_shentsize
         fin.seek(self.ehdr.e_shoff)
@@ -868,6 +1090,9 @@ class Executable:
         for shdr in shdrs:
             if shdr.sh_type == SH_TYPE.NOBITS:
                 continue
+            elif image is not None:
+                # no copying - pages are only read when the data is accessed
+                shdr.data = image[shdr.sh_offset:shdr.sh_offset + shdr.sh_size]
             else:
                 fin.seek(shdr.sh_offset)
                 shdr.data = fin.read(shdr.sh_size)
@@ -877,31 +1102,42 @@ class Executable:
             shdr.name = str_offset_to_name(shdr.sh_name, sh_strtab)
         return shdrs
 
-    def _load_symbols(self, fin: io.BytesIO, which, shdrs):
+    def _parse_symbols(self, which, shdrs: List[Section]) -> List[Symbol]:
         symtab = None
         for shdr in shdrs:
             if shdr.sh_type == SH_TYPE.SYMTAB.value and shdr.name == ".symtab":
                 assert symtab is None
                 symtab = shdr
         if not symtab:
-            return
+            return []
         strtab = shdrs[symtab.sh_link]
         # note, sh_info is the index of the last local symbol + 1
         size = Symbol.SIZE[which]
         n = symtab.sh_size // size
         assert n * size == symtab.sh_size
-        fin.seek(symtab.sh_offset)
+        out = []
         for i in range(n):
             sym = Symbol()
-            self.symbols.append(sym)
+            out.append(sym)
+            sym.unpack(which, symtab.data[i * size:(i + 1) * size])
             if len(shdrs) > sym.st_shndx > 0:
                 sym.section = shdrs[sym.st_shndx]
-            sym.unpack(which, fin.read(size))
             sym.name = str_offset_to_name(sym.st_name, strtab)
+        return out
+
+    def load(self, fin: io.BytesIO, lazy=False):
+        """Initialize the object from the content of a file
 
-    def load(self, fin: io.BytesIO):
-        """Initialize the object from the content of a file """
+        With `lazy` the file is mmap'ed and the section data become memoryview
+        slices of it, so only the parts which are actually looked at get read.
+        Symbols are parsed on the first access of `symbols`.
+        The mapping stays around until close() is called.
+        """
         assert not self.sections and not self.segments
+        image = None
+        if lazy:
+            self._mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+            image = self._image = memoryview(self._mmap)
         self.ehdr_ident.unpack(fin.read(EHdrIdent.SIZE))
         assert self.ehdr_ident.is_valid()
         assert self.ehdr_ident.ei_data == EI_DATA.LSB2
@@ -911,8 +1147,11 @@ class Executable:
         self.ehdr.unpack(which, fin.read(EHdr.SIZE[which]))
 
         self.start_vaddr, self.segments = self._load_segements(fin, which)
-        self.sections = self._load_sections(fin, which)
-        self._load_symbols(fin, which, self.sections)
+        self.sections = self._load_sections(fin, which, image)
+        if lazy:
+            self._symbols_pending = True
+        else:
+            self.symbols = self._parse_symbols(which, self.sections)
 
         # assign sections to segments
         # The null sections goes into the first segment
@@ -930,7 +1169,9 @@ class Executable:
                     phdr.sections.append(sec)
 
             else:
-                assert sec.sh_type != SH_TYPE.X_NULL, f"unexpected {sec}"
+                # relocatable objects do not have any segments
+                assert sec.sh_type != SH_TYPE.X_NULL or self.ehdr.e_type == E_TYPE.REL, (
+                    f"unexpected {sec}")
                 if pseudo_segment is None:
                     pseudo_segment = Segment.MakePseudoSegment()
                     self.segments.append(pseudo_segment)
@@ -938,6 +1179,21 @@ class Executable:
 
         # print(self)
 
+    def close(self):
+        """Unmaps the file of a load(lazy=True) - a no-op otherwise
+
+        The section data (and symbols not parsed yet) must not be used afterwards.
+        """
+        if self._mmap is None:
+            return
+        for sec in self.sections:
+            if isinstance(sec.data, memoryview):
+                sec.data.release()
+        self._image.release()
+        self._image = None
+        self._mmap.close()
+        self._mmap = None
+
     def combined_header_size(self) -> int:
         """assumes a layout where the phdrs follow directly after the ehdr"""
         which = self.ehdr_ident.ei_class
@@ -1098,17 +1354,18 @@ if __name__ == "__main__":
     def verify(exe: str):
         fin = open(exe, "rb")
         obj = Executable()
-        obj.load(fin)
+        obj.load(fin, lazy=True)
         obj.verify_vaddrs_and_offsets()
+        obj.close()
 
 
     def clone(exe: str, exe_clone: str):
         fin = open(exe, "rb")
         obj = Executable()
-        obj.load(fin)
+        obj.load(fin, lazy=True)
         obj.verify_vaddrs_and_offsets()
-        fout = open(exe_clone, "wb")
-        obj.save(fout)
+        obj.save_to_path(exe_clone)
+        obj.close()
 
 
     if mode == "verify":
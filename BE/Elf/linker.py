@@ -0,0 +1,262 @@
+"""A minimal static linker for relocatable objects produced by Cwerg
+
+Objects are read into elf_unit.Units (see elf_unit.UnitLoadFromObject) and
+merged into a single Unit with all global symbols resolved.
+The merged Unit is turned into an executable by the assembler of the
+respective cpu (e.g. CpuX64.assembler.Assemble()) which takes care of the
+layout and of applying the relocations.
+
+Units can also be stripped of funs and mems which are not reachable
+from a set of root symbols (see UnitRemoveUnreferenced).
+
+The funs in .text can be reordered, e.g. to place the hot ones
+together (see UnitReorderFuns).
+
+LinkWithRuntime combines both to link a freshly generated Unit against a
+precompiled runtime object (e.g. the startup code plus StdLib, see StdLib/README.md)
+instead of recompiling the runtime from IR for every program.
+"""
+import bisect
+from typing import List, Dict, Set, Tuple, Optional
+
+import BE.Elf.elfhelper as elf
+from BE.Elf import elf_unit
+from BE.Elf.enum_tab import ST_INFO_BIND, E_MACHINE
+
+# an atom is identified by the id() of its section and the index of its start offset
+Atom = Tuple[int, int]
+
+# symbols which are always kept by UnitRemoveUnreferenced
+ROOTS = ["_start", elf_unit.RW_DATA_END]
+
+
+def _CopyRange(dst: elf.Section, src: elf.Section, start: int, end: int):
+    """Appends the [start, end) range of `src` to `dst` keeping runs unmaterialized"""
+    if dst.is_nobits():
+        dst.sh_size += end - start
+        return
+    data = memoryview(src.data)
+    offset = 0
+    pos = 0
+    for run in src.runs + [None]:
+        data_end = len(data) if run is None else run.data_pos
+        lo = max(start, offset)
+        hi = min(end, offset + data_end - pos)
+        if lo < hi:
+            dst.AddData(data[pos + lo - offset: pos + hi - offset])
+        if run is None:
+            break
+        offset += data_end - pos
+        pos = data_end
+        if start < offset + run.size() and offset < end:
+            assert start <= offset and offset + run.size() <= end, "atom boundary inside a run"
+            dst.AddFill(run.pattern, run.repeats)
+        offset += run.size()
+
+
+def _AtomOf(starts: Dict[int, List[int]], sec: elf.Section, offset: int) -> Atom:
+    return id(sec), bisect.bisect_right(starts[id(sec)], offset) - 1
+
+
+def _AddUnit(out: elf_unit.Unit, unit: elf_unit.Unit, starts: Dict[int, List[int]],
+             live: Set[Atom], first: Optional[List[Atom]] = None):
+    """Appends the `live` atoms of `unit` to `out`
+
+    `starts` has the sorted start offsets of the atoms for each section of `unit`.
+    An atom extends to the start of the next one.
+    The atoms in `first` are placed (in that order) before the other atoms of their
+    section, repeated atoms only count at their first occurrence.
+    Offsets modulo the section alignment are preserved so all alignment
+    constraints within a section continue to hold.
+    """
+    first = first or []
+    sec_map: Dict[int, elf.Section] = {}
+    new_starts: Dict[Atom, int] = {}
+    for src, dst in zip(unit.sections(), out.sections()):
+        sec_map[id(src)] = dst
+        align = max(1, src.sh_addralign)
+        dst.sh_addralign = max(dst.sh_addralign, align)
+        bounds = starts[id(src)] + [src.sh_size]
+        # dict preserves the order - an atom listed repeatedly is placed only once
+        atoms = list(dict.fromkeys(atom for atom in first if atom[0] == id(src)))
+        placed = set(atoms)
+        atoms += [(id(src), n) for n in range(len(bounds) - 1) if (id(src), n) not in placed]
+        for atom in atoms:
+            if atom not in live:
+                continue
+            start = bounds[atom[1]]
+            dst.AddFill(elf_unit.ZERO_BYTE, (start - dst.sh_size) % align)
+            new_starts[atom] = dst.sh_size
+            _CopyRange(dst, src, start, bounds[atom[1] + 1])
+
+    def new_offset(sec: elf.Section, offset: int):
+        atom = _AtomOf(starts, sec, offset)
+        if atom not in live:
+            return None
+        return new_starts[atom] + offset - starts[id(sec)][atom[1]]
+
+    sym_map: Dict[int, elf.Symbol] = {}
+    for sym in unit.symbols:
+        is_local = sym.st_bind == ST_INFO_BIND.LOCAL
+        if not is_local and sym.name == elf_unit.RW_DATA_END:
+            # recomputed by _FinishUnit() - only if referenced (see below)
+            continue
+        if sym.is_undefined():
+            sec, val = None, ~0
+        else:
+            sec, val = sec_map[id(sym.section)], new_offset(sym.section, sym.st_value)
+            if val is None:
+                continue
+        if is_local:
+            new_sym = elf.Symbol.Init(sym.name, True, sec, val)
+            out.symbols.append(new_sym)
+        else:
+            new_sym = out.FindOrAddSymbol(sym.name, False)
+            is_weak = sym.st_bind == ST_INFO_BIND.WEAK
+            if sec is None:
+                pass
+            elif new_sym.is_undefined() or (
+                    new_sym.st_bind == ST_INFO_BIND.WEAK and not is_weak):
+                new_sym.section = sec
+                new_sym.st_value = val
+                new_sym.st_bind = sym.st_bind
+            else:
+                assert is_weak, f"duplicate symbol {sym.name}"
+        sym_map[id(sym)] = new_sym
+
+    for rel in unit.relocations:
+        offset = new_offset(rel.section, rel.r_offset)
+        if offset is None:
+            continue
+        sym = sym_map.get(id(rel.symbol))
+        if sym is None:
+            sym = out.FindOrAddSymbol(rel.symbol.name, False)
+        out.relocations.append(elf.Reloc.Init(
+            rel.r_type, sec_map[id(rel.section)], offset, sym, rel.r_addend))
+
+    for offset, filename, line in unit.lines:
+        if line == 0:
+            # marks the end of a fun and hence belongs to the preceding atom
+            new = new_offset(unit.sec_text, offset - 1)
+            if new is not None:
+                out.lines.append((new + 1, filename, line))
+        else:
+            new = new_offset(unit.sec_text, offset)
+            if new is not None:
+                out.lines.append((new, filename, line))
+    if first:
+        # the end markers (line 0) of a fun go before the start of the next one
+        out.lines.sort(key=lambda x: (x[0], x[2] != 0))
+
+
+def _FinishUnit(out: elf_unit.Unit) -> elf_unit.Unit:
+    out.AddLinkerDefs()
+    for sym in out.symbols:
+        assert not sym.is_undefined(), f"undefined symbol {sym.name}"
+    return out
+
+
+def Link(units: List[elf_unit.Unit]) -> elf_unit.Unit:
+    """Merges the units and resolves global symbols by name
+
+    Local symbols stay private to the unit they came from.
+    Duplicate definitions are only allowed for weak symbols, the first global (or
+    if there is none the first weak) definition wins.
+    Linker defined symbols (e.g. elf_unit.RW_DATA_END) are recomputed for
+    the merged unit.
+    """
+    out = elf_unit.Unit()
+    for unit in units:
+        # every section is a single atom
+        starts = {id(sec): [0] for sec in unit.sections()}
+        _AddUnit(out, unit, starts, {(id(sec), 0) for sec in unit.sections()})
+    return _FinishUnit(out)
+
+
+def _AtomStarts(unit: elf_unit.Unit) -> Dict[int, List[int]]:
+    """Every global symbol starts a new atom as does every local one outside of .text
+    (e.g. jump tables). Local symbols inside .text are just labels within a fun.
+    """
+    starts: Dict[int, List[int]] = {id(sec): [0] for sec in unit.sections()}
+    for sym in unit.symbols:
+        if sym.is_undefined():
+            continue
+        if sym.st_bind != ST_INFO_BIND.LOCAL or sym.section is not unit.sec_text:
+            starts[id(sym.section)].append(sym.st_value)
+    for key, offsets in starts.items():
+        starts[key] = sorted(set(offsets))
+    return starts
+
+
+def UnitRemoveUnreferenced(unit: elf_unit.Unit, roots: List[str]) -> elf_unit.Unit:
+    """Returns a copy of `unit` without the funs and mems unreachable from `roots`
+
+    The atoms are determined by _AtomStarts().
+    Reachability follows the relocations from the atom containing the relocated
+    location to the atom containing the target symbol.
+    """
+    starts = _AtomStarts(unit)
+    edges: Dict[Atom, List[Atom]] = {}
+    for rel in unit.relocations:
+        if rel.symbol.is_undefined():
+            continue
+        edges.setdefault(_AtomOf(starts, rel.section, rel.r_offset), []).append(
+            _AtomOf(starts, rel.symbol.section, rel.symbol.st_value))
+
+    live: Set[Atom] = set()
+    worklist = [_AtomOf(starts, sym.section, sym.st_value)
+                for sym in (unit.global_symbol_map.get(name) for name in roots)
+                if sym is not None and not sym.is_undefined()]
+    while worklist:
+        atom = worklist.pop()
+        if atom in live:
+            continue
+        live.add(atom)
+        worklist += edges.get(atom, [])
+
+    out = elf_unit.Unit()
+    _AddUnit(out, unit, starts, live)
+    return _FinishUnit(out)
+
+
+def LinkWithRuntime(unit: elf_unit.Unit, runtime_path: str,
+                    machine: E_MACHINE) -> elf_unit.Unit:
+    """Links `unit` with the runtime object at `runtime_path`
+
+    The runtime comes first so it can provide `_start`. Everything not
+    reachable from ROOTS, in particular the unused parts of the runtime, is dropped.
+    """
+    with open(runtime_path, "rb") as fin:
+        runtime_machine, runtime = elf_unit.UnitLoadFromObject(fin)
+    assert runtime_machine == machine, f"{runtime_path} is for {runtime_machine}"
+    return UnitRemoveUnreferenced(Link([runtime, unit]), ROOTS)
+
+
+def FunSizes(unit: elf_unit.Unit) -> Dict[str, int]:
+    """Returns the size of every fun in .text including the padding which follows it"""
+    starts = _AtomStarts(unit)[id(unit.sec_text)]
+    bounds = starts + [unit.sec_text.sh_size]
+    out = {}
+    for sym in unit.global_symbol_map.values():
+        if sym.section is unit.sec_text:
+            n = bisect.bisect_right(starts, sym.st_value) - 1
+            out[sym.name] = bounds[n + 1] - sym.st_value
+    return out
+
+
+def UnitReorderFuns(unit: elf_unit.Unit, hot: List[str]) -> elf_unit.Unit:
+    """Returns a copy of `unit` with the funs in `hot` placed first in .text
+
+    The hot funs appear in the given order followed by all other funs in their
+    original order. Names which are not funs of `unit` and repetitions are ignored.
+    """
+    starts = _AtomStarts(unit)
+    first: List[Atom] = []
+    for name in hot:
+        sym = unit.global_symbol_map.get(name)
+        if sym is not None and sym.section is unit.sec_text:
+            first.append(_AtomOf(starts, unit.sec_text, sym.st_value))
+    live = {(key, n) for key, offsets in starts.items() for n in range(len(offsets))}
+    out = elf_unit.Unit()
+    _AddUnit(out, unit, starts, live, first)
+    return _FinishUnit(out)
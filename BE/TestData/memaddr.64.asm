@@ -15,6 +15,106 @@
 .addr.mem 8  HASH 0
 .addr.mem 8  SEMI 0
 
+.mem copies 8 RW
+.data 32 [0]
+
+
+.mem spill_data 8 RW
+.data 64 [0]
+
+# loads whose destination gets spilled must not use the folded address mode
+.fun spilled_loads NORMAL [U64] = []
+.reg U64 [v0 v1 v2 v3 v4 v5 v6 v7 v8 v9 v10 v11 v12 v13 v14 v15 v16 v17 v18 v19 v20 v21 v22 v23]
+.bbl start
+    lea.mem base:A64 spill_data 0
+    mov i:S64 0
+.bbl fill
+    shl off:S64 i 3
+    st base off i
+    add i i 1
+    blt i 8 fill
+    mov i 0
+.bbl loop
+    shl off0:S64 i 3
+    ld v0 base off0
+    shl off1:S64 i 3
+    ld v1 base off1
+    shl off2:S64 i 3
+    ld v2 base off2
+    shl off3:S64 i 3
+    ld v3 base off3
+    shl off4:S64 i 3
+    ld v4 base off4
+    shl off5:S64 i 3
+    ld v5 base off5
+    shl off6:S64 i 3
+    ld v6 base off6
+    shl off7:S64 i 3
+    ld v7 base off7
+    shl off8:S64 i 3
+    ld v8 base off8
+    shl off9:S64 i 3
+    ld v9 base off9
+    shl off10:S64 i 3
+    ld v10 base off10
+    shl off11:S64 i 3
+    ld v11 base off11
+    shl off12:S64 i 3
+    ld v12 base off12
+    shl off13:S64 i 3
+    ld v13 base off13
+    shl off14:S64 i 3
+    ld v14 base off14
+    shl off15:S64 i 3
+    ld v15 base off15
+    shl off16:S64 i 3
+    ld v16 base off16
+    shl off17:S64 i 3
+    ld v17 base off17
+    shl off18:S64 i 3
+    ld v18 base off18
+    shl off19:S64 i 3
+    ld v19 base off19
+    shl off20:S64 i 3
+    ld v20 base off20
+    shl off21:S64 i 3
+    ld v21 base off21
+    shl off22:S64 i 3
+    ld v22 base off22
+    shl off23:S64 i 3
+    ld v23 base off23
+    add i i 1
+    blt i 8 loop
+.bbl sum
+    mov sum:U64 0
+    add sum sum v0
+    add sum sum v1
+    add sum sum v2
+    add sum sum v3
+    add sum sum v4
+    add sum sum v5
+    add sum sum v6
+    add sum sum v7
+    add sum sum v8
+    add sum sum v9
+    add sum sum v10
+    add sum sum v11
+    add sum sum v12
+    add sum sum v13
+    add sum sum v14
+    add sum sum v15
+    add sum sum v16
+    add sum sum v17
+    add sum sum v18
+    add sum sum v19
+    add sum sum v20
+    add sum sum v21
+    add sum sum v22
+    add sum sum v23
+    pusharg sum
+    ret
+
+
 
 .fun main NORMAL [S32] = []
 .reg A64 [s]
@@ -36,6 +136,47 @@
     pusharg s
     bsr print_ln
 
+    # scaled index: copy the pointers in reverse order
+    lea.mem src:A64 string_pointers 0
+    lea.mem dst:A64 copies 8
+    mov i:S64 0
+.bbl copy
+    sub j:S64 2 i
+    shl off:S64 j 3
+    ld s src off
+    shl off i 3
+    add off off -8
+    st dst off s
+    add i i 1
+    blt i 3 copy
+
+    mov i 0
+.bbl print
+    shl off i 3
+    lea p:A64 dst off
+    ld s p -8
+    pusharg 10:U64
+    pusharg s
+    bsr print_ln
+    add i i 1
+    blt i 3 print
+
+    # x * 3 and x * 5 via lea
+    mov i 7
+    mul k:S64 i 3
+    conv k32:U32 k
+    pusharg k32
+    bsr print_u_ln
+    mul k32 k32 5
+    pusharg k32
+    bsr print_u_ln
+
+    bsr spilled_loads
+    poparg sum:U64
+    conv k32 sum
+    pusharg k32
+    bsr print_u_ln
+
     pusharg 0:S32
     ret
 
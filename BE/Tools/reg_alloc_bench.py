@@ -0,0 +1,417 @@
+#!/bin/env python3
+"""
+Register allocation quality benchmark
+
+Runs the register allocator of the X64, A64 and A32 backends over a corpus
+of programs and reports per function and overall:
+
+* spills:    number of spilled regs
+* ld_spill:  spill loads  (for X64: uses of spilled regs, i.e. mem operands)
+* st_spill:  spill stores (for X64: defs of spilled regs, i.e. mem operands)
+* moves:     residual reg-reg moves between different cpu regs
+* frame:     frame size in bytes (reg_alloc_local mode only)
+* ms:        wall time spent inside the allocator phases
+
+Two modes mirror the `-mode` flag of the codegen.py drivers:
+
+* reg_alloc_global: stats after global register allocation
+* reg_alloc_local:  stats after global and local register allocation
+
+Inputs can be IR (*.asm), WASM modules (*.wasm, translated with
+FE_WASM/wasm2cwerg.py) and Cwerg sources (*.cw, translated with FE/emit_ir.py
+in a sub-process). Without inputs BE/TestData, FE_WASM/TestData and FE/Lib
+are used. The std lib is prepended to every input like the Makefiles do.
+
+Usage:
+./Tools/reg_alloc_bench.py -save /tmp/ra.json
+... change the allocator ...
+./Tools/reg_alloc_bench.py -baseline /tmp/ra.json
+
+./Tools/reg_alloc_bench.py -backend x64 -mode reg_alloc_local -per_fun TestData/queens.64.asm
+"""
+
+from typing import List, Dict, Tuple
+import argparse
+import collections
+import glob
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+from BE.Base import ir
+from BE.Base import cfg
+from BE.Base import opcode_tab as o
+from BE.Base import sanity
+from BE.Base import serialize
+
+from BE.CodeGenX64 import codegen as x64_codegen
+from BE.CodeGenX64 import legalize as x64_legalize
+from BE.CodeGenX64 import regs as x64_regs
+
+from BE.CodeGenA64 import codegen as a64_codegen
+from BE.CodeGenA64 import legalize as a64_legalize
+from BE.CodeGenA64 import regs as a64_regs
+
+from BE.CodeGenA32 import codegen as a32_codegen
+from BE.CodeGenA32 import legalize as a32_legalize
+from BE.CodeGenA32 import regs as a32_regs
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_STD_LIB = os.path.join(_ROOT, "BE", "StdLib")
+_WASI_LIB = os.path.join(_ROOT, "FE_WASM")
+
+BACKENDS = ["x64", "a64", "a32"]
+MODES = ["reg_alloc_global", "reg_alloc_local"]
+
+METRICS = ["spills", "ld_spill", "st_spill", "moves", "frame", "ms"]
+
+# the timing is too noisy to flag functions as changed
+_QUALITY_METRICS = ["spills", "ld_spill", "st_spill", "moves", "frame"]
+
+_BITS = {"x64": 64, "a64": 64, "a32": 32}
+
+# std lib files prepended to each input, see the Makefile_py files
+_STD_LIB_FILES = {
+    "x64": [os.path.join(_STD_LIB, f) for f in
+            ["startup.x64.asm", "syscall.x64.asm", "std_lib.64.asm"]],
+    "a64": [os.path.join(_STD_LIB, f) for f in
+            ["startup.a64.asm", "syscall.a64.asm", "std_lib.64.asm"]],
+    "a32": [os.path.join(_STD_LIB, f) for f in
+            ["startup.a32.asm", "syscall.a32.asm", "std_lib.32.asm"]],
+}
+
+# variant for tests whose main does not take argc/argv
+_STD_LIB_FILES_NO_ARGV = {
+    "x64": [os.path.join(_STD_LIB, f) for f in
+            ["startup_no_argv.x64.asm", "syscall.x64.asm", "std_lib.64.asm"]],
+    "a64": [os.path.join(_STD_LIB, f) for f in
+            ["startup_no_argv.asm", "syscall.a64.asm", "std_lib.64.asm"]],
+    "a32": [os.path.join(_STD_LIB, f) for f in
+            ["startup_no_argv.asm", "syscall.a32.asm", "std_lib.32.asm"]],
+}
+
+# WASM programs do not use the Cwerg std lib but a wasi shim instead,
+# see FE_WASM/Makefile
+_WASI_FILES = {
+    "x64": [os.path.join(_STD_LIB, "startup.x64.asm"), os.path.join(_STD_LIB, "syscall.x64.asm"),
+            os.path.join(_WASI_LIB, "wasi.lite.64.asm")],
+    "a64": [os.path.join(_STD_LIB, "startup.a64.asm"), os.path.join(_STD_LIB, "syscall.a64.asm"),
+            os.path.join(_WASI_LIB, "wasi.64.asm")],
+    "a32": [os.path.join(_STD_LIB, "startup.a32.asm"), os.path.join(_STD_LIB, "syscall.a32.asm"),
+            os.path.join(_WASI_LIB, "wasi.32.asm")],
+}
+
+_CODEGEN = {
+    "x64": (x64_codegen, x64_legalize, x64_regs),
+    "a64": (a64_codegen, a64_legalize, a64_regs),
+    "a32": (a32_codegen, a32_legalize, a32_regs),
+}
+
+FunStats = Dict[str, float]
+
+
+############################################################
+# Corpus
+############################################################
+
+def DefaultInputs() -> List[str]:
+    out = sorted(glob.glob(os.path.join(_ROOT, "BE", "TestData", "*.asm")))
+    out += sorted(glob.glob(os.path.join(_ROOT, "FE_WASM", "TestData", "*.wasm")))
+    out += sorted(glob.glob(os.path.join(_ROOT, "FE", "Lib", "*_test.cw")))
+    return out
+
+
+def _InputMatchesBackend(path: str, backend: str) -> bool:
+    """BE/TestData has separate .32.asm and .64.asm variants of some tests"""
+    if path.endswith(".32.asm"):
+        return _BITS[backend] == 32
+    if path.endswith(".64.asm"):
+        return _BITS[backend] == 64
+    return True
+
+
+def _MainTakesNoArgs(lines: List[str]) -> bool:
+    for line in lines:
+        if line.startswith(".fun main "):
+            return line.rstrip().endswith("= []")
+    return False
+
+
+def _ReadLines(filenames: List[str]) -> List[str]:
+    out = []
+    for fn in filenames:
+        with open(fn) as fin:
+            out += fin.readlines()
+    return out
+
+
+def _WasmToAsm(path: str, backend: str) -> List[str]:
+    # FE_WASM is only needed for .wasm inputs
+    from FE_WASM import wasm2cwerg
+    import FE_WASM.parser as wasm
+    with open(path, "rb") as fin:
+        mod = wasm.Module.read(fin)
+    addr_type = o.DK.A64 if _BITS[backend] == 64 else o.DK.A32
+    unit = wasm2cwerg.Translate(mod, addr_type)
+    return [line + "\n" for line in serialize.UnitRenderToASM(unit)]
+
+
+def _CwToAsm(path: str, backend: str) -> List[str]:
+    # the front end has its own python version requirements so we run it
+    # in a separate process
+    cmd = [sys.executable, os.path.join(_ROOT, "FE", "emit_ir.py")]
+    if backend == "a32":
+        cmd += ["-shake_tree", "-arch", "a32"]
+    cmd.append(path)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = _ROOT
+    res = subprocess.run(cmd, capture_output=True, text=True, env=env,
+                         cwd=os.path.join(_ROOT, "FE"))
+    if res.returncode != 0:
+        last = (res.stderr.strip().splitlines() or ["unknown error"])[-1]
+        raise RuntimeError(f"emit_ir.py failed: {last}")
+    return res.stdout.splitlines(keepends=True)
+
+
+def ReadInput(path: str, backend: str) -> ir.Unit:
+    if path.endswith(".wasm"):
+        lines = _ReadLines(_WASI_FILES[backend]) + _WasmToAsm(path, backend)
+    elif path.endswith(".cw"):
+        lines = _ReadLines(_STD_LIB_FILES[backend]) + _CwToAsm(path, backend)
+    else:
+        with open(path) as fin:
+            lines = fin.readlines()
+        std_lib = _STD_LIB_FILES_NO_ARGV if _MainTakesNoArgs(lines) else _STD_LIB_FILES
+        lines = _ReadLines(std_lib[backend]) + lines
+    return serialize.UnitParseFromAsm(io.StringIO("".join(lines)))
+
+
+############################################################
+# Allocation
+############################################################
+
+def _FunsInAllocationOrder(backend: str, unit: ir.Unit) -> List[ir.Fun]:
+    if backend == "x64":
+        # callees first so that clobber summaries are available
+        return cfg.UnitFunsInCallGraphPostOrder(unit)
+    return list(unit.funs)
+
+
+def RegAlloc(backend: str, mode: str, unit: ir.Unit) -> Dict[str, float]:
+    """Runs the allocator like the codegen.py driver but times each fun
+
+    Returns the allocation time in ms for each fun
+    """
+    codegen, legalize, _ = _CODEGEN[backend]
+    opt_stats: Dict[str, int] = collections.defaultdict(int)
+    codegen.LegalizeAll(unit, opt_stats, None)
+    timing: Dict[str, float] = {}
+    funs = _FunsInAllocationOrder(backend, unit)
+    for fun in funs:
+        sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
+        start = time.perf_counter()
+        legalize.PhaseGlobalRegAlloc(fun, opt_stats, None)
+        if mode == "reg_alloc_local" and backend == "x64":
+            legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, None)
+            legalize.PhaseComputeClobberSummary(fun, opt_stats, None)
+        timing[fun.name] = (time.perf_counter() - start) * 1000.0
+    if mode == "reg_alloc_local" and backend != "x64":
+        for fun in funs:
+            start = time.perf_counter()
+            legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, None)
+            timing[fun.name] += (time.perf_counter() - start) * 1000.0
+    return timing
+
+
+############################################################
+# Stats
+############################################################
+
+def _IsSpillStk(stk: ir.Stk) -> bool:
+    return stk.name.startswith("$gspill_") or stk.name.startswith("$spill_")
+
+
+def _IsCpuReg(op) -> bool:
+    return isinstance(op, ir.Reg) and isinstance(op.cpu_reg, ir.CpuReg)
+
+
+def FunStatsAfterRegAlloc(backend: str, mode: str, fun: ir.Fun) -> FunStats:
+    _, _, regs = _CODEGEN[backend]
+    spills = 0
+    ld_spill = 0
+    st_spill = 0
+    moves = 0
+    if backend == "x64":
+        # spilled regs are stack slots used as memory operands directly
+        spills = sum(1 for reg in fun.regs if reg.IsSpilled())
+    else:
+        # spilled regs are rewritten into explicit loads and stores
+        spills = sum(1 for stk in fun.stk_syms.values() if _IsSpillStk(stk))
+
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            opc = ins.opcode
+            if opc is o.MOV:
+                dst, src = ins.operands
+                if _IsCpuReg(dst) and _IsCpuReg(src) and dst.cpu_reg != src.cpu_reg:
+                    moves += 1
+            elif opc is o.LD_STK and _IsSpillStk(ins.operands[1]):
+                ld_spill += 1
+                continue
+            elif opc is o.ST_STK and _IsSpillStk(ins.operands[0]):
+                st_spill += 1
+                continue
+            if backend == "x64":
+                num_defs = opc.def_ops_count()
+                for n, op in enumerate(ins.operands):
+                    if isinstance(op, ir.Reg) and op.IsSpilled():
+                        if n < num_defs:
+                            st_spill += 1
+                        else:
+                            ld_spill += 1
+    frame = 0
+    if mode == "reg_alloc_local" and fun.kind is o.FUN_KIND.NORMAL:
+        frame = regs.FunComputeEmitContext(fun).FrameSize()
+    return {"spills": spills, "ld_spill": ld_spill, "st_spill": st_spill,
+            "moves": moves, "frame": frame}
+
+
+def RunOne(backend: str, mode: str, path: str) -> Dict[str, FunStats]:
+    unit = ReadInput(path, backend)
+    timing = RegAlloc(backend, mode, unit)
+    name = os.path.relpath(path, _ROOT)
+    out: Dict[str, FunStats] = {}
+    for fun in unit.funs:
+        if fun.kind is not o.FUN_KIND.NORMAL:
+            continue
+        stats = FunStatsAfterRegAlloc(backend, mode, fun)
+        stats["ms"] = round(timing.get(fun.name, 0.0), 3)
+        out[f"{name}:{fun.name}"] = stats
+    return out
+
+
+def Totals(funs: Dict[str, FunStats]) -> FunStats:
+    out = {m: 0 for m in METRICS}
+    for stats in funs.values():
+        for m in METRICS:
+            out[m] += stats[m]
+    out["ms"] = round(out["ms"], 3)
+    return out
+
+
+############################################################
+# Reporting
+############################################################
+
+def _FormatRow(name: str, stats: FunStats) -> str:
+    cols = [f"{stats[m]:>10.1f}" if m == "ms" else f"{stats[m]:>10}" for m in METRICS]
+    return f"{name:<50} " + " ".join(cols)
+
+
+def _Header() -> str:
+    return f"{'':<50} " + " ".join(f"{m:>10}" for m in METRICS)
+
+
+def _FormatDelta(old, new) -> str:
+    if old == new:
+        return f"{new}"
+    pct = f" {100.0 * (new - old) / old:+.1f}%" if old else ""
+    if isinstance(new, float):
+        return f"{old:.1f} -> {new:.1f}{pct}"
+    return f"{old} -> {new} ({new - old:+}){pct}"
+
+
+def ReportResults(results, per_fun: bool, fout):
+    for key, funs in results.items():
+        print(f"# {key}", file=fout)
+        print(_Header(), file=fout)
+        if per_fun:
+            for name, stats in sorted(funs.items()):
+                print(_FormatRow(name, stats), file=fout)
+        print(_FormatRow("TOTAL", Totals(funs)), file=fout)
+        print(file=fout)
+
+
+def ReportDiff(results, baseline, max_funs: int, fout):
+    for key, funs in results.items():
+        old_funs = baseline.get(key)
+        if old_funs is None:
+            print(f"# {key}: not in baseline", file=fout)
+            continue
+        print(f"# {key} diff against baseline", file=fout)
+        old_totals = Totals(old_funs)
+        new_totals = Totals(funs)
+        for m in METRICS:
+            print(f"  {m:<10} {_FormatDelta(old_totals[m], new_totals[m])}", file=fout)
+
+        changed: List[Tuple[int, str]] = []
+        for name, stats in funs.items():
+            old = old_funs.get(name)
+            if old is None:
+                continue
+            if any(stats[m] != old[m] for m in _QUALITY_METRICS):
+                # rank by the change in spill code and moves
+                delta = sum(stats[m] - old[m] for m in ["ld_spill", "st_spill", "moves"])
+                changed.append((delta, name))
+        added = len(set(funs) - set(old_funs))
+        removed = len(set(old_funs) - set(funs))
+        print(f"  funs changed: {len(changed)}  added: {added}  removed: {removed}", file=fout)
+        changed.sort()
+        # show the biggest improvements and regressions
+        shown = changed if len(changed) <= 2 * max_funs else \
+            changed[:max_funs] + changed[-max_funs:]
+        for _, name in shown:
+            old = old_funs[name]
+            new = funs[name]
+            deltas = [f"{m}: {_FormatDelta(old[m], new[m])}" for m in _QUALITY_METRICS
+                      if old[m] != new[m]]
+            print(f"    {name}  " + "  ".join(deltas), file=fout)
+        print(file=fout)
+
+
+if __name__ == "__main__":
+    def main():
+        parser = argparse.ArgumentParser(description='reg_alloc_bench')
+        parser.add_argument('-backend', type=str, action="append", choices=BACKENDS,
+                            help='backend(s) to benchmark, default all')
+        parser.add_argument('-mode', type=str, action="append", choices=MODES,
+                            help='mode(s) to benchmark, default all')
+        parser.add_argument('-per_fun', action="store_true", help='show per fun stats')
+        parser.add_argument('-save', type=str, help='save results as json')
+        parser.add_argument('-baseline', type=str, help='json results to diff against')
+        parser.add_argument('-max_funs', type=int, default=10,
+                            help='max number of changed funs shown in diff per direction')
+        parser.add_argument('inputs', type=str, nargs="*", help='input files')
+        args = parser.parse_args()
+
+        inputs = [os.path.abspath(p) for p in args.inputs] or DefaultInputs()
+        results: Dict[str, Dict[str, FunStats]] = {}
+        failures = 0
+        for backend in args.backend or BACKENDS:
+            for mode in args.mode or MODES:
+                funs: Dict[str, FunStats] = {}
+                for path in inputs:
+                    if not _InputMatchesBackend(path, backend):
+                        continue
+                    try:
+                        funs.update(RunOne(backend, mode, path))
+                    except Exception as err:
+                        failures += 1
+                        print(f"SKIPPING {backend} {mode} {os.path.relpath(path, _ROOT)}: "
+                              f"{type(err).__name__}: {err}", file=sys.stderr)
+                results[f"{backend}/{mode}"] = funs
+
+        ReportResults(results, args.per_fun, sys.stdout)
+        if args.baseline:
+            with open(args.baseline) as fin:
+                ReportDiff(results, json.load(fin), args.max_funs, sys.stdout)
+        if args.save:
+            with open(args.save, "w") as fout:
+                json.dump(results, fout, indent=1, sort_keys=True)
+        if failures:
+            print(f"{failures} inputs skipped", file=sys.stderr)
+
+    main()
@@ -41,6 +41,9 @@ ZEROS = [b"\0" * i for i in range(128)]
 
 _DUMMY_VOID_REG = "@DUMMY_FOR_VOID_RESULTS@"
 
+# set via -emit_line_numbers: precede statements with `line` markers for debug info
+_EMIT_LINE_NUMBERS = False
+
 
 def _IterateValVec(points: list[cwast.ValPoint], dim, srcloc):
     """Pairs given ValPoints from a ValCompound repesenting a Vec with their indices"""
@@ -758,8 +761,17 @@ def _EmitCopy(dst: BaseOffset, src: BaseOffset, length, alignment,
             curr += width
 
 
+def _EmitLine(srcloc: Optional[cwast.SrcLoc]):
+    # skip locations which do not refer to a real file, e.g. cwast.SRCLOC_GENERATED
+    if srcloc is None or srcloc.filename.startswith("@"):
+        return
+    print(f'{TAB}line "{srcloc.filename}" {srcloc.lineno}')
+
+
 def EmitIRStmt(node, result: Optional[ReturnResultLocation], ta: type_corpus.TargetArchConfig,
                id_gen: identifier.IdGenIR):
+    if _EMIT_LINE_NUMBERS:
+        _EmitLine(node.x_srcloc)
     if isinstance(node, cwast.DefVar):
         # name translation!
         node.name = id_gen.NewName(str(node.name))
@@ -1108,9 +1120,14 @@ def main() -> int:
         '-stop', help='stop at the given stage')
     parser.add_argument(
         '-emit_stats', help='stop at the given stage and emit stats')
+    parser.add_argument(
+        '-emit_line_numbers', action="store_true",
+        help='emit source line markers (needed for debug line info)')
     parser.add_argument('files', metavar='F', type=str, nargs='+',
                         help='an input source file')
     args = parser.parse_args()
+    global _EMIT_LINE_NUMBERS
+    _EMIT_LINE_NUMBERS = args.emit_line_numbers
 
     logging.basicConfig(level=logging.WARN)
     # typify.logger.setLevel(logging.INFO)